@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Measure the work after the FAISS call in single-stage agent search.
+
+Builds a ``--vectors`` synthetic index (``--fields`` vectors per agent) plus
+an in-memory registry of the agents, then for random queries times:
+
+- the FAISS search for ``max_results * 10`` field hits;
+- grouping and composite scoring of the hits, as per-agent Python lists
+  (the previous implementation) and with NumPy (``rank_agent_scores``);
+- search and ranking end to end on arrays (``search_ranked_agents``);
+- fetching the ranked cards, one ``get_agent`` await per agent and with one
+  ``get_agents`` call.
+
+The default dimensions are kept small so a 1M-vector index fits in memory;
+the ranking and fetch costs do not depend on them.
+
+Usage:
+    python benchmarks/bench_agent_ranking.py --vectors 1000000
+    python benchmarks/bench_agent_ranking.py --max-results 100 --dims 384
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from a2a_registry.proto.generated.registry_pb2 import Vector  # noqa: E402
+from a2a_registry.storage import InMemoryStorage  # noqa: E402
+from a2a_registry.vector_store import (  # noqa: E402
+    FAISSVectorStore,
+    rank_agent_scores,
+)
+
+
+def python_rank_agents(
+    similar_vectors: list[tuple[str, float]], max_results: int
+) -> list[tuple[str, float]]:
+    """Composite ranking with per-agent lists, as search_agents_vector did."""
+    agent_vector_matches: dict[str, list[float]] = {}
+    for agent_id, score in similar_vectors:
+        if agent_id not in agent_vector_matches:
+            agent_vector_matches[agent_id] = []
+        agent_vector_matches[agent_id].append(score)
+
+    agent_composite_scores: dict[str, float] = {}
+    for agent_id, scores in agent_vector_matches.items():
+        max_score = max(scores)
+        top_3_mean = sum(sorted(scores, reverse=True)[:3]) / min(3, len(scores))
+        coverage_bonus = min(len(scores) / 5.0, 1.0)
+        agent_composite_scores[agent_id] = (
+            0.6 * max_score + 0.3 * top_3_mean + 0.1 * coverage_bonus
+        )
+    return sorted(agent_composite_scores.items(), key=lambda x: x[1], reverse=True)[
+        :max_results
+    ]
+
+
+async def build(args: argparse.Namespace) -> tuple[FAISSVectorStore, InMemoryStorage]:
+    rng = np.random.default_rng(42)
+    topics = rng.standard_normal((args.topics, args.dims)).astype(np.float32)
+    store = FAISSVectorStore(vector_dimensions=args.dims, segment_size=args.vectors)
+    storage = InMemoryStorage()
+    agents = args.vectors // args.fields
+    for first in range(0, agents, 1000):
+        batch = {}
+        for i in range(first, min(first + 1000, agents)):
+            center = topics[rng.integers(args.topics)]
+            rows = center + rng.standard_normal((args.fields, args.dims))
+            batch[f"agent-{i}"] = [Vector(values=row.tolist()) for row in rows]
+        store.add_agents_vectors(batch)
+        await storage.register_agents(
+            [
+                {"name": agent_id, "description": agent_id, "url": "http://x"}
+                for agent_id in batch
+            ]
+        )
+    return store, storage
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vectors", type=int, default=1000000)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--dims", type=int, default=32)
+    parser.add_argument("--topics", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--max-results", type=int, default=100)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    store, storage = await build(args)
+    print(
+        f"{args.vectors} vectors ({args.vectors // args.fields} agents) x "
+        f"{args.dims} dims built in {time.perf_counter() - start:.1f} s"
+    )
+
+    rng = np.random.default_rng(7)
+    queries = [
+        Vector(values=row.tolist())
+        for row in rng.standard_normal((args.queries, args.dims))
+    ]
+    timings = dict.fromkeys(
+        ["faiss search", "python ranking", "numpy ranking", "get_agent x N"], 0.0
+    )
+    timings["search_ranked_agents"] = 0.0
+    timings["get_agents"] = 0.0
+    hits_total = 0
+    for query in queries:
+        start = time.perf_counter()
+        hits = store.search_agent_scores(
+            query, k=args.max_results * 10, similarity_threshold=-1.0
+        )
+        timings["faiss search"] += time.perf_counter() - start
+        hits_total += len(hits)
+
+        start = time.perf_counter()
+        expected = python_rank_agents(hits, args.max_results)
+        timings["python ranking"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        ranked = rank_agent_scores(hits, args.max_results)
+        timings["numpy ranking"] += time.perf_counter() - start
+        assert [agent for agent, _ in ranked] == [agent for agent, _ in expected]
+
+        start = time.perf_counter()
+        (end_to_end,) = store.search_ranked_agents(
+            [query],
+            k=args.max_results * 10,
+            max_results=args.max_results,
+            similarity_threshold=-1.0,
+        )
+        timings["search_ranked_agents"] += time.perf_counter() - start
+        assert [agent for agent, _ in end_to_end] == [agent for agent, _ in ranked]
+
+        agent_ids = [agent_id for agent_id, _ in ranked]
+        start = time.perf_counter()
+        for agent_id in agent_ids:
+            await storage.get_agent(agent_id)
+        timings["get_agent x N"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        await storage.get_agents(agent_ids)
+        timings["get_agents"] += time.perf_counter() - start
+
+    print(
+        f"{hits_total // len(queries)} hits/query, "
+        f"{args.max_results} agents ranked and fetched"
+    )
+    for name, total in timings.items():
+        print(f"{name:<20} {total / len(queries) * 1000:>9.3f} ms/query")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Compare FAISSVectorStore index types and storage precisions.
+
+Builds a store of ``--vectors`` clustered random vectors (agent cards yield
+many similar field vectors) for every index type and vector storage
+precision, then reports build time, search latency, the store's reported
+memory footprint and recall@k against the exact float32 flat index.
+
+Usage:
+    python benchmarks/bench_ann_index.py --vectors 100000 --k 100
+    python benchmarks/bench_ann_index.py --types flat,hnsw --hnsw-ef-search 256
+    python benchmarks/bench_ann_index.py --types flat --storages float32,fp16,sq8
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from a2a_registry.proto.generated.registry_pb2 import Vector  # noqa: E402
+from a2a_registry.vector_store import FAISSVectorStore  # noqa: E402
+
+VECTORS_PER_AGENT = 20
+
+
+def make_data(args: argparse.Namespace) -> tuple[dict[str, list[Vector]], np.ndarray]:
+    rng = np.random.default_rng(42)
+    centers = rng.standard_normal((args.clusters, args.dims)).astype(np.float32)
+    assignment = rng.integers(0, args.clusters, args.vectors)
+    rows = centers[assignment] + 0.5 * rng.standard_normal(
+        (args.vectors, args.dims), dtype=np.float32
+    )
+    agents_vectors: dict[str, list[Vector]] = {}
+    for i, row in enumerate(rows):
+        agent_id = f"agent-{i // VECTORS_PER_AGENT}"
+        agents_vectors.setdefault(agent_id, []).append(
+            Vector(values=row.tolist(), agent_id=agent_id, field_path=f"field[{i}]")
+        )
+    queries = rows[rng.choice(args.vectors, args.queries, replace=False)]
+    queries += 0.3 * rng.standard_normal(queries.shape, dtype=np.float32)
+    return agents_vectors, queries
+
+
+def run(index_type: str, vector_storage: str, agents_vectors, queries, args):
+    start = time.perf_counter()
+    store = FAISSVectorStore(
+        vector_dimensions=args.dims,
+        index_type=index_type,
+        ann_threshold=1,
+        hnsw_m=args.hnsw_m,
+        hnsw_ef_search=args.hnsw_ef_search,
+        ivf_nlist=args.ivf_nlist,
+        ivf_nprobe=args.ivf_nprobe,
+        pq_m=args.pq_m,
+        vector_storage=vector_storage,
+    )
+    store.add_agents_vectors(agents_vectors)
+    build = time.perf_counter() - start
+
+    hits = []
+    start = time.perf_counter()
+    for row in queries:
+        results = store.search_similar_vectors(
+            Vector(values=row.tolist()), k=args.k, similarity_threshold=-1.0
+        )
+        hits.append({vector.field_path for _agent, vector, _score in results})
+    latency = (time.perf_counter() - start) / len(queries)
+    return store, build, latency, hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vectors", type=int, default=100000)
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--clusters", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=100)
+    parser.add_argument("--types", default="flat,hnsw,ivf,ivfpq")
+    parser.add_argument("--storages", default="float32")
+    parser.add_argument("--hnsw-m", type=int, default=32)
+    parser.add_argument("--hnsw-ef-search", type=int, default=128)
+    parser.add_argument("--ivf-nlist", type=int, default=0)
+    parser.add_argument("--ivf-nprobe", type=int, default=16)
+    parser.add_argument("--pq-m", type=int, default=48)
+    args = parser.parse_args()
+
+    agents_vectors, queries = make_data(args)
+    print(f"{args.vectors} vectors x {args.dims} dims, recall@{args.k} vs flat")
+    print(
+        f"{'index':<8} {'storage':<8} {'build s':>9} {'ms/query':>9} "
+        f"{'memory MB':>10} {'recall':>7}"
+    )
+
+    # Exact float32 search is the reference for recall
+    _store, _build, _latency, baseline = run(
+        "flat", "float32", agents_vectors, queries, args
+    )
+    storages = args.storages.split(",")
+    for index_type in args.types.split(","):
+        # PQ codes are compressed already and ignore the storage precision
+        for vector_storage in storages[:1] if index_type == "ivfpq" else storages:
+            store, build, latency, hits = run(
+                index_type, vector_storage, agents_vectors, queries, args
+            )
+            recall = np.mean(
+                [
+                    len(h & b) / max(len(b), 1)
+                    for h, b in zip(hits, baseline, strict=True)
+                ]
+            )
+            memory = store.get_stats()["memory_usage_mb"]
+            print(
+                f"{index_type:<8} {vector_storage:<8} {build:>9.2f} "
+                f"{latency * 1000:>9.3f} {memory:>10.1f} {recall:>7.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Compare single-stage and two-stage (centroid) agent search.
+
+Builds a store of ``--agents`` agents with ``--fields`` field vectors each,
+drawn around a per-agent topic, then ranks agents for random queries:
+
+- field hits: the top ``max_results * 10`` field vectors regrouped by agent
+  (the single-stage search);
+- centroids: the top ``--candidates`` agent centroids re-ranked on all their
+  field vectors.
+
+Recall@max_results is measured against the exact composite ranking of every
+agent.
+
+Usage:
+    python benchmarks/bench_centroid_search.py --agents 20000 --fields 20
+    python benchmarks/bench_centroid_search.py --candidates 50,100,200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from a2a_registry.proto.generated.registry_pb2 import Vector  # noqa: E402
+from a2a_registry.vector_store import (  # noqa: E402
+    FAISSVectorStore,
+    composite_agent_scores,
+)
+
+
+def make_store(args: argparse.Namespace) -> tuple[FAISSVectorStore, np.ndarray]:
+    rng = np.random.default_rng(42)
+    topics = rng.standard_normal((args.topics, args.dims)).astype(np.float32)
+    store = FAISSVectorStore(vector_dimensions=args.dims, segment_size=100000)
+    for first in range(0, args.agents, 1000):
+        batch = {}
+        for i in range(first, min(first + 1000, args.agents)):
+            center = topics[rng.integers(args.topics)]
+            rows = center + rng.standard_normal((args.fields, args.dims))
+            batch[f"agent-{i}"] = [Vector(values=row.tolist()) for row in rows]
+        store.add_agents_vectors(batch)
+    queries = topics[rng.integers(args.topics, size=args.queries)]
+    queries = queries + 0.5 * rng.standard_normal(queries.shape)
+    return store, queries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=20000)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--max-results", type=int, default=10)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--candidates", default="50,100,200")
+    args = parser.parse_args()
+
+    store, queries = make_store(args)
+    query_vectors = [Vector(values=row.tolist()) for row in queries]
+    print(
+        f"{args.agents} agents x {args.fields} fields x {args.dims} dims, "
+        f"recall@{args.max_results} vs exact agent ranking"
+    )
+
+    # Exact reference: every agent is a candidate
+    reference = [
+        {agent for agent, _ in ranked}
+        for ranked in store.search_agents_by_centroid(
+            query_vectors,
+            candidates=args.agents,
+            max_results=args.max_results,
+            similarity_threshold=args.threshold,
+        )
+    ]
+
+    def report(name: str, latency: float, results: list[set[str]]) -> None:
+        recall = np.mean(
+            [
+                len(found & exact) / max(len(exact), 1)
+                for found, exact in zip(results, reference, strict=True)
+            ]
+        )
+        print(f"{name:<18} {latency * 1000:>9.3f} ms/query  recall {recall:.3f}")
+
+    start = time.perf_counter()
+    results = []
+    for query in query_vectors:
+        hits = store.search_agent_scores(
+            query, k=args.max_results * 10, similarity_threshold=args.threshold
+        )
+        agents, groups = np.unique([agent for agent, _ in hits], return_inverse=True)
+        scores = composite_agent_scores(
+            groups, np.array([score for _, score in hits]), len(agents)
+        )
+        top = np.argsort(-scores)[: args.max_results]
+        results.append(set(agents[top].tolist()))
+    report("field hits", (time.perf_counter() - start) / len(queries), results)
+
+    for candidates in [int(c) for c in args.candidates.split(",")]:
+        start = time.perf_counter()
+        results = [
+            {agent for agent, _ in ranked}
+            for query in query_vectors
+            for ranked in store.search_agents_by_centroid(
+                [query],
+                candidates=candidates,
+                max_results=args.max_results,
+                similarity_threshold=args.threshold,
+            )
+        ]
+        report(
+            f"centroids M={candidates}",
+            (time.perf_counter() - start) / len(queries),
+            results,
+        )
+
+
+if __name__ == "__main__":
+    main()
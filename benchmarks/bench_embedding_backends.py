@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Compare embedding backends: startup, throughput and search agreement.
+
+For each backend in ``--backends`` times loading it in a fresh interpreter
+(imports included, as a process importing ``a2a_registry.storage`` pays it),
+then embeds ``--texts`` synthetic agent card texts in this process. Agreement
+is the overlap of each backend's top-``--k`` neighbours of ``--queries``
+texts with the first backend's. Backends whose dependencies or model files
+are missing are reported and skipped.
+
+Usage:
+    python benchmarks/bench_embedding_backends.py
+    python benchmarks/bench_embedding_backends.py --backends hashing,onnx --texts 2000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from a2a_registry.embedding_backends import load_embedding_backend  # noqa: E402
+
+WORDS = (
+    "plan book translate summarize trips hotels flights legal documents "
+    "emails invoices contracts weather forecasts code reviews tests search "
+    "news articles recipes meals fitness workouts music playlists support "
+    "tickets calendars meetings reports sales leads images captions"
+).split()
+
+
+def make_texts(count: int) -> list[str]:
+    rng = np.random.default_rng(42)
+    return [" ".join(rng.choice(WORDS, size=rng.integers(4, 16))) for _ in range(count)]
+
+
+def startup_seconds(backend: str, model: str) -> float:
+    """Seconds to import the backend and load its model in a new process."""
+    code = (
+        "from a2a_registry.embedding_backends import load_embedding_backend\n"
+        f"load_embedding_backend({backend!r}, {model!r})\n"
+    )
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code],
+        env=os.environ | {"PYTHONPATH": str(SRC)},
+        check=True,
+        capture_output=True,
+    )
+    return time.perf_counter() - start
+
+
+def top_k(embeddings: np.ndarray, queries: int, k: int) -> list[set[int]]:
+    scores = embeddings[:queries] @ embeddings.T
+    return [set(np.argsort(-row)[1 : k + 1]) for row in scores]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backends", default="sentence-transformers,onnx,hashing")
+    parser.add_argument("--model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts)
+    print(f"{args.texts} texts, model {args.model}")
+    print(
+        f"{'backend':<22} {'startup s':>10} {'texts/s':>10} "
+        f"{'agree@' + str(args.k):>9}"
+    )
+    reference = None
+    for backend in args.backends.split(","):
+        try:
+            startup = startup_seconds(backend, args.model)
+            model = load_embedding_backend(backend, args.model)
+        except (subprocess.CalledProcessError, ImportError, OSError) as e:
+            print(f"{backend:<22} unavailable ({type(e).__name__})")
+            continue
+        start = time.perf_counter()
+        embeddings = np.asarray(model.encode(texts, batch_size=64))
+        rate = len(texts) / (time.perf_counter() - start)
+
+        neighbours = top_k(embeddings, args.queries, args.k)
+        if reference is None:
+            reference = neighbours
+        agreement = np.mean(
+            [len(a & b) / args.k for a, b in zip(reference, neighbours, strict=True)]
+        )
+        print(f"{backend:<22} {startup:>10.2f} {rate:>10.0f} {agreement:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
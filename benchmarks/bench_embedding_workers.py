@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark bulk embedding throughput with EmbeddingExecutor worker counts.
+
+Embeds the field texts of ``--cards`` synthetic agent cards in-process and
+with 1, 2, 4, ... worker processes (up to ``--max-workers``) and reports
+cards/sec. Scaling is near-linear until the worker count reaches the number
+of physical cores.
+
+Without ``--model`` a CPU-bound stand-in model is used so the benchmark runs
+without downloading weights; pass ``--model all-MiniLM-L6-v2`` for the real
+transformer.
+
+Usage:
+    python benchmarks/bench_embedding_workers.py --cards 2000 --max-workers 8
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from a2a_registry.embedding_backends import load_sentence_transformer  # noqa: E402
+from a2a_registry.embedding_workers import EmbeddingExecutor  # noqa: E402
+
+DIMS = 384
+FIELDS_PER_CARD = 8
+
+
+class SimulatedModel:
+    """CPU-bound stand-in: repeated hashing costs roughly one forward pass."""
+
+    def __init__(self, rounds: int = 2000) -> None:
+        self.rounds = rounds
+
+    def encode(self, texts, batch_size=64, convert_to_numpy=True):
+        rows = np.empty((len(texts), DIMS), dtype=np.float32)
+        for i, text in enumerate(texts):
+            digest = text.encode()
+            for _ in range(self.rounds):
+                digest = hashlib.sha256(digest).digest()
+            rows[i] = np.frombuffer(digest * (DIMS * 4 // 32), dtype=np.uint8)[:DIMS]
+        return rows
+
+
+def load_simulated_model(model_name: str) -> SimulatedModel:
+    return SimulatedModel()
+
+
+def make_texts(cards: int) -> list[str]:
+    return [
+        f"agent {i} field {j} description of a capability"
+        for i in range(cards)
+        for j in range(FIELDS_PER_CARD)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--model", help="Use a real sentence-transformers model")
+    args = parser.parse_args()
+
+    loader = load_sentence_transformer if args.model else load_simulated_model
+    model_name = args.model or "simulated"
+    texts = make_texts(args.cards)
+    print(f"{args.cards} cards, {len(texts)} texts, {os.cpu_count()} CPUs")
+
+    model = loader(model_name)
+    start = time.perf_counter()
+    model.encode(texts)
+    baseline = args.cards / (time.perf_counter() - start)
+    print(f"{'in-process':<12} {baseline:>9.1f} cards/s")
+
+    workers = 1
+    while workers <= args.max_workers:
+        executor = EmbeddingExecutor(
+            model_name, DIMS, workers=workers, model_loader=loader
+        )
+        executor.encode(texts[: workers * 2])  # start workers, load models
+        start = time.perf_counter()
+        executor.encode(texts)
+        rate = args.cards / (time.perf_counter() - start)
+        executor.close()
+        print(
+            f"{workers:>2} workers   {rate:>9.1f} cards/s "
+            f"({rate / baseline:>4.2f}x in-process)"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
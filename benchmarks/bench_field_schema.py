@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Compare vector field schemas: index size, embedding work and search.
+
+Generates ``--agents`` synthetic agent cards (``--skills`` skills with name,
+description, tags and examples, plus one extension) and indexes them once
+per schema in ``--schemas`` (presets or JSON, see ``FieldSchema.parse``).
+Each query is drawn from one skill's description and examples; hit@k is the
+share of queries whose agent is among the top ``--max-results``.
+
+Without ``--model`` texts are embedded with the feature-hashing backend,
+so timings cover everything but the transformer; the "texts" column is the
+embedding work a real model would do.
+
+Usage:
+    python benchmarks/bench_field_schema.py --agents 5000
+    python benchmarks/bench_field_schema.py --model all-MiniLM-L6-v2 --agents 500
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from a2a_registry.field_schema import FieldSchema  # noqa: E402
+from a2a_registry.vector_generator import VectorGenerator  # noqa: E402
+from a2a_registry.vector_store import FAISSVectorStore  # noqa: E402
+
+DIMS = 384
+
+
+def make_cards(
+    args: argparse.Namespace,
+) -> tuple[list[tuple[str, dict[str, Any]]], list[str], list[str]]:
+    """Agent cards, plus queries and the agent each query is about."""
+    rng = np.random.default_rng(42)
+
+    def words(prefix: str, count: int, vocabulary: int) -> str:
+        return " ".join(f"{prefix}{i}" for i in rng.integers(vocabulary, size=count))
+
+    cards = []
+    queries = []
+    targets = []
+    for a in range(args.agents):
+        agent_id = f"agent-{a}"
+        skills = []
+        for _ in range(args.skills):
+            topic = f"t{rng.integers(args.topics)}w"
+            skill = {
+                "id": words("id", 1, 10**6),
+                "name": words(topic, 3, 50),
+                "description": words(topic, 10, 50),
+                "tags": words(topic, 2, 50).split(),
+                "examples": [words(topic, 6, 50), words(topic, 6, 50)],
+            }
+            skills.append(skill)
+            if len(queries) < args.queries and rng.random() < 0.2:
+                text = f"{skill['description']} {' '.join(skill['examples'])}"
+                queries.append(" ".join(rng.choice(text.split(), size=5)))
+                targets.append(agent_id)
+        cards.append(
+            (
+                agent_id,
+                {
+                    "name": words("name", 2, 5000),
+                    "description": words("d", 12, 2000),
+                    "url": f"http://{agent_id}",
+                    "skills": skills,
+                    "capabilities": {
+                        "extensions": [
+                            {
+                                "uri": "urn:persona",
+                                "description": words("e", 8, 2000),
+                                "params": {"traits": words("p", 6, 2000).split()},
+                            }
+                        ]
+                    },
+                },
+            )
+        )
+    return cards, queries, targets
+
+
+def count_encoded_texts(generator: VectorGenerator) -> list[int]:
+    """Count the texts the generator's model embeds (in a one-item list)."""
+    encoded = [0]
+    encode = generator.model.encode
+
+    def counting_encode(texts: Any, **kwargs: Any) -> np.ndarray:
+        encoded[0] += 1 if isinstance(texts, str) else len(texts)
+        return encode(texts, **kwargs)
+
+    generator.model.encode = counting_encode
+    return encoded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=5000)
+    parser.add_argument("--skills", type=int, default=4)
+    parser.add_argument("--topics", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--max-results", type=int, default=10)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--schemas", default="full;combined;parts")
+    parser.add_argument("--model", default="")
+    args = parser.parse_args()
+
+    cards, queries, targets = make_cards(args)
+    print(
+        f"{args.agents} agents x {args.skills} skills, {len(queries)} queries, "
+        f"{'model ' + args.model if args.model else 'hashing embeddings'}"
+    )
+    print(
+        f"{'schema':<10} {'vectors':>9} {'texts':>9} {'embed s':>8} "
+        f"{'index MB':>9} {'two-stage':>10} {'single':>10} "
+        f"{'hit@' + str(args.max_results):>7}"
+    )
+    for spec in args.schemas.split(";"):
+        schema = FieldSchema.parse(spec)
+        generator = VectorGenerator(
+            args.model,
+            field_schema=schema,
+            backend="sentence-transformers" if args.model else "hashing",
+        )
+        encoded = count_encoded_texts(generator)
+        start = time.perf_counter()
+        agents_vectors = generator.generate_agents_vectors(cards)
+        embed_seconds = time.perf_counter() - start
+        texts = encoded[0]
+        store = FAISSVectorStore(
+            vector_dimensions=generator.vector_dimensions or DIMS,
+            segment_size=10**7,
+            field_weights=schema.weights if schema.weighted else None,
+        )
+        store.add_agents_vectors(agents_vectors)
+        query_vectors = generator.generate_query_vectors(queries)
+
+        search = {
+            "max_results": args.max_results,
+            "similarity_threshold": args.threshold,
+        }
+        start = time.perf_counter()
+        two_stage = [
+            store.search_agents_by_centroid([query], candidates=100, **search)[0]
+            for query in query_vectors
+        ]
+        two_stage_ms = (time.perf_counter() - start) / len(queries) * 1000
+        start = time.perf_counter()
+        for query in query_vectors:
+            store.search_ranked_agents([query], k=args.max_results * 10, **search)
+        single_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        hits = np.mean(
+            [
+                target in {agent for agent, _ in ranked}
+                for target, ranked in zip(targets, two_stage, strict=True)
+            ]
+        )
+        stats = store.get_stats()
+        label = spec if len(spec) <= 10 else "custom"
+        print(
+            f"{label:<10} {stats['total_vectors']:>9} {texts:>9} "
+            f"{embed_seconds:>8.2f} {stats['memory_usage_mb']:>9.1f} "
+            f"{two_stage_ms:>8.2f}ms {single_ms:>8.2f}ms {hits:>7.3f}"
+        )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark FileStorage registrations/sec: full-rewrite vs. write-ahead journal.
+
+Pre-populates a registry, then re-registers (heartbeats) a sample of agents
+sequentially and with concurrent clients.
+
+Usage:
+    python benchmarks/bench_file_storage.py --agents 20000 --heartbeats 500
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from a2a_registry.storage import FileStorage  # noqa: E402
+
+
+def make_agent_card(i: int) -> dict:
+    return {
+        "name": f"agent-{i:06d}",
+        "description": f"Benchmark agent number {i} providing planning and analysis",
+        "url": f"https://agents.example.com/{i}",
+        "version": "1.0.0",
+        "protocol_version": "0.3.0",
+        "skills": [
+            {"id": f"skill-{i % 97}", "description": "Strategic planning"},
+            {"id": f"skill-{i % 13}", "description": "Market analysis"},
+        ],
+    }
+
+
+async def run_case(
+    label: str, journal: bool, agents: int, heartbeats: int, concurrency: int
+) -> None:
+    with tempfile.TemporaryDirectory() as data_dir:
+        # Seed the registry with a snapshot so both modes start from the same state
+        seed = FileStorage(data_dir)
+        seed._agents = {f"agent-{i:06d}": make_agent_card(i) for i in range(agents)}
+        seed._save_agents()
+
+        storage = FileStorage(data_dir, journal=journal)
+        cards = [make_agent_card(i * 7 % agents) for i in range(heartbeats)]
+
+        start = time.perf_counter()
+        if concurrency <= 1:
+            for card in cards:
+                await storage.register_agent(card)
+        else:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def register(card: dict) -> None:
+                async with semaphore:
+                    await storage.register_agent(card)
+
+            await asyncio.gather(*(register(card) for card in cards))
+        elapsed = time.perf_counter() - start
+        storage.close()
+
+        print(
+            f"{label:<28} concurrency={concurrency:<4} "
+            f"{heartbeats / elapsed:>10.1f} registrations/sec "
+            f"({elapsed * 1000 / heartbeats:.3f} ms/op)"
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=20000)
+    parser.add_argument("--heartbeats", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"Registry size: {args.agents} agents, {args.heartbeats} re-registrations")
+    for concurrency in (1, args.concurrency):
+        await run_case("full rewrite", False, args.agents, args.heartbeats, concurrency)
+        await run_case(
+            "journal (group commit)", True, args.agents, args.heartbeats, concurrency
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark keyword search_agents latency as the registry grows.
+
+Compares the inverted index used by the storage backends with the previous
+O(N) lower-case substring scan. Index cost is proportional to the number of
+trigram candidates, so the average match count is reported alongside.
+
+Usage:
+    python benchmarks/bench_keyword_search.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import functools
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from a2a_registry.search_index import KeywordIndex  # noqa: E402
+
+SYLLABLES = "ka lo mi ren tus va pel dor ix an qua ber sol tri nek zu fa".split()
+
+
+def make_vocabulary(rng: random.Random, size: int) -> list[str]:
+    return ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(size)]
+
+
+def make_agent_card(i: int, rng: random.Random, words: list[str]) -> dict:
+    return {
+        "name": f"agent-{i:06d}-{rng.choice(words)}",
+        "description": " ".join(rng.choices(words, k=12)),
+        "skills": [{"id": f"{rng.choice(words)}_{j}"} for j in range(3)],
+    }
+
+
+def scan(agents: list[dict], query: str) -> list[dict]:
+    query_lower = query.lower()
+    return [
+        agent
+        for agent in agents
+        if query_lower in agent.get("name", "").lower()
+        or query_lower in agent.get("description", "").lower()
+        or any(
+            query_lower in skill.get("id", "").lower()
+            for skill in agent.get("skills", [])
+        )
+    ]
+
+
+def time_queries(fn, queries: list[str], repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - start) * 1000 / (repeats * len(queries))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    words = make_vocabulary(rng, args.vocabulary)
+    # Whole words, word prefixes, substrings and a miss
+    queries = [rng.choice(words) for _ in range(4)]
+    queries += [rng.choice(words)[:5] for _ in range(2)]
+    queries += [rng.choice(words)[1:6] for _ in range(2)]
+    queries += ["xyzzy"]
+    print(
+        f"{'agents':>8} {'matches':>8} {'scan ms':>10} {'index ms':>10} "
+        f"{'index top-k ms':>15}"
+    )
+    for size in args.sizes:
+        agents = [make_agent_card(i, rng, words) for i in range(size)]
+        index = KeywordIndex()
+        for agent in agents:
+            index.add(agent["name"], agent)
+
+        scan_ms = time_queries(functools.partial(scan, agents), queries, args.repeats)
+        index_ms = time_queries(index.search, queries, args.repeats)
+        topk_ms = time_queries(
+            functools.partial(index.search, limit=args.limit), queries, args.repeats
+        )
+        matches = sum(len(index.search(q)) for q in queries) / len(queries)
+        print(
+            f"{size:>8} {matches:>8.0f} {scan_ms:>10.3f} {index_ms:>10.3f} "
+            f"{topk_ms:>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent semantic query encoding.
+
+Fires ``--queries`` concurrent query encodings and compares encoding each one
+synchronously inside the coroutine (the previous behavior) with the
+micro-batching QueryEncoder. A heartbeat coroutine measures how long the
+event loop stalls, which is what ``/health`` would see.
+
+Without ``--model`` the transformer is simulated: each call costs
+``--call-ms`` plus ``--per-query-ms`` per query, as a forward pass does.
+
+Usage:
+    python benchmarks/bench_query_encoder.py --queries 200
+    python benchmarks/bench_query_encoder.py --model all-MiniLM-L6-v2
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from a2a_registry.proto.generated.registry_pb2 import Vector  # noqa: E402
+from a2a_registry.query_encoder import QueryEncoder  # noqa: E402
+
+
+def simulated_encoder(args: argparse.Namespace) -> Callable[[list[str]], list[Vector]]:
+    def encode_batch(queries: list[str]) -> list[Vector]:
+        time.sleep((args.call_ms + args.per_query_ms * len(queries)) / 1000)
+        return [Vector(values=[0.0], field_content=q) for q in queries]
+
+    return encode_batch
+
+
+async def measure(label: str, encode: Callable, queries: list[str]) -> None:
+    max_gap = 0.0
+
+    async def heartbeat() -> None:
+        nonlocal max_gap
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            max_gap = max(max_gap, now - last)
+            last = now
+
+    beat = asyncio.ensure_future(heartbeat())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(encode(q) for q in queries))
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.005)  # let the heartbeat observe the last stall
+    beat.cancel()
+    print(
+        f"{label:<16} {len(queries) / elapsed:>9.1f} queries/s  "
+        f"max event-loop stall {max_gap * 1000:>8.1f} ms"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    if args.model:
+        from a2a_registry.vector_generator import VectorGenerator
+
+        encode_batch = VectorGenerator(args.model).generate_query_vectors
+    else:
+        encode_batch = simulated_encoder(args)
+
+    queries = [f"agent that can do task number {i}" for i in range(args.queries)]
+
+    async def blocking(query: str) -> Vector:
+        return encode_batch([query])[0]
+
+    await measure("synchronous", blocking, queries)
+
+    encoder = QueryEncoder(
+        encode_batch, max_batch_size=args.batch_size, max_wait_ms=args.wait_ms
+    )
+    await measure("micro-batched", encoder.encode, queries)
+    stats = encoder.get_stats()
+    encoder.close()
+    print(
+        f"batches: {stats['batches']}, mean batch size {stats['mean_batch_size']:.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--wait-ms", type=float, default=2.0)
+    parser.add_argument("--call-ms", type=float, default=8.0)
+    parser.add_argument("--per-query-ms", type=float, default=0.5)
+    parser.add_argument("--model", help="Use a real sentence-transformers model")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Benchmark FAISSVectorStore startup from a saved index.
+
+Saves a store of ``--vectors`` random vectors, then opens it again in fresh
+subprocesses and reports the time until the store is loaded and until the
+first search returns, plus the resident memory of the loading process (Linux). The
+index is memory-mapped, so load time and memory should stay flat as
+``--vectors`` grows; pages are only read (and shared through the page cache)
+as searches touch them.
+
+Then re-registers ``--changes`` of the agents and times the next flush, which
+writes only a new segment and tombstones: its cost and bytes written follow
+the change rate, not the index size.
+
+Usage:
+    python benchmarks/bench_vector_persistence.py --vectors 200000 --dims 384
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+SRC = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from a2a_registry.proto.generated.registry_pb2 import Vector  # noqa: E402
+from a2a_registry.vector_store import FAISSVectorStore  # noqa: E402
+
+VECTORS_PER_AGENT = 10
+
+# Runs in a fresh interpreter so nothing is shared with the writer
+LOADER = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+from a2a_registry.vector_store import FAISSVectorStore
+from a2a_registry.proto.generated.registry_pb2 import Vector
+
+started = time.perf_counter()
+store = FAISSVectorStore(
+    vector_dimensions={dims}, persist_path={path!r}, index_type={index_type!r}
+)
+loaded = time.perf_counter()
+store.search_agent_scores(
+    Vector(values=[1.0] * {dims}), k=10, similarity_threshold=-1.0
+)
+searched = time.perf_counter()
+print(json.dumps({{
+    "vectors": store.get_stats()["total_vectors"],
+    "load_ms": (loaded - started) * 1000,
+    "first_search_ms": (searched - loaded) * 1000,
+    "rss_mb": int(
+        open("/proc/self/status").read().split("VmRSS:")[1].split()[0]
+    ) / 1024,
+}}))
+"""
+
+
+def disk_usage(path: str) -> int:
+    return sum(f.stat().st_size for f in Path(path).rglob("*") if f.is_file())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--vectors", type=int, default=200000)
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--index-type", default="flat")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--changes", type=float, default=0.01)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    rows = rng.standard_normal((args.vectors, args.dims), dtype=np.float32)
+    store_args = {"vector_dimensions": args.dims, "index_type": args.index_type}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "index")
+        store = FAISSVectorStore(persist_path=path, **store_args)
+        agents_vectors: dict[str, list[Vector]] = {}
+        for i, row in enumerate(rows):
+            agent_id = f"agent-{i // VECTORS_PER_AGENT}"
+            agents_vectors.setdefault(agent_id, []).append(
+                Vector(
+                    values=row.tolist(),
+                    agent_id=agent_id,
+                    field_path=f"skills[{i % VECTORS_PER_AGENT}].description",
+                    field_content=f"Skill {i % 1000} of {agent_id}",
+                )
+            )
+        store.add_agents_vectors(agents_vectors)
+        del agents_vectors
+
+        started = time.perf_counter()
+        store.save_index()
+        size = disk_usage(path)
+        print(
+            f"Saved {args.vectors} x {args.dims} vectors "
+            f"({size / 1024 / 1024:.1f} MB) in {time.perf_counter() - started:.2f}s"
+        )
+
+        script = LOADER.format(
+            src=str(SRC), dims=args.dims, path=path, index_type=args.index_type
+        )
+        print(f"{'run':>4} {'load ms':>9} {'1st search ms':>14} {'RSS MB':>11}")
+        for run in range(args.runs):
+            output = subprocess.run(
+                [sys.executable, "-c", script],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            assert result["vectors"] == args.vectors
+            print(
+                f"{run + 1:>4} {result['load_ms']:>9.1f} "
+                f"{result['first_search_ms']:>14.1f} {result['rss_mb']:>11.1f}"
+            )
+
+        agents = args.vectors // VECTORS_PER_AGENT
+        changed = rng.choice(
+            agents, size=max(1, int(agents * args.changes)), replace=False
+        )
+        store.add_agents_vectors(
+            {
+                f"agent-{i}": [
+                    Vector(
+                        values=row.tolist(),
+                        agent_id=f"agent-{i}",
+                        field_path="description",
+                        field_content=f"Updated agent-{i}",
+                    )
+                    for row in rng.standard_normal(
+                        (VECTORS_PER_AGENT, args.dims), dtype=np.float32
+                    )
+                ]
+                for i in changed
+            }
+        )
+        before = {f: f.stat().st_mtime_ns for f in Path(path).rglob("*")}
+        started = time.perf_counter()
+        store.flush()
+        elapsed = time.perf_counter() - started
+        written = sum(
+            f.stat().st_size
+            for f in Path(path).rglob("*")
+            if f.is_file() and before.get(f) != f.stat().st_mtime_ns
+        )
+        print(
+            f"Flushed {len(changed)} re-registered agents "
+            f"({written / 1024:.1f} KB written) in {elapsed * 1000:.1f} ms"
+        )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark re-registering agents in FAISSVectorStore.
+
+Builds an index of ``--agents`` x ``--vectors-per-agent`` random vectors, then
+re-registers ``--fraction`` of the agents one by one. Compares the segmented
+store (old vectors tombstoned, new ones added to the mutable segment) with
+rebuilding the whole index from every other agent on each update.
+Also reports search latency for ``--k`` hits.
+
+Usage:
+    python benchmarks/bench_vector_store.py --agents 10000 --vectors-per-agent 10
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from a2a_registry.proto.generated.registry_pb2 import Vector  # noqa: E402
+from a2a_registry.vector_store import FAISSVectorStore  # noqa: E402
+
+
+class RebuildVectorStore(FAISSVectorStore):
+    """Previous behavior: every removal rebuilds the index from all vectors."""
+
+    def _remove_agents(self, agent_ids):
+        super()._remove_agents(agent_ids)
+        self._seal()
+        snapshot = [
+            (segment, live, segment.agent_codes(live))
+            for segment in self.segments
+            for live in [segment.live_ids()]
+        ]
+        if snapshot:
+            self._install_merge(snapshot, self._build_merge(snapshot, None))
+
+
+def make_vectors(rng: np.random.Generator, agent_id: str, count: int, dims: int):
+    values = rng.random((count, dims), dtype=np.float32)
+    return [
+        Vector(values=row.tolist(), agent_id=agent_id, field_path=f"field[{i}]")
+        for i, row in enumerate(values)
+    ]
+
+
+def run(label: str, store_cls, args: argparse.Namespace) -> FAISSVectorStore:
+    rng = np.random.default_rng(42)
+    store = store_cls(vector_dimensions=args.dims)
+    store.add_agents_vectors(
+        {
+            f"agent-{i}": make_vectors(
+                rng, f"agent-{i}", args.vectors_per_agent, args.dims
+            )
+            for i in range(args.agents)
+        }
+    )
+
+    updates = max(1, int(args.agents * args.fraction))
+    agent_ids = rng.choice(args.agents, size=updates, replace=False)
+    new_vectors = [
+        (
+            f"agent-{i}",
+            make_vectors(rng, f"agent-{i}", args.vectors_per_agent, args.dims),
+        )
+        for i in agent_ids
+    ]
+
+    start = time.perf_counter()
+    for agent_id, vectors in new_vectors:
+        store.add_agent_vectors(agent_id, vectors)
+    elapsed = time.perf_counter() - start
+
+    assert store.get_stats()["total_vectors"] == args.agents * args.vectors_per_agent
+    print(
+        f"{label:<22} {updates:>6} updates in {elapsed:>8.3f}s "
+        f"({elapsed * 1000 / updates:>8.3f} ms/update)"
+    )
+    return store
+
+
+def run_search(store: FAISSVectorStore, args: argparse.Namespace) -> None:
+    rng = np.random.default_rng(7)
+    queries = make_vectors(rng, "query", 20, args.dims)
+    start = time.perf_counter()
+    for query in queries:
+        store.search_similar_vectors(query, k=args.k, similarity_threshold=-1.0)
+    elapsed = time.perf_counter() - start
+    print(f"search k={args.k:<4} {elapsed * 1000 / len(queries):>8.3f} ms/query")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agents", type=int, default=10000)
+    parser.add_argument("--vectors-per-agent", type=int, default=10)
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--fraction", type=float, default=0.01)
+    parser.add_argument("--k", type=int, default=100)
+    args = parser.parse_args()
+
+    total = args.agents * args.vectors_per_agent
+    print(f"Index size: {total} vectors, re-registering {args.fraction:.1%} of agents")
+    store = run("segments + tombstones", FAISSVectorStore, args)
+    run_search(store, args)
+    run("full rebuild", RebuildVectorStore, args)
+
+
+if __name__ == "__main__":
+    main()
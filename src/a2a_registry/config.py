@@ -43,6 +43,118 @@ class RegistryConfig:
         self.storage_type = os.getenv("STORAGE_TYPE", "memory").lower()
         self.storage_data_dir = os.getenv("STORAGE_DATA_DIR", "/data")
 
+        # Write-ahead journal for file storage (group commit + compaction)
+        self.storage_journal = os.getenv("STORAGE_JOURNAL", "false").lower() == "true"
+        self.storage_journal_commit_interval_ms = float(
+            os.getenv("STORAGE_JOURNAL_COMMIT_INTERVAL_MS", "2")
+        )
+        self.storage_journal_max_batch_size = int(
+            os.getenv("STORAGE_JOURNAL_MAX_BATCH_SIZE", "512")
+        )
+        self.storage_journal_compact_threshold = int(
+            os.getenv("STORAGE_JOURNAL_COMPACT_THRESHOLD", "10000")
+        )
+
+        # Agent cards kept in memory by the SQLite backend (LRU)
+        self.storage_sqlite_cache_size = int(
+            os.getenv("STORAGE_SQLITE_CACHE_SIZE", "10000")
+        )
+
+        # Vector search configuration
+        self.vector_embedding_batch_size = int(
+            os.getenv("VECTOR_EMBEDDING_BATCH_SIZE", "64")
+        )
+
+        # Embedded card fields: a preset (full, combined, parts), or a JSON list
+        # of field kinds or object of field kind -> scoring weight, inline or in
+        # a file; agents are re-indexed on startup when the fields change
+        self.vector_field_schema = os.getenv("VECTOR_FIELD_SCHEMA", "full")
+
+        # Embedding backend: sentence-transformers, onnx (ONNX Runtime on CPU,
+        # int8-quantized unless ONNX_QUANTIZE is false) or hashing (feature
+        # hashing into HASHING_DIMENSIONS values; no model, instant startup)
+        self.vector_embedding_backend = os.getenv(
+            "VECTOR_EMBEDDING_BACKEND", "sentence-transformers"
+        ).lower()
+        self.vector_onnx_quantize = (
+            os.getenv("VECTOR_ONNX_QUANTIZE", "true").lower() == "true"
+        )
+        self.vector_hashing_dimensions = int(
+            os.getenv("VECTOR_HASHING_DIMENSIONS", "384")
+        )
+
+        # Worker processes embedding bulk registrations (0 embeds in-process)
+        self.vector_embedding_workers = int(os.getenv("VECTOR_EMBEDDING_WORKERS", "0"))
+
+        # Embedding cache: in-memory LRU rows, plus an on-disk directory that
+        # keeps embeddings across restarts (opt-in, unset keeps them in memory)
+        self.vector_embedding_cache_size = int(
+            os.getenv("VECTOR_EMBEDDING_CACHE_SIZE", "10000")
+        )
+        self.vector_embedding_cache_dir = os.getenv("VECTOR_EMBEDDING_CACHE_DIR", "")
+
+        # FAISS index: flat (exact), or hnsw, ivf or ivfpq for merged segments
+        # of at least ANN_THRESHOLD vectors (IVF is trained at each merge)
+        self.vector_index_type = os.getenv("VECTOR_INDEX_TYPE", "flat").lower()
+        self.vector_ann_threshold = int(os.getenv("VECTOR_ANN_THRESHOLD", "10000"))
+        self.vector_hnsw_m = int(os.getenv("VECTOR_HNSW_M", "32"))
+        self.vector_hnsw_ef_search = int(os.getenv("VECTOR_HNSW_EF_SEARCH", "128"))
+        self.vector_ivf_nlist = int(os.getenv("VECTOR_IVF_NLIST", "0"))
+        self.vector_ivf_nprobe = int(os.getenv("VECTOR_IVF_NPROBE", "16"))
+        self.vector_pq_m = int(os.getenv("VECTOR_PQ_M", "16"))
+        # Embedding precision in the index: float32, fp16 or sq8
+        self.vector_storage = os.getenv("VECTOR_STORAGE", "float32").lower()
+
+        # Index segments: persisted under INDEX_PATH (empty keeps the index in
+        # memory), the mutable segment is sealed after SEGMENT_SIZE vectors,
+        # MERGE_FACTOR similar segments are merged, and new segments and
+        # tombstones are flushed every FLUSH_INTERVAL_S seconds by a background
+        # thread (0 flushes only when vectors are saved on shutdown)
+        self.vector_index_path = os.getenv("VECTOR_INDEX_PATH", "data/vectors/index")
+        self.vector_segment_size = int(os.getenv("VECTOR_SEGMENT_SIZE", "10000"))
+        self.vector_segment_merge_factor = int(
+            os.getenv("VECTOR_SEGMENT_MERGE_FACTOR", "10")
+        )
+        self.vector_flush_interval_s = float(os.getenv("VECTOR_FLUSH_INTERVAL_S", "5"))
+
+        # Two-stage search: agents re-ranked per query after the coarse
+        # centroid index (0 ranks the top field vector hits instead)
+        self.vector_centroid_candidates = int(
+            os.getenv("VECTOR_CENTROID_CANDIDATES", "100")
+        )
+
+        # Filtered search: exact scoring of the filtered agents' vectors when
+        # they are at most this fraction of the index, else ANN with growing k
+        self.vector_filter_exact_selectivity = float(
+            os.getenv("VECTOR_FILTER_EXACT_SELECTIVITY", "0.05")
+        )
+
+        # Background indexing: registrations return before vectors are built
+        self.vector_async_indexing = (
+            os.getenv("VECTOR_ASYNC_INDEXING", "true").lower() == "true"
+        )
+        self.vector_index_batch_size = int(os.getenv("VECTOR_INDEX_BATCH_SIZE", "256"))
+        self.vector_index_wait_timeout_ms = float(
+            os.getenv("VECTOR_INDEX_WAIT_TIMEOUT_MS", "5000")
+        )
+
+        # Query encoder micro-batching (max queries per batch, max wait)
+        self.vector_query_batch_size = int(os.getenv("VECTOR_QUERY_BATCH_SIZE", "32"))
+        self.vector_query_batch_wait_ms = float(
+            os.getenv("VECTOR_QUERY_BATCH_WAIT_MS", "2")
+        )
+
+        # Search caches: query embeddings and ranked results (0 disables); the
+        # HOT_QUERIES most frequent queries are saved to pre-warm the next run
+        self.vector_query_cache_size = int(os.getenv("VECTOR_QUERY_CACHE_SIZE", "1024"))
+        self.vector_result_cache_size = int(
+            os.getenv("VECTOR_RESULT_CACHE_SIZE", "1024")
+        )
+        self.vector_hot_queries = int(os.getenv("VECTOR_HOT_QUERIES", "256"))
+        self.vector_hot_queries_path = os.getenv(
+            "VECTOR_HOT_QUERIES_PATH", "data/vectors/hot_queries.json"
+        )
+
     @property
     def is_production_mode(self) -> bool:
         """Check if registry is running in production mode."""
@@ -0,0 +1,292 @@
+"""Embedding backends: the models that turn texts into vectors."""
+
+import json
+import logging
+import math
+import re
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BACKENDS = ("sentence-transformers", "onnx", "hashing")
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class EmbeddingBackend(ABC):
+    """Embeds texts into float32 vectors.
+
+    The interface is the subset of ``SentenceTransformer`` the registry uses,
+    so sentence-transformers models are backends as they are.
+    """
+
+    @abstractmethod
+    def get_sentence_embedding_dimension(self) -> int:
+        """Number of values per embedding."""
+
+    @abstractmethod
+    def encode(
+        self, sentences: str | list[str], batch_size: int = 32, **kwargs: Any
+    ) -> np.ndarray:
+        """Embed one text (1-D result) or a list of texts (one row per text).
+
+        Args:
+            sentences: Text or texts to embed
+            batch_size: Texts per inference call
+            **kwargs: Accepted for ``SentenceTransformer`` compatibility
+
+        Returns:
+            float32 embeddings
+        """
+
+
+def load_sentence_transformer(model_name: str) -> Any:
+    """Load a sentence-transformers model (imported on first use)."""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+@lru_cache(maxsize=1 << 16)
+def _hashed_feature(feature: str, dimensions: int) -> tuple[int, float]:
+    """Bucket and sign of a feature; stable across processes, unlike hash()."""
+    digest = zlib.crc32(feature.encode("utf-8"))
+    return digest % dimensions, 1.0 if digest >> 31 else -1.0
+
+
+class HashingEmbedder(EmbeddingBackend):
+    """Feature-hashing embedder: no model files, no dependencies, no startup.
+
+    A text's features are its lowercase words and, for words of three or
+    more characters, their character trigrams (with word boundary markers),
+    so inflections and compound words share features. Each feature is
+    hashed to one of ``dimensions`` buckets with a random sign, so
+    collisions cancel out on average, and weighted by 1 + log(count), times
+    ``trigram_weight`` for trigrams. The vector is L2-normalized.
+
+    Texts with overlapping wording get similar vectors, synonyms do not: this
+    is approximate, lexical semantic search for tests and edge deployments.
+    """
+
+    def __init__(self, dimensions: int = 384, trigram_weight: float = 0.2) -> None:
+        """Initialize the embedder.
+
+        Args:
+            dimensions: Number of hash buckets (embedding size)
+            trigram_weight: Weight of a character trigram relative to a word
+        """
+        self.dimensions = max(dimensions, 1)
+        self.trigram_weight = trigram_weight
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimensions
+
+    def _features(self, text: str) -> tuple[Counter[str], Counter[str]]:
+        """Word and character trigram counts of a text."""
+        words = Counter(_WORD_PATTERN.findall(text.lower()))
+        trigrams: Counter[str] = Counter()
+        if self.trigram_weight > 0:
+            for word, count in words.items():
+                if len(word) >= 3:
+                    marked = f"<{word}>"
+                    for i in range(len(marked) - 2):
+                        trigrams["#" + marked[i : i + 3]] += count
+        return words, trigrams
+
+    def encode(
+        self, sentences: str | list[str], batch_size: int = 32, **kwargs: Any
+    ) -> np.ndarray:
+        if isinstance(sentences, str):
+            return np.asarray(self.encode([sentences])[0])
+        # Scatter every (text, bucket, value) of the batch with one add
+        rows: list[int] = []
+        buckets: list[int] = []
+        values: list[float] = []
+        for row, text in enumerate(sentences):
+            words, trigrams = self._features(text)
+            for features, scale in ((words, 1.0), (trigrams, self.trigram_weight)):
+                for feature, count in features.items():
+                    bucket, sign = _hashed_feature(feature, self.dimensions)
+                    rows.append(row)
+                    buckets.append(bucket)
+                    values.append(sign * scale * (1.0 + math.log(count)))
+        matrix = np.zeros((len(sentences), self.dimensions), dtype=np.float32)
+        np.add.at(matrix, (rows, buckets), values)
+        matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        return matrix
+
+
+class OnnxEmbedder(EmbeddingBackend):
+    """A sentence-transformers model run with ONNX Runtime on the CPU.
+
+    Uses ``onnx/model.onnx`` (or ``model.onnx``) and ``tokenizer.json`` from
+    a local directory or a Hugging Face repo (``sentence-transformers/<name>``
+    for bare model names). With ``quantize`` an int8 copy is made once with
+    ONNX Runtime's dynamic quantization and run instead: int8 weights, with
+    activations quantized per batch. Token embeddings are mean-pooled over
+    the attention mask and L2-normalized, as in the default
+    sentence-transformers models.
+
+    Needs the ``onnx`` extra (onnxruntime and tokenizers).
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        quantize: bool = True,
+        max_length: int = 256,
+        threads: int = 0,
+    ) -> None:
+        """Load the model.
+
+        Args:
+            model_name: Model directory, Hugging Face repo id or model name
+            quantize: Run the int8 dynamically quantized model
+            max_length: Tokens per text (longer texts are truncated)
+            threads: ONNX Runtime intra-op threads (0 lets it decide)
+        """
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        directory = self._resolve(model_name)
+        model_path = directory / "onnx" / "model.onnx"
+        if not model_path.exists():
+            model_path = directory / "model.onnx"
+        if quantize:
+            model_path = self._quantized(model_path)
+
+        options = ort.SessionOptions()
+        if threads > 0:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(
+            str(model_path), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {
+            model_input.name for model_input in self.session.get_inputs()
+        }
+
+        self.tokenizer = Tokenizer.from_file(str(directory / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length)
+        if self.tokenizer.padding is None:
+            self.tokenizer.enable_padding()
+
+        width = self.session.get_outputs()[0].shape[-1]
+        if not isinstance(width, int):
+            width = json.loads((directory / "config.json").read_text())["hidden_size"]
+        self.dimensions: int = width
+        logger.info(f"Loaded ONNX embedding model {model_path} ({width} dimensions)")
+
+    @staticmethod
+    def _resolve(model_name: str) -> Path:
+        """Local directory holding the model files, downloaded if needed."""
+        if Path(model_name).is_dir():
+            return Path(model_name)
+        from huggingface_hub import snapshot_download
+
+        repo_id = (
+            model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        )
+        return Path(
+            snapshot_download(
+                repo_id,
+                allow_patterns=[
+                    "onnx/model.onnx",
+                    "model.onnx",
+                    "tokenizer.json",
+                    "config.json",
+                ],
+            )
+        )
+
+    @staticmethod
+    def _quantized(model_path: Path) -> Path:
+        """Int8 dynamically quantized copy of ``model_path``, made once."""
+        quantized = model_path.with_name(f"{model_path.stem}_int8_dynamic.onnx")
+        if not quantized.exists():
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            staging = quantized.with_suffix(".tmp")
+            quantize_dynamic(model_path, staging, weight_type=QuantType.QInt8)
+            staging.replace(quantized)
+            logger.info(f"Quantized {model_path} to int8 at {quantized}")
+        return quantized
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimensions
+
+    def encode(
+        self, sentences: str | list[str], batch_size: int = 32, **kwargs: Any
+    ) -> np.ndarray:
+        if isinstance(sentences, str):
+            return np.asarray(self.encode([sentences], batch_size)[0])
+        rows = [np.empty((0, self.dimensions), dtype=np.float32)]
+        for start in range(0, len(sentences), max(batch_size, 1)):
+            encodings = self.tokenizer.encode_batch(
+                sentences[start : start + batch_size]
+            )
+            mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+            feeds = {
+                "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+                "attention_mask": mask,
+            }
+            if "token_type_ids" in self.input_names:
+                feeds["token_type_ids"] = np.array(
+                    [e.type_ids for e in encodings], dtype=np.int64
+                )
+            tokens = self.session.run(None, feeds)[0]
+            pooled = (tokens * mask[..., None]).sum(axis=1) / np.maximum(
+                mask.sum(axis=1, keepdims=True), 1
+            )
+            pooled /= np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+            rows.append(pooled.astype(np.float32))
+        return np.concatenate(rows)
+
+
+def embedding_model_id(
+    backend: str, model_name: str, dimensions: int = 384, quantize: bool = True
+) -> str:
+    """Name of the embeddings a backend produces, for caches and metadata.
+
+    Embeddings of different backends (or an int8 model) are not
+    interchangeable, so each gets its own name.
+    """
+    if backend == "hashing":
+        return f"feature-hashing-{dimensions}"
+    if backend == "onnx":
+        return f"{model_name}-onnx{'-int8' if quantize else ''}"
+    return model_name
+
+
+def load_embedding_backend(
+    backend: str, model_name: str, dimensions: int = 384, quantize: bool = True
+) -> Any:
+    """Load an embedding backend.
+
+    A ``functools.partial`` of this function, without the model name, is the
+    ``EmbeddingExecutor`` model loader for the same backend.
+
+    Args:
+        backend: One of ``EMBEDDING_BACKENDS``
+        model_name: Model of the sentence-transformers and onnx backends
+        dimensions: Embedding size of the hashing backend
+        quantize: Run the onnx backend's int8 quantized model
+
+    Returns:
+        The backend (an ``EmbeddingBackend`` or ``SentenceTransformer``)
+    """
+    if backend == "sentence-transformers":
+        return load_sentence_transformer(model_name)
+    if backend == "onnx":
+        return OnnxEmbedder(model_name, quantize=quantize)
+    if backend == "hashing":
+        return HashingEmbedder(dimensions)
+    raise ValueError(
+        f"Unknown embedding backend {backend!r}, expected one of {EMBEDDING_BACKENDS}"
+    )
@@ -0,0 +1,219 @@
+"""Two-tier cache of text embeddings keyed by model name and content hash."""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Cache of text embeddings for one embedding model.
+
+    Entries are keyed by the SHA-256 of the text (see
+    ``vector_generator.text_content_hash``); the model name selects the cache
+    directory, so different models never share rows.
+
+    The first tier is an in-memory LRU of ``memory_size`` rows. The second
+    tier is an append-only file of float32 rows (``embeddings.f32``) read
+    through ``numpy.memmap``, plus ``keys.txt`` holding one hash per row. Rows
+    are written before their keys, so a torn append is ignored on load.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        vector_dimensions: int,
+        cache_dir: str | Path | None = None,
+        memory_size: int = 10000,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            model_name: Embedding model the cached rows belong to
+            vector_dimensions: Number of float32 values per embedding
+            cache_dir: Root directory of the on-disk tier (None keeps memory only)
+            memory_size: Maximum number of embeddings in the in-memory LRU
+        """
+        self.model_name = model_name
+        self.vector_dimensions = vector_dimensions
+        self.memory_size = max(memory_size, 0)
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._disk_rows: dict[str, int] = {}
+        self._row_count = 0
+        self._mmap: np.memmap | None = None
+        self._lock = threading.Lock()
+
+        self.cache_dir: Path | None = None
+        if cache_dir is not None:
+            safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+            self.cache_dir = Path(cache_dir) / f"{safe_name}-{vector_dimensions}"
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._load_keys()
+
+    @property
+    def _data_path(self) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / "embeddings.f32"
+
+    @property
+    def _keys_path(self) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / "keys.txt"
+
+    def _load_keys(self) -> None:
+        """Index the rows of the on-disk tier."""
+        if not self._keys_path.exists() and not self._data_path.exists():
+            return
+        row_bytes = self.vector_dimensions * 4
+        rows = 0
+        if self._data_path.exists():
+            rows = self._data_path.stat().st_size // row_bytes
+        keys: list[str] = []
+        if self._keys_path.exists():
+            with open(self._keys_path, encoding="ascii") as f:
+                keys = [line.strip() for line in f]
+        # Keys without a complete row (torn append) and rows without a key
+        # are dropped
+        keys = keys[:rows]
+        # A blank key keeps its row's position but is never looked up
+        self._disk_rows = {key: row for row, key in enumerate(keys) if key}
+        self._row_count = len(keys)
+        # Rewrite to drop a torn tail so later appends stay aligned
+        with open(self._keys_path, "w", encoding="ascii") as f:
+            f.writelines(f"{key}\n" for key in keys)
+        self._truncate_data(len(keys))
+        logger.info(
+            f"Loaded {len(self._disk_rows)} cached embeddings from {self.cache_dir}"
+        )
+
+    def _truncate_data(self, rows: int) -> None:
+        """Cut the data file down to ``rows`` rows (creating it if missing)."""
+        with open(self._data_path, "ab") as f:
+            f.truncate(rows * self.vector_dimensions * 4)
+
+    def _disk_get(self, key: str) -> np.ndarray | None:
+        row = self._disk_rows.get(key)
+        if row is None:
+            return None
+        if self._mmap is None or row >= self._mmap.shape[0]:
+            self._mmap = np.memmap(
+                self._data_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(self._row_count, self.vector_dimensions),
+            )
+        return np.array(self._mmap[row])
+
+    def _memory_put(self, key: str, embedding: np.ndarray) -> None:
+        if self.memory_size == 0:
+            return
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, np.ndarray]:
+        """Look up embeddings.
+
+        Args:
+            keys: Content hashes of the texts
+
+        Returns:
+            Mapping of the keys found in either tier to their embeddings
+        """
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                if key in found:
+                    continue
+                embedding = self._memory.get(key)
+                if embedding is not None:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    found[key] = embedding
+                    continue
+                embedding = self._disk_get(key)
+                if embedding is not None:
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self._memory_put(key, embedding)
+                    found[key] = embedding
+                    continue
+                self.misses += 1
+        return found
+
+    def put_many(self, entries: dict[str, np.ndarray]) -> None:
+        """Store embeddings in both tiers.
+
+        Args:
+            entries: Mapping of content hash to embedding
+        """
+        with self._lock:
+            new_rows: dict[str, np.ndarray] = {}
+            for key, embedding in entries.items():
+                embedding = np.asarray(embedding, dtype=np.float32)
+                self._memory_put(key, embedding)
+                if self.cache_dir is not None and key not in self._disk_rows:
+                    new_rows[key] = embedding
+            if not new_rows:
+                return
+            keys_size = (
+                self._keys_path.stat().st_size if self._keys_path.exists() else 0
+            )
+            try:
+                # Rows first, then keys: a torn key file only loses entries
+                with open(self._data_path, "ab") as f:
+                    f.write(np.stack(list(new_rows.values())).tobytes())
+                    f.flush()
+                with open(self._keys_path, "a", encoding="ascii") as f:
+                    f.writelines(f"{key}\n" for key in new_rows)
+                    f.flush()
+            except OSError as e:
+                logger.warning(f"Failed to write embeddings to {self.cache_dir}: {e}")
+                self._rollback_append(keys_size)
+                return
+            # Only rows that are fully written are looked up from disk
+            for row, key in enumerate(new_rows, start=self._row_count):
+                self._disk_rows[key] = row
+            self._row_count += len(new_rows)
+            self._mmap = None
+
+    def _rollback_append(self, keys_size: int) -> None:
+        """Drop a partial append so later rows stay aligned with their keys."""
+        try:
+            if self._keys_path.exists():
+                os.truncate(self._keys_path, keys_size)
+            if self._data_path.exists():
+                os.truncate(
+                    self._data_path, self._row_count * self.vector_dimensions * 4
+                )
+        except OSError as e:
+            logger.warning(f"Disabling on-disk embedding cache {self.cache_dir}: {e}")
+            self.cache_dir = None
+            self._disk_rows = {}
+            self._mmap = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit/miss counters and sizes."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_entries": len(self._disk_rows),
+        }
@@ -0,0 +1,133 @@
+"""Process pool that embeds texts on several cores for bulk indexing."""
+
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+import numpy as np
+
+from .embedding_backends import load_sentence_transformer
+
+logger = logging.getLogger(__name__)
+
+# Model loaded once per worker process by ``_init_worker``
+_worker_model: Any = None
+
+
+def _init_worker(model_loader: Callable[[str], Any], model_name: str) -> None:
+    global _worker_model
+    _worker_model = model_loader(model_name)
+
+
+def _encode_shard(
+    texts: list[str],
+    shm_name: str,
+    shape: tuple[int, int],
+    start: int,
+    batch_size: int,
+) -> int:
+    """Embed ``texts`` and write them to rows ``start:`` of the shared matrix."""
+    embeddings = _worker_model.encode(
+        texts, batch_size=batch_size, convert_to_numpy=True
+    )
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+        out[start : start + len(texts)] = embeddings
+        del out
+    finally:
+        shm.close()
+    return len(texts)
+
+
+class EmbeddingExecutor:
+    """Embed large text batches on a pool of worker processes.
+
+    Every worker loads the model once. ``encode`` splits the texts into
+    contiguous shards, and workers write their float32 embeddings straight
+    into one shared-memory matrix owned by the caller, so only the texts and
+    shard offsets are pickled.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        vector_dimensions: int,
+        workers: int = 2,
+        batch_size: int = 64,
+        shard_size: int = 256,
+        model_loader: Callable[[str], Any] = load_sentence_transformer,
+        start_method: str = "spawn",
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            model_name: Embedding model each worker loads
+            vector_dimensions: Embedding size of the model
+            workers: Number of worker processes
+            batch_size: Texts per model forward pass inside a worker
+            shard_size: Max texts handed to a worker per task
+            model_loader: Picklable function loading the model in a worker
+            start_method: multiprocessing start method for the workers
+        """
+        self.model_name = model_name
+        self.vector_dimensions = vector_dimensions
+        self.workers = max(workers, 1)
+        self.batch_size = max(batch_size, 1)
+        self.shard_size = max(shard_size, 1)
+
+        # Workers must share the parent's tracker for the shared matrices
+        resource_tracker.ensure_running()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(model_loader, model_name),
+        )
+        logger.info(
+            f"Started {self.workers} embedding worker processes for {model_name}"
+        )
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """Embed texts across the worker processes.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 matrix with one embedding row per text, in input order
+        """
+        shape = (len(texts), self.vector_dimensions)
+        if not texts:
+            return np.empty(shape, dtype=np.float32)
+
+        # Shards small enough to keep every worker busy until the end
+        shard = min(self.shard_size, -(-len(texts) // self.workers))
+        shm = shared_memory.SharedMemory(
+            create=True, size=max(len(texts) * self.vector_dimensions * 4, 1)
+        )
+        try:
+            futures = [
+                self._pool.submit(
+                    _encode_shard,
+                    texts[start : start + shard],
+                    shm.name,
+                    shape,
+                    start,
+                    self.batch_size,
+                )
+                for start in range(0, len(texts), shard)
+            ]
+            for future in futures:
+                future.result()
+            return np.ndarray(shape, dtype=np.float32, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self._pool.shutdown()
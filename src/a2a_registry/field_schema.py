@@ -0,0 +1,120 @@
+"""Declarative schema of the agent card fields embedded for vector search."""
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+# Field kinds, in vector order: agent fields, then per skill its parts and the
+# combined skill vector, then the same for extensions
+FIELD_KINDS = (
+    "name",
+    "description",
+    "skills.name",
+    "skills.description",
+    "skills.tags",
+    "skills.examples",
+    "skills",
+    "extensions.description",
+    "extensions.params",
+    "extensions",
+)
+
+# Named schemas: every vector (the original layout), combined skill and
+# extension vectors only, or their parts only
+PRESETS: dict[str, tuple[str, ...]] = {
+    "full": FIELD_KINDS,
+    "combined": ("name", "description", "skills", "extensions"),
+    "parts": tuple(
+        kind for kind in FIELD_KINDS if kind not in ("skills", "extensions")
+    ),
+}
+
+_INDEX_PATTERN = re.compile(r"\[\d+\]")
+
+
+def field_kind(field_path: str) -> str:
+    """Schema kind of a vector field path ("skills[2].tags" -> "skills.tags")."""
+    return _INDEX_PATTERN.sub("", field_path)
+
+
+class FieldSchema:
+    """Which agent card fields get a vector, and their weight when scoring.
+
+    Fields are named by kind, the field path without list indexes (see
+    ``FIELD_KINDS``). A combined skill or extension vector embeds all the
+    parts of its skill or extension, whether or not the parts get vectors of
+    their own. At search time each matching vector's similarity is multiplied
+    by its field's weight before the agent's composite score is computed;
+    similarity thresholds still apply to the unweighted similarity.
+
+    Changing the embedded fields requires re-indexing (tracked by
+    ``signature``); weights can change freely.
+    """
+
+    def __init__(self, weights: dict[str, float]) -> None:
+        """Initialize a schema.
+
+        Args:
+            weights: Scoring weight per embedded field kind
+
+        Raises:
+            ValueError: For unknown field kinds, non-positive weights or an
+                        empty schema
+        """
+        unknown = set(weights) - set(FIELD_KINDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown vector fields {sorted(unknown)}, expected any of {FIELD_KINDS}"
+            )
+        if not weights:
+            raise ValueError("Vector field schema embeds no fields")
+        for kind, weight in weights.items():
+            if not weight > 0:
+                raise ValueError(f"Weight of vector field {kind!r} must be positive")
+        self.weights = {
+            kind: float(weights[kind]) for kind in FIELD_KINDS if kind in weights
+        }
+
+    @classmethod
+    def parse(cls, spec: str) -> "FieldSchema":
+        """Schema from a preset name, a JSON document or a JSON file path.
+
+        The JSON is either a list of field kinds (weight 1) or an object of
+        field kind to weight, e.g. ``{"name": 2, "description": 1, "skills": 1}``.
+
+        Args:
+            spec: Preset name (see ``PRESETS``), JSON, or path to a JSON file
+
+        Returns:
+            The parsed schema
+        """
+        spec = spec.strip()
+        if spec in PRESETS:
+            return cls(dict.fromkeys(PRESETS[spec], 1.0))
+        if not spec.startswith(("{", "[")):
+            path = Path(spec)
+            if not path.is_file():
+                raise ValueError(
+                    f"Unknown vector field schema {spec!r}: not a preset "
+                    f"({', '.join(PRESETS)}), JSON or a JSON file"
+                )
+            spec = path.read_text()
+        document: Any = json.loads(spec)
+        if isinstance(document, list):
+            return cls(dict.fromkeys(document, 1.0))
+        return cls(document)
+
+    def embeds(self, field_path: str) -> bool:
+        """Whether the field at ``field_path`` gets a vector."""
+        return field_kind(field_path) in self.weights
+
+    @property
+    def signature(self) -> str:
+        """Identifies the embedded fields, which the index must match."""
+        return ",".join(self.weights)
+
+    @property
+    def weighted(self) -> bool:
+        """Whether any field's weight differs from 1."""
+        return any(weight != 1.0 for weight in self.weights.values())
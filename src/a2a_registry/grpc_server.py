@@ -5,10 +5,10 @@ from typing import Any
 
 import grpc
 import grpc.aio
-from google.protobuf import empty_pb2, timestamp_pb2
+from google.protobuf import empty_pb2, json_format, timestamp_pb2
 
 from .proto.generated import a2a_pb2, registry_pb2, registry_pb2_grpc
-from .storage import storage
+from .storage import batch_search_agents, bulk_register_agents, storage
 
 logger = logging.getLogger(__name__)
 
@@ -137,6 +137,53 @@ class A2ARegistryServicer(registry_pb2_grpc.A2ARegistryServiceServicer):
                 success=False, message=f"Internal error: {str(e)}"
             )
 
+    async def StoreAgentCards(
+        self,
+        request_iterator: Any,
+        context: grpc.aio.ServicerContext,
+    ) -> registry_pb2.StoreAgentCardsResponse:
+        """Store a client stream of agent cards as one batch."""
+        try:
+            requests = [request async for request in request_iterator]
+            agent_cards = [
+                json_format.MessageToDict(
+                    request.registry_agent_card.agent_card,
+                    preserving_proto_field_name=True,
+                )
+                for request in requests
+            ]
+
+            results = await bulk_register_agents(self.storage, agent_cards)
+
+            responses = []
+            for request, result in zip(requests, results, strict=True):
+                if result["success"]:
+                    responses.append(
+                        registry_pb2.StoreAgentCardResponse(
+                            success=True,
+                            message="Agent registered successfully",
+                            stored_card=request.registry_agent_card,
+                        )
+                    )
+                else:
+                    responses.append(
+                        registry_pb2.StoreAgentCardResponse(
+                            success=False, message=result["error"]
+                        )
+                    )
+
+            stored_count = sum(1 for result in results if result["success"])
+            return registry_pb2.StoreAgentCardsResponse(
+                results=responses,
+                stored_count=stored_count,
+                failed_count=len(results) - stored_count,
+            )
+        except Exception as e:
+            logger.error(f"Error storing agent cards: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Internal error: {str(e)}")
+            return registry_pb2.StoreAgentCardsResponse()
+
     async def SearchAgents(
         self,
         request: registry_pb2.SearchAgentsRequest,
@@ -192,6 +239,53 @@ class A2ARegistryServicer(registry_pb2_grpc.A2ARegistryServiceServicer):
                 agents=[], next_page_token="", total_count=0, similarity_scores=[]
             )
 
+    async def SearchAgentsBatch(
+        self,
+        request: registry_pb2.SearchAgentsBatchRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> registry_pb2.SearchAgentsBatchResponse:
+        """Search agents for many queries with one batched vector search.
+
+        Skills, search mode, similarity threshold and page size (max results
+        per query) come from the shared criteria.
+        """
+        try:
+            criteria = request.criteria
+            search_mode = (
+                "SEARCH_MODE_KEYWORD"
+                if criteria.search_mode == registry_pb2.SEARCH_MODE_KEYWORD
+                else "SEARCH_MODE_VECTOR"
+            )
+            batch = await batch_search_agents(
+                self.storage,
+                list(request.semantic_queries),
+                skills=list(criteria.required_skills) or None,
+                search_mode=search_mode,
+                similarity_threshold=criteria.similarity_threshold or 0.5,
+                max_results=criteria.page_size or 10,
+            )
+
+            return registry_pb2.SearchAgentsBatchResponse(
+                results=[
+                    registry_pb2.SearchAgentsResponse(
+                        agents=[
+                            self._convert_agent_card_to_registry_card(agent)
+                            for agent, _ in results
+                        ],
+                        total_count=len(results),
+                        similarity_scores=[
+                            score for _, score in results if score is not None
+                        ],
+                    )
+                    for results in batch
+                ]
+            )
+        except Exception as e:
+            logger.error(f"Error batch searching agents: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Internal error: {str(e)}")
+            return registry_pb2.SearchAgentsBatchResponse()
+
     async def DeleteAgentCard(
         self,
         request: registry_pb2.DeleteAgentCardRequest,
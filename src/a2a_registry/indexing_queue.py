@@ -0,0 +1,188 @@
+"""Background indexing queue with sequence numbers for read-your-writes."""
+
+import asyncio
+import concurrent.futures
+import heapq
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class IndexingQueue:
+    """Apply index updates in order on a background thread.
+
+    Every enqueued job gets the next sequence number. A single worker thread
+    drains the queue in batches of up to ``max_batch_size`` jobs and hands
+    each batch to ``process_batch``; once it returns, ``indexed_seq`` covers
+    the batch. Callers that need to read their own writes wait for the
+    sequence number they were given.
+
+    With ``background=False`` jobs are processed on the calling thread as
+    they are enqueued, which keeps the same sequence semantics.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[Any]], None],
+        max_batch_size: int = 256,
+        background: bool = True,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            process_batch: Callback applying a list of jobs, in order
+            max_batch_size: Max jobs handed to ``process_batch`` at once
+            background: Process jobs on a worker thread instead of inline
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max(max_batch_size, 1)
+        self.background = background
+
+        self.last_seq = 0
+        self.indexed_seq = 0
+        self.jobs_processed = 0
+        self.batches = 0
+
+        # (seq, enqueued_at, job) in sequence order
+        self._queue: deque[tuple[int, float, Any]] = deque()
+        self._waiters: list[tuple[int, int, concurrent.futures.Future]] = []
+        self._waiter_count = 0
+        self._recent: deque[tuple[float, int]] = deque(maxlen=64)
+        self._cond = threading.Condition()
+        self._process_lock = threading.Lock()
+        self._closed = False
+        self._worker: threading.Thread | None = None
+
+    def enqueue(self, jobs: Sequence[Any]) -> int:
+        """Queue jobs for indexing.
+
+        Args:
+            jobs: Jobs in the order they must be applied
+
+        Returns:
+            Sequence number of the last job (the current one if ``jobs`` is empty)
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Indexing queue is closed")
+            now = time.monotonic()
+            for job in jobs:
+                self.last_seq += 1
+                self._queue.append((self.last_seq, now, job))
+            seq = self.last_seq
+            if self.background and jobs:
+                self._ensure_worker()
+                self._cond.notify()
+
+        if not self.background:
+            while self._process_next():
+                pass
+        return seq
+
+    def wait_for_seq(self, seq: int) -> concurrent.futures.Future:
+        """Return a future resolved once every job up to ``seq`` is indexed."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            if seq <= self.indexed_seq:
+                future.set_result(True)
+            else:
+                self._waiter_count += 1
+                heapq.heappush(self._waiters, (seq, self._waiter_count, future))
+        return future
+
+    async def wait(self, seq: int, timeout: float | None = None) -> bool:
+        """Wait until ``seq`` is indexed.
+
+        Args:
+            seq: Sequence number returned when the write was queued
+            timeout: Max seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if ``seq`` is indexed, False if the timeout expired first
+        """
+        future = self.wait_for_seq(seq)
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    def close(self) -> None:
+        """Process outstanding jobs and stop the worker thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue depth, lag and throughput."""
+        with self._cond:
+            now = time.monotonic()
+            oldest = self._queue[0][1] if self._queue else None
+            recent = list(self._recent)
+        throughput = 0.0
+        if len(recent) > 1 and recent[-1][0] > recent[0][0]:
+            jobs = sum(count for _at, count in recent[1:])
+            throughput = jobs / (recent[-1][0] - recent[0][0])
+        return {
+            "queue_depth": self.last_seq - self.indexed_seq,
+            "last_seq": self.last_seq,
+            "indexed_seq": self.indexed_seq,
+            "lag_seconds": now - oldest if oldest is not None else 0.0,
+            "jobs_processed": self.jobs_processed,
+            "batches": self.batches,
+            "throughput_per_sec": throughput,
+        }
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="a2a-registry-indexer", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+            self._process_next()
+
+    def _process_next(self) -> bool:
+        """Process one batch of queued jobs; False if the queue was empty."""
+        with self._process_lock:
+            with self._cond:
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(len(self._queue), self.max_batch_size))
+                ]
+            if not batch:
+                return False
+
+            try:
+                self.process_batch([job for _seq, _at, job in batch])
+            except Exception as e:
+                # The sequence still advances so waiters are not stuck
+                logger.error(f"Failed to index {len(batch)} jobs: {e}")
+
+            with self._cond:
+                self.indexed_seq = batch[-1][0]
+                self.jobs_processed += len(batch)
+                self.batches += 1
+                self._recent.append((time.monotonic(), len(batch)))
+                ready = []
+                while self._waiters and self._waiters[0][0] <= self.indexed_seq:
+                    ready.append(heapq.heappop(self._waiters)[2])
+            for future in ready:
+                if not future.done():
+                    future.set_result(True)
+            return True
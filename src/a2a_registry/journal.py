@@ -0,0 +1,294 @@
+"""Append-only write-ahead journal with group commit for file-based storage."""
+
+import concurrent.futures
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_PATTERN = re.compile(r"^journal-(\d{8})\.log$")
+
+
+class _CompactionMarker:
+    """Queue item asking the writer thread to start a new journal segment."""
+
+    def __init__(self, snapshot: Any) -> None:
+        self.snapshot = snapshot
+        self.started = False
+
+
+class StorageJournal:
+    """Write-ahead journal for registry mutations.
+
+    Mutations are appended as JSON lines to numbered segment files. A single
+    writer thread drains the queue, so concurrent writers share one
+    ``write`` + ``fsync`` (group commit). A record waits at most
+    ``commit_interval_ms`` for siblings before its batch is committed.
+
+    Compaction rotates to a new segment and hands the captured state to a
+    background thread, which writes the snapshot and then deletes the
+    segments it covers. Records are full-value upserts/deletes, so replaying
+    a segment on top of a newer snapshot is idempotent.
+    """
+
+    def __init__(
+        self,
+        journal_dir: Path,
+        snapshot_writer: Callable[[Any], None],
+        commit_interval_ms: float = 2.0,
+        max_batch_size: int = 512,
+        compact_threshold: int = 10000,
+    ) -> None:
+        """Initialize the journal.
+
+        Args:
+            journal_dir: Directory holding ``journal-*.log`` segment files
+            snapshot_writer: Callback persisting a captured state snapshot
+            commit_interval_ms: Max time a record waits for a group commit
+            max_batch_size: Commit immediately once this many records queue up
+            compact_threshold: Records since last snapshot that trigger compaction
+        """
+        self.journal_dir = Path(journal_dir)
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshot_writer = snapshot_writer
+        self.commit_interval = max(commit_interval_ms, 0.0) / 1000.0
+        self.max_batch_size = max(max_batch_size, 1)
+        self.compact_threshold = compact_threshold
+
+        self.records_since_snapshot = 0
+        self.commits = 0
+        self.records_written = 0
+
+        self._queue: list[tuple[Any, concurrent.futures.Future | None]] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._compacting = False
+        self._segment_file: Any = None
+        self._committed_offset = 0
+        self._segment_number = self._latest_segment_number()
+        self._writer: threading.Thread | None = None
+        self._compactor: threading.Thread | None = None
+
+    def _segments(self) -> list[tuple[int, Path]]:
+        """Return existing segment files ordered by segment number."""
+        segments = []
+        for path in self.journal_dir.iterdir():
+            match = _SEGMENT_PATTERN.match(path.name)
+            if match:
+                segments.append((int(match.group(1)), path))
+        return sorted(segments)
+
+    def _latest_segment_number(self) -> int:
+        segments = self._segments()
+        return segments[-1][0] if segments else 0
+
+    def _segment_path(self, number: int) -> Path:
+        return self.journal_dir / f"journal-{number:08d}.log"
+
+    def replay(self) -> Iterator[dict[str, Any]]:
+        """Yield every journaled record in commit order.
+
+        A torn trailing line (crash mid-write) is skipped.
+        """
+        for _number, path in self._segments():
+            with open(path, encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(
+                            f"Skipping corrupt journal record {path.name}:{line_no}"
+                        )
+                        continue
+                    self.records_since_snapshot += 1
+                    yield record
+
+    def append(self, record: dict[str, Any]) -> concurrent.futures.Future:
+        """Queue a record; the returned future resolves once it is fsynced."""
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Journal is closed")
+            self._ensure_writer()
+            self._queue.append((line, future))
+            self.records_since_snapshot += 1
+            self._cond.notify()
+        return future
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Whether enough records accumulated since the last snapshot."""
+        return (
+            not self._compacting
+            and self.records_since_snapshot >= self.compact_threshold
+        )
+
+    def compact(self, snapshot: Any) -> None:
+        """Schedule a background snapshot of ``snapshot`` and journal truncation.
+
+        ``snapshot`` must reflect every record appended before this call.
+        """
+        with self._cond:
+            if self._closed or self._compacting:
+                return
+            self._ensure_writer()
+            self._compacting = True
+            self.records_since_snapshot = 0
+            self._queue.append((_CompactionMarker(snapshot), None))
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Commit outstanding records and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+        if self._segment_file is not None:
+            self._segment_file.close()
+            self._segment_file = None
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._run, name="a2a-registry-journal", daemon=True
+            )
+            self._writer.start()
+
+    def _open_next_segment(self) -> None:
+        segment_file = open(
+            self._segment_path(self._segment_number + 1), "a", encoding="utf-8"
+        )
+        if self._segment_file is not None:
+            self._segment_file.close()
+        self._segment_number += 1
+        self._segment_file = segment_file
+        self._committed_offset = 0
+
+    def _discard_uncommitted(self) -> None:
+        """Cut records written since the last fsync from the current segment.
+
+        Their writers are told the append failed, so they must not be
+        replayed; the next batch starts a fresh segment.
+        """
+        if self._segment_file is None:
+            return
+        try:
+            self._segment_file.close()
+        except Exception:
+            pass  # The buffered records are discarded below anyway
+        self._segment_file = None
+        try:
+            os.truncate(
+                self._segment_path(self._segment_number), self._committed_offset
+            )
+        except OSError as e:
+            logger.error(f"Failed to discard uncommitted journal records: {e}")
+
+    def _take_batch(self) -> list[tuple[Any, concurrent.futures.Future | None]]:
+        with self._cond:
+            while not self._queue and not self._closed:
+                self._cond.wait()
+            deadline = time.monotonic() + self.commit_interval
+            while len(self._queue) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = self._queue
+            self._queue = []
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+
+            pending: list[concurrent.futures.Future] = []
+            try:
+                for item, future in batch:
+                    if isinstance(item, _CompactionMarker):
+                        self._commit(pending)
+                        pending = []
+                        self._rotate(item)
+                        continue
+                    if self._segment_file is None:
+                        self._open_next_segment()
+                    assert self._segment_file is not None
+                    self._segment_file.write(item + "\n")
+                    if future is not None:
+                        pending.append(future)
+                self._commit(pending)
+            except Exception as e:
+                logger.error(f"Failed to commit journal batch: {e}")
+                self._discard_uncommitted()
+                for item, future in batch:
+                    if isinstance(item, _CompactionMarker) and not item.started:
+                        with self._cond:
+                            self._compacting = False
+                    elif future is not None and not future.done():
+                        future.set_exception(e)
+
+    def _commit(self, futures: list[concurrent.futures.Future]) -> None:
+        if not futures:
+            return
+        self._segment_file.flush()
+        os.fsync(self._segment_file.fileno())
+        self._committed_offset = self._segment_file.tell()
+        self.commits += 1
+        self.records_written += len(futures)
+        for future in futures:
+            future.set_result(True)
+
+    def _rotate(self, marker: _CompactionMarker) -> None:
+        """Start a new segment and snapshot the state covered by older ones."""
+        covered = [path for _number, path in self._segments()]
+        self._open_next_segment()
+        marker.started = True
+        self._compactor = threading.Thread(
+            target=self._write_snapshot,
+            args=(marker.snapshot, covered),
+            name="a2a-registry-compaction",
+            daemon=True,
+        )
+        self._compactor.start()
+
+    def _write_snapshot(self, snapshot: Any, covered: list[Path]) -> None:
+        try:
+            self.snapshot_writer(snapshot)
+            for path in covered:
+                path.unlink(missing_ok=True)
+            logger.info(f"Compacted {len(covered)} journal segment(s) into snapshot")
+        except Exception as e:
+            logger.error(f"Failed to compact journal: {e}")
+        finally:
+            with self._cond:
+                self._compacting = False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get journal statistics."""
+        return {
+            "segment": self._segment_number,
+            "commits": self.commits,
+            "records_written": self.records_written,
+            "records_since_snapshot": self.records_since_snapshot,
+            "avg_batch_size": (
+                self.records_written / self.commits if self.commits else 0.0
+            ),
+        }
@@ -8,7 +8,7 @@ from fasta2a.schema import AgentCard  # type: ignore
 from jsonrpcserver import Error, Result, Success, method
 
 from . import A2A_PROTOCOL_VERSION, __version__
-from .storage import storage
+from .storage import batch_search_agents, bulk_register_agents, storage
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +50,7 @@ async def register_agent(agent_card: dict[str, Any]) -> Result:
                     "success": True,
                     "agent_id": agent_card["name"],
                     "message": "Agent registered successfully",
+                    "index_seq": await storage.get_agent_index_seq(agent_card["name"]),
                     "transport": "JSONRPC",
                 }
             )
@@ -61,6 +62,37 @@ async def register_agent(agent_card: dict[str, Any]) -> Result:
         return Error(code=-32603, message=str(e))
 
 
+@method
+async def register_agents(agent_cards: list[dict[str, Any]]) -> Result:
+    """Register many agents in one call via JSON-RPC.
+
+    Args:
+        agent_cards: List of agent cards following FastA2A schema
+
+    Returns:
+        Success with one result per card (in order) or Error
+    """
+    try:
+        if not isinstance(agent_cards, list):
+            return Error(code=-32602, message="agent_cards must be a list")
+
+        results = await bulk_register_agents(storage, agent_cards)
+        registered_count = sum(1 for result in results if result["success"])
+        return Success(
+            {
+                "success": registered_count == len(results),
+                "results": results,
+                "registered_count": registered_count,
+                "failed_count": len(results) - registered_count,
+                "transport": "JSONRPC",
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Error registering agents via JSON-RPC: {e}")
+        return Error(code=-32603, message=str(e))
+
+
 @method
 async def get_agent(agent_id: str) -> Result:
     """Get an agent by ID via JSON-RPC.
@@ -140,6 +172,7 @@ async def search_agents(
     search_mode: str = "SEARCH_MODE_VECTOR",
     similarity_threshold: float = 0.5,
     max_results: int = 10,
+    min_index_seq: int | None = None,
 ) -> Result:
     """Search for agents via JSON-RPC with vector search support.
 
@@ -149,6 +182,8 @@ async def search_agents(
         search_mode: "SEARCH_MODE_KEYWORD" or "SEARCH_MODE_VECTOR"
         similarity_threshold: Minimum similarity score for vector search (0.0-1.0)
         max_results: Maximum number of results to return
+        min_index_seq: ``index_seq`` from a registration; vector search waits
+            (bounded) until that registration is indexed
 
     Returns:
         Success with matching agents and similarity scores
@@ -162,6 +197,7 @@ async def search_agents(
                 search_mode=search_mode,
                 similarity_threshold=similarity_threshold,
                 max_results=max_results,
+                min_index_seq=min_index_seq,
             )
 
             # Format response with similarity scores
@@ -184,39 +220,25 @@ async def search_agents(
             return Success(response)
 
         else:
-            # Fallback to basic keyword search for backward compatibility
-            results = []
-            query_lower = query.lower() if query else ""
-
-            agents = await storage.list_agents()
-            for agent in agents:
-                matches = False
-
-                # Search by query in name, description
-                if query_lower:
-                    if (
-                        query_lower in agent.get("name", "").lower()
-                        or query_lower in agent.get("description", "").lower()
-                        or any(
-                            query_lower in skill.get("id", "").lower()
-                            or query_lower in skill.get("description", "").lower()
-                            for skill in agent.get("skills", [])
-                        )
-                    ):
-                        matches = True
-                else:
-                    matches = True  # No query means match all
-
-                # Filter by skills if provided
-                if skills and matches:
-                    agent_skills = [
-                        skill.get("id", "") for skill in agent.get("skills", [])
-                    ]
-                    if not any(skill in agent_skills for skill in skills):
-                        matches = False
-
-                if matches:
-                    results.append(agent)
+            # Fallback to the backend's indexed keyword search, which matches
+            # skill descriptions too as this path always has; an empty query
+            # matches all agents
+            agents = await storage.search_agents(
+                query or "", None if skills else max_results, skill_descriptions=True
+            )
+
+            # Filter by skills if provided
+            if skills:
+                results = [
+                    agent
+                    for agent in agents
+                    if any(
+                        skill.get("id", "") in skills
+                        for skill in agent.get("skills", [])
+                    )
+                ]
+            else:
+                results = agents
 
             return Success(
                 {
@@ -234,6 +256,71 @@ async def search_agents(
         return Error(code=-32603, message=str(e))
 
 
+@method
+async def search_agents_batch(
+    queries: list[str],
+    skills: list[str] | None = None,
+    search_mode: str = "SEARCH_MODE_VECTOR",
+    similarity_threshold: float = 0.5,
+    max_results: int = 10,
+    min_index_seq: int | None = None,
+) -> Result:
+    """Search agents for many queries in one call via JSON-RPC.
+
+    Vector queries are encoded in one batch and searched with one multi-row
+    FAISS search; each query is ranked like ``search_agents``.
+
+    Args:
+        queries: Search queries
+        skills: Optional list of skill IDs to filter every query by
+        search_mode: "SEARCH_MODE_KEYWORD" or "SEARCH_MODE_VECTOR"
+        similarity_threshold: Minimum similarity score for vector search (0.0-1.0)
+        max_results: Maximum number of results per query
+        min_index_seq: ``index_seq`` from a registration to wait for
+
+    Returns:
+        Success with one result per query (in order) or Error
+    """
+    try:
+        if not isinstance(queries, list) or not all(
+            isinstance(query, str) for query in queries
+        ):
+            return Error(code=-32602, message="queries must be a list of strings")
+
+        batch = await batch_search_agents(
+            storage,
+            queries,
+            skills=skills,
+            search_mode=search_mode,
+            similarity_threshold=similarity_threshold,
+            max_results=max_results,
+            min_index_seq=min_index_seq,
+        )
+        return Success(
+            {
+                "results": [
+                    {
+                        "query": query,
+                        "agents": [dict(agent) for agent, _ in results],
+                        "count": len(results),
+                        "similarity_scores": [
+                            score for _, score in results if score is not None
+                        ],
+                    }
+                    for query, results in zip(queries, batch, strict=True)
+                ],
+                "count": len(batch),
+                "skills_filter": skills,
+                "search_mode": search_mode,
+                "transport": "JSONRPC",
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Error batch searching agents via JSON-RPC: {e}")
+        return Error(code=-32603, message=str(e))
+
+
 @method
 async def list_extensions(
     uri_pattern: str | None = None,
@@ -345,12 +432,20 @@ async def get_agent_card() -> Result:
                     "id": "register_agent",
                     "description": "Register a new agent in the registry",
                 },
+                {
+                    "id": "register_agents",
+                    "description": "Register many agents in one request",
+                },
                 {"id": "get_agent", "description": "Retrieve agent information by ID"},
                 {"id": "list_agents", "description": "List all registered agents"},
                 {
                     "id": "search_agents",
                     "description": "Search for agents by query and skills",
                 },
+                {
+                    "id": "search_agents_batch",
+                    "description": "Search for agents for many queries at once",
+                },
                 {
                     "id": "unregister_agent",
                     "description": "Remove an agent from the registry",
@@ -577,10 +672,12 @@ def get_jsonrpc_methods() -> list[str]:
     """Get list of available JSON-RPC methods for introspection."""
     return [
         "register_agent",
+        "register_agents",
         "get_agent",
         "list_agents",
         "unregister_agent",
         "search_agents",
+        "search_agents_batch",
         "list_extensions",
         "ping_agent",
         "get_agent_card",
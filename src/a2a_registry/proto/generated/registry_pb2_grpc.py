@@ -1,5 +1,6 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
 """Client and server classes corresponding to protobuf-defined services."""
+
 import grpc
 import warnings
 
@@ -50,12 +51,24 @@ class A2ARegistryServiceStub(object):
             response_deserializer=registry__pb2.StoreAgentCardResponse.FromString,
             _registered_method=True,
         )
+        self.StoreAgentCards = channel.stream_unary(
+            "/a2a.v1.registry.A2ARegistryService/StoreAgentCards",
+            request_serializer=registry__pb2.StoreAgentCardRequest.SerializeToString,
+            response_deserializer=registry__pb2.StoreAgentCardsResponse.FromString,
+            _registered_method=True,
+        )
         self.SearchAgents = channel.unary_unary(
             "/a2a.v1.registry.A2ARegistryService/SearchAgents",
             request_serializer=registry__pb2.SearchAgentsRequest.SerializeToString,
             response_deserializer=registry__pb2.SearchAgentsResponse.FromString,
             _registered_method=True,
         )
+        self.SearchAgentsBatch = channel.unary_unary(
+            "/a2a.v1.registry.A2ARegistryService/SearchAgentsBatch",
+            request_serializer=registry__pb2.SearchAgentsBatchRequest.SerializeToString,
+            response_deserializer=registry__pb2.SearchAgentsBatchResponse.FromString,
+            _registered_method=True,
+        )
         self.DeleteAgentCard = channel.unary_unary(
             "/a2a.v1.registry.A2ARegistryService/DeleteAgentCard",
             request_serializer=registry__pb2.DeleteAgentCardRequest.SerializeToString,
@@ -121,12 +134,24 @@ class A2ARegistryServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StoreAgentCards(self, request_iterator, context):
+        """Bulk registration"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def SearchAgents(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def SearchAgentsBatch(self, request, context):
+        """Many queries, one search"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def DeleteAgentCard(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -188,11 +213,21 @@ def add_A2ARegistryServiceServicer_to_server(servicer, server):
             request_deserializer=registry__pb2.StoreAgentCardRequest.FromString,
             response_serializer=registry__pb2.StoreAgentCardResponse.SerializeToString,
         ),
+        "StoreAgentCards": grpc.stream_unary_rpc_method_handler(
+            servicer.StoreAgentCards,
+            request_deserializer=registry__pb2.StoreAgentCardRequest.FromString,
+            response_serializer=registry__pb2.StoreAgentCardsResponse.SerializeToString,
+        ),
         "SearchAgents": grpc.unary_unary_rpc_method_handler(
             servicer.SearchAgents,
             request_deserializer=registry__pb2.SearchAgentsRequest.FromString,
             response_serializer=registry__pb2.SearchAgentsResponse.SerializeToString,
         ),
+        "SearchAgentsBatch": grpc.unary_unary_rpc_method_handler(
+            servicer.SearchAgentsBatch,
+            request_deserializer=registry__pb2.SearchAgentsBatchRequest.FromString,
+            response_serializer=registry__pb2.SearchAgentsBatchResponse.SerializeToString,
+        ),
         "DeleteAgentCard": grpc.unary_unary_rpc_method_handler(
             servicer.DeleteAgentCard,
             request_deserializer=registry__pb2.DeleteAgentCardRequest.FromString,
@@ -307,6 +342,36 @@ class A2ARegistryService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def StoreAgentCards(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            "/a2a.v1.registry.A2ARegistryService/StoreAgentCards",
+            registry__pb2.StoreAgentCardRequest.SerializeToString,
+            registry__pb2.StoreAgentCardsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def SearchAgents(
         request,
@@ -337,6 +402,36 @@ class A2ARegistryService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def SearchAgentsBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/a2a.v1.registry.A2ARegistryService/SearchAgentsBatch",
+            registry__pb2.SearchAgentsBatchRequest.SerializeToString,
+            registry__pb2.SearchAgentsBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def DeleteAgentCard(
         request,
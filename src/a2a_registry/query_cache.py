@@ -0,0 +1,162 @@
+"""LRU caches of search query embeddings and ranked search results."""
+
+import json
+import logging
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """Thread-safe LRU mapping with hit and miss counters."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (0 disables the cache)
+        """
+        self.max_size = max(max_size, 0)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Look up ``key``, marking it most recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value``, evicting the least recently used entries."""
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss counters and size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_size": self.max_size,
+        }
+
+
+class SearchCache:
+    """Query embedding and search result caches of a registry.
+
+    ``embeddings`` maps query text to its query Vector. ``results`` maps a
+    search (query, mode, skills, threshold, max results) to the ranked
+    (agent_id, score) pairs it returned, keyed together with the registry's
+    mutation ``generation``. Every write bumps the generation through
+    ``invalidate``, so results cached before it are never hit again and age
+    out of the LRU.
+
+    Query texts are counted so the most frequent ones can be saved and used
+    to pre-warm the embeddings of the next run.
+    """
+
+    def __init__(self, embedding_size: int = 1024, result_size: int = 1024) -> None:
+        """Initialize the caches.
+
+        Args:
+            embedding_size: Query embeddings kept (0 disables the cache)
+            result_size: Search results kept (0 disables the cache)
+        """
+        self.embeddings = LRUCache(embedding_size)
+        self.results = LRUCache(result_size)
+        self.generation = 0
+        self._query_counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Start a new generation after a registry write."""
+        with self._lock:
+            self.generation += 1
+
+    def count_query(self, query: str) -> None:
+        """Record a search for ``query`` for the hot query list."""
+        with self._lock:
+            self._query_counts[query] += 1
+            # Keep the counter bounded by dropping the rarest queries
+            limit = 10 * max(self.embeddings.max_size, 100)
+            if len(self._query_counts) > limit:
+                self._query_counts = Counter(
+                    dict(self._query_counts.most_common(limit // 2))
+                )
+
+    def get_results(
+        self, key: tuple[Hashable, ...]
+    ) -> list[tuple[str, float | None]] | None:
+        """Ranked (agent_id, score) pairs cached for a search in this generation."""
+        return self.results.get((self.generation, *key))
+
+    def put_results(
+        self,
+        key: tuple[Hashable, ...],
+        ranked: list[tuple[str, float | None]],
+        generation: int,
+    ) -> None:
+        """Cache a search's ranked results.
+
+        Args:
+            key: Search parameters
+            ranked: (agent_id, score) pairs in result order
+            generation: Generation the search started in; results computed
+                        across a write are never hit again
+        """
+        self.results.put((generation, *key), ranked)
+
+    def hot_queries(self, count: int) -> list[str]:
+        """The ``count`` most frequent queries, most frequent first."""
+        with self._lock:
+            return [query for query, _ in self._query_counts.most_common(count)]
+
+    def save_hot_queries(self, path: str | Path, count: int) -> None:
+        """Write the most frequent queries to ``path`` as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f"{path.name}.tmp")
+        staging.write_text(json.dumps(self.hot_queries(count)))
+        staging.replace(path)
+        logger.debug(f"Saved hot queries to {path}")
+
+    @staticmethod
+    def load_hot_queries(path: str | Path) -> list[str]:
+        """Read queries written by ``save_hot_queries`` (empty if missing)."""
+        try:
+            queries = json.loads(Path(path).read_text())
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load hot queries from {path}: {e}")
+            return []
+        return [query for query in queries if isinstance(query, str)]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit ratios and sizes of both caches."""
+        return {
+            "generation": self.generation,
+            "embeddings": self.embeddings.get_stats(),
+            "results": self.results.get_stats(),
+        }
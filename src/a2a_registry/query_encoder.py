@@ -0,0 +1,136 @@
+"""Micro-batching encoder for concurrent semantic search queries."""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .proto.generated.registry_pb2 import Vector  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEncoder:
+    """Encode search queries in small batches on a worker thread.
+
+    Callers queue a query text and await a future, so the event loop is never
+    blocked by a transformer forward pass. A single worker thread waits up to
+    ``max_wait_ms`` for more queries (or until ``max_batch_size`` are queued),
+    encodes the whole batch with one call and resolves every caller's future.
+    Identical queries in a batch are encoded once.
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[list[str]], list[Vector]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        """Initialize the encoder.
+
+        Args:
+            encode_batch: Function turning a list of queries into query vectors
+            max_batch_size: Encode immediately once this many queries are queued
+            max_wait_ms: Max time a query waits for others to join its batch
+        """
+        self.encode_batch = encode_batch
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait_ms, 0.0) / 1000.0
+
+        self.batches = 0
+        self.queries_encoded = 0
+        self.largest_batch = 0
+
+        self._queue: list[tuple[str, concurrent.futures.Future]] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._worker: threading.Thread | None = None
+
+    def submit(self, query: str) -> concurrent.futures.Future:
+        """Queue a query; the returned future resolves to its Vector."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Query encoder is closed")
+            self._ensure_worker()
+            self._queue.append((query, future))
+            self._cond.notify()
+        return future
+
+    async def encode(self, query: str) -> Vector:
+        """Encode a query without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(query))
+
+    def close(self) -> None:
+        """Encode outstanding queries and stop the worker thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics."""
+        return {
+            "batches": self.batches,
+            "queries_encoded": self.queries_encoded,
+            "mean_batch_size": (
+                self.queries_encoded / self.batches if self.batches else 0.0
+            ),
+            "largest_batch": self.largest_batch,
+            "queued": len(self._queue),
+        }
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="a2a-registry-query-encoder", daemon=True
+            )
+            self._worker.start()
+
+    def _take_batch(self) -> list[tuple[str, concurrent.futures.Future]]:
+        with self._cond:
+            while not self._queue and not self._closed:
+                self._cond.wait()
+            deadline = time.monotonic() + self.max_wait
+            while len(self._queue) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = self._queue[: self.max_batch_size]
+            self._queue = self._queue[self.max_batch_size :]
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+
+            # Skip queries whose caller gave up (cancelled while queued)
+            batch = [
+                (query, future)
+                for query, future in batch
+                if future.set_running_or_notify_cancel()
+            ]
+            queries = list(dict.fromkeys(query for query, _future in batch))
+            if not queries:
+                continue
+            try:
+                vector_of = dict(zip(queries, self.encode_batch(queries), strict=True))
+            except Exception as e:
+                logger.error(f"Failed to encode {len(queries)} queries: {e}")
+                for _query, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.queries_encoded += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            for query, future in batch:
+                future.set_result(vector_of[query])
@@ -0,0 +1,220 @@
+"""Inverted keyword and skill indexes for agent search."""
+
+import heapq
+import re
+from typing import Any
+
+# Minimum query length answered from trigram postings; shorter queries are
+# verified against every indexed agent (their result sets are large anyway).
+NGRAM_SIZE = 3
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Relative importance of each searchable field when ranking matches
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "skill": 2.0,
+    "description": 1.0,
+    "skill_description": 1.0,
+}
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN_PATTERN.findall(text))
+
+
+class KeywordIndex:
+    """Incrementally maintained inverted index over agent cards.
+
+    Indexes the same fields the storage backends have always searched (name,
+    description and skill ids), plus skill descriptions, which only searches
+    that ask for them match, with case-insensitive substring semantics:
+
+    - trigram postings narrow a query down to candidate agents, which are then
+      verified with an exact substring check, so results match a full scan;
+    - token postings identify whole-word matches, which rank above prefix and
+      plain substring matches.
+
+    Ties keep registration order, so unranked callers see stable results.
+    """
+
+    def __init__(self) -> None:
+        self._fields: dict[str, list[tuple[str, str]]] = {}
+        self._order: dict[str, int] = {}
+        self._grams: dict[str, set[str]] = {}
+        # token -> agent_id -> bitmask of the agent's fields containing the token
+        self._tokens: dict[str, dict[str, int]] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    @staticmethod
+    def _extract_fields(agent_card: Any) -> list[tuple[str, str]]:
+        fields = [
+            ("name", str(agent_card.get("name", "")).lower()),
+            ("description", str(agent_card.get("description", "")).lower()),
+        ]
+        for skill in agent_card.get("skills", []) or []:
+            if isinstance(skill, dict):
+                fields.append(("skill", str(skill.get("id", "")).lower()))
+                fields.append(
+                    ("skill_description", str(skill.get("description", "")).lower())
+                )
+        return [(field, text) for field, text in fields if text]
+
+    def add(self, agent_id: str, agent_card: Any) -> None:
+        """Index (or re-index) an agent card."""
+        order = self._order.get(agent_id)
+        self.remove(agent_id)
+        if order is None:
+            order = self._next_order
+            self._next_order += 1
+
+        fields = self._extract_fields(agent_card)
+        self._fields[agent_id] = fields
+        self._order[agent_id] = order
+        for position, (_field, text) in enumerate(fields):
+            for gram in _ngrams(text):
+                self._grams.setdefault(gram, set()).add(agent_id)
+            for token in _tokens(text):
+                masks = self._tokens.setdefault(token, {})
+                masks[agent_id] = masks.get(agent_id, 0) | (1 << position)
+
+    def remove(self, agent_id: str) -> None:
+        """Drop an agent from the index."""
+        fields = self._fields.pop(agent_id, None)
+        self._order.pop(agent_id, None)
+        if not fields:
+            return
+        for _field, text in fields:
+            for gram in _ngrams(text):
+                ids = self._grams.get(gram)
+                if ids is not None:
+                    ids.discard(agent_id)
+                    if not ids:
+                        del self._grams[gram]
+            for token in _tokens(text):
+                masks = self._tokens.get(token)
+                if masks is not None:
+                    masks.pop(agent_id, None)
+                    if not masks:
+                        del self._tokens[token]
+
+    def _candidates(self, query: str) -> set[str] | list[str]:
+        if len(query) < NGRAM_SIZE:
+            return list(self._fields)
+        postings = []
+        for gram in _ngrams(query):
+            ids = self._grams.get(gram)
+            if not ids:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates &= ids
+            if not candidates:
+                break
+        return candidates
+
+    def _score(
+        self, agent_id: str, query: str, word_mask: int, skill_descriptions: bool
+    ) -> float:
+        score = 0.0
+        for position, (field, text) in enumerate(self._fields[agent_id]):
+            if query not in text:
+                continue
+            if field == "skill_description" and not skill_descriptions:
+                continue
+            weight = FIELD_WEIGHTS[field]
+            if text == query:
+                weight *= 3.0
+            elif word_mask >> position & 1:
+                weight *= 2.0
+            elif text.startswith(query):
+                weight *= 1.5
+            score += weight
+        return score
+
+    def search(
+        self, query: str, limit: int | None = None, skill_descriptions: bool = False
+    ) -> list[str]:
+        """Return ids of agents matching ``query``, best matches first.
+
+        Args:
+            query: Case-insensitive substring to look for
+            limit: Optional maximum number of results (top-k)
+            skill_descriptions: Also match skill descriptions
+
+        Returns:
+            Matching agent ids ranked by score, then registration order
+        """
+        query = query.lower()
+        if not query:
+            ranked = sorted(self._fields, key=self._order.__getitem__)
+            return ranked[:limit] if limit is not None else ranked
+
+        word_masks = self._tokens.get(query, {})
+        scored = []
+        for agent_id in self._candidates(query):
+            score = self._score(
+                agent_id, query, word_masks.get(agent_id, 0), skill_descriptions
+            )
+            if score > 0:
+                scored.append((-score, self._order[agent_id], agent_id))
+
+        if limit is not None:
+            top = heapq.nsmallest(limit, scored)
+        else:
+            top = sorted(scored)
+        return [agent_id for _score, _order, agent_id in top]
+
+
+class SkillIndex:
+    """Skill id postings: the agents that have each skill.
+
+    Used to resolve skill filters to agent ids before a search, and to
+    estimate how selective a filter is.
+    """
+
+    def __init__(self) -> None:
+        self._agents: dict[str, set[str]] = {}
+        self._skills: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def add(self, agent_id: str, agent_card: Any) -> None:
+        """Index (or re-index) an agent's skill ids."""
+        self.remove(agent_id)
+        skills = {
+            str(skill.get("id", ""))
+            for skill in agent_card.get("skills", []) or []
+            if isinstance(skill, dict)
+        }
+        skills.discard("")
+        if not skills:
+            return
+        self._skills[agent_id] = skills
+        for skill in skills:
+            self._agents.setdefault(skill, set()).add(agent_id)
+
+    def remove(self, agent_id: str) -> None:
+        """Drop an agent from the index."""
+        for skill in self._skills.pop(agent_id, ()):
+            agents = self._agents[skill]
+            agents.discard(agent_id)
+            if not agents:
+                del self._agents[skill]
+
+    def agents(self, skills: list[str]) -> set[str]:
+        """Ids of agents that have any of ``skills``."""
+        matched: set[str] = set()
+        for skill in skills:
+            matched |= self._agents.get(skill, set())
+        return matched
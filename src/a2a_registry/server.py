@@ -1,10 +1,13 @@
 """A2A Registry server using FastAPI and FastA2A schemas with dual transport support."""
 
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 from urllib.parse import unquote
 
-from fasta2a.schema import AgentCard  # type: ignore
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 from jsonrpcserver import async_dispatch
@@ -17,7 +20,13 @@ from . import (
     jsonrpc_server,  # noqa: F401
 )
 from .config import config
-from .storage import storage
+from .storage import (
+    batch_search_agents,
+    bulk_register_agents,
+    extract_agent_extensions,
+    storage,
+    validate_agent_card,
+)
 
 GRAPHQL_AVAILABLE = False
 
@@ -36,12 +45,50 @@ class AgentSearchRequest(BaseModel):
     query: str
 
 
+class AgentBatchSearchRequest(BaseModel):
+    """Request to search for agents for many queries at once."""
+
+    queries: list[str]
+    skills: list[str] | None = None
+    search_mode: str = "SEARCH_MODE_VECTOR"
+    similarity_threshold: float = 0.5
+    max_results: int = 10
+    min_index_seq: int | None = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Migrate vectors to the field schema on startup, persist them on shutdown.
+
+    Shutdown also saves the hot search queries, then closes the storage:
+    queued index work is drained, background threads are stopped and pending
+    journal writes are committed.
+    """
+    if hasattr(storage, "migrate_vectors"):
+        try:
+            await storage.migrate_vectors()
+        except Exception as e:
+            logger.error(f"Failed to re-index vectors: {e}")
+    yield
+    if hasattr(storage, "save_vectors"):
+        try:
+            storage.save_vectors()
+        except Exception as e:
+            logger.error(f"Failed to save vectors on shutdown: {e}")
+    try:
+        # Draining the indexing queue can take a while; keep the loop free
+        await asyncio.to_thread(storage.close)
+    except Exception as e:
+        logger.error(f"Failed to close storage on shutdown: {e}")
+
+
 def create_app() -> FastAPI:
     """Create FastAPI application for A2A Registry."""
     app = FastAPI(
         title="A2A Registry",
         description="Agent-to-Agent Registry Service with GraphQL",
         version=__version__,
+        lifespan=lifespan,
     )
 
     # Try to initialize GraphQL extension storage and setup GraphQL API if available
@@ -62,49 +109,14 @@ def create_app() -> FastAPI:
         """Register an agent in the registry."""
         try:
             # AgentCard is a TypedDict, so we can use the dict directly
-            # but we should validate required fields
-            agent_card_dict = request.agent_card
-
-            # Validate required fields for AgentCard
-            required_fields = [
-                "name",
-                "description",
-                "url",
-                "version",
-                "protocol_version",
-            ]
-            for field in required_fields:
-                if field not in agent_card_dict:
-                    raise ValueError(f"Missing required field: {field}")
-
-            # Set default transport to JSONRPC per A2A specification
-            if "preferred_transport" not in agent_card_dict:
-                agent_card_dict["preferred_transport"] = "JSONRPC"
-
-            # Cast to AgentCard type for type safety
-            agent_card: AgentCard = agent_card_dict  # type: ignore
+            # once required fields are validated
+            agent_card = validate_agent_card(request.agent_card)
             success = await storage.register_agent(agent_card)
 
             if success:
                 # Extract and update agent extensions
                 agent_id = agent_card["name"]
-                extensions = []
-
-                # Get extensions from agent card capabilities
-                capabilities = agent_card.get("capabilities", {})
-                if isinstance(capabilities, dict):
-                    agent_extensions = capabilities.get("extensions", [])
-                    if isinstance(agent_extensions, list):
-                        extensions = [
-                            {
-                                "uri": ext.get("uri", ""),
-                                "description": ext.get("description", ""),
-                                "required": ext.get("required", False),
-                                "params": ext.get("params", {}),
-                            }
-                            for ext in agent_extensions
-                            if isinstance(ext, dict) and ext.get("uri")
-                        ]
+                extensions = extract_agent_extensions(agent_card)
 
                 # Update agent extensions in storage
                 await storage.update_agent_extensions(agent_id, extensions)
@@ -114,6 +126,8 @@ def create_app() -> FastAPI:
                     "agent_id": agent_id,
                     "message": "Agent registered successfully",
                     "extensions_processed": len(extensions),
+                    # Pass as min_index_seq to search once vectors are built
+                    "index_seq": await storage.get_agent_index_seq(agent_id),
                 }
             else:
                 raise HTTPException(status_code=400, detail="Failed to register agent")
@@ -122,6 +136,46 @@ def create_app() -> FastAPI:
             logger.error(f"Error registering agent: {e}")
             raise HTTPException(status_code=400, detail=str(e)) from e
 
+    @app.post("/agents:batch", response_model=dict[str, Any])
+    async def register_agents(request: Request) -> dict[str, Any]:
+        """Register many agents in one request.
+
+        Accepts either a JSON body ``{"agent_cards": [...]}`` or newline-delimited
+        JSON (``application/x-ndjson``) with one agent card per line. Each card
+        gets its own result, so invalid cards do not fail the whole batch.
+        """
+        try:
+            body = await request.body()
+            content_type = request.headers.get("content-type", "")
+            agent_cards: Any
+            if "ndjson" in content_type or "jsonl" in content_type:
+                agent_cards = [
+                    json.loads(line) for line in body.splitlines() if line.strip()
+                ]
+                # Lines may also be wrapped like single registrations
+                agent_cards = [
+                    card.get("agent_card", card) if isinstance(card, dict) else card
+                    for card in agent_cards
+                ]
+            else:
+                payload = json.loads(body or b"null")
+                agent_cards = (
+                    payload.get("agent_cards") if isinstance(payload, dict) else None
+                )
+            if not isinstance(agent_cards, list):
+                raise ValueError("Request must contain an 'agent_cards' list")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+        results = await bulk_register_agents(storage, agent_cards)
+        registered_count = sum(1 for result in results if result["success"])
+        return {
+            "success": registered_count == len(results),
+            "results": results,
+            "registered_count": registered_count,
+            "failed_count": len(results) - registered_count,
+        }
+
     @app.get("/agents/{agent_id}", response_model=dict[str, Any])
     async def get_agent(agent_id: str) -> dict[str, Any]:
         """Get an agent by ID."""
@@ -164,6 +218,33 @@ def create_app() -> FastAPI:
             "query": request.query,
         }
 
+    @app.post("/agents/search:batch", response_model=dict[str, Any])
+    async def search_agents_batch(request: AgentBatchSearchRequest) -> dict[str, Any]:
+        """Search for agents for many queries; results come back in query order."""
+        batch = await batch_search_agents(
+            storage,
+            request.queries,
+            skills=request.skills,
+            search_mode=request.search_mode,
+            similarity_threshold=request.similarity_threshold,
+            max_results=request.max_results,
+            min_index_seq=request.min_index_seq,
+        )
+        return {
+            "results": [
+                {
+                    "query": query,
+                    "agents": [dict(agent) for agent, _ in results],
+                    "count": len(results),
+                    "similarity_scores": [
+                        score for _, score in results if score is not None
+                    ],
+                }
+                for query, results in zip(request.queries, batch, strict=True)
+            ],
+            "count": len(batch),
+        }
+
     # Extension discovery endpoints
     @app.get("/extensions", response_model=dict[str, Any])
     async def list_extensions(
@@ -282,9 +363,11 @@ def create_app() -> FastAPI:
                 "transport": "HTTP+JSON",
                 "endpoints": {
                     "register": "POST /agents",
+                    "register_batch": "POST /agents:batch",
                     "get": "GET /agents/{id}",
                     "list": "GET /agents",
                     "search": "POST /agents/search",
+                    "search_batch": "POST /agents/search:batch",
                     "unregister": "DELETE /agents/{id}",
                     "list_extensions": "GET /extensions",
                     "get_extension": "GET /extensions/{uri}",
@@ -0,0 +1,634 @@
+"""SQLite storage backend for A2A Registry."""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from fasta2a.schema import AgentCard  # type: ignore
+
+from .config import config
+from .search_index import NGRAM_SIZE
+from .storage import ExtensionInfo, StorageBackend, card_content_hash
+
+logger = logging.getLogger(__name__)
+
+FTS_SCHEMA = """CREATE VIRTUAL TABLE IF NOT EXISTS agents_fts USING fts5(
+    name, description, skills, skill_descriptions, tokenize = 'trigram'
+)"""
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS agents (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    card TEXT NOT NULL,
+    card_hash TEXT,
+    last_seen TEXT
+);
+{FTS_SCHEMA};
+CREATE TABLE IF NOT EXISTS extensions (
+    rowid INTEGER PRIMARY KEY,
+    uri TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL,
+    required INTEGER NOT NULL,
+    params TEXT NOT NULL,
+    first_declared_by_agent TEXT NOT NULL,
+    first_declared_at TEXT NOT NULL,
+    trust_level TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS extensions_trust_level ON extensions (trust_level, rowid);
+CREATE TABLE IF NOT EXISTS extension_agents (
+    extension INTEGER NOT NULL REFERENCES extensions (rowid) ON DELETE CASCADE,
+    agent_id TEXT NOT NULL,
+    PRIMARY KEY (extension, agent_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS extension_agents_agent ON extension_agents (agent_id);
+"""
+
+# Ranking weights for name, description, skill and skill description
+# matches, as in KeywordIndex
+_FTS_COLUMNS = ("name", "description", "skills", "skill_descriptions")
+_BM25_WEIGHTS = (3.0, 1.0, 2.0, 1.0)
+
+
+def _fts_phrase(query: str) -> str:
+    """Quote ``query`` as an FTS5 phrase (a substring with the trigram tokenizer)."""
+    return '"' + query.replace('"', '""') + '"'
+
+
+def _like_pattern(query: str) -> str:
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class _Transaction:
+    """Serialize access to the connection and wrap it in BEGIN/COMMIT."""
+
+    def __init__(
+        self, conn: sqlite3.Connection, lock: threading.RLock, on_rollback: Any
+    ) -> None:
+        self.conn = conn
+        self.lock = lock
+        self.on_rollback = on_rollback
+
+    def __enter__(self) -> None:
+        self.lock.acquire()
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+        except Exception:
+            self.lock.release()
+            raise
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc_type is None:
+                self.conn.execute("COMMIT")
+            else:
+                self.conn.execute("ROLLBACK")
+                self.on_rollback()
+        finally:
+            self.lock.release()
+
+
+class SQLiteStorage(StorageBackend):
+    """SQLite-backed persistent storage for agent registry.
+
+    Agent cards live in the database and are loaded on demand through a
+    bounded LRU cache, so resident memory does not grow with the registry and
+    startup does not parse the whole registry. Keyword search uses an FTS5
+    trigram index (substring semantics like the other backends), and
+    extension filters and pagination run as indexed SQL queries. The database
+    runs in WAL mode so readers do not block the writer.
+    """
+
+    def __init__(self, data_dir: str = "/data", cache_size: int = 10000) -> None:
+        """Initialize SQLite storage.
+
+        Args:
+            data_dir: Directory holding ``registry.db``
+            cache_size: Maximum number of agent cards kept in memory
+        """
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.db_file = self.data_dir / "registry.db"
+        self.cache_size = max(cache_size, 0)
+        self._cache: OrderedDict[str, AgentCard] = OrderedDict()
+        self._lock = threading.RLock()
+
+        is_new = not self.db_file.exists()
+        self._conn = sqlite3.connect(
+            self.db_file, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+
+        if is_new:
+            self._import_json_files()
+
+    def _migrate(self) -> None:
+        """Add columns introduced after a database was created."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(agents)")}
+        for column in ("card_hash", "last_seen"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE agents ADD COLUMN {column} TEXT")
+
+        # FTS5 tables cannot gain columns: rebuild the index from the cards
+        fts_columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(agents_fts)")
+        }
+        if "skill_descriptions" not in fts_columns:
+            with self._transaction():
+                self._conn.execute("DROP TABLE agents_fts")
+                self._conn.execute(FTS_SCHEMA)
+                for rowid, card in self._conn.execute(
+                    "SELECT rowid, card FROM agents"
+                ).fetchall():
+                    self._index_agent_text(rowid, json.loads(card))
+            logger.info("Rebuilt the SQLite keyword index with skill descriptions")
+
+    def _transaction(self) -> Any:
+        """Context manager running the enclosed statements in one transaction."""
+        # Cached cards may reflect the rolled back writes
+        return _Transaction(self._conn, self._lock, self._cache.clear)
+
+    def _import_json_files(self) -> None:
+        """Import agents.json / extensions.json left by FileStorage, if any."""
+        agents_file = self.data_dir / "agents.json"
+        extensions_file = self.data_dir / "extensions.json"
+        try:
+            with self._transaction():
+                if agents_file.exists():
+                    with open(agents_file, encoding="utf-8") as f:
+                        agents = json.load(f)
+                    for agent_card in agents.values():
+                        self._put_agent(agent_card)
+                    logger.info(f"Imported {len(agents)} agents from {agents_file}")
+                if extensions_file.exists():
+                    with open(extensions_file, encoding="utf-8") as f:
+                        extensions = json.load(f)
+                    for ext_data in extensions.values():
+                        self._put_extension(ExtensionInfo.from_dict(ext_data))
+                    logger.info(
+                        f"Imported {len(extensions)} extensions from {extensions_file}"
+                    )
+        except Exception as e:
+            logger.warning(f"Failed to import JSON files into SQLite storage: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # Agent card cache
+    def _cache_get(self, agent_id: str) -> AgentCard | None:
+        agent_card = self._cache.get(agent_id)
+        if agent_card is not None:
+            self._cache.move_to_end(agent_id)
+        return agent_card
+
+    def _cache_put(self, agent_id: str, agent_card: AgentCard) -> None:
+        if self.cache_size == 0:
+            return
+        self._cache[agent_id] = agent_card
+        self._cache.move_to_end(agent_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _load_agents(self, agent_ids: list[str]) -> list[AgentCard]:
+        """Fetch cards in ``agent_ids`` order, from the cache where possible."""
+        cards: dict[str, AgentCard] = {}
+        missing = []
+        for agent_id in agent_ids:
+            agent_card = self._cache_get(agent_id)
+            if agent_card is None:
+                missing.append(agent_id)
+            else:
+                cards[agent_id] = agent_card
+        # Stay below SQLite's bound parameter limit
+        for start in range(0, len(missing), 500):
+            chunk = missing[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT id, card FROM agents WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+            for agent_id, card in rows:
+                agent_card = json.loads(card)
+                cards[agent_id] = agent_card
+                self._cache_put(agent_id, agent_card)
+        return [cards[agent_id] for agent_id in agent_ids if agent_id in cards]
+
+    # Agent operations
+    def _put_agent(self, agent_card: AgentCard) -> bool:
+        """Upsert an agent row and its search index entry (inside a transaction).
+
+        Returns:
+            False if the stored card was identical and only last-seen changed
+        """
+        agent_id = agent_card["name"]
+        card_hash = card_content_hash(agent_card)
+        now = datetime.now(UTC).isoformat()
+        row = self._conn.execute(
+            "SELECT rowid, card_hash FROM agents WHERE id = ?", (agent_id,)
+        ).fetchone()
+        if row is not None and row[1] == card_hash:
+            self._conn.execute(
+                "UPDATE agents SET last_seen = ? WHERE rowid = ?", (now, row[0])
+            )
+            return False
+
+        self._conn.execute(
+            "INSERT INTO agents (id, card, card_hash, last_seen) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET card = excluded.card, "
+            "card_hash = excluded.card_hash, last_seen = excluded.last_seen",
+            (agent_id, json.dumps(agent_card, ensure_ascii=False), card_hash, now),
+        )
+        (rowid,) = self._conn.execute(
+            "SELECT rowid FROM agents WHERE id = ?", (agent_id,)
+        ).fetchone()
+        self._conn.execute("DELETE FROM agents_fts WHERE rowid = ?", (rowid,))
+        self._index_agent_text(rowid, agent_card)
+        self._cache_put(agent_id, agent_card)
+        return True
+
+    def _index_agent_text(self, rowid: int, agent_card: AgentCard) -> None:
+        """Add a card's searchable text to the keyword index."""
+        skills = [
+            skill
+            for skill in agent_card.get("skills", []) or []
+            if isinstance(skill, dict)
+        ]
+        self._conn.execute(
+            "INSERT INTO agents_fts (rowid, name, description, skills, "
+            "skill_descriptions) VALUES (?, ?, ?, ?, ?)",
+            (
+                rowid,
+                str(agent_card.get("name", "")),
+                str(agent_card.get("description", "")),
+                "\n".join(str(skill.get("id", "")) for skill in skills),
+                "\n".join(str(skill.get("description", "")) for skill in skills),
+            ),
+        )
+
+    async def register_agent(self, agent_card: AgentCard) -> bool:
+        """Register an agent in the registry."""
+        agent_id = agent_card.get("name")
+        if not agent_id:
+            return False
+        with self._transaction():
+            changed = self._put_agent(agent_card)
+        if changed:
+            logger.info(f"Registered agent: {agent_id}")
+        else:
+            logger.debug(f"Agent unchanged, refreshed last seen: {agent_id}")
+        return True
+
+    async def get_agent_card_hash(self, agent_id: str) -> str | None:
+        """Content hash of the stored card of ``agent_id``, if registered."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT card_hash, card FROM agents WHERE id = ?", (agent_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0] or card_content_hash(json.loads(row[1]))
+
+    async def get_agent_last_seen(self, agent_id: str) -> datetime | None:
+        """When ``agent_id`` last (re-)registered."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_seen FROM agents WHERE id = ?", (agent_id,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return datetime.fromisoformat(row[0])
+
+    async def register_agents(self, agent_cards: list[AgentCard]) -> list[bool]:
+        """Register several agents in a single transaction."""
+        results = []
+        with self._transaction():
+            for agent_card in agent_cards:
+                if not agent_card.get("name"):
+                    results.append(False)
+                    continue
+                self._put_agent(agent_card)
+                results.append(True)
+        logger.info(f"Registered {sum(results)} agents in bulk")
+        return results
+
+    async def get_agent(self, agent_id: str) -> AgentCard | None:
+        """Get an agent by ID."""
+        cards = self._load_agents([agent_id])
+        return cards[0] if cards else None
+
+    async def get_agents(self, agent_ids: list[str]) -> list[AgentCard | None]:
+        """Get several agents by ID with one query per 500 missing from cache."""
+        cards = {
+            agent_card["name"]: agent_card
+            for agent_card in self._load_agents(agent_ids)
+        }
+        return [cards.get(agent_id) for agent_id in agent_ids]
+
+    async def list_agents(self) -> list[AgentCard]:
+        """List all registered agents."""
+        # Streamed straight from the table so a full listing does not evict
+        # the hot entries of the cache
+        with self._lock:
+            rows = self._conn.execute("SELECT card FROM agents ORDER BY rowid")
+            return [json.loads(card) for (card,) in rows]
+
+    async def unregister_agent(self, agent_id: str) -> bool:
+        """Unregister an agent."""
+        with self._transaction():
+            row = self._conn.execute(
+                "SELECT rowid FROM agents WHERE id = ?", (agent_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM agents WHERE rowid = ?", row)
+            self._conn.execute("DELETE FROM agents_fts WHERE rowid = ?", row)
+        self._cache.pop(agent_id, None)
+        logger.info(f"Unregistered agent: {agent_id}")
+        return True
+
+    async def search_agents(
+        self, query: str, limit: int | None = None, skill_descriptions: bool = False
+    ) -> list[AgentCard]:
+        """Search agents by name, description, or capabilities."""
+        limit_sql = -1 if limit is None else limit
+        columns = _FTS_COLUMNS if skill_descriptions else _FTS_COLUMNS[:-1]
+        if not query:
+            sql = "SELECT id FROM agents ORDER BY rowid LIMIT ?"
+            params: Any = (limit_sql,)
+        elif len(query) < NGRAM_SIZE:
+            # Too short for trigram lookups; rank a LIKE scan the same way
+            matches = [f"(f.{column} LIKE :p ESCAPE '\\')" for column in columns]
+            rank = " + ".join(
+                f"{match} * {weight}"
+                for match, weight in zip(matches, _BM25_WEIGHTS, strict=False)
+            )
+            sql = (
+                "SELECT a.id FROM agents_fts f JOIN agents a ON a.rowid = f.rowid "
+                f"WHERE {' OR '.join(matches)} "
+                f"ORDER BY {rank} DESC, a.rowid LIMIT :limit"
+            )
+            params = {"p": _like_pattern(query), "limit": limit_sql}
+        else:
+            sql = (
+                "SELECT a.id FROM agents_fts f JOIN agents a ON a.rowid = f.rowid "
+                "WHERE agents_fts MATCH ? "
+                "ORDER BY bm25(agents_fts, ?, ?, ?, ?), a.rowid LIMIT ?"
+            )
+            phrase = f"{{{' '.join(columns)}}} : {_fts_phrase(query)}"
+            params = (phrase, *_BM25_WEIGHTS, limit_sql)
+
+        with self._lock:
+            agent_ids = [agent_id for (agent_id,) in self._conn.execute(sql, params)]
+        return self._load_agents(agent_ids)
+
+    # Extension-related methods
+    def _put_extension(self, extension_info: ExtensionInfo) -> None:
+        """Upsert an extension and its declaring agents (inside a transaction)."""
+        self._conn.execute(
+            "INSERT INTO extensions (uri, description, required, params, "
+            "first_declared_by_agent, first_declared_at, trust_level) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (uri) DO UPDATE SET description = excluded.description, "
+            "required = excluded.required, params = excluded.params, "
+            "first_declared_by_agent = excluded.first_declared_by_agent, "
+            "first_declared_at = excluded.first_declared_at, "
+            "trust_level = excluded.trust_level",
+            (
+                extension_info.uri,
+                extension_info.description,
+                int(extension_info.required),
+                json.dumps(extension_info.params, ensure_ascii=False),
+                extension_info.first_declared_by_agent,
+                extension_info.first_declared_at.isoformat(),
+                extension_info.trust_level,
+            ),
+        )
+        (rowid,) = self._conn.execute(
+            "SELECT rowid FROM extensions WHERE uri = ?", (extension_info.uri,)
+        ).fetchone()
+        self._conn.execute("DELETE FROM extension_agents WHERE extension = ?", (rowid,))
+        self._conn.executemany(
+            "INSERT INTO extension_agents (extension, agent_id) VALUES (?, ?)",
+            [(rowid, agent_id) for agent_id in extension_info.declaring_agents],
+        )
+
+    def _extensions_from_rows(self, rows: Iterable[tuple]) -> list[ExtensionInfo]:
+        """Build ExtensionInfo objects (with declaring agents) from table rows."""
+        extensions: dict[int, ExtensionInfo] = {}
+        for (
+            rowid,
+            uri,
+            description,
+            required,
+            params,
+            first_declared_by_agent,
+            first_declared_at,
+            trust_level,
+        ) in rows:
+            ext_info = ExtensionInfo(
+                uri=uri,
+                description=description,
+                required=bool(required),
+                params=json.loads(params),
+                first_declared_at=datetime.fromisoformat(first_declared_at),
+                trust_level=trust_level,
+            )
+            ext_info.first_declared_by_agent = first_declared_by_agent
+            extensions[rowid] = ext_info
+
+        rowids = list(extensions)
+        for start in range(0, len(rowids), 500):
+            chunk = rowids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for rowid, agent_id in self._conn.execute(
+                "SELECT extension, agent_id FROM extension_agents "
+                f"WHERE extension IN ({placeholders})",
+                chunk,
+            ):
+                extensions[rowid].declaring_agents.add(agent_id)
+        return list(extensions.values())
+
+    _EXTENSION_COLUMNS = (
+        "e.rowid, e.uri, e.description, e.required, e.params, "
+        "e.first_declared_by_agent, e.first_declared_at, e.trust_level"
+    )
+
+    async def store_extension(self, extension_info: ExtensionInfo) -> bool:
+        """Store extension information."""
+        with self._transaction():
+            self._put_extension(extension_info)
+        logger.info(f"Stored extension: {extension_info.uri}")
+        return True
+
+    async def get_extension(self, uri: str) -> ExtensionInfo | None:
+        """Get extension information by URI."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._EXTENSION_COLUMNS} FROM extensions e WHERE e.uri = ?",
+                (uri,),
+            ).fetchall()
+            extensions = self._extensions_from_rows(rows)
+        return extensions[0] if extensions else None
+
+    async def list_extensions(
+        self,
+        uri_pattern: str | None = None,
+        declaring_agents: list[str] | None = None,
+        trust_levels: list[str] | None = None,
+        page_size: int = 100,
+        page_token: str | None = None,
+    ) -> tuple[list[ExtensionInfo], str | None, int]:
+        """List extensions with optional filtering and pagination."""
+        conditions = []
+        params: list[Any] = []
+        if declaring_agents:
+            placeholders = ",".join("?" * len(declaring_agents))
+            conditions.append(
+                "e.rowid IN (SELECT extension FROM extension_agents "
+                f"WHERE agent_id IN ({placeholders}))"
+            )
+            params.extend(declaring_agents)
+        if trust_levels:
+            placeholders = ",".join("?" * len(trust_levels))
+            conditions.append(f"e.trust_level IN ({placeholders})")
+            params.extend(trust_levels)
+        if uri_pattern:
+            conditions.append("instr(lower(e.uri), ?) > 0")
+            params.append(uri_pattern.lower())
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        start_idx = 0
+        if page_token:
+            try:
+                start_idx = int(page_token)
+            except ValueError:
+                start_idx = 0
+
+        with self._lock:
+            (total_count,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM extensions e {where}", params
+            ).fetchone()
+            rows = self._conn.execute(
+                f"SELECT {self._EXTENSION_COLUMNS} FROM extensions e {where} "
+                "ORDER BY e.rowid LIMIT ? OFFSET ?",
+                [*params, page_size, start_idx],
+            ).fetchall()
+            page_extensions = self._extensions_from_rows(rows)
+
+        end_idx = start_idx + page_size
+        next_page_token = None
+        if end_idx < total_count:
+            next_page_token = str(end_idx)
+
+        return page_extensions, next_page_token, total_count
+
+    async def get_agent_extensions(self, agent_id: str) -> list[ExtensionInfo]:
+        """Get all extensions used by a specific agent."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._EXTENSION_COLUMNS} FROM extension_agents x "
+                "JOIN extensions e ON e.rowid = x.extension "
+                "WHERE x.agent_id = ? ORDER BY e.rowid",
+                (agent_id,),
+            ).fetchall()
+            return self._extensions_from_rows(rows)
+
+    def _remove_agent_from_extensions(self, agent_id: str) -> None:
+        """Drop an agent's declarations and orphaned extensions (in a transaction)."""
+        rowids = [
+            rowid
+            for (rowid,) in self._conn.execute(
+                "SELECT extension FROM extension_agents WHERE agent_id = ?",
+                (agent_id,),
+            ).fetchall()
+        ]
+        if not rowids:
+            return
+        self._conn.execute(
+            "DELETE FROM extension_agents WHERE agent_id = ?", (agent_id,)
+        )
+        placeholders = ",".join("?" * len(rowids))
+        orphaned = self._conn.execute(
+            f"SELECT rowid, uri FROM extensions WHERE rowid IN ({placeholders}) "
+            "AND NOT EXISTS (SELECT 1 FROM extension_agents x "
+            "WHERE x.extension = extensions.rowid)",
+            rowids,
+        ).fetchall()
+        # If no agents are using an extension anymore, remove it
+        for rowid, uri in orphaned:
+            self._conn.execute("DELETE FROM extensions WHERE rowid = ?", (rowid,))
+            logger.info(f"Removed unused extension: {uri}")
+
+    def _set_agent_extensions(self, agent_id: str, extensions: list[dict]) -> None:
+        """Replace an agent's extension declarations (in a transaction)."""
+        # Remove agent from all current extensions
+        self._remove_agent_from_extensions(agent_id)
+
+        # Add agent to new extensions
+        for ext_data in extensions:
+            uri = ext_data.get("uri", "")
+            if not uri:
+                continue
+
+            # Check if extension is allowed in current mode
+            if not config.is_extension_allowed(uri):
+                logger.warning(f"Extension {uri} not allowed in current mode")
+                continue
+
+            row = self._conn.execute(
+                "SELECT rowid FROM extensions WHERE uri = ?", (uri,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO extension_agents (extension, agent_id) "
+                    "VALUES (?, ?)",
+                    (row[0], agent_id),
+                )
+            else:
+                # Create new extension info
+                self._put_extension(
+                    ExtensionInfo(
+                        uri=uri,
+                        description=ext_data.get("description", ""),
+                        required=ext_data.get("required", False),
+                        params=ext_data.get("params", {}),
+                        first_declared_by_agent=agent_id,
+                        trust_level=config.get_default_trust_level(),
+                    )
+                )
+                logger.info(f"Stored extension: {uri}")
+
+    async def update_agent_extensions(
+        self, agent_id: str, extensions: list[dict]
+    ) -> bool:
+        """Update extensions for an agent."""
+        with self._transaction():
+            self._set_agent_extensions(agent_id, extensions)
+        return True
+
+    async def update_agents_extensions(
+        self, agent_extensions: dict[str, list[dict]]
+    ) -> None:
+        """Update the extensions of several agents in one transaction."""
+        with self._transaction():
+            for agent_id, extensions in agent_extensions.items():
+                self._set_agent_extensions(agent_id, extensions)
+
+    async def remove_agent_from_extensions(self, agent_id: str) -> bool:
+        """Remove agent from all extension declarations."""
+        with self._transaction():
+            self._remove_agent_from_extensions(agent_id)
+        return True
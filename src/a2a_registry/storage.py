@@ -1,17 +1,132 @@
 """Storage module for A2A Registry."""
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from fasta2a.schema import AgentCard  # type: ignore
 
 from .config import config
+from .journal import StorageJournal
+from .search_index import KeywordIndex
 
 logger = logging.getLogger(__name__)
 
+# Fields every registered AgentCard must carry
+REQUIRED_AGENT_CARD_FIELDS = [
+    "name",
+    "description",
+    "url",
+    "version",
+    "protocol_version",
+]
+
+
+def validate_agent_card(agent_card: dict[str, Any]) -> AgentCard:
+    """Validate an agent card and apply protocol defaults.
+
+    Args:
+        agent_card: Agent card data following FastA2A schema
+
+    Returns:
+        The same card, typed as an AgentCard
+
+    Raises:
+        ValueError: If a required field is missing
+    """
+    if not isinstance(agent_card, dict):
+        raise ValueError("Agent card must be an object")
+    for field in REQUIRED_AGENT_CARD_FIELDS:
+        if field not in agent_card:
+            raise ValueError(f"Missing required field: {field}")
+
+    # Set default transport to JSONRPC per A2A specification
+    if "preferred_transport" not in agent_card:
+        agent_card["preferred_transport"] = "JSONRPC"
+    return agent_card  # type: ignore
+
+
+def extract_agent_extensions(agent_card: AgentCard) -> list[dict[str, Any]]:
+    """Extract the extensions declared in an agent card's capabilities."""
+    capabilities = agent_card.get("capabilities", {})
+    if not isinstance(capabilities, dict):
+        return []
+    agent_extensions = capabilities.get("extensions", [])
+    if not isinstance(agent_extensions, list):
+        return []
+    return [
+        {
+            "uri": ext.get("uri", ""),
+            "description": ext.get("description", ""),
+            "required": ext.get("required", False),
+            "params": ext.get("params", {}),
+        }
+        for ext in agent_extensions
+        if isinstance(ext, dict) and ext.get("uri")
+    ]
+
+
+def card_content_hash(agent_card: AgentCard) -> str:
+    """Content hash of an agent card, independent of key order."""
+    canonical = json.dumps(
+        agent_card,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class AgentFingerprints:
+    """Content hashes and last-seen times of registered agent cards.
+
+    Lets backends recognise a re-registration of an identical card and skip
+    re-indexing and persistence, only refreshing the last-seen time. Hashes
+    are computed lazily from the stored card, so loading a registry does not
+    hash every card. Last-seen times are kept in memory only.
+    """
+
+    def __init__(self) -> None:
+        self._hashes: dict[str, str] = {}
+        self.last_seen: dict[str, datetime] = {}
+
+    def hash_of(self, agent_id: str, stored_card: AgentCard | None) -> str | None:
+        """Hash of the currently stored card of ``agent_id``."""
+        if stored_card is None:
+            return None
+        card_hash = self._hashes.get(agent_id)
+        if card_hash is None:
+            card_hash = self._hashes[agent_id] = card_content_hash(stored_card)
+        return card_hash
+
+    def touch_if_unchanged(
+        self, agent_id: str, stored_card: AgentCard | None, card_hash: str
+    ) -> bool:
+        """Refresh last-seen and return True if ``card_hash`` is already stored."""
+        if self.hash_of(agent_id, stored_card) != card_hash:
+            return False
+        self.last_seen[agent_id] = datetime.now(UTC)
+        return True
+
+    def record(self, agent_id: str, card_hash: str) -> None:
+        """Remember the hash of a newly stored card."""
+        self._hashes[agent_id] = card_hash
+        self.last_seen[agent_id] = datetime.now(UTC)
+
+    def remove(self, agent_id: str) -> None:
+        """Forget an unregistered agent."""
+        self._hashes.pop(agent_id, None)
+        self.last_seen.pop(agent_id, None)
+
 
 class ExtensionInfo:
     """Information about an agent extension with provenance tracking."""
@@ -80,6 +195,112 @@ class ExtensionInfo:
         return ext_info
 
 
+class ExtensionIndex:
+    """Secondary indexes over stored extensions.
+
+    Maintains agent_id -> URIs (the reverse of ``ExtensionInfo.declaring_agents``)
+    and trust level -> URIs buckets, so per-agent lookups and trust-level
+    filtering do not scan every extension. Storage backends must route every
+    change to declaring agents or trust level through this index. The index
+    remembers what it indexed, so re-storing an object mutated in place (for
+    example a new ``trust_level``) moves it to the right buckets.
+    """
+
+    def __init__(self) -> None:
+        self.by_agent: dict[str, set[str]] = {}
+        self.by_trust_level: dict[str, set[str]] = {}
+        # What was indexed per URI, independent of later in-place mutation
+        self._trust_level_of: dict[str, str] = {}
+        self._agents_of: dict[str, set[str]] = {}
+        # Stable insertion order, used to keep filtered results in storage order
+        self._sequence: dict[str, int] = {}
+        self._next_sequence = 0
+
+    def add(self, ext_info: ExtensionInfo) -> None:
+        """Index an extension (again) with all of its declaring agents."""
+        uri = ext_info.uri
+        self._unindex(uri)
+        if uri not in self._sequence:
+            self._sequence[uri] = self._next_sequence
+            self._next_sequence += 1
+        self._trust_level_of[uri] = ext_info.trust_level
+        self.by_trust_level.setdefault(ext_info.trust_level, set()).add(uri)
+        for agent_id in ext_info.declaring_agents:
+            self.add_agent(uri, agent_id)
+
+    def remove(self, ext_info: ExtensionInfo) -> None:
+        """Drop an extension from all indexes."""
+        self._unindex(ext_info.uri)
+        self._sequence.pop(ext_info.uri, None)
+
+    def _unindex(self, uri: str) -> None:
+        trust_level = self._trust_level_of.pop(uri, None)
+        if trust_level is None:
+            return
+        self._discard(self.by_trust_level, trust_level, uri)
+        for agent_id in self._agents_of.pop(uri, set()):
+            self._discard(self.by_agent, agent_id, uri)
+
+    def add_agent(self, uri: str, agent_id: str) -> None:
+        """Record that ``agent_id`` declares ``uri``."""
+        self.by_agent.setdefault(agent_id, set()).add(uri)
+        self._agents_of.setdefault(uri, set()).add(agent_id)
+
+    def remove_agent(self, uri: str, agent_id: str) -> None:
+        """Record that ``agent_id`` no longer declares ``uri``."""
+        self._discard(self.by_agent, agent_id, uri)
+        self._discard(self._agents_of, uri, agent_id)
+
+    def uris_for_agent(self, agent_id: str) -> list[str]:
+        """URIs declared by ``agent_id`` in storage insertion order."""
+        return self.ordered(self.by_agent.get(agent_id, set()))
+
+    @staticmethod
+    def _discard(buckets: dict[str, set[str]], key: str, member: str) -> None:
+        members = buckets.get(key)
+        if members is not None:
+            members.discard(member)
+            if not members:
+                del buckets[key]
+
+    def ordered(self, uris: set[str]) -> list[str]:
+        """Return ``uris`` in storage insertion order."""
+        return sorted(uris, key=lambda uri: self._sequence.get(uri, -1))
+
+    def select(
+        self,
+        extensions: dict[str, ExtensionInfo],
+        uri_pattern: str | None = None,
+        declaring_agents: list[str] | None = None,
+        trust_levels: list[str] | None = None,
+    ) -> list[ExtensionInfo]:
+        """Apply ``list_extensions`` filters using the indexes."""
+        candidates: set[str] | None = None
+        if declaring_agents:
+            candidates = set()
+            for agent_id in declaring_agents:
+                candidates |= self.by_agent.get(agent_id, set())
+
+        if trust_levels:
+            by_trust: set[str] = set()
+            for trust_level in trust_levels:
+                by_trust |= self.by_trust_level.get(trust_level, set())
+            candidates = by_trust if candidates is None else candidates & by_trust
+
+        if candidates is None:
+            selected = list(extensions.values())
+        else:
+            selected = [
+                extensions[uri] for uri in self.ordered(candidates) if uri in extensions
+            ]
+
+        if uri_pattern:
+            pattern = uri_pattern.lower()
+            selected = [ext for ext in selected if pattern in ext.uri.lower()]
+
+        return selected
+
+
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
 
@@ -88,11 +309,54 @@ class StorageBackend(ABC):
         """Register an agent in the registry."""
         pass
 
+    async def register_agents(self, agent_cards: list[AgentCard]) -> list[bool]:
+        """Register several agents at once.
+
+        Backends override this to persist a batch in one write; the default
+        registers the cards one by one.
+
+        Returns:
+            Per-card success flags, in input order
+        """
+        return [await self.register_agent(agent_card) for agent_card in agent_cards]
+
+    async def get_agent_card_hash(self, agent_id: str) -> str | None:
+        """Content hash of the stored card of ``agent_id``, if registered."""
+        agent_card = await self.get_agent(agent_id)
+        return card_content_hash(agent_card) if agent_card is not None else None
+
+    async def get_agent_last_seen(self, agent_id: str) -> datetime | None:
+        """When ``agent_id`` last (re-)registered, if the backend tracks it."""
+        return None
+
+    async def get_agent_index_seq(self, agent_id: str) -> int | None:
+        """Index sequence number covering the latest write of ``agent_id``.
+
+        Only backends that index asynchronously return one; pass it as
+        ``min_index_seq`` to a search to read your own registration.
+        """
+        return None
+
+    def close(self) -> None:
+        """Flush pending writes and release files and threads (default: none)."""
+        return None
+
     @abstractmethod
     async def get_agent(self, agent_id: str) -> AgentCard | None:
         """Get an agent by ID."""
         pass
 
+    async def get_agents(self, agent_ids: list[str]) -> list[AgentCard | None]:
+        """Get several agents by ID.
+
+        Backends override this to fetch all cards in one lookup; the default
+        gets them one by one.
+
+        Returns:
+            Per-id cards (None if not registered), in input order
+        """
+        return [await self.get_agent(agent_id) for agent_id in agent_ids]
+
     @abstractmethod
     async def list_agents(self) -> list[AgentCard]:
         """List all registered agents."""
@@ -104,8 +368,14 @@ class StorageBackend(ABC):
         pass
 
     @abstractmethod
-    async def search_agents(self, query: str) -> list[AgentCard]:
-        """Search agents by name, description, or capabilities."""
+    async def search_agents(
+        self, query: str, limit: int | None = None, skill_descriptions: bool = False
+    ) -> list[AgentCard]:
+        """Search agents by name, description, or capabilities.
+
+        Results are ranked best match first; ``limit`` caps them (top-k).
+        With ``skill_descriptions`` skill descriptions are matched too.
+        """
         pass
 
     # Extension-related abstract methods
@@ -143,6 +413,20 @@ class StorageBackend(ABC):
         """Update extensions for an agent."""
         pass
 
+    async def update_agents_extensions(
+        self, agent_extensions: dict[str, list[dict]]
+    ) -> None:
+        """Update the extensions of several agents at once.
+
+        Backends override this to persist a batch in one write; the default
+        updates the agents one by one.
+
+        Args:
+            agent_extensions: Extensions declared by each agent
+        """
+        for agent_id, extensions in agent_extensions.items():
+            await self.update_agent_extensions(agent_id, extensions)
+
     @abstractmethod
     async def remove_agent_from_extensions(self, agent_id: str) -> bool:
         """Remove agent from all extension declarations."""
@@ -155,20 +439,43 @@ class InMemoryStorage(StorageBackend):
     def __init__(self) -> None:
         self._agents: dict[str, AgentCard] = {}
         self._extensions: dict[str, ExtensionInfo] = {}
+        self._extension_index = ExtensionIndex()
+        self._keyword_index = KeywordIndex()
+        self._fingerprints = AgentFingerprints()
 
     async def register_agent(self, agent_card: AgentCard) -> bool:
         """Register an agent in the registry."""
         agent_id = agent_card.get("name")
         if not agent_id:
             return False
+        card_hash = card_content_hash(agent_card)
+        if self._fingerprints.touch_if_unchanged(
+            agent_id, self._agents.get(agent_id), card_hash
+        ):
+            logger.debug(f"Agent unchanged, refreshed last seen: {agent_id}")
+            return True
         self._agents[agent_id] = agent_card
+        self._keyword_index.add(agent_id, agent_card)
+        self._fingerprints.record(agent_id, card_hash)
         logger.info(f"Registered agent: {agent_id}")
         return True
 
+    async def get_agent_card_hash(self, agent_id: str) -> str | None:
+        """Content hash of the stored card of ``agent_id``, if registered."""
+        return self._fingerprints.hash_of(agent_id, self._agents.get(agent_id))
+
+    async def get_agent_last_seen(self, agent_id: str) -> datetime | None:
+        """When ``agent_id`` last (re-)registered."""
+        return self._fingerprints.last_seen.get(agent_id)
+
     async def get_agent(self, agent_id: str) -> AgentCard | None:
         """Get an agent by ID."""
         return self._agents.get(agent_id)
 
+    async def get_agents(self, agent_ids: list[str]) -> list[AgentCard | None]:
+        """Get several agents by ID."""
+        return [self._agents.get(agent_id) for agent_id in agent_ids]
+
     async def list_agents(self) -> list[AgentCard]:
         """List all registered agents."""
         return list(self._agents.values())
@@ -177,33 +484,28 @@ class InMemoryStorage(StorageBackend):
         """Unregister an agent."""
         if agent_id in self._agents:
             del self._agents[agent_id]
+            self._keyword_index.remove(agent_id)
+            self._fingerprints.remove(agent_id)
             logger.info(f"Unregistered agent: {agent_id}")
             return True
         return False
 
-    async def search_agents(self, query: str) -> list[AgentCard]:
+    async def search_agents(
+        self, query: str, limit: int | None = None, skill_descriptions: bool = False
+    ) -> list[AgentCard]:
         """Search agents by name, description, or capabilities."""
-        results = []
-        query_lower = query.lower()
-
-        for agent in self._agents.values():
-            # Search in name, description, and skills
-            if (
-                query_lower in agent.get("name", "").lower()
-                or query_lower in agent.get("description", "").lower()
-                or any(
-                    query_lower in skill.get("id", "").lower()
-                    for skill in agent.get("skills", [])
-                )
-            ):
-                results.append(agent)
-
-        return results
+        agent_ids = self._keyword_index.search(query, limit, skill_descriptions)
+        return [self._agents[agent_id] for agent_id in agent_ids]
 
     # Extension-related methods
+    def _index_extension(self, extension_info: ExtensionInfo) -> None:
+        """Store an extension object and (re)build its index entries."""
+        self._extensions[extension_info.uri] = extension_info
+        self._extension_index.add(extension_info)
+
     async def store_extension(self, extension_info: ExtensionInfo) -> bool:
         """Store extension information."""
-        self._extensions[extension_info.uri] = extension_info
+        self._index_extension(extension_info)
         logger.info(f"Stored extension: {extension_info.uri}")
         return True
 
@@ -220,23 +522,9 @@ class InMemoryStorage(StorageBackend):
         page_token: str | None = None,
     ) -> tuple[list[ExtensionInfo], str | None, int]:
         """List extensions with optional filtering and pagination."""
-        extensions = list(self._extensions.values())
-
-        # Apply filters
-        if uri_pattern:
-            extensions = [
-                ext for ext in extensions if uri_pattern.lower() in ext.uri.lower()
-            ]
-
-        if declaring_agents:
-            extensions = [
-                ext
-                for ext in extensions
-                if any(agent in ext.declaring_agents for agent in declaring_agents)
-            ]
-
-        if trust_levels:
-            extensions = [ext for ext in extensions if ext.trust_level in trust_levels]
+        extensions = self._extension_index.select(
+            self._extensions, uri_pattern, declaring_agents, trust_levels
+        )
 
         # Simple pagination (in production, use more sophisticated approach)
         total_count = len(extensions)
@@ -259,7 +547,8 @@ class InMemoryStorage(StorageBackend):
     async def get_agent_extensions(self, agent_id: str) -> list[ExtensionInfo]:
         """Get all extensions used by a specific agent."""
         return [
-            ext for ext in self._extensions.values() if agent_id in ext.declaring_agents
+            self._extensions[uri]
+            for uri in self._extension_index.uris_for_agent(agent_id)
         ]
 
     async def update_agent_extensions(
@@ -283,6 +572,7 @@ class InMemoryStorage(StorageBackend):
             existing_ext = await self.get_extension(uri)
             if existing_ext:
                 existing_ext.add_declaring_agent(agent_id)
+                self._extension_index.add_agent(uri, agent_id)
             else:
                 # Create new extension info
                 ext_info = ExtensionInfo(
@@ -299,26 +589,36 @@ class InMemoryStorage(StorageBackend):
 
     async def remove_agent_from_extensions(self, agent_id: str) -> bool:
         """Remove agent from all extension declarations."""
-        extensions_to_remove = []
-
-        for uri, ext_info in self._extensions.items():
+        for uri in self._extension_index.uris_for_agent(agent_id):
+            ext_info = self._extensions[uri]
             ext_info.remove_declaring_agent(agent_id)
+            self._extension_index.remove_agent(uri, agent_id)
             # If no agents are using this extension anymore, remove it
             if ext_info.usage_count == 0:
-                extensions_to_remove.append(uri)
-
-        # Remove unused extensions
-        for uri in extensions_to_remove:
-            del self._extensions[uri]
-            logger.info(f"Removed unused extension: {uri}")
+                self._extension_index.remove(ext_info)
+                del self._extensions[uri]
+                logger.info(f"Removed unused extension: {uri}")
 
         return True
 
 
 class FileStorage(StorageBackend):
-    """File-based persistent storage for agent registry."""
+    """File-based persistent storage for agent registry.
 
-    def __init__(self, data_dir: str = "/data") -> None:
+    By default every mutation rewrites the full JSON file. With ``journal``
+    enabled, mutations are appended to a write-ahead journal with group
+    commit instead, and the JSON files become snapshots compacted in the
+    background. Startup replays snapshot + journal.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "/data",
+        journal: bool = False,
+        journal_commit_interval_ms: float = 2.0,
+        journal_max_batch_size: int = 512,
+        journal_compact_threshold: int = 10000,
+    ) -> None:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.agents_file = self.data_dir / "agents.json"
@@ -328,6 +628,25 @@ class FileStorage(StorageBackend):
         self._load_agents()
         self._load_extensions()
 
+        self._journal: StorageJournal | None = None
+        if journal:
+            self._journal = StorageJournal(
+                self.data_dir / "journal",
+                snapshot_writer=self._write_snapshot,
+                commit_interval_ms=journal_commit_interval_ms,
+                max_batch_size=journal_max_batch_size,
+                compact_threshold=journal_compact_threshold,
+            )
+            self._replay_journal()
+
+        self._keyword_index = KeywordIndex()
+        for agent_id, agent_card in self._agents.items():
+            self._keyword_index.add(agent_id, agent_card)
+        self._extension_index = ExtensionIndex()
+        for ext_info in self._extensions.values():
+            self._extension_index.add(ext_info)
+        self._fingerprints = AgentFingerprints()
+
     def _load_agents(self) -> None:
         """Load agents from file."""
         try:
@@ -380,20 +699,189 @@ class FileStorage(StorageBackend):
         except Exception as e:
             logger.error(f"Failed to save extensions to file: {e}")
 
+    def _replay_journal(self) -> None:
+        """Apply journaled mutations on top of the loaded snapshot."""
+        if self._journal is None:
+            return
+        replayed = 0
+        for record in self._journal.replay():
+            op = record.get("op")
+            if op == "put_agent":
+                self._agents[record["id"]] = record["card"]
+            elif op == "delete_agent":
+                self._agents.pop(record["id"], None)
+            elif op == "put_extension":
+                self._extensions[record["uri"]] = ExtensionInfo.from_dict(
+                    record["extension"]
+                )
+            elif op == "delete_extension":
+                self._extensions.pop(record["uri"], None)
+            else:
+                logger.warning(f"Unknown journal operation: {op}")
+                continue
+            replayed += 1
+        if replayed:
+            logger.info(f"Replayed {replayed} journal records from {self.data_dir}")
+
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Any) -> None:
+        """Write JSON to a temporary file, fsync it and rename it over ``path``."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _capture_snapshot(self) -> tuple[dict[str, AgentCard], dict[str, dict]]:
+        """Capture the current state for a background snapshot."""
+        return dict(self._agents), {
+            uri: ext.to_dict() for uri, ext in self._extensions.items()
+        }
+
+    def _write_snapshot(self, snapshot: tuple[dict, dict]) -> None:
+        """Persist a captured snapshot (runs on the journal compaction thread)."""
+        agents, extensions = snapshot
+        self._write_json_atomic(self.agents_file, agents)
+        self._write_json_atomic(self.extensions_file, extensions)
+        logger.debug(
+            f"Wrote snapshot of {len(agents)} agents and {len(extensions)} extensions"
+        )
+
+    async def _append_journal(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the journal and wait for their group commit.
+
+        Raises:
+            Exception: If the records could not be made durable
+        """
+        assert self._journal is not None
+        futures = [self._journal.append(record) for record in records]
+        await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+        if self._journal.needs_compaction:
+            self._journal.compact(self._capture_snapshot())
+
+    async def _persist_agents(self, agent_ids: Iterable[str]) -> None:
+        """Persist the current state of the given agents."""
+        if self._journal is None:
+            self._save_agents()
+            return
+        records: list[dict[str, Any]] = []
+        for agent_id in agent_ids:
+            agent_card = self._agents.get(agent_id)
+            if agent_card is None:
+                records.append({"op": "delete_agent", "id": agent_id})
+            else:
+                records.append({"op": "put_agent", "id": agent_id, "card": agent_card})
+        if records:
+            await self._append_journal(records)
+
+    async def _persist_extensions(self, uris: Iterable[str]) -> None:
+        """Persist the current state of the given extensions."""
+        if self._journal is None:
+            self._save_extensions()
+            return
+        records: list[dict[str, Any]] = []
+        for uri in uris:
+            ext_info = self._extensions.get(uri)
+            if ext_info is None:
+                records.append({"op": "delete_extension", "uri": uri})
+            else:
+                records.append(
+                    {"op": "put_extension", "uri": uri, "extension": ext_info.to_dict()}
+                )
+        if records:
+            await self._append_journal(records)
+
+    def close(self) -> None:
+        """Flush and stop the journal, if enabled."""
+        if self._journal is not None:
+            self._journal.close()
+
     async def register_agent(self, agent_card: AgentCard) -> bool:
         """Register an agent in the registry."""
         agent_id = agent_card.get("name")
         if not agent_id:
             return False
-        self._agents[agent_id] = agent_card
-        self._save_agents()
+        previous = self._agents.get(agent_id)
+        if not self._store_agent(agent_id, agent_card):
+            logger.debug(f"Agent unchanged, refreshed last seen: {agent_id}")
+            return True
+        try:
+            await self._persist_agents([agent_id])
+        except Exception as e:
+            logger.error(f"Failed to persist agent {agent_id}: {e}")
+            self._restore_agent(agent_id, previous)
+            return False
         logger.info(f"Registered agent: {agent_id}")
         return True
 
+    async def register_agents(self, agent_cards: list[AgentCard]) -> list[bool]:
+        """Register several agents, persisting them in a single write."""
+        results = []
+        previous: dict[str, AgentCard | None] = {}
+        registered: dict[str, None] = {}
+        for agent_card in agent_cards:
+            agent_id = agent_card.get("name")
+            if not agent_id:
+                results.append(False)
+                continue
+            previous.setdefault(agent_id, self._agents.get(agent_id))
+            if self._store_agent(agent_id, agent_card):
+                registered[agent_id] = None
+            results.append(True)
+        if registered:
+            try:
+                await self._persist_agents(registered)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(registered)} agents: {e}")
+                for agent_id in registered:
+                    self._restore_agent(agent_id, previous[agent_id])
+                return [
+                    success and agent_card.get("name") not in registered
+                    for agent_card, success in zip(agent_cards, results, strict=True)
+                ]
+            logger.info(f"Registered {len(registered)} agents in bulk")
+        return results
+
+    def _store_agent(self, agent_id: str, agent_card: AgentCard) -> bool:
+        """Store and index a card; return False if it was unchanged."""
+        card_hash = card_content_hash(agent_card)
+        if self._fingerprints.touch_if_unchanged(
+            agent_id, self._agents.get(agent_id), card_hash
+        ):
+            return False
+        self._agents[agent_id] = agent_card
+        self._keyword_index.add(agent_id, agent_card)
+        self._fingerprints.record(agent_id, card_hash)
+        return True
+
+    def _restore_agent(self, agent_id: str, agent_card: AgentCard | None) -> None:
+        """Put back the card ``agent_id`` had before a failed write."""
+        if agent_card is None:
+            self._agents.pop(agent_id, None)
+            self._keyword_index.remove(agent_id)
+            self._fingerprints.remove(agent_id)
+            return
+        self._agents[agent_id] = agent_card
+        self._keyword_index.add(agent_id, agent_card)
+        self._fingerprints.record(agent_id, card_content_hash(agent_card))
+
+    async def get_agent_card_hash(self, agent_id: str) -> str | None:
+        """Content hash of the stored card of ``agent_id``, if registered."""
+        return self._fingerprints.hash_of(agent_id, self._agents.get(agent_id))
+
+    async def get_agent_last_seen(self, agent_id: str) -> datetime | None:
+        """When ``agent_id`` last (re-)registered since startup."""
+        return self._fingerprints.last_seen.get(agent_id)
+
     async def get_agent(self, agent_id: str) -> AgentCard | None:
         """Get an agent by ID."""
         return self._agents.get(agent_id)
 
+    async def get_agents(self, agent_ids: list[str]) -> list[AgentCard | None]:
+        """Get several agents by ID."""
+        return [self._agents.get(agent_id) for agent_id in agent_ids]
+
     async def list_agents(self) -> list[AgentCard]:
         """List all registered agents."""
         return list(self._agents.values())
@@ -401,36 +889,70 @@ class FileStorage(StorageBackend):
     async def unregister_agent(self, agent_id: str) -> bool:
         """Unregister an agent."""
         if agent_id in self._agents:
-            del self._agents[agent_id]
-            self._save_agents()
+            previous = self._agents.pop(agent_id)
+            self._keyword_index.remove(agent_id)
+            self._fingerprints.remove(agent_id)
+            try:
+                await self._persist_agents([agent_id])
+            except Exception as e:
+                logger.error(f"Failed to persist unregistering {agent_id}: {e}")
+                self._restore_agent(agent_id, previous)
+                return False
             logger.info(f"Unregistered agent: {agent_id}")
             return True
         return False
 
-    async def search_agents(self, query: str) -> list[AgentCard]:
+    async def search_agents(
+        self, query: str, limit: int | None = None, skill_descriptions: bool = False
+    ) -> list[AgentCard]:
         """Search agents by name, description, or capabilities."""
-        results = []
-        query_lower = query.lower()
-
-        for agent in self._agents.values():
-            # Search in name, description, and skills
-            if (
-                query_lower in agent.get("name", "").lower()
-                or query_lower in agent.get("description", "").lower()
-                or any(
-                    query_lower in skill.get("id", "").lower()
-                    for skill in agent.get("skills", [])
-                )
-            ):
-                results.append(agent)
-
-        return results
+        agent_ids = self._keyword_index.search(query, limit, skill_descriptions)
+        return [self._agents[agent_id] for agent_id in agent_ids]
 
     # Extension-related methods (similar to InMemoryStorage but with file persistence)
+    def _index_extension(self, extension_info: ExtensionInfo) -> None:
+        """Store an extension object and (re)build its index entries."""
+        self._extensions[extension_info.uri] = extension_info
+        self._extension_index.add(extension_info)
+
+    def _copy_extensions(self, uris: Iterable[str]) -> dict[str, ExtensionInfo | None]:
+        """Copies of the given extensions, to put back after a failed write."""
+        copies: dict[str, ExtensionInfo | None] = {}
+        for uri in uris:
+            ext_info = self._extensions.get(uri)
+            copies[uri] = (
+                ExtensionInfo.from_dict(ext_info.to_dict()) if ext_info else None
+            )
+        return copies
+
+    def _restore_extensions(self, previous: dict[str, ExtensionInfo | None]) -> None:
+        """Put back the extensions captured by ``_copy_extensions``."""
+        for uri, ext_info in previous.items():
+            if ext_info is not None:
+                self._index_extension(ext_info)
+            elif uri in self._extensions:
+                self._extension_index.remove(self._extensions.pop(uri))
+
+    async def _persist_extensions_or_restore(
+        self, uris: Iterable[str], previous: dict[str, ExtensionInfo | None]
+    ) -> bool:
+        """Persist the given extensions; on failure restore ``previous``."""
+        try:
+            await self._persist_extensions(uris)
+        except Exception as e:
+            logger.error(f"Failed to persist extensions: {e}")
+            self._restore_extensions(previous)
+            return False
+        return True
+
     async def store_extension(self, extension_info: ExtensionInfo) -> bool:
         """Store extension information."""
-        self._extensions[extension_info.uri] = extension_info
-        self._save_extensions()
+        previous = self._copy_extensions([extension_info.uri])
+        self._index_extension(extension_info)
+        if not await self._persist_extensions_or_restore(
+            [extension_info.uri], previous
+        ):
+            return False
         logger.info(f"Stored extension: {extension_info.uri}")
         return True
 
@@ -447,23 +969,9 @@ class FileStorage(StorageBackend):
         page_token: str | None = None,
     ) -> tuple[list[ExtensionInfo], str | None, int]:
         """List extensions with optional filtering and pagination."""
-        extensions = list(self._extensions.values())
-
-        # Apply filters
-        if uri_pattern:
-            extensions = [
-                ext for ext in extensions if uri_pattern.lower() in ext.uri.lower()
-            ]
-
-        if declaring_agents:
-            extensions = [
-                ext
-                for ext in extensions
-                if any(agent in ext.declaring_agents for agent in declaring_agents)
-            ]
-
-        if trust_levels:
-            extensions = [ext for ext in extensions if ext.trust_level in trust_levels]
+        extensions = self._extension_index.select(
+            self._extensions, uri_pattern, declaring_agents, trust_levels
+        )
 
         # Simple pagination
         total_count = len(extensions)
@@ -486,15 +994,16 @@ class FileStorage(StorageBackend):
     async def get_agent_extensions(self, agent_id: str) -> list[ExtensionInfo]:
         """Get all extensions used by a specific agent."""
         return [
-            ext for ext in self._extensions.values() if agent_id in ext.declaring_agents
+            self._extensions[uri]
+            for uri in self._extension_index.uris_for_agent(agent_id)
         ]
 
-    async def update_agent_extensions(
+    def _set_agent_extensions(
         self, agent_id: str, extensions: list[dict]
-    ) -> bool:
-        """Update extensions for an agent."""
+    ) -> dict[str, None]:
+        """Replace an agent's extensions in memory; return the modified URIs."""
         # Remove agent from all current extensions
-        await self.remove_agent_from_extensions(agent_id)
+        modified_uris = self._detach_agent_extensions(agent_id)
 
         # Add agent to new extensions
         for ext_data in extensions:
@@ -507,10 +1016,10 @@ class FileStorage(StorageBackend):
                 logger.warning(f"Extension {uri} not allowed in current mode")
                 continue
 
-            existing_ext = await self.get_extension(uri)
+            existing_ext = self._extensions.get(uri)
             if existing_ext:
                 existing_ext.add_declaring_agent(agent_id)
-                self._save_extensions()  # Save after modification
+                self._extension_index.add_agent(uri, agent_id)
             else:
                 # Create new extension info
                 ext_info = ExtensionInfo(
@@ -521,35 +1030,182 @@ class FileStorage(StorageBackend):
                     first_declared_by_agent=agent_id,
                     trust_level=config.get_default_trust_level(),
                 )
-                await self.store_extension(ext_info)
+                self._index_extension(ext_info)
+                logger.info(f"Stored extension: {uri}")
+            modified_uris[uri] = None
+
+        return modified_uris
+
+    def _extension_uris(self, agent_id: str, extensions: list[dict]) -> list[str]:
+        """URIs ``_set_agent_extensions`` may modify for ``agent_id``."""
+        uris = self._extension_index.uris_for_agent(agent_id)
+        return uris + [
+            ext_data["uri"] for ext_data in extensions if ext_data.get("uri")
+        ]
+
+    def _detach_agent_extensions(self, agent_id: str) -> dict[str, None]:
+        """Drop an agent's declarations in memory; return the modified URIs."""
+        modified_uris = dict.fromkeys(self._extension_index.uris_for_agent(agent_id))
+
+        for uri in modified_uris:
+            ext_info = self._extensions[uri]
+            ext_info.remove_declaring_agent(agent_id)
+            self._extension_index.remove_agent(uri, agent_id)
+            # If no agents are using this extension anymore, remove it
+            if ext_info.usage_count == 0:
+                self._extension_index.remove(ext_info)
+                del self._extensions[uri]
+                logger.info(f"Removed unused extension: {uri}")
 
+        return modified_uris
+
+    async def update_agent_extensions(
+        self, agent_id: str, extensions: list[dict]
+    ) -> bool:
+        """Update extensions for an agent."""
+        previous = self._copy_extensions(self._extension_uris(agent_id, extensions))
+        modified_uris = self._set_agent_extensions(agent_id, extensions)
+        if modified_uris:
+            return await self._persist_extensions_or_restore(modified_uris, previous)
         return True
 
+    async def update_agents_extensions(
+        self, agent_extensions: dict[str, list[dict]]
+    ) -> None:
+        """Update the extensions of several agents, persisting them in one write."""
+        previous = self._copy_extensions(
+            uri
+            for agent_id, extensions in agent_extensions.items()
+            for uri in self._extension_uris(agent_id, extensions)
+        )
+        modified_uris: dict[str, None] = {}
+        for agent_id, extensions in agent_extensions.items():
+            modified_uris.update(self._set_agent_extensions(agent_id, extensions))
+        if modified_uris:
+            await self._persist_extensions_or_restore(modified_uris, previous)
+
     async def remove_agent_from_extensions(self, agent_id: str) -> bool:
         """Remove agent from all extension declarations."""
-        extensions_to_remove = []
-        modified = False
-
-        for uri, ext_info in self._extensions.items():
-            if agent_id in ext_info.declaring_agents:
-                ext_info.remove_declaring_agent(agent_id)
-                modified = True
-                # If no agents are using this extension anymore, remove it
-                if ext_info.usage_count == 0:
-                    extensions_to_remove.append(uri)
-
-        # Remove unused extensions
-        for uri in extensions_to_remove:
-            del self._extensions[uri]
-            logger.info(f"Removed unused extension: {uri}")
-            modified = True
-
-        if modified:
-            self._save_extensions()
-
+        previous = self._copy_extensions(self._extension_index.uris_for_agent(agent_id))
+        modified_uris = self._detach_agent_extensions(agent_id)
+        if modified_uris:
+            return await self._persist_extensions_or_restore(modified_uris, previous)
         return True
 
 
+async def bulk_register_agents(
+    backend: StorageBackend, agent_cards: list[Any]
+) -> list[dict[str, Any]]:
+    """Validate and register a batch of agent cards.
+
+    Every card is validated first; the valid ones are handed to the backend's
+    ``register_agents`` in one call so they are persisted and embedded together.
+
+    Args:
+        backend: Storage backend to register into
+        agent_cards: Agent card dictionaries following FastA2A schema
+
+    Returns:
+        One result per input card, in input order, with ``index``,
+        ``success``, ``agent_id`` and either ``extensions_processed`` and
+        ``index_seq`` or ``error``
+    """
+    results: list[dict[str, Any]] = []
+    valid: list[tuple[int, AgentCard]] = []
+    for index, agent_card in enumerate(agent_cards):
+        agent_id = agent_card.get("name") if isinstance(agent_card, dict) else None
+        result: dict[str, Any] = {
+            "index": index,
+            "success": False,
+            "agent_id": agent_id,
+        }
+        try:
+            valid.append((index, validate_agent_card(agent_card)))
+        except ValueError as e:
+            result["error"] = str(e)
+        results.append(result)
+
+    if not valid:
+        return results
+
+    registered = await backend.register_agents([card for _index, card in valid])
+    agent_extensions: dict[str, list[dict]] = {}
+    for (index, agent_card), success in zip(valid, registered, strict=True):
+        result = results[index]
+        if not success:
+            result["error"] = "Failed to register agent"
+            continue
+        extensions = extract_agent_extensions(agent_card)
+        agent_id = agent_card["name"]
+        # Skip the extension write for agents that neither have nor had any
+        if extensions or await backend.get_agent_extensions(agent_id):
+            agent_extensions[agent_id] = extensions
+        result["success"] = True
+        result["extensions_processed"] = len(extensions)
+        result["index_seq"] = await backend.get_agent_index_seq(agent_id)
+    # Persist every agent's extensions in one write
+    if agent_extensions:
+        await backend.update_agents_extensions(agent_extensions)
+    return results
+
+
+async def batch_search_agents(
+    backend: StorageBackend,
+    queries: list[str],
+    skills: list[str] | None = None,
+    search_mode: str = "SEARCH_MODE_VECTOR",
+    similarity_threshold: float = 0.5,
+    max_results: int = 10,
+    min_index_seq: int | None = None,
+) -> list[list[tuple[AgentCard, float | None]]]:
+    """Search agents for several queries.
+
+    Vector-enhanced backends encode and search all queries together; other
+    backends run one keyword search per query.
+
+    Args:
+        backend: Storage backend to search
+        queries: Search queries
+        skills: Optional skill IDs an agent must have one of
+        search_mode: "SEARCH_MODE_KEYWORD" or "SEARCH_MODE_VECTOR"
+        similarity_threshold: Minimum similarity score for vector search
+        max_results: Maximum number of results per query
+        min_index_seq: Index sequence number vector search must reflect
+
+    Returns:
+        One list of (agent_card, similarity_score) tuples per query, in order;
+        scores are None for keyword search
+    """
+    results: list[list[tuple[AgentCard, float | None]]]
+    if hasattr(backend, "search_agents_batch"):
+        results = await backend.search_agents_batch(
+            queries,
+            skills=skills,
+            search_mode=search_mode,
+            similarity_threshold=similarity_threshold,
+            max_results=max_results,
+            min_index_seq=min_index_seq,
+        )
+        return results
+
+    results = []
+    for query in queries:
+        # An empty query matches all agents
+        agents = await backend.search_agents(
+            query or "", None if skills else max_results
+        )
+        if skills:
+            agents = [
+                agent
+                for agent in agents
+                if any(
+                    skill.get("id", "") in skills for skill in agent.get("skills", [])
+                )
+            ]
+        results.append([(agent, None) for agent in agents[:max_results]])
+    return results
+
+
 def get_storage_backend() -> StorageBackend:
     """Get the appropriate storage backend based on environment configuration."""
     storage_type = config.storage_type
@@ -557,7 +1213,18 @@ def get_storage_backend() -> StorageBackend:
 
     if storage_type == "file":
         logger.info(f"Using file storage backend with data directory: {data_dir}")
-        return FileStorage(data_dir)
+        return FileStorage(
+            data_dir,
+            journal=config.storage_journal,
+            journal_commit_interval_ms=config.storage_journal_commit_interval_ms,
+            journal_max_batch_size=config.storage_journal_max_batch_size,
+            journal_compact_threshold=config.storage_journal_compact_threshold,
+        )
+    elif storage_type == "sqlite":
+        from .sqlite_storage import SQLiteStorage
+
+        logger.info(f"Using SQLite storage backend with data directory: {data_dir}")
+        return SQLiteStorage(data_dir, cache_size=config.storage_sqlite_cache_size)
     else:
         logger.info("Using in-memory storage backend")
         return InMemoryStorage()
@@ -582,5 +1249,32 @@ def get_vector_enhanced_storage() -> StorageBackend:
         return get_storage_backend()
 
 
+class LazyStorage:
+    """Storage backend built on first use.
+
+    Building the vector-enhanced storage loads the embedding model, which
+    takes seconds (and may reach the network), so the global instance is
+    only built when the registry first touches it rather than on import.
+    Attribute access is delegated to the built backend.
+    """
+
+    def __init__(self, factory: Callable[[], StorageBackend]) -> None:
+        # Own attributes are prefixed so they cannot shadow the backend's
+        self._lazy_factory = factory
+        self._lazy_backend: StorageBackend | None = None
+        self._lazy_lock = threading.Lock()
+
+    def get_backend(self) -> StorageBackend:
+        """The storage backend, built by the first caller."""
+        if self._lazy_backend is None:
+            with self._lazy_lock:
+                if self._lazy_backend is None:
+                    self._lazy_backend = self._lazy_factory()
+        return self._lazy_backend
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get_backend(), name)
+
+
 # Global storage instance (with vector enhancement if available)
-storage = get_vector_enhanced_storage()
+storage: StorageBackend = LazyStorage(get_vector_enhanced_storage)  # type: ignore[assignment]
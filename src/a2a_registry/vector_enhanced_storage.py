@@ -1,14 +1,26 @@
 """Vector-enhanced storage for A2A Registry with semantic search capabilities."""
 
+import asyncio
 import logging
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from datetime import datetime
+from functools import partial
 from typing import Any
 
 from fasta2a.schema import AgentCard
 
+from .config import config
+from .field_schema import PRESETS, FieldSchema
+from .indexing_queue import IndexingQueue
 from .proto.generated.registry_pb2 import Vector  # type: ignore
-from .storage import ExtensionInfo, StorageBackend
+from .query_cache import SearchCache
+from .query_encoder import QueryEncoder
+from .search_index import SkillIndex
+from .storage import ExtensionInfo, StorageBackend, card_content_hash
 from .vector_generator import VectorGenerator
-from .vector_store import FAISSVectorStore
+from .vector_store import FAISSVectorStore, rank_agent_scores
 
 logger = logging.getLogger(__name__)
 
@@ -16,36 +28,289 @@ logger = logging.getLogger(__name__)
 class VectorEnhancedStorage(StorageBackend):
     """Storage wrapper that adds vector search capabilities to any storage backend."""
 
-    def __init__(self, backend: StorageBackend, vector_model: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        backend: StorageBackend,
+        vector_model: str = "all-MiniLM-L6-v2",
+        async_indexing: bool | None = None,
+    ):
         """Initialize vector-enhanced storage.
 
         Args:
             backend: Underlying storage backend
-            vector_model: Sentence transformer model name
+            vector_model: Sentence transformer model name (see
+                          ``VECTOR_EMBEDDING_BACKEND`` for other backends)
+            async_indexing: Generate vectors on a background queue after the
+                            card is committed (defaults to config)
         """
         self.backend = backend
-        self.vector_generator = VectorGenerator(vector_model)
+        self.field_schema = FieldSchema.parse(config.vector_field_schema)
+        self.vector_generator = VectorGenerator(
+            vector_model,
+            batch_size=config.vector_embedding_batch_size,
+            cache_dir=config.vector_embedding_cache_dir or None,
+            cache_size=config.vector_embedding_cache_size,
+            workers=config.vector_embedding_workers,
+            field_schema=self.field_schema,
+            backend=config.vector_embedding_backend,
+            dimensions=config.vector_hashing_dimensions,
+            quantize=config.vector_onnx_quantize,
+        )
+        self.query_encoder = QueryEncoder(
+            self.vector_generator.generate_query_vectors,
+            max_batch_size=config.vector_query_batch_size,
+            max_wait_ms=config.vector_query_batch_wait_ms,
+        )
         self.vector_store = FAISSVectorStore(
             vector_dimensions=self.vector_generator.vector_dimensions or 384,
-            persist_path="data/vectors/index",
+            persist_path=config.vector_index_path or None,
+            index_type=config.vector_index_type,
+            ann_threshold=config.vector_ann_threshold,
+            hnsw_m=config.vector_hnsw_m,
+            hnsw_ef_search=config.vector_hnsw_ef_search,
+            ivf_nlist=config.vector_ivf_nlist,
+            ivf_nprobe=config.vector_ivf_nprobe,
+            pq_m=config.vector_pq_m,
+            vector_storage=config.vector_storage,
+            segment_size=config.vector_segment_size,
+            merge_factor=config.vector_segment_merge_factor,
+            flush_interval=config.vector_flush_interval_s,
+            filter_exact_selectivity=config.vector_filter_exact_selectivity,
+            field_weights=(
+                self.field_schema.weights if self.field_schema.weighted else None
+            ),
+        )
+        # Vectors of other fields or models are re-indexed by ``migrate_vectors``
+        indexed = self._indexed_schema()
+        current = (self.field_schema.signature, self.vector_generator.model_name)
+        self._schema_migration = indexed is not None and indexed != current
+        if not self._schema_migration:
+            self.vector_store.set_index_schema(*current)
+        # Guards the vector store against the indexing thread
+        self._vector_lock = threading.RLock()
+        if async_indexing is None:
+            async_indexing = config.vector_async_indexing
+        self.indexer = IndexingQueue(
+            self._index_jobs,
+            max_batch_size=config.vector_index_batch_size,
+            background=async_indexing,
         )
+        self._agent_index_seq: dict[str, int] = {}
+        # Skill postings for filtered search, built from the backend on first use
+        self._skill_index: SkillIndex | None = None
+        self.search_cache = SearchCache(
+            embedding_size=config.vector_query_cache_size,
+            result_size=config.vector_result_cache_size,
+        )
+        if config.vector_hot_queries_path:
+            self._prewarm(SearchCache.load_hot_queries(config.vector_hot_queries_path))
         logger.info(f"Initialized vector-enhanced storage with {vector_model}")
 
+    def _prewarm(self, queries: list[str]) -> None:
+        """Encode hot queries of the previous run into the embedding cache."""
+        if not queries or not self.search_cache.embeddings.max_size:
+            return
+
+        def cache(query: str, future: Future) -> None:
+            if future.exception() is None:
+                self.search_cache.embeddings.put(query, future.result())
+
+        for query in queries:
+            self.query_encoder.submit(query).add_done_callback(partial(cache, query))
+        logger.info(f"Pre-warming {len(queries)} query embeddings")
+
     async def register_agent(self, agent_card: AgentCard) -> bool:
-        """Register an agent and generate its vectors."""
+        """Register an agent and queue vector generation for its changed fields."""
+        agent_id = agent_card.get("name", "")
+        previous_hash = await self.backend.get_agent_card_hash(agent_id)
+
         # Store in underlying backend
         success = await self.backend.register_agent(agent_card)
         if not success:
             return False
 
-        # Generate and store vectors
-        await self._update_agent_vectors(agent_card)
+        self.search_cache.invalidate()
+        if self._skill_index is not None:
+            self._skill_index.add(agent_id, agent_card)
+        self._enqueue_upserts({agent_id: dict(agent_card)}, {agent_id: previous_hash})
         return True
 
+    async def register_agents(self, agent_cards: list[AgentCard]) -> list[bool]:
+        """Register several agents and queue their vector generation in bulk."""
+        previous_hashes = {
+            agent_id: await self.backend.get_agent_card_hash(agent_id)
+            for agent_id in {agent_card.get("name", "") for agent_card in agent_cards}
+        }
+        results = await self.backend.register_agents(agent_cards)
+
+        # Later cards win when a batch repeats an agent, as with register_agent
+        registered = {
+            agent_card.get("name", ""): dict(agent_card)
+            for agent_card, success in zip(agent_cards, results, strict=True)
+            if success
+        }
+        if registered:
+            self.search_cache.invalidate()
+        if self._skill_index is not None:
+            for agent_id, agent_card in registered.items():
+                self._skill_index.add(agent_id, agent_card)
+        self._enqueue_upserts(registered, previous_hashes)
+        return results
+
+    def _enqueue_upserts(
+        self,
+        agent_cards: dict[str, dict[str, Any]],
+        previous_hashes: dict[str, str | None],
+    ) -> None:
+        """Queue vector generation for registered cards that changed."""
+        agent_cards.pop("", None)
+        jobs = [
+            ("upsert", agent_id, agent_card)
+            for agent_id, agent_card in agent_cards.items()
+            if self._index_pending(agent_id)
+            or not self._is_unchanged(
+                agent_id, agent_card, previous_hashes.get(agent_id)
+            )
+        ]
+        self._enqueue(jobs)
+
+    def _enqueue(self, jobs: Sequence[tuple[str, str, dict[str, Any] | None]]) -> None:
+        """Queue index jobs and remember each agent's sequence number."""
+        if not jobs:
+            return
+        first_seq = self.indexer.last_seq + 1
+        for offset, (_op, agent_id, _card) in enumerate(jobs):
+            self._agent_index_seq[agent_id] = first_seq + offset
+        self.indexer.enqueue(jobs)
+
+    def _index_pending(self, agent_id: str) -> bool:
+        """Whether an index job for ``agent_id`` has not been applied yet."""
+        return self._agent_index_seq.get(agent_id, 0) > self.indexer.indexed_seq
+
+    def _index_jobs(self, jobs: list[tuple[str, str, dict[str, Any] | None]]) -> None:
+        """Apply queued upserts and removals (runs on the indexing thread)."""
+        # Only the last job per agent matters
+        final: dict[str, dict[str, Any] | None] = {}
+        for _op, agent_id, agent_card in jobs:
+            final.pop(agent_id, None)
+            final[agent_id] = agent_card
+        upserts = {
+            agent_id: card for agent_id, card in final.items() if card is not None
+        }
+
+        with self._vector_lock:
+            for agent_id, agent_card in final.items():
+                if agent_card is None:
+                    self.vector_store.remove_agent_vectors(agent_id)
+            existing = {
+                agent_id: self.vector_store.get_agent_vectors(agent_id)
+                for agent_id in upserts
+            }
+        if not upserts:
+            self.search_cache.invalidate()
+            return
+
+        # Embedding runs without the lock so searches continue meanwhile
+        agents_vectors = self.vector_generator.generate_agents_vectors(
+            list(upserts.items()), existing=existing
+        )
+        with self._vector_lock:
+            self.vector_store.add_agents_vectors(agents_vectors)
+        self.search_cache.invalidate()
+        logger.debug(f"Indexed vectors for {len(upserts)} agents")
+
+    def _indexed_schema(self) -> tuple[str, str] | None:
+        """Field schema signature and embedding model of the stored vectors.
+
+        Indexes saved before these were recorded hold every field, embedded
+        by the model named in their vectors' metadata.
+
+        Returns:
+            (field schema, embedding model), or None without stored vectors
+        """
+        store = self.vector_store
+        if not store.agent_vector_ids:
+            return None
+        embedding_model = store.embedding_model
+        if embedding_model is None:
+            vectors = store.get_agent_vectors(next(iter(store.agent_vector_ids)))
+            metadata = vectors[0].metadata
+            embedding_model = (
+                metadata["model"]
+                if "model" in metadata.fields
+                else self.vector_generator.model_name
+            )
+        return store.field_schema or ",".join(PRESETS["full"]), embedding_model
+
+    async def migrate_vectors(self) -> int:
+        """Re-index all agents if the index was built differently.
+
+        Runs on startup when ``VECTOR_FIELD_SCHEMA`` changed the embedded
+        fields or the embedding backend or model changed. With the same
+        model, stored embeddings of unchanged texts are reused, so switching
+        between presets encodes only texts no vector held before. Agents keep
+        their old vectors until re-indexed, and the new schema is recorded
+        with the index once every agent is done.
+
+        Returns:
+            Number of agents queued for re-indexing
+        """
+        if not self._schema_migration:
+            return 0
+        self._schema_migration = False
+        jobs = [
+            ("upsert", agent_card["name"], dict(agent_card))
+            for agent_card in await self.backend.list_agents()
+            if agent_card.get("name")
+        ]
+        self._enqueue(jobs)
+        signature = self.field_schema.signature
+        model_name = self.vector_generator.model_name
+
+        def record(_future: Future) -> None:
+            with self._vector_lock:
+                self.vector_store.set_index_schema(signature, model_name)
+            logger.info(f"Re-indexed {len(jobs)} agents")
+
+        logger.info(
+            f"Re-indexing {len(jobs)} agents for field schema {signature} "
+            f"and embedding model {model_name}"
+        )
+        self.indexer.wait_for_seq(self.indexer.last_seq).add_done_callback(record)
+        return len(jobs)
+
+    async def get_agent_index_seq(self, agent_id: str) -> int | None:
+        """Index sequence number covering the latest write of ``agent_id``."""
+        return self._agent_index_seq.get(agent_id, self.indexer.indexed_seq)
+
+    async def wait_for_index(self, seq: int, timeout: float | None = None) -> bool:
+        """Wait (bounded) until index sequence number ``seq`` is searchable.
+
+        Args:
+            seq: Sequence number returned by a registration
+            timeout: Max seconds to wait (defaults to config)
+
+        Returns:
+            True if ``seq`` is indexed, False if the wait timed out
+        """
+        if timeout is None:
+            timeout = config.vector_index_wait_timeout_ms / 1000.0
+        indexed = await self.indexer.wait(seq, timeout)
+        if not indexed:
+            logger.warning(
+                f"Index seq {seq} not reached within {timeout}s "
+                f"(indexed {self.indexer.indexed_seq})"
+            )
+        return indexed
+
     async def get_agent(self, agent_id: str) -> AgentCard | None:
         """Get an agent by ID."""
         return await self.backend.get_agent(agent_id)
 
+    async def get_agents(self, agent_ids: list[str]) -> list[AgentCard | None]:
+        """Get several agents by ID with one backend call."""
+        return await self.backend.get_agents(agent_ids)
+
     async def list_agents(self) -> list[AgentCard]:
         """List all registered agents."""
         return await self.backend.list_agents()
@@ -54,79 +319,211 @@ class VectorEnhancedStorage(StorageBackend):
         """Unregister an agent and remove its vectors."""
         success = await self.backend.unregister_agent(agent_id)
         if success:
-            self.vector_store.remove_agent_vectors(agent_id)
+            self.search_cache.invalidate()
+            if self._skill_index is not None:
+                self._skill_index.remove(agent_id)
+            self._enqueue([("remove", agent_id, None)])
         return success
 
-    async def search_agents(self, query: str) -> list[AgentCard]:
+    async def search_agents(
+        self, query: str, limit: int | None = None, skill_descriptions: bool = False
+    ) -> list[AgentCard]:
         """Search agents (default implementation uses keyword search)."""
-        return await self.backend.search_agents(query)
+        return await self.backend.search_agents(query, limit, skill_descriptions)
 
-    async def search_agents_keyword(self, query: str) -> list[AgentCard]:
+    async def search_agents_keyword(
+        self, query: str, limit: int | None = None
+    ) -> list[AgentCard]:
         """Search agents using keyword-based search."""
-        return await self.backend.search_agents(query)
+        return await self.backend.search_agents(query, limit)
 
     async def search_agents_vector(
-        self, query: str, similarity_threshold: float = 0.5, max_results: int = 10
+        self,
+        query: str,
+        similarity_threshold: float = 0.5,
+        max_results: int = 10,
+        min_index_seq: int | None = None,
+        skills: list[str] | None = None,
     ) -> list[tuple[AgentCard, float]]:
         """Search agents using vector similarity with information-theoretically sound aggregation.
 
+        Without a skill filter agents are retrieved in two stages: the nearest
+        agent centroids, re-ranked on all their field vectors (see
+        ``FAISSVectorStore.search_agents_by_centroid``).
+
         Args:
             query: Natural language search query
             similarity_threshold: Minimum similarity score
             max_results: Maximum number of results
+            min_index_seq: Wait (bounded) until this index sequence number
+                           is searchable, to read one's own registrations
+            skills: Only search agents with any of these skills
 
         Returns:
             List of (agent_card, similarity_score) tuples
         """
-        # Generate query vector
-        query_vector = self.vector_generator.generate_query_vector(query)
-
-        # Phase 1: Candidate generation - find all vectors above threshold
-        # Use a larger k to capture more candidate vectors
-        candidate_k = max_results * 10  # Expand search space for candidates
-        similar_vectors = self.vector_store.search_similar_vectors(
-            query_vector, k=candidate_k, similarity_threshold=similarity_threshold
+        if min_index_seq:
+            await self.wait_for_index(min_index_seq)
+
+        # Generate query vector (batched with concurrent queries, off the loop)
+        query_vector = self.search_cache.embeddings.get(query)
+        if query_vector is None:
+            query_vector = await self.query_encoder.encode(query)
+            self.search_cache.embeddings.put(query, query_vector)
+
+        agent_filter = await self._agents_with_skills(skills) if skills else None
+        ranked = await asyncio.to_thread(
+            self._rank_agents,
+            [query_vector],
+            agent_filter,
+            similarity_threshold,
+            max_results,
         )
+        return await self._fetch_ranked(ranked[0])
 
-        # Phase 2: Agent profiling - collect all matches per agent
-        agent_vector_matches: dict[str, list[tuple[Vector, float]]] = {}
-        for agent_id, vector, score in similar_vectors:
-            if agent_id not in agent_vector_matches:
-                agent_vector_matches[agent_id] = []
-            agent_vector_matches[agent_id].append((vector, score))
-
-        # Phase 3: Information-theoretic composite scoring
-        agent_composite_scores: dict[str, float] = {}
-        for agent_id, matches in agent_vector_matches.items():
-            if not matches:
-                continue
-
-            # Extract scores for this agent
-            scores = [score for _vector, score in matches]
-
-            # Composite scoring strategy: weighted combination
-            # - Top score (strongest signal): 60% weight
-            # - Mean of top 3 scores (consistency): 30% weight
-            # - Coverage bonus (number of matches): 10% weight
+    async def search_agents_vector_batch(
+        self,
+        queries: list[str],
+        similarity_threshold: float = 0.5,
+        max_results: int = 10,
+        min_index_seq: int | None = None,
+        skills: list[str] | None = None,
+    ) -> list[list[tuple[AgentCard, float]]]:
+        """Vector search for several queries at once.
 
-            max_score = max(scores)
-            top_3_mean = sum(sorted(scores, reverse=True)[:3]) / min(3, len(scores))
-            coverage_bonus = min(len(scores) / 5.0, 1.0)  # Normalize to [0, 1]
+        The queries are encoded in one batch and searched with one multi-row
+        FAISS search per index segment; each is then ranked on its own like
+        ``search_agents_vector``. With ``skills`` each query runs its own
+        filtered search.
 
-            composite_score = 0.6 * max_score + 0.3 * top_3_mean + 0.1 * coverage_bonus
+        Args:
+            queries: Natural language search queries
+            similarity_threshold: Minimum similarity score
+            max_results: Maximum number of results per query
+            min_index_seq: Index sequence number the search must reflect
+            skills: Only search agents with any of these skills
 
-            agent_composite_scores[agent_id] = composite_score
+        Returns:
+            One list of (agent_card, similarity_score) tuples per query, in order
+        """
+        if min_index_seq:
+            await self.wait_for_index(min_index_seq)
+        if not queries:
+            return []
+
+        query_vectors = await self._encode_queries(queries)
+        agent_filter = await self._agents_with_skills(skills) if skills else None
+        ranked = await asyncio.to_thread(
+            self._rank_agents,
+            query_vectors,
+            agent_filter,
+            similarity_threshold,
+            max_results,
+        )
+        return await self._fetch_ranked_lists(ranked)
 
-        # Phase 4: Rank and return results
-        results = []
-        for agent_id, score in sorted(
-            agent_composite_scores.items(), key=lambda x: x[1], reverse=True
-        )[:max_results]:
-            agent_card = await self.get_agent(agent_id)
-            if agent_card:
-                results.append((agent_card, score))
+    def _rank_agents(
+        self,
+        query_vectors: list[Vector],
+        agent_filter: set[str] | None,
+        similarity_threshold: float,
+        max_results: int,
+    ) -> list[list[tuple[str, float]]]:
+        """Ranked (agent_id, composite score) per query vector.
+
+        Without a filter agents are retrieved in two stages (or from the top
+        field hits when ``VECTOR_CENTROID_CANDIDATES`` is 0); with one, the
+        filtered search plans exact or ANN scoring of the agents' vectors.
+        Callers run this off the event loop: the indexing thread holds the
+        vector lock while it adds (and possibly merges) segments.
+        """
+        # Phase 1: Candidate generation - find all vectors above threshold
+        # Use a larger k to capture more candidate vectors
+        candidate_k = max_results * 10  # Expand search space for candidates
+        with self._vector_lock:
+            if agent_filter is not None:
+                return [
+                    rank_agent_scores(
+                        self.vector_store.search_agent_scores_filtered(
+                            query_vector,
+                            agent_filter,
+                            k=candidate_k,
+                            similarity_threshold=similarity_threshold,
+                        ),
+                        max_results,
+                    )
+                    for query_vector in query_vectors
+                ]
+            if config.vector_centroid_candidates > 0:
+                # Two-stage: nearest agent centroids, re-ranked on their vectors
+                return self.vector_store.search_agents_by_centroid(
+                    query_vectors,
+                    candidates=config.vector_centroid_candidates,
+                    max_results=max_results,
+                    similarity_threshold=similarity_threshold,
+                )
+            return self.vector_store.search_ranked_agents(
+                query_vectors,
+                k=candidate_k,
+                max_results=max_results,
+                similarity_threshold=similarity_threshold,
+            )
 
-        return results
+    async def _agents_with_skills(self, skills: list[str]) -> set[str]:
+        """Ids of agents with any of ``skills``, from the skill postings."""
+        if self._skill_index is None:
+            # Built in one step: the backends' list_agents does not yield, so
+            # no registration slips in between listing and indexing
+            skill_index = SkillIndex()
+            for agent_card in await self.backend.list_agents():
+                skill_index.add(agent_card.get("name", ""), agent_card)
+            self._skill_index = skill_index
+        return self._skill_index.agents(skills)
+
+    async def _encode_queries(self, queries: list[str]) -> list[Vector]:
+        """Query vectors from the embedding cache, encoding misses together.
+
+        Misses go through the query encoder, so they share its batches with
+        concurrent single searches instead of running a separate forward pass.
+        """
+        vectors = {}
+        for query in queries:
+            if query not in vectors:
+                vectors[query] = self.search_cache.embeddings.get(query)
+        missing = [query for query, vector in vectors.items() if vector is None]
+        if missing:
+            encoded = await asyncio.gather(
+                *(self.query_encoder.encode(query) for query in missing)
+            )
+            for query, vector in zip(missing, encoded, strict=True):
+                vectors[query] = vector
+                self.search_cache.embeddings.put(query, vector)
+        return [vectors[query] for query in queries]
+
+    async def _fetch_ranked(
+        self, ranked: list[tuple[str, Any]]
+    ) -> list[tuple[AgentCard, Any]]:
+        """Cards of ranked (agent_id, score) pairs, skipping removed agents."""
+        return (await self._fetch_ranked_lists([ranked]))[0]
+
+    async def _fetch_ranked_lists(
+        self, ranked_lists: list[list[tuple[str, Any]]]
+    ) -> list[list[tuple[AgentCard, Any]]]:
+        """``_fetch_ranked`` for several rankings with one backend call."""
+        agent_ids = list(
+            dict.fromkeys(agent_id for ranked in ranked_lists for agent_id, _ in ranked)
+        )
+        agent_cards = dict(
+            zip(agent_ids, await self.get_agents(agent_ids), strict=True)
+        )
+        return [
+            [
+                (agent_cards[agent_id], score)
+                for agent_id, score in ranked
+                if agent_cards[agent_id]
+            ]
+            for ranked in ranked_lists
+        ]
 
     async def search_agents_hybrid(
         self,
@@ -135,6 +532,7 @@ class VectorEnhancedStorage(StorageBackend):
         search_mode: str = "SEARCH_MODE_VECTOR",
         similarity_threshold: float = 0.5,
         max_results: int = 10,
+        min_index_seq: int | None = None,
     ) -> list[tuple[AgentCard, float | None]]:
         """Search agents using hybrid approach per proto spec.
 
@@ -144,36 +542,120 @@ class VectorEnhancedStorage(StorageBackend):
             search_mode: "SEARCH_MODE_KEYWORD" or "SEARCH_MODE_VECTOR"
             similarity_threshold: For vector search
             max_results: Maximum number of results
+            min_index_seq: Index sequence number vector search must reflect
 
         Returns:
             List of (agent_card, similarity_score) tuples
         """
-        if search_mode == "SEARCH_MODE_VECTOR" and query:
-            # Vector-only search
-            results = await self.search_agents_vector(
-                query, similarity_threshold, max_results
+        if min_index_seq:
+            await self.wait_for_index(min_index_seq)
+
+        # Ranked agent ids are cached until the next registry write
+        key = (
+            query,
+            search_mode,
+            tuple(sorted(skills or ())),
+            similarity_threshold,
+            max_results,
+        )
+        self.search_cache.count_query(query)
+        generation = self.search_cache.generation
+        ranked = self.search_cache.get_results(key)
+        if ranked is None:
+            results = await self._search_agents_hybrid(
+                query, skills, search_mode, similarity_threshold, max_results
+            )
+            self.search_cache.put_results(
+                key,
+                [(agent_card["name"], score) for agent_card, score in results],
+                generation,
             )
+            return results
 
-            # Apply skill filtering if specified
-            if skills:
-                filtered_results: list[tuple[AgentCard, float | None]] = []
-                for agent_card, score in results:
-                    agent_skills = [
-                        skill.get("id", "") for skill in agent_card.get("skills", [])
-                    ]
-                    if any(skill in agent_skills for skill in skills):
-                        filtered_results.append((agent_card, score))
-                return filtered_results
+        return await self._fetch_ranked(ranked)
 
-            # Cast to match return type
-            results_cast: list[tuple[AgentCard, float | None]] = [
-                (agent, score) for agent, score in results
-            ]
-            return results_cast
+    async def search_agents_batch(
+        self,
+        queries: list[str],
+        skills: list[str] | None = None,
+        search_mode: str = "SEARCH_MODE_VECTOR",
+        similarity_threshold: float = 0.5,
+        max_results: int = 10,
+        min_index_seq: int | None = None,
+    ) -> list[list[tuple[AgentCard, float | None]]]:
+        """Run ``search_agents_hybrid`` for several queries at once.
+
+        Vector queries missing from the result cache are encoded and searched
+        together (see ``search_agents_vector_batch``).
+
+        Args:
+            queries: Search queries
+            skills: Optional list of required skills, applied to every query
+            search_mode: "SEARCH_MODE_KEYWORD" or "SEARCH_MODE_VECTOR"
+            similarity_threshold: For vector search
+            max_results: Maximum number of results per query
+            min_index_seq: Index sequence number vector search must reflect
+
+        Returns:
+            One list of (agent_card, similarity_score) tuples per query, in order
+        """
+        if min_index_seq:
+            await self.wait_for_index(min_index_seq)
+
+        skills_key = tuple(sorted(skills or ()))
+        generation = self.search_cache.generation
+        results: list[list[tuple[AgentCard, float | None]] | None] = []
+        for query in queries:
+            self.search_cache.count_query(query)
+            ranked = self.search_cache.get_results(
+                (query, search_mode, skills_key, similarity_threshold, max_results)
+            )
+            results.append(None if ranked is None else await self._fetch_ranked(ranked))
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        searched: dict[str, list[tuple[AgentCard, float | None]]] = {}
+        if search_mode == "SEARCH_MODE_VECTOR":
+            vector_queries = sorted({queries[i] for i in missing if queries[i]})
+            found = await self.search_agents_vector_batch(
+                vector_queries, similarity_threshold, max_results, skills=skills
+            )
+            for query, hits in zip(vector_queries, found, strict=True):
+                searched[query] = [(card, score) for card, score in hits]
+
+        for i in missing:
+            query = queries[i]
+            if query not in searched:
+                searched[query] = await self._search_agents_hybrid(
+                    query, skills, search_mode, similarity_threshold, max_results
+                )
+            results[i] = searched[query]
+            self.search_cache.put_results(
+                (query, search_mode, skills_key, similarity_threshold, max_results),
+                [(agent_card["name"], score) for agent_card, score in searched[query]],
+                generation,
+            )
+        return results  # type: ignore[return-value]
+
+    async def _search_agents_hybrid(
+        self,
+        query: str,
+        skills: list[str] | None,
+        search_mode: str,
+        similarity_threshold: float,
+        max_results: int,
+    ) -> list[tuple[AgentCard, float | None]]:
+        """Run a hybrid search without the result cache."""
+        if search_mode == "SEARCH_MODE_VECTOR" and query:
+            # Vector-only search, planned over the agents with the skills
+            return await self.search_agents_vector(  # type: ignore[return-value]
+                query, similarity_threshold, max_results, skills=skills
+            )
 
         else:
-            # Keyword-only search
-            agents = await self.search_agents_keyword(query)
+            # Keyword-only search; top-k can be pushed down without a skill filter
+            agents = await self.search_agents_keyword(
+                query, None if skills else max_results
+            )
 
             # Apply skill filtering if specified
             if skills:
@@ -189,40 +671,46 @@ class VectorEnhancedStorage(StorageBackend):
             # Return without similarity scores for keyword search
             return [(agent, None) for agent in agents[:max_results]]
 
+    def _locked(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Call ``function`` holding the vector lock."""
+        with self._vector_lock:
+            return function(*args)
+
     async def get_agent_vectors(self, agent_id: str) -> list[Vector]:
         """Get all vectors for an agent."""
-        return self.vector_store.get_agent_vectors(agent_id)
+        return await asyncio.to_thread(
+            self._locked, self.vector_store.get_agent_vectors, agent_id
+        )
 
     async def update_agent_vectors(self, agent_id: str, vectors: list[Vector]) -> bool:
         """Update vectors for an agent directly."""
         try:
-            self.vector_store.add_agent_vectors(agent_id, vectors)
+            await asyncio.to_thread(
+                self._locked, self.vector_store.add_agent_vectors, agent_id, vectors
+            )
+            self.search_cache.invalidate()
             return True
         except Exception as e:
             logger.error(f"Failed to update vectors for agent {agent_id}: {e}")
             return False
 
-    async def _update_agent_vectors(self, agent_card: AgentCard) -> None:
-        """Generate and update vectors for an agent card."""
-        try:
-            # Use same ID strategy as backend storage (name)
-            agent_id = agent_card.get("name", "")
-            if not agent_id:
-                logger.warning("Agent card missing name, cannot generate vectors")
-                return
-
-            # Generate vectors from agent card
-            vectors = self.vector_generator.generate_agent_vectors(
-                dict(agent_card), agent_id
-            )
-
-            # Store vectors
-            self.vector_store.add_agent_vectors(agent_id, vectors)
+    def _is_unchanged(
+        self, agent_id: str, agent_card: AgentCard, previous_hash: str | None
+    ) -> bool:
+        """Whether a re-registered card matches the stored one and has vectors."""
+        return (
+            previous_hash is not None
+            and previous_hash == card_content_hash(agent_card)
+            and agent_id in self.vector_store.agent_vector_ids
+        )
 
-            logger.debug(f"Generated {len(vectors)} vectors for agent {agent_id}")
+    async def get_agent_card_hash(self, agent_id: str) -> str | None:
+        """Get the content hash of an agent's stored card."""
+        return await self.backend.get_agent_card_hash(agent_id)
 
-        except Exception as e:
-            logger.error(f"Failed to generate vectors for agent: {e}")
+    async def get_agent_last_seen(self, agent_id: str) -> datetime | None:
+        """Get when an agent last (re-)registered."""
+        return await self.backend.get_agent_last_seen(agent_id)
 
     async def list_extensions(
         self,
@@ -242,12 +730,37 @@ class VectorEnhancedStorage(StorageBackend):
         )
 
     def get_vector_stats(self) -> dict:
-        """Get vector store statistics."""
-        return self.vector_store.get_stats()
+        """Get vector store, embedding cache and indexing queue statistics."""
+        with self._vector_lock:
+            stats = self.vector_store.get_stats()
+        stats["indexing"] = self.indexer.get_stats()
+        if self.vector_generator.cache is not None:
+            stats["embedding_cache"] = self.vector_generator.cache.get_stats()
+        stats["query_encoder"] = self.query_encoder.get_stats()
+        stats["query_cache"] = self.search_cache.get_stats()
+        return stats
 
     def save_vectors(self) -> None:
-        """Persist vectors to disk."""
-        self.vector_store.save_index()
+        """Persist vectors, and the hot queries to pre-warm the next run."""
+        with self._vector_lock:
+            self.vector_store.save_index()
+        if config.vector_hot_queries_path:
+            self.search_cache.save_hot_queries(
+                config.vector_hot_queries_path, config.vector_hot_queries
+            )
+
+    def close(self) -> None:
+        """Drain pending index work, then stop the background threads.
+
+        Queued registrations are indexed and queued queries encoded before
+        their workers stop; the vector store then flushes what changed and
+        stops its maintenance thread, and the backend is closed last.
+        """
+        self.indexer.close()
+        self.query_encoder.close()
+        self.vector_store.close()
+        self.vector_generator.close()
+        self.backend.close()
 
     # Extension-related methods (delegated to backend)
     async def store_extension(self, extension_info: ExtensionInfo) -> bool:
@@ -268,6 +781,12 @@ class VectorEnhancedStorage(StorageBackend):
         """Update extensions for an agent."""
         return await self.backend.update_agent_extensions(agent_id, extensions)
 
+    async def update_agents_extensions(
+        self, agent_extensions: dict[str, list[dict]]
+    ) -> None:
+        """Update the extensions of several agents at once."""
+        await self.backend.update_agents_extensions(agent_extensions)
+
     async def remove_agent_from_extensions(self, agent_id: str) -> bool:
         """Remove agent from all extension declarations."""
         return await self.backend.remove_agent_from_extensions(agent_id)
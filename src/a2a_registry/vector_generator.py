@@ -1,34 +1,92 @@
 """Vector generation module for A2A Registry agent cards and extensions."""
 
+import hashlib
 import logging
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 
 import numpy as np
 from google.protobuf import struct_pb2, timestamp_pb2
-from sentence_transformers import SentenceTransformer
 
+from .embedding_backends import embedding_model_id, load_embedding_backend
+from .embedding_cache import EmbeddingCache
+from .embedding_workers import EmbeddingExecutor
+from .field_schema import PRESETS, FieldSchema
 from .proto.generated.registry_pb2 import Vector  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 
+def text_content_hash(text: str) -> str:
+    """SHA-256 hex digest of a field text, used to detect changed fields."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 class VectorGenerator:
     """Generate embedding vectors from agent card content with provenance tracking."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        batch_size: int = 64,
+        cache_dir: str | None = None,
+        cache_size: int = 0,
+        workers: int = 0,
+        field_schema: FieldSchema | None = None,
+        backend: str = "sentence-transformers",
+        dimensions: int = 384,
+        quantize: bool = True,
+    ):
         """Initialize the vector generator.
 
         Args:
             model_name: Name of the sentence transformer model to use.
                        Options: 'all-MiniLM-L6-v2' (fast, 384 dims),
                                'all-mpnet-base-v2' (better quality, 768 dims)
+                       (ignored by the hashing backend)
+            batch_size: Number of texts per model forward pass when embedding
+                        agent cards
+            cache_dir: Directory of the on-disk embedding cache (None disables it)
+            cache_size: Embeddings kept in the in-memory cache tier
+            workers: Worker processes for embedding large batches (0 embeds
+                     on the calling thread)
+            field_schema: Agent card fields to embed (defaults to every field)
+            backend: Embedding backend: "sentence-transformers", "onnx" or
+                     "hashing" (see ``embedding_backends``)
+            dimensions: Embedding size of the hashing backend
+            quantize: Run the onnx backend's int8 quantized model
         """
-        self.model_name = model_name
-        self.model = SentenceTransformer(model_name)
+        # Embeddings of other backends are not interchangeable: own name
+        self.model_name = embedding_model_id(backend, model_name, dimensions, quantize)
+        self.backend = backend
+        self.field_schema = field_schema or FieldSchema(
+            dict.fromkeys(PRESETS["full"], 1.0)
+        )
+        self.batch_size = max(batch_size, 1)
+        self.model = load_embedding_backend(backend, model_name, dimensions, quantize)
         self.vector_dimensions = self.model.get_sentence_embedding_dimension()
+        self.cache: EmbeddingCache | None = None
+        if cache_dir is not None or cache_size > 0:
+            self.cache = EmbeddingCache(
+                self.model_name, self.vector_dimensions or 384, cache_dir, cache_size
+            )
+        self.executor: EmbeddingExecutor | None = None
+        if workers > 0:
+            self.executor = EmbeddingExecutor(
+                model_name,
+                self.vector_dimensions or 384,
+                workers=workers,
+                batch_size=self.batch_size,
+                model_loader=partial(
+                    load_embedding_backend,
+                    backend,
+                    dimensions=dimensions,
+                    quantize=quantize,
+                ),
+            )
         logger.info(
-            f"Initialized VectorGenerator with model {model_name} ({self.vector_dimensions} dimensions)"
+            f"Initialized VectorGenerator with model {self.model_name} ({self.vector_dimensions} dimensions)"
         )
 
     def extract_text_from_params(self, params: dict[str, Any]) -> str:
@@ -65,30 +123,23 @@ class VectorGenerator:
         _extract_recursive(params)
         return " ".join(texts)
 
-    def generate_agent_vectors(
-        self, agent_card: dict[str, Any], agent_id: str | None = None
-    ) -> list[Vector]:
-        """Generate vectors for all searchable fields in an agent card.
+    def _collect_field_texts(self, agent_card: dict[str, Any]) -> list[tuple[str, str]]:
+        """Collect the texts of an agent card's fields in the field schema.
 
         Args:
             agent_card: Agent card dictionary
-            agent_id: Explicit agent ID (if not provided, uses "url" field)
 
         Returns:
-            List of Vector proto messages with provenance
+            List of (field_path, text) tuples in vector order
         """
-        vectors = []
-        if agent_id is None:
-            agent_id = agent_card.get("url", "")
+        fields = []
 
         # Agent-level fields
         if "name" in agent_card:
-            vectors.append(self._create_vector(agent_id, "name", agent_card["name"]))
+            fields.append(("name", agent_card["name"]))
 
         if "description" in agent_card:
-            vectors.append(
-                self._create_vector(agent_id, "description", agent_card["description"])
-            )
+            fields.append(("description", agent_card["description"]))
 
         # Skills
         skills = agent_card.get("skills", [])
@@ -97,40 +148,25 @@ class VectorGenerator:
 
             if "name" in skill:
                 skill_texts.append(skill["name"])
-                vectors.append(
-                    self._create_vector(agent_id, f"skills[{i}].name", skill["name"])
-                )
+                fields.append((f"skills[{i}].name", skill["name"]))
 
             if "description" in skill:
                 skill_texts.append(skill["description"])
-                vectors.append(
-                    self._create_vector(
-                        agent_id, f"skills[{i}].description", skill["description"]
-                    )
-                )
+                fields.append((f"skills[{i}].description", skill["description"]))
 
             if "tags" in skill and isinstance(skill["tags"], list):
                 tags_text = " ".join(skill["tags"])
                 skill_texts.append(tags_text)
-                vectors.append(
-                    self._create_vector(agent_id, f"skills[{i}].tags", tags_text)
-                )
+                fields.append((f"skills[{i}].tags", tags_text))
 
             if "examples" in skill and isinstance(skill["examples"], list):
                 examples_text = " ".join(skill["examples"])
                 skill_texts.append(examples_text)
-                vectors.append(
-                    self._create_vector(
-                        agent_id, f"skills[{i}].examples", examples_text
-                    )
-                )
+                fields.append((f"skills[{i}].examples", examples_text))
 
             # Combined skill vector
             if skill_texts:
-                combined_text = " ".join(skill_texts)
-                vectors.append(
-                    self._create_vector(agent_id, f"skills[{i}]", combined_text)
-                )
+                fields.append((f"skills[{i}]", " ".join(skill_texts)))
 
         # Extensions
         capabilities = agent_card.get("capabilities", {})
@@ -141,12 +177,8 @@ class VectorGenerator:
 
             if "description" in extension:
                 extension_texts.append(extension["description"])
-                vectors.append(
-                    self._create_vector(
-                        agent_id,
-                        f"extensions[{i}].description",
-                        extension["description"],
-                    )
+                fields.append(
+                    (f"extensions[{i}].description", extension["description"])
                 )
 
             # Extract text from params
@@ -154,21 +186,157 @@ class VectorGenerator:
                 params_text = self.extract_text_from_params(extension["params"])
                 if params_text.strip():
                     extension_texts.append(params_text)
-                    vectors.append(
-                        self._create_vector(
-                            agent_id, f"extensions[{i}].params", params_text
-                        )
-                    )
+                    fields.append((f"extensions[{i}].params", params_text))
 
             # Combined extension vector
             if extension_texts:
-                combined_text = " ".join(extension_texts)
-                vectors.append(
-                    self._create_vector(agent_id, f"extensions[{i}]", combined_text)
+                fields.append((f"extensions[{i}]", " ".join(extension_texts)))
+
+        return [
+            (field_path, text)
+            for field_path, text in fields
+            if self.field_schema.embeds(field_path)
+        ]
+
+    def generate_agent_vectors(
+        self, agent_card: dict[str, Any], agent_id: str | None = None
+    ) -> list[Vector]:
+        """Generate vectors for the fields of an agent card in the field schema.
+
+        Args:
+            agent_card: Agent card dictionary
+            agent_id: Explicit agent ID (if not provided, uses "url" field)
+
+        Returns:
+            List of Vector proto messages with provenance
+        """
+        if agent_id is None:
+            agent_id = agent_card.get("url", "")
+
+        return self.generate_agents_vectors([(agent_id, agent_card)])[agent_id]
+
+    def generate_agents_vectors(
+        self,
+        agent_cards: list[tuple[str, dict[str, Any]]],
+        batch_size: int | None = None,
+        existing: dict[str, list[Vector]] | None = None,
+    ) -> dict[str, list[Vector]]:
+        """Generate vectors for one or more agent cards with batched encoding.
+
+        The texts of every field of every card are collected first and
+        embedded with one batched ``encode`` call (identical texts, such as a
+        combined skill vector with a single part, are embedded once). The
+        Vector protos are built afterwards with the usual field paths.
+
+        Texts not embedded before are looked up in the embedding cache, if
+        configured, before running the model. When ``existing`` vectors are
+        given, fields whose text hash is unchanged reuse the stored Vector
+        proto (or its embedding, if the text moved to another field path) and
+        only changed texts are encoded. Vectors embedded by another model are
+        never reused.
+
+        Args:
+            agent_cards: List of (agent_id, agent_card) tuples
+            batch_size: Texts per model forward pass (defaults to ``self.batch_size``)
+            existing: Previously generated vectors per agent_id, for reuse
+
+        Returns:
+            Mapping of agent_id to its vectors, same fields as generate_agent_vectors
+        """
+        fields: list[tuple[str, str, str]] = []
+        for agent_id, agent_card in agent_cards:
+            for field_path, text in self._collect_field_texts(agent_card):
+                fields.append((agent_id, field_path, text))
+
+        vectors: dict[str, list[Vector]] = {
+            agent_id: [] for agent_id, _card in agent_cards
+        }
+        if not fields:
+            return vectors
+
+        # Previous vectors by (agent_id, field_path) and by text hash
+        previous: dict[tuple[str, str], Vector] = {}
+        embedding_of: dict[str, np.ndarray] = {}
+        for agent_id, agent_vectors in (existing or {}).items():
+            for vector in agent_vectors:
+                if not self._same_model(vector):
+                    continue
+                previous[(agent_id, vector.field_path)] = vector
+                embedding_of.setdefault(
+                    self._content_hash_of(vector),
+                    np.asarray(vector.values, dtype=np.float32),
+                )
+
+        hashes = [text_content_hash(text) for _agent_id, _field_path, text in fields]
+        missing = {
+            content_hash: text
+            for content_hash, (_agent_id, _field_path, text) in zip(
+                hashes, fields, strict=True
+            )
+            if content_hash not in embedding_of
+        }
+        if missing and self.cache is not None:
+            for content_hash, embedding in self.cache.get_many(missing).items():
+                embedding_of[content_hash] = embedding
+                del missing[content_hash]
+        if missing:
+            embeddings = self._encode_texts(list(missing.values()), batch_size)
+            encoded = dict(zip(missing, embeddings, strict=True))
+            embedding_of.update(encoded)
+            if self.cache is not None:
+                self.cache.put_many(encoded)
+
+        timestamp = timestamp_pb2.Timestamp()
+        timestamp.FromDatetime(datetime.now(UTC))
+        for content_hash, (agent_id, field_path, text) in zip(
+            hashes, fields, strict=True
+        ):
+            vector = previous.get((agent_id, field_path))
+            if vector is None or self._content_hash_of(vector) != content_hash:
+                vector = self._build_vector(
+                    agent_id,
+                    field_path,
+                    text,
+                    embedding_of[content_hash],
+                    timestamp,
+                    content_hash,
                 )
+            vectors[agent_id].append(vector)
 
+        if existing:
+            logger.debug(
+                f"Encoded {len(missing)} changed texts for {len(agent_cards)} agents"
+            )
         return vectors
 
+    def _encode_texts(self, texts: list[str], batch_size: int | None) -> Any:
+        """Embed field texts, on the worker processes for large batches."""
+        if self.executor is not None and len(texts) > self.batch_size:
+            return self.executor.encode(texts)
+        return self.model.encode(
+            texts, batch_size=batch_size or self.batch_size, convert_to_numpy=True
+        )
+
+    def close(self) -> None:
+        """Stop the embedding worker processes, if any."""
+        if self.executor is not None:
+            self.executor.close()
+            self.executor = None
+
+    def _same_model(self, vector: Vector) -> bool:
+        """Whether a stored vector was embedded by this generator's model."""
+        return (
+            "model" not in vector.metadata.fields
+            or vector.metadata["model"] == self.model_name
+        )
+
+    @staticmethod
+    def _content_hash_of(vector: Vector) -> str:
+        """Content hash of a stored vector (computed for vectors without one)."""
+        if "content_hash" in vector.metadata.fields:
+            return str(vector.metadata["content_hash"])
+        return text_content_hash(vector.field_content)
+
     def generate_query_vector(self, query: str) -> Vector:
         """Generate a vector for a search query.
 
@@ -180,6 +348,27 @@ class VectorGenerator:
         """
         return self._create_vector("", "query", query)
 
+    def generate_query_vectors(self, queries: list[str]) -> list[Vector]:
+        """Generate vectors for several search queries with one encode call.
+
+        Args:
+            queries: Search query texts
+
+        Returns:
+            Vector proto messages in the order of ``queries``
+        """
+        if not queries:
+            return []
+        embeddings = self.model.encode(
+            queries, batch_size=self.batch_size, convert_to_numpy=True
+        )
+        timestamp = timestamp_pb2.Timestamp()
+        timestamp.FromDatetime(datetime.now(UTC))
+        return [
+            self._build_vector("", "query", query, embedding, timestamp)
+            for query, embedding in zip(queries, embeddings, strict=True)
+        ]
+
     def calculate_similarity(self, vector1: Vector, vector2: Vector) -> float:
         """Calculate cosine similarity between two vectors.
 
@@ -246,11 +435,22 @@ class VectorGenerator:
         """
         # Generate embedding
         embedding = self.model.encode(content, convert_to_numpy=True)
+        return self._build_vector(agent_id, field_path, content, embedding)
 
+    def _build_vector(
+        self,
+        agent_id: str,
+        field_path: str,
+        content: str,
+        embedding: np.ndarray,
+        timestamp: timestamp_pb2.Timestamp | None = None,
+        content_hash: str | None = None,
+    ) -> Vector:
+        """Wrap an embedding of ``content`` in a Vector proto message."""
         # Create timestamp
-        now = datetime.now(UTC)
-        timestamp = timestamp_pb2.Timestamp()
-        timestamp.FromDatetime(now)
+        if timestamp is None:
+            timestamp = timestamp_pb2.Timestamp()
+            timestamp.FromDatetime(datetime.now(UTC))
 
         # Create metadata
         metadata = struct_pb2.Struct()
@@ -259,6 +459,7 @@ class VectorGenerator:
                 "model": self.model_name,
                 "dimensions": self.vector_dimensions,
                 "content_length": len(content),
+                "content_hash": content_hash or text_content_hash(content),
             }
         )
 
@@ -0,0 +1,345 @@
+"""Columnar per-vector metadata for the FAISS vector store."""
+
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+from google.protobuf import struct_pb2, timestamp_pb2
+
+from .proto.generated.registry_pb2 import Vector  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Metadata keys rebuilt from the columns on materialization
+_DERIVED_METADATA = {"model", "dimensions", "content_length", "content_hash"}
+
+# Per-vector columns, saved as one .npy file each
+_COLUMNS = ("agent", "field", "model", "text_start", "text_len", "created")
+
+# Compact the text arena once this much of it belongs to removed vectors
+_MIN_ARENA_GARBAGE = 1 << 20
+
+
+class VectorMetadataTable:
+    """Metadata of every stored vector as columns indexed by vector id.
+
+    Per vector the table keeps an agent code, an interned field path code, an
+    interned model code, the offset and length of its UTF-8 text in a shared
+    arena, and ``created_at`` as int64 nanoseconds (about 30 bytes plus the
+    text). Agent codes of removed vectors are -1. Vector protos are only
+    built by ``materialize`` when an API returns vectors; ``content_length``
+    and ``content_hash`` are derived from the text and ``dimensions`` from the
+    store. Metadata keys beyond those are kept per vector as a serialized
+    Struct.
+    """
+
+    def __init__(self, vector_dimensions: int) -> None:
+        """Initialize an empty table.
+
+        Args:
+            vector_dimensions: Embedding size reported in materialized metadata
+        """
+        self.vector_dimensions = vector_dimensions
+        self.agent_ids: list[str] = []  # agent code -> agent_id
+        self.agent_codes: dict[str, int] = {}  # agent_id -> agent code
+        self.field_paths: list[str] = []
+        self._field_codes: dict[str, int] = {}
+        self.models: list[str] = []
+        self._model_codes: dict[str, int] = {}
+
+        self.agent = np.full(0, -1, dtype=np.int32)
+        self.field = np.zeros(0, dtype=np.int32)
+        self.model = np.zeros(0, dtype=np.int16)
+        self.text_start = np.zeros(0, dtype=np.int64)
+        self.text_len = np.zeros(0, dtype=np.int32)
+        self.created = np.zeros(0, dtype=np.int64)
+
+        # UTF-8 texts; memory-mapped after ``open`` until first appended to
+        self.arena: bytearray | np.memmap = bytearray()
+        self.arena_garbage = 0
+        self.extra_metadata: dict[int, bytes] = {}
+
+    @staticmethod
+    def _intern(value: str, values: list[str], codes: dict[str, int]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = len(values)
+            codes[value] = code
+            values.append(value)
+        return code
+
+    def agent_code(self, agent_id: str) -> int:
+        """Code of ``agent_id`` (assigned on first use)."""
+        return self._intern(agent_id, self.agent_ids, self.agent_codes)
+
+    def _ensure_capacity(self, needed: int) -> None:
+        capacity = len(self.agent)
+        if needed <= capacity:
+            return
+        grow = max(needed, 2 * capacity, 1024) - capacity
+        self.agent = np.concatenate([self.agent, np.full(grow, -1, dtype=np.int32)])
+        self.field = np.concatenate([self.field, np.zeros(grow, dtype=np.int32)])
+        self.model = np.concatenate([self.model, np.zeros(grow, dtype=np.int16)])
+        self.text_start = np.concatenate(
+            [self.text_start, np.zeros(grow, dtype=np.int64)]
+        )
+        self.text_len = np.concatenate([self.text_len, np.zeros(grow, dtype=np.int32)])
+        self.created = np.concatenate([self.created, np.zeros(grow, dtype=np.int64)])
+
+    def _append_text(self, text: bytes, offsets: dict[bytes, int]) -> int:
+        """Append ``text`` to the arena once per batch; return its offset."""
+        start = offsets.get(text)
+        if start is None:
+            if not isinstance(self.arena, bytearray):
+                self.arena = bytearray(self.arena)
+            start = len(self.arena)
+            self.arena += text
+            offsets[text] = start
+        return start
+
+    def append(self, ids: Sequence[int], agent_id: str, vectors: list[Vector]) -> None:
+        """Record the metadata of an agent's vectors under ``ids``."""
+        self._ensure_capacity(max(ids) + 1)
+        code = self.agent_code(agent_id)
+        offsets: dict[bytes, int] = {}
+        for vector_id, vector in zip(ids, vectors, strict=True):
+            text = vector.field_content.encode("utf-8")
+            model = ""
+            if "model" in vector.metadata.fields:
+                model = vector.metadata["model"]
+                extra = set(vector.metadata.fields) - _DERIVED_METADATA
+                if extra:
+                    struct = struct_pb2.Struct()
+                    for key in extra:
+                        struct.fields[key].CopyFrom(vector.metadata.fields[key])
+                    self.extra_metadata[vector_id] = struct.SerializeToString()
+            elif vector.metadata.fields:
+                self.extra_metadata[vector_id] = vector.metadata.SerializeToString()
+
+            self.agent[vector_id] = code
+            self.field[vector_id] = self._intern(
+                vector.field_path, self.field_paths, self._field_codes
+            )
+            self.model[vector_id] = self._intern(model, self.models, self._model_codes)
+            self.text_start[vector_id] = self._append_text(text, offsets)
+            self.text_len[vector_id] = len(text)
+            self.created[vector_id] = (
+                vector.created_at.seconds * 1_000_000_000 + vector.created_at.nanos
+            )
+
+    def copy_rows(
+        self,
+        source: "VectorMetadataTable",
+        source_ids: np.ndarray | Sequence[int],
+        ids: Sequence[int],
+        agent_codes: np.ndarray | None = None,
+    ) -> None:
+        """Copy rows of ``source`` (ids ``source_ids``) to ``ids`` of this table.
+
+        Args:
+            source: Table to copy from
+            source_ids: Rows of ``source`` to copy
+            ids: Rows of this table to copy them to
+            agent_codes: Agent codes of the source rows (read from ``source``
+                         when omitted; pass a snapshot if it may change)
+        """
+        if not len(ids):
+            return
+        self._ensure_capacity(max(ids) + 1)
+        src = np.asarray(source_ids, dtype=np.int64)
+        dst = np.asarray(ids, dtype=np.int64)
+        agent_map = np.array(
+            [self.agent_code(agent_id) for agent_id in source.agent_ids] or [0],
+            dtype=np.int32,
+        )
+        field_map = np.array(
+            [
+                self._intern(path, self.field_paths, self._field_codes)
+                for path in source.field_paths
+            ]
+            or [0],
+            dtype=np.int32,
+        )
+        model_map = np.array(
+            [
+                self._intern(model, self.models, self._model_codes)
+                for model in source.models
+            ]
+            or [0],
+            dtype=np.int16,
+        )
+        if agent_codes is None:
+            agent_codes = source.agent[src]
+        self.agent[dst] = agent_map[agent_codes]
+        self.field[dst] = field_map[source.field[src]]
+        self.model[dst] = model_map[source.model[src]]
+        self.created[dst] = source.created[src]
+        self.text_len[dst] = source.text_len[src]
+        offsets: dict[bytes, int] = {}
+        for old, new in zip(source_ids, ids, strict=True):
+            self.text_start[new] = self._append_text(source.text(old), offsets)
+            if old in source.extra_metadata:
+                self.extra_metadata[new] = source.extra_metadata[old]
+
+    def remove(self, ids: np.ndarray, compact: bool = True) -> None:
+        """Mark vector ids as removed.
+
+        Args:
+            ids: Vector ids to remove
+            compact: Compact the text arena once it is mostly garbage
+        """
+        self.agent[ids] = -1
+        self.arena_garbage += int(self.text_len[ids].sum())
+        for vector_id in ids.tolist():
+            self.extra_metadata.pop(vector_id, None)
+        if compact and self.arena_garbage > max(
+            _MIN_ARENA_GARBAGE, len(self.arena) // 2
+        ):
+            self._compact_arena()
+
+    def _compact_arena(self) -> None:
+        """Rewrite the arena with the texts of live vectors only."""
+        arena = bytearray()
+        offsets: dict[bytes, int] = {}
+        live = np.flatnonzero(self.agent >= 0)
+        for vector_id in live.tolist():
+            text = self.text(vector_id)
+            start = offsets.get(text)
+            if start is None:
+                start = len(arena)
+                arena += text
+                offsets[text] = start
+            self.text_start[vector_id] = start
+        logger.debug(f"Compacted vector text arena {len(self.arena)} -> {len(arena)}")
+        self.arena = arena
+        self.arena_garbage = 0
+
+    def text(self, vector_id: int) -> bytes:
+        """UTF-8 text of a vector."""
+        start = int(self.text_start[vector_id])
+        return bytes(self.arena[start : start + int(self.text_len[vector_id])])
+
+    def materialize(
+        self, ids: Sequence[int], values: np.ndarray | None = None
+    ) -> list[Vector]:
+        """Build Vector protos for vector ids.
+
+        Args:
+            ids: Vector ids to materialize
+            values: Embedding rows for ``ids`` (omitted leaves ``values`` empty)
+
+        Returns:
+            Vector proto messages in the order of ``ids``
+        """
+        vectors = []
+        for row, vector_id in enumerate(ids):
+            content = self.text(vector_id).decode("utf-8")
+            created = int(self.created[vector_id])
+            timestamp = timestamp_pb2.Timestamp(
+                seconds=created // 1_000_000_000, nanos=created % 1_000_000_000
+            )
+            metadata = struct_pb2.Struct()
+            if vector_id in self.extra_metadata:
+                metadata.MergeFromString(self.extra_metadata[vector_id])
+            model = self.models[self.model[vector_id]]
+            if model:
+                metadata.update(
+                    {
+                        "model": model,
+                        "dimensions": self.vector_dimensions,
+                        "content_length": len(content),
+                        "content_hash": hashlib.sha256(
+                            content.encode("utf-8")
+                        ).hexdigest(),
+                    }
+                )
+            vectors.append(
+                Vector(
+                    values=[] if values is None else values[row].tolist(),
+                    agent_id=self.agent_ids[self.agent[vector_id]],
+                    field_path=self.field_paths[self.field[vector_id]],
+                    field_content=content,
+                    created_at=timestamp,
+                    metadata=metadata,
+                )
+            )
+        return vectors
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the columns, the arena and extra metadata."""
+        return (
+            self.agent.nbytes
+            + self.field.nbytes
+            + self.model.nbytes
+            + self.text_start.nbytes
+            + self.text_len.nbytes
+            + self.created.nbytes
+            + len(self.arena)
+            + sum(len(extra) for extra in self.extra_metadata.values())
+        )
+
+    def save(self, directory: Path, count: int) -> None:
+        """Write the first ``count`` rows as ``.npy`` columns plus raw blobs.
+
+        Args:
+            directory: Directory to write the files into
+            count: Number of vector ids in use (rows beyond are unused capacity)
+        """
+        for column in _COLUMNS:
+            np.save(directory / f"{column}.npy", getattr(self, column)[:count])
+        (directory / "arena.bin").write_bytes(bytes(self.arena))
+        extra_ids = np.array(sorted(self.extra_metadata), dtype=np.int64)
+        blobs = [self.extra_metadata[vector_id] for vector_id in extra_ids.tolist()]
+        np.save(directory / "extra_ids.npy", extra_ids)
+        np.save(
+            directory / "extra_offsets.npy",
+            np.cumsum([0] + [len(blob) for blob in blobs], dtype=np.int64),
+        )
+        (directory / "extra.bin").write_bytes(b"".join(blobs))
+        strings = {
+            "agent_ids": self.agent_ids,
+            "field_paths": self.field_paths,
+            "models": self.models,
+        }
+        (directory / "strings.json").write_text(json.dumps(strings))
+
+    @classmethod
+    def open(cls, directory: Path, vector_dimensions: int) -> "VectorMetadataTable":
+        """Map a table written by ``save``.
+
+        Columns and the text arena are memory-mapped copy-on-write: pages are
+        read on demand and shared through the page cache until modified.
+
+        Args:
+            directory: Directory the table was saved to
+            vector_dimensions: Embedding size reported in materialized metadata
+        """
+        table = cls(vector_dimensions)
+        strings = json.loads((directory / "strings.json").read_text())
+        table.agent_ids = strings["agent_ids"]
+        table.agent_codes = {a: code for code, a in enumerate(table.agent_ids)}
+        table.field_paths = strings["field_paths"]
+        table._field_codes = {p: code for code, p in enumerate(table.field_paths)}
+        table.models = strings["models"]
+        table._model_codes = {m: code for code, m in enumerate(table.models)}
+        for column in _COLUMNS:
+            setattr(table, column, np.load(directory / f"{column}.npy", mmap_mode="c"))
+        if (directory / "arena.bin").stat().st_size:
+            table.arena = np.memmap(directory / "arena.bin", dtype=np.uint8, mode="c")
+
+        extra_ids = np.load(directory / "extra_ids.npy").tolist()
+        if extra_ids:
+            offsets = np.load(directory / "extra_offsets.npy").tolist()
+            blob = (directory / "extra.bin").read_bytes()
+            table.extra_metadata = {
+                vector_id: blob[offsets[i] : offsets[i + 1]]
+                for i, vector_id in enumerate(extra_ids)
+            }
+        live = table.agent >= 0
+        # Texts are shared within a batch, so this is an estimate
+        table.arena_garbage = max(len(table.arena) - int(table.text_len[live].sum()), 0)
+        return table
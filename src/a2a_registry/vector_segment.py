@@ -0,0 +1,371 @@
+"""Index segments of the FAISS vector store."""
+
+import logging
+import shutil
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+import faiss
+import numpy as np
+
+from .proto.generated.registry_pb2 import Vector  # type: ignore
+from .vector_metadata import VectorMetadataTable
+
+logger = logging.getLogger(__name__)
+
+# Memory-map flat codes too where faiss supports it; older releases only map
+# the inverted lists of IVF indexes and read other indexes into memory
+_MMAP_FLAG = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+
+
+def pool_vectors(matrix: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Unit-normalized mean of each run of rows starting at ``offsets``.
+
+    Args:
+        matrix: Normalized embeddings, runs of one agent's vectors in order
+        offsets: First row of each run, ascending
+
+    Returns:
+        One pooled (centroid) vector per run
+    """
+    if not len(offsets):
+        return np.empty((0, matrix.shape[1]), dtype=np.float32)
+    pooled = np.add.reduceat(matrix, offsets, axis=0).astype(np.float32)
+    faiss.normalize_L2(pooled)
+    return pooled
+
+
+class VectorSegment:
+    """Vectors with ids in ``[base, base + size)``: a FAISS index plus metadata.
+
+    FAISS ids are the store-wide vector ids; metadata rows are indexed by the
+    id relative to ``base``. Only the store's mutable segment removes vectors
+    from its index. Sealed segments are never modified: removed vectors stay
+    in the index as tombstones (agent code -1 in the metadata) until the
+    segment is merged.
+
+    The segment also keeps one pooled vector (centroid) per agent, keyed by
+    the agent's first vector id, for the store's coarse agent index; rows of
+    removed agents are dropped when the segment is merged.
+    """
+
+    def __init__(
+        self,
+        base: int,
+        index: faiss.Index,
+        metadata: VectorMetadataTable,
+        index_type: str = "flat",
+        trained_size: int = 0,
+        size: int = 0,
+        name: str | None = None,
+        centroid_ids: np.ndarray | None = None,
+        centroids: np.ndarray | None = None,
+    ) -> None:
+        """Initialize a segment.
+
+        Args:
+            base: First vector id of the segment
+            index: FAISS index holding the segment's embeddings by vector id
+            metadata: Metadata rows indexed by ``vector id - base``
+            index_type: Kind of ``index`` ("flat", "hnsw", "ivf" or "ivfpq")
+            trained_size: Vectors the index was trained on
+            size: Vector ids assigned to the segment (including removed ones)
+            name: Directory name once the segment is persisted
+            centroid_ids: First vector id of each agent with a centroid
+            centroids: Pooled vector per entry of ``centroid_ids``
+        """
+        self.base = base
+        self.index = index
+        self.metadata = metadata
+        self.index_type = index_type
+        self.trained_size = trained_size
+        self.size = size
+        self.name = name
+        self.live = int((metadata.agent[:size] >= 0).sum())
+        if centroid_ids is None or centroids is None:
+            centroid_ids = np.empty(0, dtype=np.int64)
+            centroids = np.empty((0, index.d), dtype=np.float32)
+        self.centroid_ids = centroid_ids
+        self.centroids = centroids
+        # Scoring weight per field path code (see ``field_weights``)
+        self._path_weights = np.empty(0, dtype=np.float32)
+
+    @property
+    def end(self) -> int:
+        """One past the last vector id of the segment."""
+        return self.base + self.size
+
+    @property
+    def tombstones(self) -> int:
+        """Removed vectors still held by the index."""
+        return self.index.ntotal - self.live
+
+    def add(
+        self, agents: list[tuple[str, range, list[Vector]]], matrix: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Add agents' vectors with consecutive ids starting at ``end``.
+
+        Args:
+            agents: (agent_id, vector ids, vectors) per agent, in id order
+            matrix: Normalized embeddings of all vectors, in order
+
+        Returns:
+            The added agents' first vector ids and centroids
+        """
+        ids: list[int] = []
+        for agent_id, agent_ids, vectors in agents:
+            self.metadata.append(
+                range(agent_ids.start - self.base, agent_ids.stop - self.base),
+                agent_id,
+                vectors,
+            )
+            ids.extend(agent_ids)
+        self.index.add_with_ids(matrix, np.asarray(ids, dtype=np.int64))
+        self.size = ids[-1] + 1 - self.base
+        self.live += len(ids)
+
+        starts = np.array(
+            [agent_ids.start for _, agent_ids, _ in agents], dtype=np.int64
+        )
+        centroids = pool_vectors(matrix, starts - starts[0])
+        self.centroid_ids = np.concatenate([self.centroid_ids, starts])
+        self.centroids = np.concatenate([self.centroids, centroids])
+        return starts, centroids
+
+    def set_centroids(self, matrix: np.ndarray | None = None) -> None:
+        """Pool the live vectors of every agent into its centroid.
+
+        Args:
+            matrix: Embeddings of the live vectors in id order (reconstructed
+                    from the index when omitted)
+        """
+        ranges = sorted(self.agent_ranges().values(), key=lambda ids: ids.start)
+        if matrix is None:
+            matrix = self.reconstruct(self.live_ids())
+        # Live ids run agent by agent, so each agent's rows are consecutive
+        offsets = np.cumsum([0] + [len(ids) for ids in ranges])[:-1]
+        self.centroid_ids = np.array([ids.start for ids in ranges], dtype=np.int64)
+        self.centroids = pool_vectors(matrix, offsets)
+
+    def live_centroids(self) -> tuple[np.ndarray, np.ndarray]:
+        """First vector ids and centroids of the agents still in the segment."""
+        if not len(self.centroid_ids):
+            return self.centroid_ids, self.centroids
+        live = self.agent_codes(self.centroid_ids) >= 0
+        return self.centroid_ids[live], np.asarray(self.centroids[live])
+
+    def remove(self, ids: np.ndarray, from_index: bool) -> None:
+        """Remove vector ids; ``from_index`` also deletes them from the index."""
+        # Sealed segments may be read by a merge, so their arena is not compacted
+        self.metadata.remove(ids - self.base, compact=from_index)
+        self.live -= len(ids)
+        if from_index:
+            self.index.remove_ids(faiss.IDSelectorBatch(ids))
+
+    def search(
+        self, queries: np.ndarray, k: int, similarity_threshold: float
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Ids and similarities of the top ``k`` live vectors above threshold.
+
+        Args:
+            queries: Normalized query embeddings, shape (queries, dimensions)
+            k: Max vectors to return per query
+            similarity_threshold: Minimum similarity score
+
+        Returns:
+            One (ids, similarities) pair per query row, best first
+        """
+        count = min(k + self.tombstones, self.index.ntotal)
+        if count <= 0:
+            empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+            return [empty] * len(queries)
+        # One multi-row search for all queries
+        similarities, ids = self.index.search(queries, count)
+        results = []
+        for row_similarities, row_ids in zip(similarities, ids, strict=True):
+            keep = (row_ids >= 0) & (row_similarities >= similarity_threshold)
+            row_similarities, row_ids = row_similarities[keep], row_ids[keep]
+            live = self.metadata.agent[row_ids - self.base] >= 0
+            results.append((row_ids[live][:k], row_similarities[live][:k]))
+        return results
+
+    def search_ids(
+        self, query: np.ndarray, ids: np.ndarray, k: int, similarity_threshold: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Exactly score only the live vector ids ``ids`` against one query.
+
+        Flat and IVF indexes scan with an ``IDSelectorBatch`` (IVF probing
+        every cell); HNSW graph search is not exhaustive under a selector, so
+        its candidates are reconstructed and scored directly.
+
+        Args:
+            query: Normalized query embedding, shape (1, dimensions)
+            ids: Candidate vector ids of this segment
+            k: Max vectors to return
+            similarity_threshold: Minimum similarity score
+
+        Returns:
+            (ids, similarities) of the best ``k`` candidates, best first
+        """
+        k = min(k, len(ids))
+        if self.index_type == "hnsw":
+            similarities = self.reconstruct(ids) @ query[0]
+            top = np.argsort(-similarities, kind="stable")[:k]
+            row_ids, row_similarities = ids[top], similarities[top]
+        else:
+            selector = faiss.IDSelectorBatch(ids)
+            params: faiss.SearchParameters
+            if self.index_type in ("ivf", "ivfpq"):
+                ivf_params = faiss.SearchParametersIVF()
+                ivf_params.nprobe = faiss.extract_index_ivf(self.index).nlist
+                params = ivf_params
+            else:
+                params = faiss.SearchParameters()
+            params.sel = selector
+            similarities, found = self.index.search(query, k, params=params)
+            row_ids, row_similarities = found[0], similarities[0]
+            row_similarities = row_similarities[row_ids >= 0]
+            row_ids = row_ids[row_ids >= 0]
+        keep = row_similarities >= similarity_threshold
+        return row_ids[keep], row_similarities[keep]
+
+    def agent_codes(self, ids: np.ndarray | np.int64) -> np.ndarray:
+        """Agent codes (into ``metadata.agent_ids``) of vector ids."""
+        return np.asarray(self.metadata.agent[ids - self.base])
+
+    def field_weights(
+        self, ids: np.ndarray | np.int64, weight_of: Callable[[str], float]
+    ) -> np.ndarray:
+        """Scoring weight of the field of each vector id.
+
+        Args:
+            ids: Vector ids of this segment
+            weight_of: Weight of a field path (fixed for the segment's life)
+
+        Returns:
+            float32 weight per id
+        """
+        paths = self.metadata.field_paths
+        if len(self._path_weights) < len(paths):
+            self._path_weights = np.array(
+                [weight_of(path) for path in paths], dtype=np.float32
+            )
+        return np.asarray(self._path_weights[self.metadata.field[ids - self.base]])
+
+    def reconstruct(self, ids: np.ndarray | Sequence[int]) -> np.ndarray:
+        """Decode the stored (normalized) embeddings of vector ids."""
+        if not len(ids):
+            return np.empty((0, self.index.d), dtype=np.float32)
+        return self.index.reconstruct_batch(np.asarray(ids, dtype=np.int64))
+
+    def materialize(self, ids: Sequence[int]) -> list[Vector]:
+        """Vector protos, with values, for vector ids of this segment."""
+        local = [vector_id - self.base for vector_id in ids]
+        return self.metadata.materialize(local, self.reconstruct(ids))
+
+    def live_ids(self) -> np.ndarray:
+        """Ids of the live vectors, ascending."""
+        return np.flatnonzero(self.metadata.agent[: self.size] >= 0) + self.base
+
+    def agent_ranges(self) -> dict[str, range]:
+        """Vector ids of every agent with live vectors in the segment.
+
+        An agent's vectors have consecutive ids, so each run of one agent
+        code among the live ids is that agent's id range.
+        """
+        live = self.live_ids()
+        if not len(live):
+            return {}
+        codes = self.agent_codes(live)
+        starts = np.flatnonzero(np.diff(codes, prepend=-1))
+        ends = np.append(starts[1:], len(live)) - 1
+        agent_ids = self.metadata.agent_ids
+        return {
+            agent_ids[code]: range(first, last + 1)
+            for code, first, last in zip(
+                codes[starts].tolist(),
+                live[starts].tolist(),
+                live[ends].tolist(),
+                strict=True,
+            )
+        }
+
+    def save(self, directory: Path) -> None:
+        """Write the segment's index and metadata to ``directory``.
+
+        Files are written to a staging directory that is renamed into place.
+        """
+        staging = directory.with_name(f"{directory.name}.tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        faiss.write_index(self.index, str(staging / "index.faiss"))
+        self.metadata.save(staging, self.size)
+        np.save(staging / "centroid_ids.npy", self.centroid_ids)
+        np.save(staging / "centroids.npy", self.centroids)
+        staging.rename(directory)
+        self.name = directory.name
+
+    def describe(self) -> dict[str, Any]:
+        """Manifest entry of a persisted segment."""
+        return {
+            "name": self.name,
+            "base": self.base,
+            "size": self.size,
+            "index_type": self.index_type,
+            "trained_size": self.trained_size,
+        }
+
+    @classmethod
+    def open(
+        cls, directory: Path, entry: dict[str, Any], vector_dimensions: int
+    ) -> "VectorSegment":
+        """Memory-map a segment written by ``save``.
+
+        Args:
+            directory: Segment directory
+            entry: The segment's manifest entry
+            vector_dimensions: Embedding size reported in materialized metadata
+        """
+        index = faiss.read_index(
+            str(directory / "index.faiss"),
+            _MMAP_FLAG | faiss.IO_FLAG_READ_ONLY,
+        )
+        segment = cls(
+            base=entry["base"],
+            index=index,
+            metadata=VectorMetadataTable.open(directory, vector_dimensions),
+            index_type=entry["index_type"],
+            trained_size=entry["trained_size"],
+            size=entry["size"],
+            name=entry.get("name"),
+        )
+        if (directory / "centroids.npy").exists():
+            segment.centroid_ids = np.load(directory / "centroid_ids.npy")
+            segment.centroids = np.load(directory / "centroids.npy", mmap_mode="r")
+        else:
+            # Written before centroids existed
+            segment.set_centroids()
+        return segment
+
+    def index_bytes(self) -> int:
+        """Approximate memory held by the FAISS index."""
+        index = self.index
+        ntotal = index.ntotal
+        size = 0
+        if isinstance(index, faiss.IndexIDMap2):
+            # id_map vector plus the reverse hash map
+            size += ntotal * (8 + 32)
+            index = faiss.downcast_index(index.index)
+        if isinstance(index, faiss.IndexHNSW):
+            # The stubs lack HNSW.neighbors
+            neighbors = index.hnsw.neighbors  # type: ignore[attr-defined]
+            size += neighbors.size() * 4 + index.hnsw.levels.size() * 4
+            index = faiss.downcast_index(index.storage)
+        if isinstance(index, faiss.IndexIVF):
+            # Codes, ids and the direct map per vector, plus the centroids
+            size += ntotal * (index.code_size + 8 + 32)
+            size += index.nlist * index.d * 4
+        else:
+            size += ntotal * index.sa_code_size()
+        return size
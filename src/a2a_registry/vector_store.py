@@ -1,49 +1,413 @@
 """FAISS-based vector store for agent registry semantic search."""
 
+import bisect
+import json
 import logging
-import pickle
+import os
+import shutil
+import threading
+import time
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
 import faiss
 import numpy as np
 
+from .field_schema import field_kind
 from .proto.generated.registry_pb2 import Vector  # type: ignore
+from .vector_metadata import VectorMetadataTable
+from .vector_segment import VectorSegment
 
 logger = logging.getLogger(__name__)
 
+# On-disk format written by ``flush``, bumped on incompatible changes.
+# Version 1 held a single index in the persist directory itself.
+INDEX_FORMAT = "a2a-registry-vector-index"
+INDEX_FORMAT_VERSION = 2
+
+# Index types selectable through ``index_type``
+INDEX_TYPES = ("flat", "hnsw", "ivf", "ivfpq")
+
+# Embedding storage precision selectable through ``vector_storage``
+VECTOR_STORAGE_TYPES = ("float32", "fp16", "sq8")
+
+_SCALAR_QUANTIZERS = {
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+    "sq8": faiss.ScalarQuantizer.QT_8bit,
+}
+
+# SQ8 ranges are learned per dimension once this many vectors are available;
+# before that the full range of normalized components, [-1, 1], is used
+_SQ_MIN_TRAINING = 256
+
+# Files of a version 1 index, removed once it is rewritten as a segment
+_V1_FILES = (
+    "index.faiss",
+    "agent.npy",
+    "field.npy",
+    "model.npy",
+    "text_start.npy",
+    "text_len.npy",
+    "created.npy",
+    "arena.bin",
+    "extra_ids.npy",
+    "extra_offsets.npy",
+    "extra.bin",
+    "strings.json",
+)
+
+
+def composite_agent_scores(
+    groups: np.ndarray, similarities: np.ndarray, group_count: int
+) -> np.ndarray:
+    """Composite score per agent from the similarities of its matching vectors.
+
+    0.6 * best score + 0.3 * mean of the best three + 0.1 * coverage, where
+    coverage is the number of matches / 5, capped at 1. Computed with one
+    sort and segment reductions, without a Python loop per agent.
+
+    Args:
+        groups: Agent (group) index of each matching vector
+        similarities: Similarity of each matching vector
+        group_count: Number of agents
+
+    Returns:
+        Composite score per agent, -inf for agents without matches
+    """
+    scores = np.full(group_count, -np.inf)
+    if not len(groups):
+        return scores
+    # Sort by agent, then best similarity first: each agent is one segment
+    order = np.lexsort((-similarities, groups))
+    groups, similarities = groups[order], similarities[order]
+    starts = np.flatnonzero(np.diff(groups, prepend=-1))
+    counts = np.diff(np.append(starts, len(groups)))
+    rank = np.arange(len(groups)) - np.repeat(starts, counts)
+    best = np.maximum.reduceat(similarities, starts)
+    top_sums = np.add.reduceat(np.where(rank < 3, similarities, 0.0), starts)
+    scores[groups[starts]] = (
+        0.6 * best
+        + 0.3 * top_sums / np.minimum(counts, 3)
+        + 0.1 * np.minimum(counts / 5.0, 1.0)
+    )
+    return scores
+
+
+def _top_indices(scores: np.ndarray, max_results: int) -> np.ndarray:
+    """Indices of the ``max_results`` best finite scores, ties in index order."""
+    if max_results <= 0:
+        return np.empty(0, dtype=np.int64)
+    if len(scores) > max_results:
+        # Partial selection, then a stable sort of the selected few
+        cutoff = np.partition(-scores, max_results - 1)[max_results - 1]
+        candidates = np.flatnonzero(-scores <= cutoff)
+    else:
+        candidates = np.arange(len(scores))
+    order = candidates[np.argsort(-scores[candidates], kind="stable")][:max_results]
+    return order[scores[order] > -np.inf]
+
+
+def top_agents(
+    agent_ids: Sequence[str], scores: np.ndarray, max_results: int
+) -> list[tuple[str, float]]:
+    """The ``max_results`` best scored agents, ties in ``agent_ids`` order.
+
+    Args:
+        agent_ids: Agent of each score
+        scores: Composite score per agent (-inf for no match)
+        max_results: Number of agents to return
+
+    Returns:
+        Ranked (agent_id, score) tuples
+    """
+    return [
+        (agent_ids[i], float(scores[i]))
+        for i in _top_indices(scores, max_results).tolist()
+    ]
+
+
+def rank_agent_scores(
+    similar_vectors: list[tuple[str, float]], max_results: int
+) -> list[tuple[str, float]]:
+    """Aggregate (agent_id, similarity) vector matches into ranked agents.
+
+    Agents are numbered in order of first appearance, so equal scores keep
+    the order of the agents' best matches.
+
+    Args:
+        similar_vectors: Matching vectors as (agent_id, similarity) tuples
+        max_results: Number of agents to return
+
+    Returns:
+        Ranked (agent_id, composite_score) tuples
+    """
+    codes: dict[str, int] = {}
+    groups = np.fromiter(
+        (codes.setdefault(agent_id, len(codes)) for agent_id, _ in similar_vectors),
+        dtype=np.int64,
+        count=len(similar_vectors),
+    )
+    similarities = np.fromiter(
+        (score for _, score in similar_vectors),
+        dtype=np.float64,
+        count=len(similar_vectors),
+    )
+    scores = composite_agent_scores(groups, similarities, len(codes))
+    return top_agents(list(codes), scores, max_results)
+
 
 class FAISSVectorStore:
-    """In-memory vector store using FAISS for similarity search."""
+    """Segmented vector store using FAISS for similarity search.
+
+    New vectors go into a small mutable segment (an exact ``IndexFlatIP``),
+    which is sealed once it holds ``segment_size`` vector ids and on every
+    flush. Sealed segments are immutable: removed vectors stay in their index
+    as tombstones, filtered from results. Searches fan out across all
+    segments and merge the top k.
+
+    Sealed segments are merged in the background (or inline without a
+    ``flush_interval``): ``merge_factor`` adjacent segments of similar size
+    become one, and a segment more than a quarter tombstones is rewritten on
+    its own. A merged segment with at least ``ann_threshold`` vectors gets the
+    approximate ``index_type``, trained on its vectors.
+
+    With a ``persist_path`` each flush writes only the segments sealed since
+    the last flush, appends new tombstones to a log and replaces a small JSON
+    manifest, so its cost follows the change rate rather than the index size.
+    Persisted segments are memory-mapped.
+
+    A coarse exact index holds one pooled vector (centroid) per agent, keyed
+    by the agent's first vector id, for two-stage agent search (see
+    ``search_agents_by_centroid``).
+
+    Agent scoring multiplies each matching vector's similarity by the weight
+    of its field kind in ``field_weights`` (see ``FieldSchema``); searches
+    returning vectors report plain similarities.
+
+    Embeddings are kept only once, in the FAISS indexes: as float32, or with
+    ``vector_storage`` "fp16" or "sq8" as scalar-quantized codes (IVF-PQ codes
+    are already compressed and ignore it). Per-vector metadata lives in
+    columnar ``VectorMetadataTable`` s; Vector protos are materialized only
+    when an API returns vectors, with ``values`` reconstructed
+    (unit-normalized) from the index.
+
+    All methods are thread-safe; ``lock`` guards the store.
+    """
 
-    def __init__(self, vector_dimensions: int = 384, persist_path: str | None = None):
+    def __init__(
+        self,
+        vector_dimensions: int = 384,
+        persist_path: str | None = None,
+        index_type: str = "flat",
+        ann_threshold: int = 10000,
+        hnsw_m: int = 32,
+        hnsw_ef_search: int = 128,
+        ivf_nlist: int = 0,
+        ivf_nprobe: int = 16,
+        pq_m: int = 16,
+        vector_storage: str = "float32",
+        segment_size: int = 10000,
+        merge_factor: int = 10,
+        flush_interval: float = 0.0,
+        filter_exact_selectivity: float = 0.05,
+        field_weights: dict[str, float] | None = None,
+    ):
         """Initialize FAISS vector store.
 
         Args:
             vector_dimensions: Dimension of vectors (should match VectorGenerator model)
-            persist_path: Optional path to persist/load index from disk
+            persist_path: Optional directory to persist/load segments
+            index_type: One of "flat", "hnsw", "ivf" or "ivfpq"
+            ann_threshold: Segment size from which an approximate index is used
+            hnsw_m: Graph neighbours per node for HNSW
+            hnsw_ef_search: HNSW search breadth (higher is slower, better recall)
+            ivf_nlist: IVF cells (0 picks about 4 * sqrt(vectors) when training)
+            ivf_nprobe: IVF cells visited per query
+            pq_m: Sub-quantizers per vector for IVF-PQ (must divide dimensions)
+            vector_storage: Embedding precision: "float32", "fp16" or "sq8"
+            segment_size: Vector ids after which the mutable segment is sealed
+            merge_factor: Adjacent segments of one size tier merged at once
+            flush_interval: Seconds between background flushes and merges
+                            (0 merges inline and flushes only when asked)
+            filter_exact_selectivity: Largest fraction of the index a filtered
+                                      search scores exactly (see
+                                      ``search_agent_scores_filtered``)
+            field_weights: Scoring weight per field kind (unlisted kinds
+                           weigh 1; None scores plain similarities)
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"Unknown vector index type {index_type!r}, expected one of {INDEX_TYPES}"
+            )
+        if vector_storage not in VECTOR_STORAGE_TYPES:
+            raise ValueError(
+                f"Unknown vector storage {vector_storage!r}, "
+                f"expected one of {VECTOR_STORAGE_TYPES}"
+            )
+        if index_type == "ivfpq" and vector_dimensions % pq_m:
+            raise ValueError(
+                f"pq_m ({pq_m}) must divide the vector dimensions ({vector_dimensions})"
+            )
         self.vector_dimensions = vector_dimensions
         self.persist_path = persist_path
+        self.index_type = index_type
+        self.ann_threshold = max(ann_threshold, 1)
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_search = hnsw_ef_search
+        self.ivf_nlist = ivf_nlist
+        self.ivf_nprobe = ivf_nprobe
+        self.pq_m = pq_m
+        self.vector_storage = vector_storage
+        self.segment_size = max(segment_size, 1)
+        self.merge_factor = max(merge_factor, 2)
+        self.flush_interval = flush_interval
+        self.filter_exact_selectivity = filter_exact_selectivity
+        self.field_weights = field_weights
+        # Field schema signature and embedding model the vectors were built with
+        self.field_schema: str | None = None
+        self.embedding_model: str | None = None
 
-        # FAISS index for similarity search
-        self.index = faiss.IndexFlatIP(
-            vector_dimensions
-        )  # Inner product (cosine similarity)
+        self.lock = threading.RLock()
+        self._cond = threading.Condition(self.lock)
 
-        # Metadata storage (agent_id -> vector list mapping)
-        self.agent_vectors: dict[str, list[Vector]] = {}
-        self.vector_id_to_agent: dict[int, str] = {}  # FAISS index ID -> agent_id
+        # agent_id -> its consecutive vector ids
+        self.agent_vector_ids: dict[str, range] = {}
         self.next_vector_id = 0
+        # Sealed segments ordered by vector id, then the mutable segment
+        self.segments: list[VectorSegment] = []
+        self.mutable = self._new_mutable_segment()
+        # Agent centroids by the agent's first vector id
+        self.centroids = faiss.IndexIDMap2(faiss.IndexFlatIP(vector_dimensions))
+
+        self.flushes = 0
+        self.merges = 0
+        # Filtered searches by plan, and ANN searches repeated with a larger k
+        self.filter_plans = {"exact": 0, "ann": 0, "ann_expansions": 0}
+        # Removed ids of persisted segments: logged, and not yet logged
+        self._tombstone_log: list[int] = []
+        self._pending_tombstones: list[int] = []
+        self._tombstone_file: str | None = None
+        self._generation = 0
+        self._merge_names: set[str] = set()  # segments being written by merges
+        self._merge_requested = False
+        self._dirty = False  # changed since the last flush
+        self._closed = False
+        self._worker: threading.Thread | None = None
 
         # Load persisted index if available
-        if persist_path and Path(persist_path).exists():
+        if persist_path and (Path(persist_path) / "manifest.json").exists():
             self.load_index()
+        elif persist_path and Path(f"{persist_path}.meta").exists():
+            logger.warning(
+                f"Ignoring pickled vector index at {persist_path}.meta; "
+                "agents are re-indexed when they register again"
+            )
+
+        if flush_interval > 0:
+            self._worker = threading.Thread(
+                target=self._run, name="a2a-registry-vector-segments", daemon=True
+            )
+            self._worker.start()
 
         logger.info(
             f"Initialized FAISS vector store with {vector_dimensions} dimensions"
         )
 
+    def _new_index(
+        self, kind: str = "flat", training: np.ndarray | None = None
+    ) -> faiss.Index:
+        """Create an empty index of type ``kind``.
+
+        Flat and HNSW indexes are wrapped in ``IndexIDMap2`` for stable ids.
+        IVF indexes store ids natively.
+
+        Args:
+            kind: One of ``INDEX_TYPES``
+            training: Normalized vectors to train IVF and SQ8 quantizers on
+        """
+        dims = self.vector_dimensions
+        qtype = _SCALAR_QUANTIZERS.get(self.vector_storage)
+        metric = faiss.METRIC_INNER_PRODUCT
+        inner: faiss.Index
+        if kind == "hnsw":
+            if qtype is None:
+                inner = faiss.IndexHNSWFlat(dims, self.hnsw_m, metric)
+            else:
+                # The stubs want a ScalarQuantizer; FAISS takes its QuantizerType
+                inner = faiss.IndexHNSWSQ(
+                    dims, qtype, self.hnsw_m, metric  # type: ignore[arg-type]
+                )
+                self._train_scalar_quantizer(inner, training)
+        elif kind in ("ivf", "ivfpq"):
+            count = 0 if training is None else len(training)
+            nlist = self.ivf_nlist or int(4 * np.sqrt(max(count, 1)))
+            # FAISS wants ~39 training points per cell
+            nlist = max(1, min(nlist, count // 39 or 1))
+            quantizer = faiss.IndexFlatIP(dims)
+            ivf: faiss.IndexIVF
+            if kind == "ivfpq":
+                ivf = faiss.IndexIVFPQ(quantizer, dims, nlist, self.pq_m, 8, metric)
+            elif qtype is not None:
+                ivf = faiss.IndexIVFScalarQuantizer(
+                    quantizer, dims, nlist, qtype, metric
+                )
+            else:
+                ivf = faiss.IndexIVFFlat(quantizer, dims, nlist, metric)
+            if training is not None and count:
+                ivf.train(training)
+            # Hashtable direct map: reconstruct by id
+            ivf.set_direct_map_type(faiss.DirectMap.Hashtable)  # type: ignore[attr-defined]
+            self._apply_search_params(ivf)
+            return ivf
+        elif qtype is not None:
+            inner = faiss.IndexScalarQuantizer(dims, qtype, metric)
+            self._train_scalar_quantizer(inner, training)
+        else:
+            inner = faiss.IndexFlatIP(dims)
+        index = faiss.IndexIDMap2(inner)
+        self._apply_search_params(index)
+        return index
+
+    def _train_scalar_quantizer(
+        self, index: faiss.Index, training: np.ndarray | None
+    ) -> None:
+        """Train SQ ranges on ``training`` or on the [-1, 1] component range."""
+        if training is None or len(training) < _SQ_MIN_TRAINING:
+            training = np.stack(
+                [
+                    np.full(self.vector_dimensions, -1.0, dtype=np.float32),
+                    np.full(self.vector_dimensions, 1.0, dtype=np.float32),
+                ]
+            )
+        index.train(training)
+
+    def _apply_search_params(self, index: faiss.Index) -> None:
+        """Set query-time parameters (efSearch, nprobe) on an index."""
+        inner = index
+        if isinstance(index, faiss.IndexIDMap2):
+            inner = faiss.downcast_index(index.index)
+        if isinstance(inner, faiss.IndexHNSW):
+            inner.hnsw.efSearch = self.hnsw_ef_search
+        elif isinstance(inner, faiss.IndexIVF):
+            inner.nprobe = min(self.ivf_nprobe, inner.nlist)
+
+    def _new_mutable_segment(self) -> VectorSegment:
+        return VectorSegment(
+            self.next_vector_id,
+            self._new_index(),
+            VectorMetadataTable(self.vector_dimensions),
+        )
+
+    def _all_segments(self) -> list[VectorSegment]:
+        return [*self.segments, self.mutable]
+
+    def _segment_of(self, vector_id: int) -> VectorSegment:
+        """Segment whose id range contains ``vector_id``."""
+        segments = self._all_segments()
+        position = bisect.bisect_right([seg.base for seg in segments], vector_id)
+        return segments[position - 1]
+
     def add_agent_vectors(self, agent_id: str, vectors: list[Vector]) -> None:
         """Add or update vectors for an agent.
 
@@ -51,31 +415,47 @@ class FAISSVectorStore:
             agent_id: Unique agent identifier
             vectors: List of vector proto messages
         """
-        # Remove existing vectors for this agent
-        self.remove_agent_vectors(agent_id)
+        self.add_agents_vectors({agent_id: vectors})
 
-        if not vectors:
-            return
+    def add_agents_vectors(self, agents_vectors: dict[str, list[Vector]]) -> None:
+        """Add or update vectors for many agents with a single index update.
 
-        # Convert vectors to numpy array
-        vector_matrix = np.array([v.values for v in vectors], dtype=np.float32)
+        Only the given agents' vectors are touched: their old ids are removed
+        and the new vectors get fresh ids in the mutable segment.
 
-        # Normalize vectors for cosine similarity
-        faiss.normalize_L2(vector_matrix)
-
-        # Add to FAISS index
-        start_id = self.next_vector_id
-        self.index.add(vector_matrix)
+        Args:
+            agents_vectors: Mapping of agent_id to its vector proto messages
+        """
+        with self.lock:
+            self._remove_agents(agents_vectors)
+            self._add(agents_vectors)
+            if self.mutable.size >= self.segment_size:
+                self._seal()
+            self._maintain()
 
-        # Update metadata mappings
-        self.agent_vectors[agent_id] = vectors
-        for i, _vector in enumerate(vectors):
-            vector_id = start_id + i
-            self.vector_id_to_agent[vector_id] = agent_id
+    def _add(self, agents_vectors: dict[str, list[Vector]]) -> None:
+        """Assign fresh ids to the agents' vectors and add them to the index."""
+        agents = []
+        vector_rows: list[Sequence[float]] = []
+        for agent_id, vectors in agents_vectors.items():
+            if not vectors:
+                continue
+            ids = range(self.next_vector_id, self.next_vector_id + len(vectors))
+            self.next_vector_id += len(vectors)
+            vector_rows.extend(vector.values for vector in vectors)
+            agents.append((agent_id, ids, vectors))
+            self.agent_vector_ids[agent_id] = ids
+            self._dirty = True
 
-        self.next_vector_id += len(vectors)
+        if agents:
+            matrix = np.array(vector_rows, dtype=np.float32)
+            faiss.normalize_L2(matrix)
+            starts, centroids = self.mutable.add(agents, matrix)
+            self.centroids.add_with_ids(centroids, starts)
 
-        logger.debug(f"Added {len(vectors)} vectors for agent {agent_id}")
+        logger.debug(
+            f"Added {len(vector_rows)} vectors for {len(agents_vectors)} agents"
+        )
 
     def remove_agent_vectors(self, agent_id: str) -> None:
         """Remove all vectors for an agent.
@@ -83,185 +463,874 @@ class FAISSVectorStore:
         Args:
             agent_id: Unique agent identifier
         """
-        if agent_id not in self.agent_vectors:
+        with self.lock:
+            self._remove_agents([agent_id])
+            self._maintain()
+        logger.debug(f"Removed vectors for agent {agent_id}")
+
+    def _remove_agents(self, agent_ids: Iterable[str]) -> None:
+        """Remove the vectors of several agents by id."""
+        starts = []
+        for agent_id in agent_ids:
+            ids = self.agent_vector_ids.pop(agent_id, None)
+            if not ids:
+                continue
+            starts.append(ids.start)
+            segment = self._segment_of(ids.start)
+            removed = np.arange(ids.start, ids.stop, dtype=np.int64)
+            segment.remove(removed, from_index=segment is self.mutable)
+            self._dirty = True
+            if segment.name is not None:
+                self._pending_tombstones.extend(ids)
+        if starts:
+            self.centroids.remove_ids(
+                faiss.IDSelectorBatch(np.array(starts, dtype=np.int64))
+            )
+
+    def _seal(self) -> None:
+        """Turn the mutable segment into a sealed one and start a new one."""
+        if self.mutable.size:
+            self.segments.append(self.mutable)
+            self.mutable = self._new_mutable_segment()
+
+    def _maintain(self) -> None:
+        """Run due merges inline, or wake the background worker."""
+        if self._worker is None:
+            self._run_merges()
+        else:
+            self._merge_requested = True
+            self._cond.notify()
+
+    def _tier(self, segment: VectorSegment) -> int:
+        """Size tier: segments within a factor ``merge_factor`` share a tier."""
+        tier, bound = 0, self.segment_size * self.merge_factor
+        while segment.live >= bound:
+            tier, bound = tier + 1, bound * self.merge_factor
+        return tier
+
+    def _plan_merge(self) -> list[VectorSegment] | None:
+        """Adjacent sealed segments to merge next, if any."""
+        for segment in self.segments:
+            if segment.tombstones > segment.index.ntotal // 4 or not segment.live:
+                return [segment]
+
+        tiers = [self._tier(segment) for segment in self.segments]
+        start = 0
+        for end in range(1, len(tiers) + 1):
+            if end == len(tiers) or tiers[end] != tiers[start]:
+                if end - start >= self.merge_factor:
+                    return self.segments[start : start + self.merge_factor]
+                start = end
+
+        # Large flat segments are rewritten with the approximate index
+        for segment in self.segments:
+            if (
+                self.index_type != segment.index_type == "flat"
+                and segment.live >= self.ann_threshold
+            ):
+                return [segment]
+        return None
+
+    def _run_merges(self) -> None:
+        """Merge segments until the merge policy is satisfied.
+
+        Planning and installing hold the lock; building the merged segment
+        does not, so searches and updates continue meanwhile.
+        """
+        while True:
+            with self.lock:
+                sources = self._plan_merge()
+                if sources is None:
+                    self._merge_requested = False
+                    return
+                snapshot = [
+                    (segment, live, segment.agent_codes(live).copy())
+                    for segment in sources
+                    for live in [segment.live_ids()]
+                ]
+                name = self._next_segment_name() if self.persist_path else None
+                if name is not None:
+                    self._merge_names.add(name)
+            try:
+                merged = self._build_merge(snapshot, name)
+                with self.lock:
+                    self._install_merge(snapshot, merged)
+            finally:
+                if name is not None:
+                    with self.lock:
+                        self._merge_names.discard(name)
+
+    def _build_merge(
+        self,
+        snapshot: list[tuple[VectorSegment, np.ndarray, np.ndarray]],
+        name: str | None,
+    ) -> VectorSegment | None:
+        """Build (and persist) one segment from the live vectors of sources.
+
+        The merged segment takes the first source's base and renumbers the
+        live vectors densely, keeping their order.
+
+        Args:
+            snapshot: (segment, live ids, their agent codes) per source
+            name: Directory name to persist the merged segment under
+        """
+        total = sum(len(live) for _segment, live, _codes in snapshot)
+        if not total:
+            return None
+        matrix = np.concatenate(
+            [segment.reconstruct(live) for segment, live, _codes in snapshot]
+        )
+        kind = self.index_type if total >= self.ann_threshold else "flat"
+        needs_training = kind != "flat" or self.vector_storage in _SCALAR_QUANTIZERS
+        base = snapshot[0][0].base
+        merged = VectorSegment(
+            base,
+            self._new_index(kind, matrix if needs_training else None),
+            VectorMetadataTable(self.vector_dimensions),
+            index_type=kind,
+            trained_size=total if kind in ("ivf", "ivfpq") else 0,
+        )
+        position = 0
+        for segment, live, codes in snapshot:
+            merged.metadata.copy_rows(
+                segment.metadata,
+                live - segment.base,
+                range(position, position + len(live)),
+                agent_codes=codes,
+            )
+            position += len(live)
+        merged.index.add_with_ids(matrix, np.arange(base, base + total))
+        merged.size = merged.live = total
+        merged.set_centroids(matrix)
+
+        if name is not None:
+            merged.save(Path(self.persist_path) / name)  # type: ignore[arg-type]
+        logger.info(
+            f"Merged {len(snapshot)} vector segments into {total} vectors ({kind})"
+        )
+        return merged
+
+    def _install_merge(
+        self,
+        snapshot: list[tuple[VectorSegment, np.ndarray, np.ndarray]],
+        merged: VectorSegment | None,
+    ) -> None:
+        """Replace the source segments with the merged one."""
+        sources = [segment for segment, _live, _codes in snapshot]
+        start = next(
+            i for i, segment in enumerate(self.segments) if segment is sources[0]
+        )
+        span_start, span_end = sources[0].base, sources[-1].end
+
+        # Vectors removed while the merge was built are tombstones in it
+        late = []
+        position = 0
+        for segment, live, _codes in snapshot:
+            removed = segment.metadata.agent[live - segment.base] < 0
+            late.append(np.flatnonzero(removed) + position)
+            position += len(live)
+        late_ids = np.concatenate(late) + span_start
+
+        # Logged tombstones of replaced ids no longer apply
+        def outside(ids: list[int]) -> list[int]:
+            return [i for i in ids if not span_start <= i < span_end]
+
+        kept_log = outside(self._tombstone_log)
+        rewrite_log = len(kept_log) != len(self._tombstone_log)
+        self._tombstone_log = kept_log
+        self._pending_tombstones = outside(self._pending_tombstones)
+
+        # Agents move to new first ids; removed ones have no centroid anymore
+        self.centroids.remove_ids(
+            faiss.IDSelectorBatch(
+                np.concatenate([segment.centroid_ids for segment in sources])
+            )
+        )
+        if merged is None:
+            del self.segments[start : start + len(sources)]
+        else:
+            if len(late_ids):
+                merged.remove(late_ids, from_index=False)
+                if merged.name is not None:
+                    self._pending_tombstones.extend(late_ids.tolist())
+            self.segments[start : start + len(sources)] = [merged]
+            self.agent_vector_ids.update(merged.agent_ranges())
+            starts, centroids = merged.live_centroids()
+            self.centroids.add_with_ids(centroids, starts)
+        self.merges += 1
+        self._dirty = True
+
+        if self.persist_path and (
+            rewrite_log or any(segment.name for segment in sources)
+        ):
+            self._write_manifest(rewrite_log)
+
+    def _merge_pending(self) -> bool:
+        with self.lock:
+            return self._merge_requested
+
+    def _run(self) -> None:
+        """Background worker: flush every ``flush_interval`` and merge."""
+        next_flush = time.monotonic() + self.flush_interval
+        while True:
+            with self._cond:
+                while not self._closed and not self._merge_requested:
+                    remaining = next_flush - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                closed = self._closed
+            try:
+                if closed or time.monotonic() >= next_flush:
+                    self.flush()
+                    next_flush = time.monotonic() + self.flush_interval
+                if self._merge_pending():
+                    self._run_merges()
+            except Exception as e:
+                logger.error(f"Vector segment maintenance failed: {e}")
+                with self.lock:
+                    self._merge_requested = False
+            if closed:
+                return
+
+    def flush(self) -> None:
+        """Seal the mutable segment and persist what changed since last flush.
+
+        Writes the newly sealed segments, appends new tombstones to the log
+        and replaces the manifest. Does nothing without changes.
+        """
+        with self.lock:
+            self._seal()
+            if self.persist_path and self._dirty:
+                directory = Path(self.persist_path)
+                directory.mkdir(parents=True, exist_ok=True)
+                for segment in self.segments:
+                    if segment.name is None:
+                        segment.save(directory / self._next_segment_name())
+                tombstone_file = self._tombstone_file
+                rewrite_log = tombstone_file is None
+                if self._pending_tombstones and tombstone_file is not None:
+                    with open(directory / tombstone_file, "ab") as f:
+                        f.write(
+                            np.array(self._pending_tombstones, dtype=np.int64).tobytes()
+                        )
+                        f.flush()
+                        os.fsync(f.fileno())
+                self._tombstone_log.extend(self._pending_tombstones)
+                self._pending_tombstones = []
+                self._write_manifest(rewrite_log)
+                self.flushes += 1
+            self._dirty = False
+            self._maintain()
+
+    def save_index(self) -> None:
+        """Persist index and metadata to disk (see ``flush``)."""
+        self.flush()
+        if self.persist_path:
+            logger.info(f"Saved vector index to {self.persist_path}")
+
+    def set_index_schema(self, field_schema: str, embedding_model: str) -> None:
+        """Record how the vectors were built, persisted by ``flush``.
+
+        Args:
+            field_schema: Signature of the field schema (see ``FieldSchema``)
+            embedding_model: Name of the embeddings' model
+        """
+        with self.lock:
+            if (field_schema, embedding_model) != (
+                self.field_schema,
+                self.embedding_model,
+            ):
+                self.field_schema = field_schema
+                self.embedding_model = embedding_model
+                self._dirty = self._dirty or self.next_vector_id > 0
+
+    def close(self) -> None:
+        """Stop background maintenance and flush."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+        else:
+            self.flush()
+
+    def _next_segment_name(self) -> str:
+        self._generation += 1
+        return f"segment-{self._generation:08d}"
+
+    def _write_manifest(self, rewrite_log: bool = False) -> None:
+        """Atomically replace the manifest, then drop unreferenced files.
+
+        Args:
+            rewrite_log: Write the tombstone log to a new file first
+        """
+        directory = Path(self.persist_path)  # type: ignore[arg-type]
+        if rewrite_log:
+            self._generation += 1
+            self._tombstone_file = f"tombstones-{self._generation:08d}.bin"
+            (directory / self._tombstone_file).write_bytes(
+                np.array(self._tombstone_log, dtype=np.int64).tobytes()
+            )
+        manifest: dict[str, Any] = {
+            "format": INDEX_FORMAT,
+            "version": INDEX_FORMAT_VERSION,
+            "vector_dimensions": self.vector_dimensions,
+            "vector_storage": self.vector_storage,
+            "field_schema": self.field_schema,
+            "embedding_model": self.embedding_model,
+            "next_vector_id": self.next_vector_id,
+            "generation": self._generation,
+            "segments": [
+                segment.describe()
+                for segment in self.segments
+                if segment.name is not None
+            ],
+            "tombstones": {
+                "file": self._tombstone_file,
+                "count": len(self._tombstone_log),
+            },
+        }
+        staging = directory / "manifest.json.tmp"
+        staging.write_text(json.dumps(manifest, indent=2))
+        os.replace(staging, directory / "manifest.json")
+
+        referenced = {segment["name"] for segment in manifest["segments"]}
+        referenced |= self._merge_names | {self._tombstone_file}
+        for path in directory.iterdir():
+            name = path.name.removesuffix(".tmp")
+            if name in referenced:
+                continue
+            if name.startswith("segment-"):
+                shutil.rmtree(path, ignore_errors=True)
+            elif name.startswith("tombstones-") or name in _V1_FILES:
+                path.unlink(missing_ok=True)
+
+    def load_index(self) -> None:
+        """Map persisted segments and apply the tombstone log.
+
+        Segments are memory-mapped rather than read, so startup does not
+        depend on the index size and processes on one host share the page
+        cache.
+        """
+        if not self.persist_path:
             return
 
-        # FAISS doesn't support efficient deletion, so we rebuild the index
-        # This is acceptable for in-memory use with moderate data sizes
-        vectors_to_keep = []
-        new_agent_vectors = {}
-        new_vector_id_mapping = {}
-        new_vector_id = 0
-
-        for aid, agent_vecs in self.agent_vectors.items():
-            if aid != agent_id:
-                vectors_to_keep.extend([v.values for v in agent_vecs])
-                new_agent_vectors[aid] = agent_vecs
-
-                for _ in agent_vecs:
-                    new_vector_id_mapping[new_vector_id] = aid
-                    new_vector_id += 1
-
-        # Rebuild index
-        self.index = faiss.IndexFlatIP(self.vector_dimensions)
-        if vectors_to_keep:
-            vector_matrix = np.array(vectors_to_keep, dtype=np.float32)
-            faiss.normalize_L2(vector_matrix)
-            self.index.add(vector_matrix)
-
-        # Update metadata
-        self.agent_vectors = new_agent_vectors
-        self.vector_id_to_agent = new_vector_id_mapping
-        self.next_vector_id = new_vector_id
+        started = time.perf_counter()
+        directory = Path(self.persist_path)
+        try:
+            manifest = json.loads((directory / "manifest.json").read_text())
+            if manifest.get("format") != INDEX_FORMAT:
+                raise ValueError(f"not a vector index: {manifest.get('format')!r}")
+            if manifest["version"] > INDEX_FORMAT_VERSION:
+                raise ValueError(
+                    f"format version {manifest['version']} is newer than "
+                    f"supported version {INDEX_FORMAT_VERSION}"
+                )
+            if manifest["vector_dimensions"] != self.vector_dimensions:
+                raise ValueError(
+                    f"index has {manifest['vector_dimensions']} dimensions, "
+                    f"expected {self.vector_dimensions}"
+                )
 
-        logger.debug(f"Removed vectors for agent {agent_id}")
+            if manifest["version"] == 1:
+                # One index in the directory itself; rewritten on next flush
+                entry = {
+                    "base": 0,
+                    "size": manifest["next_vector_id"],
+                    "index_type": manifest["index_type"],
+                    "trained_size": manifest["trained_size"],
+                    "name": None,
+                }
+                segments = [
+                    VectorSegment.open(directory, entry, self.vector_dimensions)
+                ]
+                self._dirty = True
+            else:
+                segments = [
+                    VectorSegment.open(
+                        directory / entry["name"], entry, self.vector_dimensions
+                    )
+                    for entry in manifest["segments"]
+                ]
+                self._generation = manifest["generation"]
+            for segment in segments:
+                self._apply_search_params(segment.index)
+            self.segments = segments
+            self.next_vector_id = manifest["next_vector_id"]
+            self.field_schema = manifest.get("field_schema")
+            self.embedding_model = manifest.get("embedding_model")
+            self.mutable = self._new_mutable_segment()
 
-    def search_similar_vectors(
+            tombstones = manifest["tombstones"] if manifest["version"] > 1 else {}
+            if tombstones.get("file"):
+                self._tombstone_file = tombstones["file"]
+                log = np.fromfile(
+                    directory / tombstones["file"],
+                    dtype=np.int64,
+                    count=tombstones["count"],
+                )
+                self._tombstone_log = log.tolist()
+                for segment in segments:
+                    ids = log[(log >= segment.base) & (log < segment.end)]
+                    ids = ids[segment.agent_codes(ids) >= 0]
+                    segment.remove(ids, from_index=False)
+
+            self.agent_vector_ids = {}
+            for segment in segments:
+                self.agent_vector_ids.update(segment.agent_ranges())
+                starts, centroids = segment.live_centroids()
+                self.centroids.add_with_ids(centroids, starts)
+
+            logger.info(
+                f"Loaded vector index from {self.persist_path} "
+                f"({len(segments)} segments, "
+                f"{sum(segment.live for segment in segments)} vectors) in "
+                f"{(time.perf_counter() - started) * 1000:.1f} ms"
+            )
+
+        except Exception as e:
+            logger.warning(f"Failed to load vector index: {e}")
+            # Initialize empty index
+            self.segments = []
+            self.agent_vector_ids = {}
+            self.next_vector_id = 0
+            self.field_schema = None
+            self.embedding_model = None
+            self.mutable = self._new_mutable_segment()
+            self.centroids.reset()
+            self._tombstone_log = []
+            self._tombstone_file = None
+
+    def _field_weight(self, field_path: str) -> float:
+        assert self.field_weights is not None
+        return self.field_weights.get(field_kind(field_path), 1.0)
+
+    def _weigh(
+        self,
+        segment: VectorSegment,
+        ids: np.ndarray | np.int64,
+        similarities: np.ndarray | float,
+    ) -> np.ndarray:
+        """Similarities of a segment's vector ids, times their field weights."""
+        if self.field_weights is None:
+            return np.asarray(similarities)
+        return np.asarray(similarities * segment.field_weights(ids, self._field_weight))
+
+    def _search(
+        self, query_vectors: list[Vector], k: int, similarity_threshold: float
+    ) -> list[list[tuple[VectorSegment, int, float]]]:
+        """Top ``k`` live vectors across all segments, per query."""
+        queries = np.array(
+            [vector.values for vector in query_vectors], dtype=np.float32
+        )
+        faiss.normalize_L2(queries)
+        hits: list[list[tuple[VectorSegment, int, float]]] = [[] for _ in query_vectors]
+        with self.lock:
+            for segment in self._all_segments():
+                if not segment.live:
+                    continue
+                results = segment.search(queries, k, similarity_threshold)
+                for query_hits, (ids, similarities) in zip(hits, results, strict=True):
+                    query_hits.extend(
+                        zip(
+                            [segment] * len(ids),
+                            ids.tolist(),
+                            similarities.tolist(),
+                            strict=True,
+                        )
+                    )
+        for query_hits in hits:
+            query_hits.sort(key=lambda hit: hit[2], reverse=True)
+            del query_hits[k:]
+        return hits
+
+    def search_agent_scores(
         self,
         query_vector: Vector,
         k: int = 10,
         similarity_threshold: float = 0.7,
-    ) -> list[tuple[str, Vector, float]]:
-        """Search for similar vectors.
+    ) -> list[tuple[str, float]]:
+        """Search for similar vectors without materializing them.
 
         Args:
             query_vector: Query vector proto message
-            k: Number of results to return
+            k: Number of vectors to return
             similarity_threshold: Minimum similarity score
 
         Returns:
-            List of (agent_id, vector, similarity_score) tuples
+            List of (agent_id, similarity_score) tuples, one per matching vector
         """
-        if self.index.ntotal == 0:
-            return []
+        return self.search_agent_scores_batch([query_vector], k, similarity_threshold)[
+            0
+        ]
 
-        # Prepare query vector
-        query = np.array([query_vector.values], dtype=np.float32)
-        faiss.normalize_L2(query)
+    def search_agent_scores_batch(
+        self,
+        query_vectors: list[Vector],
+        k: int = 10,
+        similarity_threshold: float = 0.7,
+    ) -> list[list[tuple[str, float]]]:
+        """Search for several queries with one multi-row search per segment.
 
-        # Search FAISS index
-        similarities, indices = self.index.search(query, min(k, self.index.ntotal))
+        Args:
+            query_vectors: Query vector proto messages
+            k: Number of vectors to return per query
+            similarity_threshold: Minimum similarity score
 
-        results = []
-        for _i, (similarity, vector_idx) in enumerate(
-            zip(similarities[0], indices[0], strict=False)
-        ):
-            if similarity < similarity_threshold:
-                continue
+        Returns:
+            One list of (agent_id, similarity_score) tuples per query, in order
+        """
+        if not query_vectors:
+            return []
+        return [
+            [
+                (
+                    segment.metadata.agent_ids[
+                        segment.agent_codes(np.int64(vector_id))
+                    ],
+                    float(self._weigh(segment, np.int64(vector_id), score)),
+                )
+                for segment, vector_id, score in query_hits
+            ]
+            for query_hits in self._search(query_vectors, k, similarity_threshold)
+        ]
 
-            agent_id = self.vector_id_to_agent.get(vector_idx)
-            if not agent_id:
-                continue
+    def search_ranked_agents(
+        self,
+        query_vectors: list[Vector],
+        k: int = 100,
+        max_results: int = 10,
+        similarity_threshold: float = 0.7,
+    ) -> list[list[tuple[str, float]]]:
+        """Single-stage agent search: the top ``k`` field hits, ranked by agent.
 
-            # Get agent vectors
-            agent_vectors = self.agent_vectors.get(agent_id, [])
-            if not agent_vectors:
-                continue
+        Hits stay in NumPy arrays from the FAISS call to the ranking: they are
+        grouped by segment-qualified agent code and scored with
+        ``composite_agent_scores``, and only the returned agents' ids are
+        looked up. Ranks exactly like ``rank_agent_scores`` over
+        ``search_agent_scores``.
 
-            # Find the specific vector that matched - simplified logic
-            try:
-                start_idx = self._get_agent_vector_start_idx(agent_id)
-                local_vector_idx = vector_idx - start_idx
-
-                if 0 <= local_vector_idx < len(agent_vectors):
-                    matched_vector = agent_vectors[local_vector_idx]
-                    # Ensure similarity is a proper float
-                    similarity_score = float(similarity)
-                    results.append((agent_id, matched_vector, similarity_score))
-                else:
-                    # Fallback: use first vector if index calculation fails
-                    logger.warning(
-                        f"Vector index calculation failed for agent {agent_id}, using first vector"
-                    )
-                    matched_vector = agent_vectors[0]
-                    similarity_score = float(similarity)
-                    results.append((agent_id, matched_vector, similarity_score))
-            except Exception as e:
-                logger.error(f"Error processing vector match for agent {agent_id}: {e}")
-                continue
+        Args:
+            query_vectors: Query vector proto messages
+            k: Field vector hits considered per query
+            max_results: Number of agents to return per query
+            similarity_threshold: Minimum similarity of a matching vector
 
+        Returns:
+            One ranked list of (agent_id, composite_score) tuples per query
+        """
+        if not query_vectors:
+            return []
+        queries = np.array(
+            [vector.values for vector in query_vectors], dtype=np.float32
+        )
+        faiss.normalize_L2(queries)
+        results = []
+        with self.lock:
+            segments = [segment for segment in self._all_segments() if segment.live]
+            searched = [
+                segment.search(queries, k, similarity_threshold) for segment in segments
+            ]
+            for row in range(len(queries)):
+                # Agent key: segment position in the high bits, agent code low
+                keys = np.concatenate(
+                    [np.empty(0, dtype=np.int64)]
+                    + [
+                        (position << 32)
+                        | segment.agent_codes(hits[row][0]).astype(np.int64)
+                        for position, (segment, hits) in enumerate(
+                            zip(segments, searched, strict=True)
+                        )
+                    ]
+                )
+                similarities = np.concatenate(
+                    [np.empty(0, dtype=np.float32)]
+                    + [hits[row][1] for hits in searched]
+                )
+                weighted = np.concatenate(
+                    [np.empty(0, dtype=np.float32)]
+                    + [
+                        self._weigh(segment, *hits[row])
+                        for segment, hits in zip(segments, searched, strict=True)
+                    ]
+                )
+                # Best k across segments, best first
+                order = np.argsort(-similarities, kind="stable")[:k]
+                keys, weighted = keys[order], weighted[order]
+
+                # Number agents by first (best) hit, like rank_agent_scores
+                unique, first, groups = np.unique(
+                    keys, return_index=True, return_inverse=True
+                )
+                by_first = np.argsort(first, kind="stable")
+                renumber = np.empty(len(unique), dtype=np.int64)
+                renumber[by_first] = np.arange(len(unique))
+                scores = composite_agent_scores(
+                    renumber[groups], weighted.astype(np.float64), len(unique)
+                )
+                ranked = []
+                for i in _top_indices(scores, max_results).tolist():
+                    key = int(unique[by_first[i]])
+                    segment = segments[key >> 32]
+                    agent_id = segment.metadata.agent_ids[key & 0xFFFFFFFF]
+                    ranked.append((agent_id, float(scores[i])))
+                results.append(ranked)
         return results
 
-    def get_agent_vectors(self, agent_id: str) -> list[Vector]:
-        """Get all vectors for an agent.
+    def search_agents_by_centroid(
+        self,
+        query_vectors: list[Vector],
+        candidates: int = 100,
+        max_results: int = 10,
+        similarity_threshold: float = 0.7,
+    ) -> list[list[tuple[str, float]]]:
+        """Two-stage agent search: centroids first, then field vectors.
+
+        The coarse index picks the ``candidates`` agents whose centroids are
+        closest to the query. Every field vector of those agents is then
+        scored exactly, and the agents are ranked with the composite score
+        (see ``composite_agent_scores``) over their vectors above threshold.
+        The top ``max_results`` are therefore exact among the candidates,
+        without over-fetching field hits.
 
         Args:
-            agent_id: Unique agent identifier
+            query_vectors: Query vector proto messages
+            candidates: Agents re-ranked per query (at least ``max_results``)
+            max_results: Number of agents to return per query
+            similarity_threshold: Minimum similarity of a matching vector
 
         Returns:
-            List of vector proto messages
+            One ranked list of (agent_id, composite_score) tuples per query
         """
-        return self.agent_vectors.get(agent_id, [])
+        if not query_vectors:
+            return []
+        queries = np.array(
+            [vector.values for vector in query_vectors], dtype=np.float32
+        )
+        faiss.normalize_L2(queries)
+        results = []
+        with self.lock:
+            count = min(max(candidates, max_results), self.centroids.ntotal)
+            if not count:
+                return [[] for _ in query_vectors]
+            _scores, starts = self.centroids.search(queries, count)
+            for query, row_starts in zip(queries, starts, strict=True):
+                agent_ids, groups, similarities, weighted = self._score_agents(
+                    query, row_starts[row_starts >= 0]
+                )
+                keep = similarities >= similarity_threshold
+                scores = composite_agent_scores(
+                    groups[keep], weighted[keep], len(agent_ids)
+                )
+                results.append(top_agents(agent_ids, scores, max_results))
+        return results
 
-    def _get_agent_vector_start_idx(self, agent_id: str) -> int:
-        """Get the starting FAISS index for an agent's vectors."""
-        start_idx = 0
-        for aid, vectors in self.agent_vectors.items():
-            if aid == agent_id:
-                break
-            start_idx += len(vectors)
-        return start_idx
+    def _score_agents(
+        self, query: np.ndarray, starts: np.ndarray
+    ) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Similarities of all vectors of the agents with first ids ``starts``.
 
-    def save_index(self) -> None:
-        """Persist index and metadata to disk."""
-        if not self.persist_path:
-            return
+        Returns:
+            The agents' ids, the agent index of each vector, its similarity
+            and its field-weighted similarity
+        """
+        by_segment: dict[int, tuple[VectorSegment, list[str]]] = {}
+        for start in starts.tolist():
+            segment = self._segment_of(start)
+            code = int(segment.agent_codes(np.int64(start)))
+            by_segment.setdefault(id(segment), (segment, []))[1].append(
+                segment.metadata.agent_ids[code]
+            )
 
-        persist_dir = Path(self.persist_path).parent
-        persist_dir.mkdir(parents=True, exist_ok=True)
+        agent_ids: list[str] = []
+        lengths: list[int] = []
+        similarities = []
+        weighted = []
+        for segment, segment_agents in by_segment.values():
+            spans = [self.agent_vector_ids[agent_id] for agent_id in segment_agents]
+            ids = np.concatenate(
+                [np.arange(span.start, span.stop, dtype=np.int64) for span in spans]
+            )
+            similarities.append(segment.reconstruct(ids) @ query)
+            weighted.append(self._weigh(segment, ids, similarities[-1]))
+            agent_ids.extend(segment_agents)
+            lengths.extend(len(span) for span in spans)
+        groups = np.repeat(np.arange(len(agent_ids)), lengths)
+        return (
+            agent_ids,
+            groups,
+            np.concatenate(similarities),
+            np.concatenate(weighted),
+        )
 
-        # Save FAISS index
-        faiss.write_index(self.index, f"{self.persist_path}.faiss")
+    def search_agent_scores_filtered(
+        self,
+        query_vector: Vector,
+        agent_ids: Iterable[str],
+        k: int = 10,
+        similarity_threshold: float = 0.7,
+    ) -> list[tuple[str, float]]:
+        """Search only the vectors of ``agent_ids``.
 
-        # Save metadata
-        metadata = {
-            "agent_vectors": self.agent_vectors,
-            "vector_id_to_agent": self.vector_id_to_agent,
-            "next_vector_id": self.next_vector_id,
-            "vector_dimensions": self.vector_dimensions,
-        }
+        The plan follows the filter's selectivity, the share of live vectors
+        belonging to the agents. A selective filter is scored exactly over
+        just those vectors. A broad one runs the regular (approximate) search
+        with k grown from ``k / selectivity`` until ``k`` filtered vectors are
+        found or no more vectors pass the threshold.
 
-        with open(f"{self.persist_path}.meta", "wb") as f:
-            pickle.dump(metadata, f)
+        Args:
+            query_vector: Query vector proto message
+            agent_ids: Agents whose vectors may match
+            k: Number of vectors to return
+            similarity_threshold: Minimum similarity score
 
-        logger.info(f"Saved vector index to {self.persist_path}")
+        Returns:
+            List of (agent_id, similarity_score) tuples, one per matching vector
+        """
+        with self.lock:
+            ranges = {
+                agent_id: self.agent_vector_ids[agent_id]
+                for agent_id in agent_ids
+                if agent_id in self.agent_vector_ids
+            }
+            candidates = sum(len(ids) for ids in ranges.values())
+            total = sum(segment.live for segment in self._all_segments())
+            if not candidates:
+                return []
+            if candidates <= total * self.filter_exact_selectivity:
+                self.filter_plans["exact"] += 1
+                return self._search_exact(
+                    query_vector, ranges.values(), k, similarity_threshold
+                )
 
-    def load_index(self) -> None:
-        """Load index and metadata from disk."""
-        if not self.persist_path:
-            return
+            self.filter_plans["ann"] += 1
+            search_k = min(total, -(-k * total // candidates))
+            while True:
+                hits = self.search_agent_scores(
+                    query_vector, search_k, similarity_threshold
+                )
+                matches = [hit for hit in hits if hit[0] in ranges]
+                if len(matches) >= k or len(hits) < search_k or search_k >= total:
+                    return matches[:k]
+                self.filter_plans["ann_expansions"] += 1
+                search_k = min(total, search_k * 2)
 
-        try:
-            # Load FAISS index
-            self.index = faiss.read_index(f"{self.persist_path}.faiss")
+    def _search_exact(
+        self,
+        query_vector: Vector,
+        ranges: Iterable[range],
+        k: int,
+        similarity_threshold: float,
+    ) -> list[tuple[str, float]]:
+        """Top ``k`` of the given vector ids, scored exactly per segment."""
+        query = np.array([query_vector.values], dtype=np.float32)
+        faiss.normalize_L2(query)
+        by_segment: dict[int, tuple[VectorSegment, list[range]]] = {}
+        for span in ranges:
+            segment = self._segment_of(span.start)
+            by_segment.setdefault(id(segment), (segment, []))[1].append(span)
 
-            # Load metadata
-            with open(f"{self.persist_path}.meta", "rb") as f:
-                metadata = pickle.load(f)
+        hits: list[tuple[str, float, float]] = []
+        for segment, spans in by_segment.values():
+            ids = np.concatenate(
+                [np.arange(span.start, span.stop, dtype=np.int64) for span in spans]
+            )
+            found, similarities = segment.search_ids(
+                query, ids, k, similarity_threshold
+            )
+            agent_ids = segment.metadata.agent_ids
+            hits.extend(
+                zip(
+                    [agent_ids[code] for code in segment.agent_codes(found).tolist()],
+                    similarities.tolist(),
+                    self._weigh(segment, found, similarities).tolist(),
+                    strict=True,
+                )
+            )
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return [(agent_id, weighted) for agent_id, _, weighted in hits[:k]]
 
-            self.agent_vectors = metadata["agent_vectors"]
-            self.vector_id_to_agent = metadata["vector_id_to_agent"]
-            self.next_vector_id = metadata["next_vector_id"]
-            self.vector_dimensions = metadata["vector_dimensions"]
+    def search_similar_vectors(
+        self,
+        query_vector: Vector,
+        k: int = 10,
+        similarity_threshold: float = 0.7,
+    ) -> list[tuple[str, Vector, float]]:
+        """Search for similar vectors.
 
-            logger.info(f"Loaded vector index from {self.persist_path}")
+        Args:
+            query_vector: Query vector proto message
+            k: Number of results to return
+            similarity_threshold: Minimum similarity score
 
-        except Exception as e:
-            logger.warning(f"Failed to load vector index: {e}")
-            # Initialize empty index
-            self.index = faiss.IndexFlatIP(self.vector_dimensions)
-            self.agent_vectors = {}
-            self.vector_id_to_agent = {}
-            self.next_vector_id = 0
+        Returns:
+            List of (agent_id, vector, similarity_score) tuples
+        """
+        results = []
+        with self.lock:
+            for segment, vector_id, score in self._search(
+                [query_vector], k, similarity_threshold
+            )[0]:
+                vector = segment.materialize([vector_id])[0]
+                results.append((vector.agent_id, vector, score))
+        return results
+
+    def get_agent_vectors(self, agent_id: str) -> list[Vector]:
+        """Get all vectors for an agent.
+
+        Args:
+            agent_id: Unique agent identifier
+
+        Returns:
+            List of vector proto messages, values decoded from the index
+        """
+        with self.lock:
+            ids = self.agent_vector_ids.get(agent_id)
+            if not ids:
+                return []
+            return self._segment_of(ids.start).materialize(ids)
 
     def get_stats(self) -> dict[str, Any]:
-        """Get vector store statistics."""
-        return {
-            "total_vectors": self.index.ntotal,
-            "total_agents": len(self.agent_vectors),
-            "vector_dimensions": self.vector_dimensions,
-            "memory_usage_mb": self.index.ntotal
-            * self.vector_dimensions
-            * 4
-            / (1024 * 1024),  # float32
-        }
+        """Get vector store statistics, including the real memory footprint."""
+        with self.lock:
+            segments = self._all_segments()
+            index_bytes = sum(segment.index_bytes() for segment in segments)
+            # Coarse centroid vectors plus their id map
+            centroid_bytes = self.centroids.ntotal * (4 * self.vector_dimensions + 40)
+            metadata_bytes = sum(segment.metadata.nbytes for segment in segments)
+            largest = max(
+                self.segments, key=lambda segment: segment.live, default=self.mutable
+            )
+            return {
+                "total_vectors": sum(segment.live for segment in segments),
+                "total_agents": len(self.agent_vector_ids),
+                "index_type": largest.index_type,
+                "configured_index_type": self.index_type,
+                "tombstones": sum(segment.tombstones for segment in segments),
+                "vector_dimensions": self.vector_dimensions,
+                "vector_storage": self.vector_storage,
+                "field_schema": self.field_schema,
+                "embedding_model": self.embedding_model,
+                "segments": [
+                    {
+                        "vectors": segment.live,
+                        "tombstones": segment.tombstones,
+                        "index_type": segment.index_type,
+                        "persisted": segment.name is not None,
+                    }
+                    for segment in self.segments
+                ],
+                "mutable_vectors": self.mutable.live,
+                "pending_tombstones": len(self._pending_tombstones),
+                "flushes": self.flushes,
+                "merges": self.merges,
+                "filter_plans": dict(self.filter_plans),
+                "centroids": self.centroids.ntotal,
+                "index_memory_mb": index_bytes / (1024 * 1024),
+                "centroid_memory_mb": centroid_bytes / (1024 * 1024),
+                "metadata_memory_mb": metadata_bytes / (1024 * 1024),
+                "memory_usage_mb": (index_bytes + centroid_bytes + metadata_bytes)
+                / (1024 * 1024),
+            }
@@ -0,0 +1,68 @@
+"""Shared test configuration and fixtures."""
+
+import os
+import zlib
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+# Storages built by the tests, including the module-level one, keep their
+# vector index and hot queries in memory instead of under ./data
+os.environ["VECTOR_INDEX_PATH"] = ""
+os.environ["VECTOR_HOT_QUERIES_PATH"] = ""
+
+from a2a_registry.config import config  # noqa: E402
+from a2a_registry.storage import InMemoryStorage, StorageBackend  # noqa: E402
+from a2a_registry.vector_enhanced_storage import VectorEnhancedStorage  # noqa: E402
+
+
+def _fake_encode(texts, **kwargs):
+    """Deterministic unit vectors per text, so a text matches itself."""
+    rows = []
+    for text in texts:
+        rng = np.random.default_rng(zlib.crc32(text.encode()))
+        row = rng.standard_normal(384).astype(np.float32)
+        rows.append(row / np.linalg.norm(row))
+    return np.stack(rows)
+
+
+@pytest.fixture
+def sentence_transformer_stub():
+    """Replace the sentence-transformers model with a deterministic stub."""
+    with patch("a2a_registry.embedding_backends.load_sentence_transformer") as loader:
+        model = Mock()
+        model.get_sentence_embedding_dimension.return_value = 384
+        model.encode.side_effect = _fake_encode
+        loader.return_value = model
+        yield model
+
+
+@pytest.fixture
+def make_vector_storage(monkeypatch):
+    """Build VectorEnhancedStorages on the hashing backend, closed after the test.
+
+    Storages are built with the configuration at call time, so a test can
+    change ``config`` between calls (for example to restart on a new schema).
+    """
+    monkeypatch.setattr(config, "vector_embedding_backend", "hashing")
+    storages: list[VectorEnhancedStorage] = []
+
+    def make(
+        backend: StorageBackend | None = None, async_indexing: bool = False
+    ) -> VectorEnhancedStorage:
+        storage = VectorEnhancedStorage(
+            backend or InMemoryStorage(), async_indexing=async_indexing
+        )
+        storages.append(storage)
+        return storage
+
+    yield make
+    for storage in storages:
+        storage.close()
+
+
+@pytest.fixture
+def vector_storage(make_vector_storage):
+    """A VectorEnhancedStorage over InMemoryStorage that indexes synchronously."""
+    return make_vector_storage()
@@ -0,0 +1,149 @@
+"""Tests for the embedding backends."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from a2a_registry.embedding_backends import (
+    HashingEmbedder,
+    embedding_model_id,
+    load_embedding_backend,
+)
+from a2a_registry.vector_generator import VectorGenerator
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+class TestHashingEmbedder:
+    """Test cases for HashingEmbedder."""
+
+    def test_embeddings_are_deterministic_unit_vectors(self):
+        embedder = HashingEmbedder(dimensions=64)
+        texts = ["Plans multi-city trips", "Translates legal documents"]
+
+        embeddings = embedder.encode(texts)
+
+        assert embeddings.shape == (2, 64)
+        assert embeddings.dtype == np.float32
+        np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-5)
+        np.testing.assert_array_equal(embeddings, HashingEmbedder(64).encode(texts))
+        assert embedder.get_sentence_embedding_dimension() == 64
+
+    def test_single_text_and_empty_inputs(self):
+        embedder = HashingEmbedder()
+
+        assert embedder.encode("travel").shape == (384,)
+        assert embedder.encode([]).shape == (0, 384)
+        assert not embedder.encode("").any()
+
+    def test_shared_wording_scores_higher(self):
+        embedder = HashingEmbedder()
+        query, related, unrelated = embedder.encode(
+            ["plan a trip to Paris", "Plans trips across Europe", "Summarizes emails"]
+        )
+
+        assert query @ related > query @ unrelated
+
+    def test_trigrams_match_inflections(self):
+        with_trigrams = HashingEmbedder()
+        words_only = HashingEmbedder(trigram_weight=0.0)
+        texts = ["translation", "translator"]
+
+        a, b = with_trigrams.encode(texts)
+        c, d = words_only.encode(texts)
+
+        assert a @ b > c @ d
+
+
+class TestLoadEmbeddingBackend:
+    """Test cases for choosing a backend."""
+
+    def test_model_ids_name_the_backend(self):
+        assert embedding_model_id("hashing", "all-MiniLM-L6-v2", 256) == (
+            "feature-hashing-256"
+        )
+        assert embedding_model_id("onnx", "all-MiniLM-L6-v2") == (
+            "all-MiniLM-L6-v2-onnx-int8"
+        )
+        assert embedding_model_id("onnx", "m", quantize=False) == "m-onnx"
+        assert embedding_model_id("sentence-transformers", "m") == "m"
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown embedding backend"):
+            load_embedding_backend("word2vec", "m")
+
+    def test_generator_with_hashing_backend(self):
+        with patch(
+            "a2a_registry.embedding_backends.load_sentence_transformer"
+        ) as mock_cls:
+            generator = VectorGenerator(backend="hashing", dimensions=128)
+        mock_cls.assert_not_called()
+
+        vectors = generator.generate_agent_vectors(
+            {"name": "planner", "description": "Plans trips"}, "planner"
+        )
+        (query,) = generator.generate_query_vectors(["trip planner"])
+
+        assert generator.model_name == "feature-hashing-128"
+        assert generator.vector_dimensions == 128
+        assert [vector.metadata["model"] for vector in vectors] == [
+            "feature-hashing-128"
+        ] * len(vectors)
+        assert len(query.values) == 128
+
+    def test_hashing_storage_import_skips_the_model(self, tmp_path):
+        """The configured hashing backend keeps torch out of the process."""
+        code = (
+            "import sys\n"
+            "from a2a_registry.storage import storage\n"
+            "assert storage.vector_generator.backend == 'hashing'\n"
+            "assert 'sentence_transformers' not in sys.modules\n"
+            "assert 'torch' not in sys.modules\n"
+        )
+        env = os.environ | {
+            "PYTHONPATH": str(SRC),
+            "VECTOR_EMBEDDING_BACKEND": "hashing",
+        }
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_storage_import_defers_the_model(self, tmp_path):
+        """Importing the registry builds no storage and loads no model."""
+        code = (
+            "import sys\n"
+            "import a2a_registry.server\n"
+            "import a2a_registry.sqlite_storage\n"
+            "from a2a_registry.storage import storage\n"
+            "assert storage._lazy_backend is None\n"
+            "assert 'sentence_transformers' not in sys.modules\n"
+            "assert 'torch' not in sys.modules\n"
+        )
+        env = os.environ | {
+            "PYTHONPATH": str(SRC),
+            "VECTOR_EMBEDDING_BACKEND": "sentence-transformers",
+        }
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
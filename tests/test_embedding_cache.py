@@ -0,0 +1,124 @@
+"""Tests for the text-embedding cache."""
+
+import numpy as np
+
+from a2a_registry.embedding_cache import EmbeddingCache
+
+DIMS = 8
+
+
+def make_entries(count: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Helper to create random embeddings keyed by fake content hashes."""
+    rng = np.random.default_rng(seed)
+    return {
+        f"hash-{seed}-{i}": rng.random(DIMS, dtype=np.float32) for i in range(count)
+    }
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache."""
+
+    def test_memory_tier_is_lru_bounded(self):
+        """Only the most recently used rows stay in memory."""
+        cache = EmbeddingCache("model", DIMS, memory_size=2)
+        entries = make_entries(3)
+        cache.put_many(entries)
+
+        found = cache.get_many(entries)
+        assert set(found) == {"hash-0-1", "hash-0-2"}
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["memory_entries"] == 2
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """Rows written to disk are served through the memory map after reload."""
+        entries = make_entries(5)
+        cache = EmbeddingCache("org/model", DIMS, tmp_path, memory_size=0)
+        cache.put_many(dict(list(entries.items())[:3]))
+        cache.put_many(dict(list(entries.items())[3:]))
+
+        reloaded = EmbeddingCache("org/model", DIMS, tmp_path, memory_size=10)
+        found = reloaded.get_many(entries)
+        for key, embedding in entries.items():
+            np.testing.assert_array_equal(found[key], embedding)
+        assert reloaded.get_stats()["disk_hits"] == 5
+
+        # Other models do not see these rows
+        other = EmbeddingCache("other-model", DIMS, tmp_path)
+        assert other.get_many(entries) == {}
+
+    def test_torn_append_is_ignored(self, tmp_path):
+        """A key without a complete row is dropped and later appends stay aligned."""
+        cache = EmbeddingCache("model", DIMS, tmp_path)
+        entries = make_entries(2)
+        cache.put_many(entries)
+        with open(cache.cache_dir / "keys.txt", "a", encoding="ascii") as f:
+            f.write("torn-key\n")
+        with open(cache.cache_dir / "embeddings.f32", "ab") as f:
+            f.write(b"\x00" * 5)
+
+        reloaded = EmbeddingCache("model", DIMS, tmp_path, memory_size=0)
+        assert reloaded.get_stats()["disk_entries"] == 2
+        more = make_entries(1, seed=1)
+        reloaded.put_many(more)
+        found = reloaded.get_many({**entries, **more, "torn-key": None})
+        assert "torn-key" not in found
+        np.testing.assert_array_equal(found["hash-1-0"], more["hash-1-0"])
+        np.testing.assert_array_equal(found["hash-0-1"], entries["hash-0-1"])
+
+    def test_keys_without_data_file_start_empty(self, tmp_path):
+        """A keys file whose data file is missing does not break the cache."""
+        cache = EmbeddingCache("model", DIMS, tmp_path)
+        cache.put_many(make_entries(2))
+        (cache.cache_dir / "embeddings.f32").unlink()
+
+        reloaded = EmbeddingCache("model", DIMS, tmp_path, memory_size=0)
+        assert reloaded.get_stats()["disk_entries"] == 0
+        more = make_entries(1, seed=1)
+        reloaded.put_many(more)
+        found = reloaded.get_many(more)
+        np.testing.assert_array_equal(found["hash-1-0"], more["hash-1-0"])
+
+    def test_blank_key_lines_keep_rows_aligned(self, tmp_path):
+        """A blank key skips its row without shifting the rows after it."""
+        cache = EmbeddingCache("model", DIMS, tmp_path)
+        entries = make_entries(3)
+        cache.put_many(entries)
+        keys_path = cache.cache_dir / "keys.txt"
+        lines = keys_path.read_text(encoding="ascii").splitlines()
+        keys_path.write_text(f"\n{lines[1]}\n{lines[2]}\n", encoding="ascii")
+
+        reloaded = EmbeddingCache("model", DIMS, tmp_path, memory_size=0)
+        more = make_entries(1, seed=1)
+        reloaded.put_many(more)
+        found = reloaded.get_many({**entries, **more})
+
+        assert "hash-0-0" not in found
+        np.testing.assert_array_equal(found["hash-0-2"], entries["hash-0-2"])
+        np.testing.assert_array_equal(found["hash-1-0"], more["hash-1-0"])
+
+    def test_failed_write_is_not_indexed(self, tmp_path, monkeypatch):
+        """Rows are looked up from disk only once their write succeeded."""
+        cache = EmbeddingCache("model", DIMS, tmp_path, memory_size=0)
+        entries = make_entries(2)
+        cache.put_many(entries)
+        real_open = open
+
+        def failing_open(path, mode="r", *args, **kwargs):
+            if str(path).endswith("keys.txt") and mode == "a":
+                raise OSError("disk full")
+            return real_open(path, mode, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", failing_open)
+        cache.put_many(make_entries(1, seed=1))
+        monkeypatch.undo()
+
+        assert cache.get_stats()["disk_entries"] == 2
+        assert cache.get_many(make_entries(1, seed=1)) == {}
+        more = make_entries(1, seed=2)
+        cache.put_many(more)
+        reloaded = EmbeddingCache("model", DIMS, tmp_path, memory_size=0)
+        found = reloaded.get_many({**entries, **more})
+        np.testing.assert_array_equal(found["hash-0-1"], entries["hash-0-1"])
+        np.testing.assert_array_equal(found["hash-2-0"], more["hash-2-0"])
@@ -0,0 +1,51 @@
+"""Tests for the process-pool embedding executor."""
+
+import zlib
+
+import numpy as np
+
+from a2a_registry.embedding_workers import EmbeddingExecutor
+
+DIMS = 8
+
+
+class FakeModel:
+    """Deterministic stand-in for a sentence-transformers model."""
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True):
+        return np.stack([fake_embedding(text) for text in texts])
+
+
+def fake_embedding(text: str) -> np.ndarray:
+    rng = np.random.default_rng(zlib.crc32(text.encode()))
+    return rng.random(DIMS, dtype=np.float32)
+
+
+def load_fake_model(model_name: str) -> FakeModel:
+    return FakeModel()
+
+
+class TestEmbeddingExecutor:
+    """Test cases for EmbeddingExecutor."""
+
+    def test_shards_are_reassembled_in_order(self):
+        """Rows written by the workers match the input order."""
+        executor = EmbeddingExecutor(
+            "fake",
+            DIMS,
+            workers=2,
+            shard_size=7,
+            model_loader=load_fake_model,
+            start_method="fork",
+        )
+        try:
+            texts = [f"text {i}" for i in range(50)]
+            embeddings = executor.encode(texts)
+            assert executor.encode([]).shape == (0, DIMS)
+        finally:
+            executor.close()
+
+        assert embeddings.dtype == np.float32
+        np.testing.assert_array_equal(
+            embeddings, np.stack([fake_embedding(t) for t in texts])
+        )
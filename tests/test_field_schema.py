@@ -0,0 +1,184 @@
+"""Tests for the vector field schema and re-indexing when it changes."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from a2a_registry.config import config
+from a2a_registry.field_schema import PRESETS, FieldSchema, field_kind
+from a2a_registry.storage import InMemoryStorage
+from a2a_registry.vector_generator import VectorGenerator
+
+CARD = {
+    "name": "planner",
+    "description": "Plans trips",
+    "url": "http://planner",
+    "version": "1.0.0",
+    "protocol_version": "0.3.0",
+    "skills": [
+        {
+            "id": "plan",
+            "name": "Trip planning",
+            "description": "Plans multi-city trips",
+            "tags": ["travel"],
+        }
+    ],
+    "capabilities": {"extensions": [{"uri": "urn:x", "description": "Travel persona"}]},
+}
+
+
+class TestFieldSchema:
+    """Test cases for FieldSchema."""
+
+    def test_parse_presets_json_and_files(self, tmp_path):
+        assert FieldSchema.parse("full").signature == ",".join(PRESETS["full"])
+        assert not FieldSchema.parse("combined").weighted
+
+        schema = FieldSchema.parse('{"skills": 1, "name": 2.5}')
+        assert schema.weights == {"name": 2.5, "skills": 1.0}
+        assert schema.signature == "name,skills"
+        assert schema.weighted
+
+        path = tmp_path / "schema.json"
+        path.write_text(json.dumps(["description", "skills.tags"]))
+        schema = FieldSchema.parse(str(path))
+        assert schema.embeds("skills[3].tags")
+        assert not schema.embeds("skills[3]")
+
+    @pytest.mark.parametrize(
+        "spec", ["compact", '{"skills.id": 1}', '{"name": 0}', "[]"]
+    )
+    def test_invalid_schemas_are_rejected(self, spec):
+        with pytest.raises(ValueError):
+            FieldSchema.parse(spec)
+
+    def test_field_kind_drops_list_indexes(self):
+        assert field_kind("skills[12].examples") == "skills.examples"
+        assert field_kind("extensions[0]") == "extensions"
+        assert field_kind("name") == "name"
+
+    @pytest.mark.parametrize(
+        "preset,paths",
+        [
+            (
+                "combined",
+                ["name", "description", "skills[0]", "extensions[0]"],
+            ),
+            (
+                "parts",
+                [
+                    "name",
+                    "description",
+                    "skills[0].name",
+                    "skills[0].description",
+                    "skills[0].tags",
+                    "extensions[0].description",
+                ],
+            ),
+        ],
+    )
+    def test_generator_embeds_schema_fields(
+        self, preset, paths, sentence_transformer_stub
+    ):
+        generator = VectorGenerator(
+            "test-model", field_schema=FieldSchema.parse(preset)
+        )
+
+        vectors = generator.generate_agent_vectors(CARD, "planner")
+
+        assert [vector.field_path for vector in vectors] == paths
+        # A combined vector embeds every part, even those without a vector
+        by_path = {vector.field_path: vector.field_content for vector in vectors}
+        if "skills[0]" in by_path:
+            assert by_path["skills[0]"] == (
+                "Trip planning Plans multi-city trips travel"
+            )
+
+
+class TestSchemaMigration:
+    """Changing the embedded fields re-indexes the persisted vectors."""
+
+    @pytest.fixture(autouse=True)
+    def isolated(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "vector_index_path", str(tmp_path / "index"))
+
+    @pytest.mark.asyncio
+    async def test_changed_schema_reindexes_with_stored_embeddings(
+        self, make_vector_storage, monkeypatch
+    ):
+        backend = InMemoryStorage()
+        storage = make_vector_storage(backend)
+        await storage.register_agent(CARD)
+        assert len(await storage.get_agent_vectors("planner")) == 8
+        storage.close()
+
+        monkeypatch.setattr(config, "vector_field_schema", "combined")
+        storage = make_vector_storage(backend)
+        model = storage.vector_generator.model
+        model.encode = Mock(wraps=model.encode)
+        assert storage.vector_store.field_schema == ",".join(PRESETS["full"])
+        # Old vectors stay searchable until the migration runs
+        assert len(await storage.get_agent_vectors("planner")) == 8
+
+        assert await storage.migrate_vectors() == 1
+
+        vectors = await storage.get_agent_vectors("planner")
+        assert [vector.field_path for vector in vectors] == [
+            "name",
+            "description",
+            "skills[0]",
+            "extensions[0]",
+        ]
+        # Every combined text already had a vector: nothing was encoded
+        storage.vector_generator.model.encode.assert_not_called()
+        assert storage.vector_store.field_schema == "name,description,skills,extensions"
+        assert await storage.migrate_vectors() == 0
+        storage.close()
+
+        storage = make_vector_storage(backend)
+        assert await storage.migrate_vectors() == 0
+        assert storage.get_vector_stats()["total_vectors"] == 4
+        storage.close()
+
+    @pytest.mark.asyncio
+    async def test_weight_changes_need_no_reindex(
+        self, make_vector_storage, monkeypatch
+    ):
+        backend = InMemoryStorage()
+        storage = make_vector_storage(backend)
+        await storage.register_agent(CARD)
+        storage.close()
+
+        weights = dict.fromkeys(PRESETS["full"], 1.0) | {"name": 3.0}
+        monkeypatch.setattr(config, "vector_field_schema", json.dumps(weights))
+        storage = make_vector_storage(backend)
+
+        assert await storage.migrate_vectors() == 0
+        assert storage.vector_store.field_weights["name"] == 3.0
+        storage.close()
+
+    @pytest.mark.asyncio
+    async def test_changed_embedding_model_reembeds(
+        self, make_vector_storage, sentence_transformer_stub, monkeypatch
+    ):
+        monkeypatch.setattr(config, "vector_embedding_backend", "sentence-transformers")
+        backend = InMemoryStorage()
+        storage = make_vector_storage(backend)
+        await storage.register_agent(CARD)
+        storage.close()
+
+        monkeypatch.setattr(config, "vector_embedding_backend", "hashing")
+        storage = make_vector_storage(backend)
+        assert storage.vector_store.embedding_model == "all-MiniLM-L6-v2"
+
+        assert await storage.migrate_vectors() == 1
+
+        vectors = await storage.get_agent_vectors("planner")
+        assert len(vectors) == 8
+        assert {vector.metadata["model"] for vector in vectors} == {
+            "feature-hashing-384"
+        }
+        assert storage.vector_store.embedding_model == "feature-hashing-384"
+        assert await storage.migrate_vectors() == 0
+        storage.close()
@@ -0,0 +1,78 @@
+"""Tests for skill-filtered vector search."""
+
+import pytest
+
+from a2a_registry.search_index import SkillIndex
+
+
+def make_card(name: str, description: str, skills: list[str]) -> dict:
+    return {
+        "name": name,
+        "description": description,
+        "url": f"http://{name}",
+        "version": "1.0.0",
+        "protocol_version": "0.3.0",
+        "skills": [{"id": skill, "name": skill} for skill in skills],
+    }
+
+
+class TestSkillIndex:
+    """Test cases for SkillIndex."""
+
+    def test_postings_follow_updates(self):
+        index = SkillIndex()
+        index.add("a", make_card("a", "", ["plan", "book"]))
+        index.add("b", make_card("b", "", ["book"]))
+        assert index.agents(["plan"]) == {"a"}
+        assert index.agents(["plan", "book"]) == {"a", "b"}
+
+        index.add("a", make_card("a", "", ["translate"]))
+        index.remove("b")
+        assert index.agents(["book"]) == set()
+        assert index.agents(["translate"]) == {"a"}
+        assert len(index) == 1
+
+
+class TestFilteredVectorSearch:
+    """Skill filters are applied before ranking, not after truncation."""
+
+    @pytest.fixture
+    def storage(self, vector_storage):
+        return vector_storage
+
+    @pytest.mark.asyncio
+    async def test_selective_filter_finds_agents_outside_the_top_k(self, storage):
+        await storage.register_agents(
+            [make_card(f"planner-{i}", "trip planning", ["plan"]) for i in range(20)]
+        )
+        await storage.register_agent(make_card("booker", "hotel booking", ["book"]))
+
+        results = await storage.search_agents_hybrid(
+            "trip planning", skills=["book"], similarity_threshold=-1.0, max_results=2
+        )
+
+        assert [card["name"] for card, _score in results] == ["booker"]
+        plans = storage.get_vector_stats()["filter_plans"]
+        assert plans["exact"] == 1
+
+    @pytest.mark.asyncio
+    async def test_skill_postings_follow_registrations(self, storage):
+        await storage.register_agent(make_card("booker", "hotel booking", ["book"]))
+        search = {"skills": ["book"], "similarity_threshold": -1.0}
+        assert len(await storage.search_agents_hybrid("booking", **search)) == 1
+
+        await storage.register_agent(make_card("flights", "flight booking", ["book"]))
+        await storage.register_agent(make_card("booker", "hotel booking", ["stay"]))
+        results = await storage.search_agents_hybrid("booking", **search)
+        assert [card["name"] for card, _score in results] == ["flights"]
+
+        await storage.unregister_agent("flights")
+        assert await storage.search_agents_hybrid("booking", **search) == []
+
+        batch = await storage.search_agents_batch(
+            ["booking", "hotel"], skills=["stay"], similarity_threshold=-1.0
+        )
+        assert [[card["name"] for card, _ in results] for results in batch] == [
+            ["booker"],
+            ["booker"],
+        ]
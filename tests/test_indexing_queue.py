@@ -0,0 +1,145 @@
+"""Tests for the background indexing queue."""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from a2a_registry.indexing_queue import IndexingQueue
+
+
+class TestIndexingQueue:
+    """Test cases for IndexingQueue."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_are_applied_in_order_with_seqs(self):
+        """Sequence numbers grow per job and waiters resolve once indexed."""
+        applied = []
+        gate = threading.Event()
+
+        def process(jobs):
+            gate.wait()
+            applied.extend(jobs)
+
+        queue = IndexingQueue(process, max_batch_size=2)
+        assert queue.enqueue(["a", "b"]) == 2
+        assert queue.enqueue(["c"]) == 3
+        assert queue.enqueue([]) == 3
+
+        assert not await queue.wait(3, timeout=0.05)
+        assert queue.get_stats()["queue_depth"] == 3
+
+        gate.set()
+        assert await queue.wait(3, timeout=5)
+        queue.close()
+        assert applied == ["a", "b", "c"]
+        stats = queue.get_stats()
+        assert stats["indexed_seq"] == 3
+        assert stats["queue_depth"] == 0
+        assert stats["jobs_processed"] == 3
+
+    def test_failed_batch_still_advances(self):
+        """A failing batch does not block later sequence numbers."""
+        queue = IndexingQueue(Mock(side_effect=RuntimeError("boom")), background=False)
+        assert queue.enqueue(["a"]) == 1
+        assert queue.indexed_seq == 1
+        assert queue.wait_for_seq(1).done()
+
+
+class TestAsyncIndexing:
+    """Registration returns before vectors exist; min_index_seq reads them."""
+
+    @pytest.mark.asyncio
+    async def test_search_waits_for_own_registration(self, make_vector_storage):
+        storage = make_vector_storage(async_indexing=True)
+
+        gate = threading.Event()
+        index_jobs = storage._index_jobs
+        storage.indexer.process_batch = lambda jobs: (gate.wait(), index_jobs(jobs))
+
+        card = {
+            "name": "planner",
+            "description": "strategic planning",
+            "url": "http://planner",
+            "version": "1.0.0",
+            "protocol_version": "0.3.0",
+            "skills": [],
+        }
+        assert await storage.register_agent(card)
+        seq = await storage.get_agent_index_seq("planner")
+        assert seq == 1
+        assert await storage.get_agent_vectors("planner") == []
+        assert storage.get_vector_stats()["indexing"]["queue_depth"] == 1
+
+        search = asyncio.ensure_future(
+            storage.search_agents_vector(
+                "strategic planning", similarity_threshold=0.9, min_index_seq=seq
+            )
+        )
+        await asyncio.sleep(0.05)
+        assert not search.done()
+        gate.set()
+        results = await search
+        assert [agent["name"] for agent, _score in results] == ["planner"]
+
+        # Unchanged re-registration is not queued again
+        await storage.register_agent(dict(card))
+        assert storage.indexer.last_seq == 1
+
+        await storage.unregister_agent("planner")
+        assert await storage.wait_for_index(
+            await storage.get_agent_index_seq("planner")
+        )
+        assert await storage.get_agent_vectors("planner") == []
+
+    @pytest.mark.asyncio
+    async def test_close_drains_queued_registrations(self, make_vector_storage):
+        storage = make_vector_storage(async_indexing=True)
+
+        gate = threading.Event()
+        index_jobs = storage._index_jobs
+        storage.indexer.process_batch = lambda jobs: (gate.wait(), index_jobs(jobs))
+        card = {
+            "name": "planner",
+            "description": "strategic planning",
+            "url": "http://planner",
+            "version": "1.0.0",
+            "protocol_version": "0.3.0",
+            "skills": [],
+        }
+        assert await storage.register_agent(card)
+        await storage.query_encoder.encode("warm up")
+        assert await storage.get_agent_vectors("planner") == []
+
+        gate.set()
+        await asyncio.to_thread(storage.close)
+
+        assert await storage.get_agent_vectors("planner")
+        assert storage.indexer._worker is None
+        assert storage.query_encoder._worker is None
+        assert storage.vector_store._worker is None
+
+    @pytest.mark.asyncio
+    async def test_search_does_not_block_loop_while_indexing(self, vector_storage):
+        storage = vector_storage
+
+        # The indexing thread holds the vector lock, e.g. during a merge
+        indexing = threading.Event()
+        done = threading.Event()
+
+        def hold_lock():
+            with storage._vector_lock:
+                indexing.set()
+                done.wait(timeout=5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        indexing.wait()
+        search = asyncio.ensure_future(storage.search_agents_vector("planning"))
+        await asyncio.sleep(0.05)
+        assert not search.done()  # the loop kept running meanwhile
+
+        done.set()
+        assert await search == []
+        holder.join()
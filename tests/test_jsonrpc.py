@@ -48,6 +48,90 @@ def test_jsonrpc_register_agent():
     assert result["id"] == 1
 
 
+def test_jsonrpc_register_agents():
+    """Test bulk agent registration via JSON-RPC."""
+    app = create_app()
+    client = TestClient(app)
+
+    def card(name):
+        return {
+            "name": name,
+            "description": f"Bulk agent {name}",
+            "url": f"http://localhost:3000/{name}",
+            "version": "0.420.0",
+            "protocol_version": A2A_PROTOCOL_VERSION,
+        }
+
+    jsonrpc_request = {
+        "jsonrpc": "2.0",
+        "method": "register_agents",
+        "params": {
+            "agent_cards": [card("bulk-a"), {"name": "bulk-broken"}, card("bulk-b")]
+        },
+        "id": 1
+    }
+
+    response = client.post("/jsonrpc", json=jsonrpc_request)
+    assert response.status_code == 200
+
+    result = response.json()["result"]
+    assert result["registered_count"] == 2
+    assert result["failed_count"] == 1
+    assert [r["agent_id"] for r in result["results"]] == [
+        "bulk-a", "bulk-broken", "bulk-b"
+    ]
+    assert result["results"][1]["success"] is False
+
+
+def test_jsonrpc_search_agents_batch():
+    """Test searching for many queries in one JSON-RPC call."""
+    app = create_app()
+    client = TestClient(app)
+
+    for name, description in [
+        ("batch-search-weather", "Weather forecasts"),
+        ("batch-search-travel", "Travel booking"),
+    ]:
+        client.post("/jsonrpc", json={
+            "jsonrpc": "2.0",
+            "method": "register_agent",
+            "params": {
+                "agent_card": {
+                    "name": name,
+                    "description": description,
+                    "url": "http://localhost:3000",
+                    "version": "0.420.0",
+                    "protocol_version": A2A_PROTOCOL_VERSION,
+                }
+            },
+            "id": 1,
+        })
+
+    response = client.post("/jsonrpc", json={
+        "jsonrpc": "2.0",
+        "method": "search_agents_batch",
+        "params": {
+            "queries": ["travel", "weather", "no-such-agent-anywhere"],
+            "search_mode": "SEARCH_MODE_KEYWORD",
+        },
+        "id": 2,
+    })
+    assert response.status_code == 200
+
+    result = response.json()["result"]
+    assert result["count"] == 3
+    assert [r["query"] for r in result["results"]] == [
+        "travel", "weather", "no-such-agent-anywhere"
+    ]
+    assert "batch-search-travel" in [
+        a["name"] for a in result["results"][0]["agents"]
+    ]
+    assert "batch-search-weather" in [
+        a["name"] for a in result["results"][1]["agents"]
+    ]
+    assert result["results"][2]["count"] == 0
+
+
 def test_jsonrpc_get_agent():
     """Test getting an agent via JSON-RPC."""
     app = create_app()
@@ -433,4 +517,44 @@ def test_root_endpoint_info():
     protocols = result["protocols"]
     assert protocols["primary"]["transport"] == "JSONRPC"
     assert protocols["primary"]["endpoint"] == "/jsonrpc"
-    assert protocols["secondary"]["transport"] == "HTTP+JSON"
\ No newline at end of file
+    assert protocols["secondary"]["transport"] == "HTTP+JSON"
+
+def test_jsonrpc_keyword_fallback_matches_skill_descriptions(monkeypatch):
+    """Without vector search, keyword queries also match skill descriptions."""
+    from a2a_registry import jsonrpc_server
+    from a2a_registry.storage import InMemoryStorage
+
+    monkeypatch.setattr(jsonrpc_server, "storage", InMemoryStorage())
+    client = TestClient(create_app())
+    client.post(
+        "/jsonrpc",
+        json={
+            "jsonrpc": "2.0",
+            "method": "register_agent",
+            "params": {
+                "agent_card": {
+                    "name": "fallback-agent",
+                    "description": "General assistant",
+                    "url": "http://localhost:4100",
+                    "version": "0.420.0",
+                    "protocol_version": A2A_PROTOCOL_VERSION,
+                    "skills": [{"id": "convert", "description": "Currency exchange"}],
+                }
+            },
+            "id": 1,
+        },
+    )
+
+    response = client.post(
+        "/jsonrpc",
+        json={
+            "jsonrpc": "2.0",
+            "method": "search_agents",
+            "params": {"query": "exchange", "search_mode": "SEARCH_MODE_KEYWORD"},
+            "id": 2,
+        },
+    )
+
+    result = response.json()["result"]
+    assert result["count"] == 1
+    assert result["agents"][0]["name"] == "fallback-agent"
@@ -0,0 +1,154 @@
+"""Tests for the query embedding and search result caches."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from a2a_registry.config import config
+from a2a_registry.query_cache import LRUCache, SearchCache
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used entry is evicted first."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (3, 1, 2)
+        assert stats["hit_ratio"] == pytest.approx(0.75)
+
+    def test_zero_size_disables_cache(self):
+        """A cache of size 0 stores nothing."""
+        cache = LRUCache(0)
+        cache.put("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestSearchCache:
+    """Test cases for SearchCache."""
+
+    def test_writes_invalidate_results(self):
+        """Results cached before a new generation are not returned."""
+        cache = SearchCache()
+        key = ("planning", "SEARCH_MODE_VECTOR", (), 0.5, 10)
+        cache.put_results(key, [("planner", 0.9)], cache.generation)
+        assert cache.get_results(key) == [("planner", 0.9)]
+
+        cache.invalidate()
+        assert cache.get_results(key) is None
+
+    def test_results_computed_across_a_write_are_not_used(self):
+        """A search that started before a write caches under the old generation."""
+        cache = SearchCache()
+        key = ("planning", "SEARCH_MODE_VECTOR", (), 0.5, 10)
+        generation = cache.generation
+        cache.invalidate()
+        cache.put_results(key, [("planner", 0.9)], generation)
+        assert cache.get_results(key) is None
+
+    def test_hot_queries_round_trip(self, tmp_path):
+        """The most frequent queries are saved and loaded in order."""
+        cache = SearchCache()
+        for query, count in [("a", 1), ("b", 3), ("c", 2)]:
+            for _ in range(count):
+                cache.count_query(query)
+        path = tmp_path / "hot.json"
+        cache.save_hot_queries(path, 2)
+
+        assert SearchCache.load_hot_queries(path) == ["b", "c"]
+        assert SearchCache.load_hot_queries(tmp_path / "missing.json") == []
+
+
+class TestCachedSearch:
+    """Search results and query embeddings are served from the caches."""
+
+    @pytest.fixture
+    def storage(self, make_vector_storage, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            config, "vector_hot_queries_path", str(tmp_path / "hot.json")
+        )
+        storage = make_vector_storage()
+        model = storage.vector_generator.model
+        model.encode = Mock(wraps=model.encode)
+        return storage
+
+    @staticmethod
+    def card(name: str, description: str) -> dict:
+        return {
+            "name": name,
+            "description": description,
+            "url": f"http://{name}",
+            "version": "1.0.0",
+            "protocol_version": "0.3.0",
+            "skills": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_hits_cache_until_write(self, storage):
+        await storage.register_agent(self.card("planner", "strategic planning"))
+        first = await storage.search_agents_hybrid(
+            "strategic planning", similarity_threshold=0.9
+        )
+        encodes = storage.vector_generator.model.encode.call_count
+        second = await storage.search_agents_hybrid(
+            "strategic planning", similarity_threshold=0.9
+        )
+
+        assert [card["name"] for card, _score in first] == ["planner"]
+        assert second == first
+        assert storage.vector_generator.model.encode.call_count == encodes
+        stats = storage.get_vector_stats()["query_cache"]
+        assert stats["results"]["hits"] == 1
+        assert stats["embeddings"]["hits"] == 0
+
+        # A registration invalidates results, the query embedding is reused
+        await storage.register_agent(self.card("strategist", "strategic planning"))
+        third = await storage.search_agents_hybrid(
+            "strategic planning", similarity_threshold=0.9
+        )
+        assert {card["name"] for card, _score in third} == {"planner", "strategist"}
+        stats = storage.get_vector_stats()["query_cache"]
+        assert stats["embeddings"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hot_queries_prewarm_next_run(self, storage, make_vector_storage):
+        await storage.search_agents_hybrid("travel booking")
+        storage.save_vectors()
+
+        restarted = make_vector_storage()
+        restarted.query_encoder.close()  # drains the pre-warm queries
+
+        assert restarted.search_cache.embeddings.get("travel booking") is not None
+
+    @pytest.mark.asyncio
+    async def test_batch_search_encodes_once(self, storage):
+        await storage.register_agent(self.card("planner", "strategic planning"))
+        await storage.register_agent(self.card("translator", "language translation"))
+        queries = ["language translation", "strategic planning", "weather"]
+        encodes = storage.vector_generator.model.encode.call_count
+
+        batch = await storage.search_agents_batch(queries, similarity_threshold=0.9)
+
+        assert storage.vector_generator.model.encode.call_count == encodes + 1
+        # Misses were encoded by the shared query encoder
+        assert storage.query_encoder.get_stats()["queries_encoded"] == 3
+        assert [[card["name"] for card, _ in results] for results in batch] == [
+            ["translator"],
+            ["planner"],
+            [],
+        ]
+        # Each query's results were cached as a single search would have
+        for query, results in zip(queries, batch, strict=True):
+            single = await storage.search_agents_hybrid(query, similarity_threshold=0.9)
+            assert single == results
+        assert storage.get_vector_stats()["query_cache"]["results"]["hits"] == 3
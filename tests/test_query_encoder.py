@@ -0,0 +1,91 @@
+"""Tests for the micro-batching query encoder."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from a2a_registry.proto.generated.registry_pb2 import Vector
+from a2a_registry.query_encoder import QueryEncoder
+
+
+class FakeModel:
+    """Encoder stub that records batches and takes a while per call."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.batches: list[list[str]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def encode_batch(self, queries: list[str]) -> list[Vector]:
+        self.release.wait()
+        time.sleep(self.delay)
+        self.batches.append(list(queries))
+        return [Vector(values=[float(len(q))], field_content=q) for q in queries]
+
+
+class TestQueryEncoder:
+    """Test cases for QueryEncoder."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_batches(self):
+        """Concurrent queries are encoded together and resolved in order."""
+        model = FakeModel()
+        model.release.clear()
+        encoder = QueryEncoder(model.encode_batch, max_batch_size=16, max_wait_ms=5)
+        queries = [f"query {i % 40}" for i in range(50)]
+
+        tasks = [asyncio.ensure_future(encoder.encode(q)) for q in queries]
+        await asyncio.sleep(0.02)
+        model.release.set()
+        vectors = await asyncio.gather(*tasks)
+        encoder.close()
+
+        assert [v.field_content for v in vectors] == queries
+        assert len(model.batches) < len(queries)
+        assert max(len(batch) for batch in model.batches) <= 16
+        # Duplicates within a batch are encoded once
+        assert all(len(batch) == len(set(batch)) for batch in model.batches)
+        assert encoder.get_stats()["queries_encoded"] == 50
+
+    @pytest.mark.asyncio
+    async def test_encoding_does_not_block_event_loop(self):
+        """Other coroutines keep running while a batch is encoded."""
+        model = FakeModel(delay=0.2)
+        encoder = QueryEncoder(model.encode_batch, max_wait_ms=0)
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        beat = asyncio.ensure_future(heartbeat())
+        await encoder.encode("slow query")
+        beat.cancel()
+        encoder.close()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        """A failing batch fails each waiting query, later batches still run."""
+        calls = 0
+
+        def encode_batch(queries):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("model crashed")
+            return [Vector(field_content=q) for q in queries]
+
+        encoder = QueryEncoder(encode_batch, max_wait_ms=20)
+        results = await asyncio.gather(
+            encoder.encode("a"), encoder.encode("b"), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert (await encoder.encode("c")).field_content == "c"
+        encoder.close()
@@ -1,5 +1,7 @@
 """Tests for A2A Registry server functionality."""
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -165,4 +167,98 @@ def test_invalid_agent_registration(client):
     }
     
     response = client.post("/agents", json=payload)
-    assert response.status_code == 400
\ No newline at end of file
+    assert response.status_code == 400
+
+def test_register_agents_batch(client):
+    """Test bulk registration with per-item results."""
+    payload = {
+        "agent_cards": [
+            create_agent_card("batch-agent-001")["agent_card"],
+            {"name": "batch-agent-invalid"},
+            create_agent_card("batch-agent-002")["agent_card"],
+        ]
+    }
+
+    response = client.post("/agents:batch", json=payload)
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["success"] is False
+    assert result["registered_count"] == 2
+    assert result["failed_count"] == 1
+    assert [r["success"] for r in result["results"]] == [True, False, True]
+    assert "Missing required field" in result["results"][1]["error"]
+
+    assert client.get("/agents/batch-agent-002").status_code == 200
+    assert client.get("/agents/batch-agent-invalid").status_code == 404
+
+
+def test_search_agents_batch(client):
+    """Test searching for many queries in one request."""
+    client.post(
+        "/agents", json=create_agent_card("rest-batch-planner", "Strategic planning")
+    )
+    client.post(
+        "/agents", json=create_agent_card("rest-batch-translator", "Translation")
+    )
+
+    response = client.post(
+        "/agents/search:batch",
+        json={
+            "queries": ["translation", "planning"],
+            "search_mode": "SEARCH_MODE_KEYWORD",
+            "max_results": 5,
+        },
+    )
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["count"] == 2
+    assert [r["query"] for r in result["results"]] == ["translation", "planning"]
+    assert "rest-batch-translator" in [
+        a["name"] for a in result["results"][0]["agents"]
+    ]
+    assert "rest-batch-planner" in [a["name"] for a in result["results"][1]["agents"]]
+
+
+def test_register_agents_batch_ndjson(client):
+    """Test bulk registration from newline-delimited JSON."""
+    lines = [
+        json.dumps(create_agent_card("ndjson-agent-001")),
+        json.dumps(create_agent_card("ndjson-agent-002")["agent_card"]),
+    ]
+
+    response = client.post(
+        "/agents:batch",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["success"] is True
+    assert [r["agent_id"] for r in result["results"]] == [
+        "ndjson-agent-001",
+        "ndjson-agent-002",
+    ]
+
+    response = client.post("/agents:batch", json={"agents": []})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_storage_on_shutdown(monkeypatch):
+    """Shutdown saves vectors, then closes the storage."""
+    from unittest.mock import AsyncMock, Mock
+
+    from a2a_registry import server
+
+    storage = Mock()
+    storage.migrate_vectors = AsyncMock(return_value=0)
+    monkeypatch.setattr(server, "storage", storage)
+
+    async with server.lifespan(create_app()):
+        storage.close.assert_not_called()
+
+    storage.save_vectors.assert_called_once()
+    storage.close.assert_called_once()
@@ -0,0 +1,633 @@
+"""Tests for storage backends."""
+
+import asyncio
+import json
+
+import pytest
+
+from a2a_registry.storage import (
+    ExtensionInfo,
+    FileStorage,
+    InMemoryStorage,
+    bulk_register_agents,
+)
+from a2a_registry.sqlite_storage import SQLiteStorage
+
+
+def make_agent_card(name: str, description: str = "", skills: list | None = None):
+    """Helper to create a minimal agent card."""
+    return {
+        "name": name,
+        "description": description or f"Description for {name}",
+        "url": f"http://localhost:8000/{name}",
+        "version": "1.0.0",
+        "protocol_version": "0.3.0",
+        "skills": skills or [],
+    }
+
+
+def make_storage(backend: str, tmp_path):
+    """Create a storage backend by name."""
+    if backend == "file":
+        return FileStorage(str(tmp_path))
+    if backend == "sqlite":
+        return SQLiteStorage(str(tmp_path))
+    return InMemoryStorage()
+
+
+class TestFileStorageJournal:
+    """Test the write-ahead journal mode of FileStorage."""
+
+    @pytest.mark.asyncio
+    async def test_journal_replay_after_restart(self, tmp_path):
+        """Mutations survive a restart without a full-file rewrite."""
+        storage = FileStorage(str(tmp_path), journal=True)
+        await storage.register_agent(make_agent_card("alpha"))
+        await storage.register_agent(make_agent_card("beta"))
+        await storage.unregister_agent("alpha")
+        await storage.store_extension(
+            ExtensionInfo(uri="https://example.com/ext", first_declared_by_agent="beta")
+        )
+        storage.close()
+
+        # No snapshot was written, only the journal
+        assert not (tmp_path / "agents.json").exists()
+        assert list((tmp_path / "journal").glob("journal-*.log"))
+
+        reloaded = FileStorage(str(tmp_path), journal=True)
+        assert await reloaded.get_agent("alpha") is None
+        assert (await reloaded.get_agent("beta"))["name"] == "beta"
+        ext = await reloaded.get_extension("https://example.com/ext")
+        assert ext is not None
+        assert ext.declaring_agents == {"beta"}
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_journal_compaction_writes_snapshot(self, tmp_path):
+        """Compaction writes the JSON snapshot and truncates the journal."""
+        storage = FileStorage(str(tmp_path), journal=True, journal_compact_threshold=5)
+        for i in range(12):
+            await storage.register_agent(make_agent_card(f"agent-{i}"))
+        storage.close()
+
+        with open(tmp_path / "agents.json", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        assert len(snapshot) >= 5
+
+        # Snapshot + remaining journal reproduce the full state
+        reloaded = FileStorage(str(tmp_path), journal=True)
+        assert len(await reloaded.list_agents()) == 12
+        reloaded.close()
+
+        # Without the journal the snapshot alone is still a valid FileStorage
+        plain = FileStorage(str(tmp_path))
+        assert len(await plain.list_agents()) == len(snapshot)
+
+    @pytest.mark.asyncio
+    async def test_journal_ignores_torn_record(self, tmp_path):
+        """A partially written trailing record is skipped on replay."""
+        storage = FileStorage(str(tmp_path), journal=True)
+        await storage.register_agent(make_agent_card("alpha"))
+        storage.close()
+
+        segment = sorted((tmp_path / "journal").glob("journal-*.log"))[-1]
+        with open(segment, "a", encoding="utf-8") as f:
+            f.write('{"op":"put_agent","id":"bro')
+
+        reloaded = FileStorage(str(tmp_path), journal=True)
+        assert [a["name"] for a in await reloaded.list_agents()] == ["alpha"]
+        await reloaded.register_agent(make_agent_card("gamma"))
+        reloaded.close()
+
+        again = FileStorage(str(tmp_path), journal=True)
+        assert {a["name"] for a in await again.list_agents()} == {"alpha", "gamma"}
+        again.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_registrations_share_commits(self, tmp_path):
+        """Concurrent writers are committed in groups."""
+        storage = FileStorage(
+            str(tmp_path), journal=True, journal_commit_interval_ms=20
+        )
+        await asyncio.gather(
+            *(storage.register_agent(make_agent_card(f"a{i}")) for i in range(50))
+        )
+        stats = storage._journal.get_stats()
+        storage.close()
+
+        assert stats["records_written"] == 50
+        assert stats["commits"] < 50
+
+    @pytest.mark.asyncio
+    async def test_failed_journal_append_rejects_the_write(self, tmp_path, monkeypatch):
+        """A write that is not durable fails and leaves the state unchanged."""
+        storage = FileStorage(str(tmp_path), journal=True)
+        await storage.register_agent(make_agent_card("alpha", "Old description"))
+
+        def failing_append(record):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(storage._journal, "append", failing_append)
+
+        assert not await storage.register_agent(make_agent_card("beta"))
+        assert await storage.get_agent("beta") is None
+        assert not await storage.register_agent(
+            make_agent_card("alpha", "New description")
+        )
+        assert (await storage.get_agent("alpha"))["description"] == "Old description"
+        assert [a["name"] for a in await storage.search_agents("new")] == []
+        assert await storage.register_agents(
+            [make_agent_card("gamma"), {"url": "http://x"}]
+        ) == [False, False]
+        assert not await storage.unregister_agent("alpha")
+        assert await storage.get_agent("alpha") is not None
+        monkeypatch.undo()
+        storage.close()
+
+        reloaded = FileStorage(str(tmp_path), journal=True)
+        assert [a["name"] for a in await reloaded.list_agents()] == ["alpha"]
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_extension_write_restores_extensions(
+        self, tmp_path, monkeypatch
+    ):
+        """Extension writes that are not durable fail without changing state."""
+        storage = FileStorage(str(tmp_path), journal=True)
+        await storage.update_agent_extensions("alpha", [{"uri": "https://ext/one"}])
+
+        def failing_append(record):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(storage._journal, "append", failing_append)
+
+        assert not await storage.update_agent_extensions(
+            "alpha", [{"uri": "https://ext/two"}]
+        )
+        assert not await storage.store_extension(ExtensionInfo(uri="https://ext/new"))
+        await storage.update_agents_extensions({"beta": [{"uri": "https://ext/one"}]})
+        assert not await storage.remove_agent_from_extensions("alpha")
+
+        assert [ext.uri for ext in await storage.get_agent_extensions("alpha")] == [
+            "https://ext/one"
+        ]
+        assert await storage.get_agent_extensions("beta") == []
+        ext = await storage.get_extension("https://ext/one")
+        assert ext.declaring_agents == {"alpha"}
+        _extensions, _token, total = await storage.list_extensions()
+        assert total == 1
+        assert await storage.get_extension("https://ext/two") is None
+        monkeypatch.undo()
+        storage.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_segment_open_fails_every_waiting_write(
+        self, tmp_path, monkeypatch
+    ):
+        """Writers in a failed batch are rejected instead of waiting forever."""
+        storage = FileStorage(
+            str(tmp_path), journal=True, journal_commit_interval_ms=20
+        )
+
+        def failing_open():
+            raise OSError("disk full")
+
+        monkeypatch.setattr(storage._journal, "_open_next_segment", failing_open)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                storage.register_agent(make_agent_card("alpha")),
+                storage.register_agent(make_agent_card("beta")),
+            ),
+            timeout=5,
+        )
+        assert results == [False, False]
+        assert await storage.list_agents() == []
+
+        monkeypatch.undo()
+        assert await storage.register_agent(make_agent_card("gamma"))
+        storage.close()
+
+        reloaded = FileStorage(str(tmp_path), journal=True)
+        assert [a["name"] for a in await reloaded.list_agents()] == ["gamma"]
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_fsync_is_not_replayed(self, tmp_path, monkeypatch):
+        """Records whose fsync failed are cut from the journal."""
+        storage = FileStorage(str(tmp_path), journal=True)
+        await storage.register_agent(make_agent_card("alpha"))
+
+        def failing_fsync(fd):
+            raise OSError("I/O error")
+
+        monkeypatch.setattr("a2a_registry.journal.os.fsync", failing_fsync)
+        assert not await storage.register_agent(make_agent_card("beta"))
+        monkeypatch.undo()
+        assert await storage.register_agent(make_agent_card("gamma"))
+        storage.close()
+
+        reloaded = FileStorage(str(tmp_path), journal=True)
+        assert {a["name"] for a in await reloaded.list_agents()} == {"alpha", "gamma"}
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_rotation_allows_later_compaction(self, tmp_path, monkeypatch):
+        """A compaction whose new segment cannot be opened is retried later."""
+        storage = FileStorage(str(tmp_path), journal=True, journal_compact_threshold=3)
+        journal = storage._journal
+        open_next_segment = journal._open_next_segment
+        await storage.register_agent(make_agent_card("agent-0"))
+
+        def failing_open():
+            raise OSError("disk full")
+
+        monkeypatch.setattr(journal, "_open_next_segment", failing_open)
+        journal.compact({})
+        # Fails along with the compaction if it shares its batch
+        registered = await asyncio.wait_for(
+            storage.register_agent(make_agent_card("x")), 5
+        )
+        assert not journal._compacting
+
+        monkeypatch.setattr(journal, "_open_next_segment", open_next_segment)
+        for i in range(1, 6):
+            assert await storage.register_agent(make_agent_card(f"agent-{i}"))
+        storage.close()
+
+        assert (tmp_path / "agents.json").exists()
+        reloaded = FileStorage(str(tmp_path), journal=True)
+        assert len(await reloaded.list_agents()) == 6 + registered
+        reloaded.close()
+
+
+class TestKeywordIndex:
+    """Test the inverted keyword index behind search_agents."""
+
+    @pytest.fixture
+    def agents(self):
+        return [
+            make_agent_card(
+                "translator",
+                "Translates documents between languages",
+                skills=[{"id": "translate"}],
+            ),
+            make_agent_card("weather-bot", "Provides weather forecasts"),
+            make_agent_card(
+                "polyglot",
+                "General assistant",
+                skills=[{"id": "translation_review"}, {"id": "summarize"}],
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "file", "sqlite"])
+    async def test_substring_semantics_match_full_scan(self, agents, backend, tmp_path):
+        """Indexed search returns exactly the agents a substring scan finds."""
+        storage = make_storage(backend, tmp_path)
+        for agent in agents:
+            await storage.register_agent(agent)
+
+        for query in ["transl", "TRANSLATE", "ather", "e", "sum", "zzz", "review"]:
+            q = query.lower()
+            expected = {
+                a["name"]
+                for a in agents
+                if q in a["name"].lower()
+                or q in a["description"].lower()
+                or any(q in s["id"].lower() for s in a["skills"])
+            }
+            found = {a["name"] for a in await storage.search_agents(query)}
+            assert found == expected, query
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "file", "sqlite"])
+    @pytest.mark.parametrize("query", ["exchange", "ex"])
+    async def test_skill_descriptions_match_on_request(self, backend, query, tmp_path):
+        """Skill descriptions are only searched when asked for."""
+        storage = make_storage(backend, tmp_path)
+        await storage.register_agent(
+            make_agent_card(
+                "converter",
+                "General assistant",
+                skills=[{"id": "convert", "description": "Currency EXCHANGE"}],
+            )
+        )
+        await storage.register_agent(make_agent_card("other", "Helps out"))
+
+        assert await storage.search_agents(query) == []
+        found = await storage.search_agents(query, skill_descriptions=True)
+        assert [a["name"] for a in found] == ["converter"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    async def test_ranking_and_limit(self, agents, backend, tmp_path):
+        """Name and whole-word matches rank first; limit returns top-k."""
+        storage = make_storage(backend, tmp_path)
+        for agent in agents:
+            await storage.register_agent(agent)
+
+        results = await storage.search_agents("translat")
+        assert [a["name"] for a in results] == ["translator", "polyglot"]
+
+        top = await storage.search_agents("translat", limit=1)
+        assert [a["name"] for a in top] == ["translator"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "sqlite"])
+    async def test_index_follows_unregister_and_reregister(
+        self, agents, backend, tmp_path
+    ):
+        """Postings are updated on unregister and re-registration."""
+        storage = make_storage(backend, tmp_path)
+        for agent in agents:
+            await storage.register_agent(agent)
+
+        await storage.unregister_agent("weather-bot")
+        assert await storage.search_agents("weather") == []
+
+        updated = make_agent_card("translator", "Now forecasts the weather")
+        await storage.register_agent(updated)
+        assert [a["name"] for a in await storage.search_agents("weather")] == [
+            "translator"
+        ]
+        assert [a["name"] for a in await storage.search_agents("translate")] == []
+
+
+class TestExtensionIndexes:
+    """Test the reverse agent->extension and trust-level indexes."""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    async def storage(self, request, tmp_path):
+        storage = make_storage(request.param, tmp_path)
+        await storage.update_agent_extensions(
+            "agent-a",
+            [{"uri": "https://ext/one"}, {"uri": "https://ext/two"}],
+        )
+        await storage.update_agent_extensions(
+            "agent-b",
+            [{"uri": "https://ext/two"}, {"uri": "https://ext/three"}],
+        )
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_agent_extensions_lookup(self, storage):
+        """Per-agent lookups come from the reverse index in storage order."""
+        uris = [ext.uri for ext in await storage.get_agent_extensions("agent-a")]
+        assert uris == ["https://ext/one", "https://ext/two"]
+        assert await storage.get_agent_extensions("nobody") == []
+
+    @pytest.mark.asyncio
+    async def test_remove_agent_updates_indexes(self, storage):
+        """Removing an agent drops its memberships and orphaned extensions."""
+        await storage.remove_agent_from_extensions("agent-a")
+
+        assert await storage.get_agent_extensions("agent-a") == []
+        assert await storage.get_extension("https://ext/one") is None
+        two = await storage.get_extension("https://ext/two")
+        assert two.declaring_agents == {"agent-b"}
+
+        extensions, _, total = await storage.list_extensions(
+            declaring_agents=["agent-a"]
+        )
+        assert extensions == [] and total == 0
+
+    @pytest.mark.asyncio
+    async def test_reregistration_replaces_memberships(self, storage):
+        """update_agent_extensions swaps an agent's memberships."""
+        await storage.update_agent_extensions("agent-b", [{"uri": "https://ext/one"}])
+
+        uris = [ext.uri for ext in await storage.get_agent_extensions("agent-b")]
+        assert uris == ["https://ext/one"]
+        assert await storage.get_extension("https://ext/three") is None
+        one = await storage.get_extension("https://ext/one")
+        assert one.declaring_agents == {"agent-a", "agent-b"}
+
+    @pytest.mark.asyncio
+    async def test_trust_level_buckets(self, storage):
+        """Trust-level filtering follows extensions re-stored with a new level."""
+        ext = await storage.get_extension("https://ext/two")
+        ext.trust_level = "TRUST_LEVEL_VERIFIED"
+        await storage.store_extension(ext)
+
+        verified, _, total = await storage.list_extensions(
+            trust_levels=["TRUST_LEVEL_VERIFIED"]
+        )
+        assert [e.uri for e in verified] == ["https://ext/two"]
+        assert total == 1
+
+        unverified, _, _ = await storage.list_extensions(
+            trust_levels=["TRUST_LEVEL_UNVERIFIED"], declaring_agents=["agent-b"]
+        )
+        assert [e.uri for e in unverified] == ["https://ext/three"]
+
+        page, token, total = await storage.list_extensions(
+            trust_levels=["TRUST_LEVEL_UNVERIFIED", "TRUST_LEVEL_VERIFIED"],
+            page_size=2,
+        )
+        assert [e.uri for e in page] == ["https://ext/one", "https://ext/two"]
+        assert token == "2" and total == 3
+
+
+class TestSQLiteStorage:
+    """Test the SQLite storage backend."""
+
+    @pytest.mark.asyncio
+    async def test_state_survives_restart(self, tmp_path):
+        """Agents, extensions and search index are persisted in the database."""
+        storage = SQLiteStorage(str(tmp_path))
+        await storage.register_agents(
+            [make_agent_card("alpha"), make_agent_card("beta", "Weather forecasts")]
+        )
+        await storage.update_agent_extensions("beta", [{"uri": "https://ext/one"}])
+        await storage.unregister_agent("alpha")
+        storage.close()
+
+        reloaded = SQLiteStorage(str(tmp_path))
+        assert [a["name"] for a in await reloaded.list_agents()] == ["beta"]
+        assert [a["name"] for a in await reloaded.search_agents("forecast")] == ["beta"]
+        ext = await reloaded.get_extension("https://ext/one")
+        assert ext.declaring_agents == {"beta"}
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_keyword_index_gains_skill_descriptions(self, tmp_path):
+        """A database indexed without skill descriptions is re-indexed on open."""
+        storage = SQLiteStorage(str(tmp_path))
+        await storage.register_agent(
+            make_agent_card("alpha", skills=[{"id": "x", "description": "Forecasts"}])
+        )
+        with storage._lock:
+            storage._conn.executescript(
+                "DROP TABLE agents_fts; "
+                "CREATE VIRTUAL TABLE agents_fts USING fts5("
+                "name, description, skills, tokenize = 'trigram'); "
+                "INSERT INTO agents_fts (rowid, name, description, skills) "
+                "SELECT rowid, id, 'Description for alpha', 'x' FROM agents;"
+            )
+        storage.close()
+
+        reloaded = SQLiteStorage(str(tmp_path))
+        found = await reloaded.search_agents("forecast", skill_descriptions=True)
+        assert [a["name"] for a in found] == ["alpha"]
+        assert [a["name"] for a in await reloaded.search_agents("alpha")] == ["alpha"]
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_card_cache_is_bounded(self, tmp_path):
+        """Only ``cache_size`` cards stay resident; others load on demand."""
+        storage = SQLiteStorage(str(tmp_path), cache_size=3)
+        await storage.register_agents([make_agent_card(f"a{i}") for i in range(10)])
+        assert len(storage._cache) == 3
+
+        assert (await storage.get_agent("a0"))["name"] == "a0"
+        assert len(storage._cache) == 3
+        assert "a0" in storage._cache
+        assert await storage.get_agent("missing") is None
+        storage.close()
+
+    @pytest.mark.asyncio
+    async def test_imports_file_storage_data(self, tmp_path):
+        """A new database imports the JSON files written by FileStorage."""
+        file_storage = FileStorage(str(tmp_path))
+        await file_storage.register_agent(make_agent_card("legacy"))
+        await file_storage.update_agent_extensions(
+            "legacy", [{"uri": "https://ext/legacy"}]
+        )
+
+        storage = SQLiteStorage(str(tmp_path))
+        assert (await storage.get_agent("legacy"))["name"] == "legacy"
+        extensions = await storage.get_agent_extensions("legacy")
+        assert [ext.uri for ext in extensions] == ["https://ext/legacy"]
+        storage.close()
+
+
+class TestChangeDetection:
+    """Test that unchanged re-registrations are no-ops."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "file", "sqlite"])
+    async def test_unchanged_card_only_refreshes_last_seen(self, backend, tmp_path):
+        """Re-registering the same card keeps its hash and bumps last seen."""
+        storage = make_storage(backend, tmp_path)
+        card = make_agent_card("agent", "Plans trips")
+        assert await storage.register_agent(card)
+        card_hash = await storage.get_agent_card_hash("agent")
+        first_seen = await storage.get_agent_last_seen("agent")
+
+        assert await storage.register_agent(dict(card))
+        assert await storage.get_agent_card_hash("agent") == card_hash
+        assert await storage.get_agent_last_seen("agent") >= first_seen
+
+        assert await storage.register_agent(make_agent_card("agent", "Books trips"))
+        assert await storage.get_agent_card_hash("agent") != card_hash
+        assert (await storage.get_agent("agent"))["description"] == "Books trips"
+
+        await storage.unregister_agent("agent")
+        assert await storage.get_agent_card_hash("agent") is None
+
+    @pytest.mark.asyncio
+    async def test_unchanged_card_is_not_journaled(self, tmp_path):
+        """FileStorage writes nothing for an unchanged re-registration."""
+        storage = FileStorage(str(tmp_path), journal=True)
+        cards = [make_agent_card(f"agent-{i}") for i in range(3)]
+        await storage.register_agents(cards)
+        await storage.register_agent(cards[0])
+        await storage.register_agents(cards[:2] + [make_agent_card("agent-3")])
+        stats = storage._journal.get_stats()
+        storage.close()
+
+        assert stats["records_written"] == 4
+
+
+class TestBulkRegistration:
+    """Test batched agent registration."""
+
+    @pytest.mark.asyncio
+    async def test_file_storage_persists_batch_once(self, tmp_path):
+        """A journaled batch is committed together and survives a restart."""
+        storage = FileStorage(str(tmp_path), journal=True)
+        results = await storage.register_agents(
+            [make_agent_card(f"bulk-{i}") for i in range(20)]
+        )
+        stats = storage._journal.get_stats()
+        storage.close()
+
+        assert results == [True] * 20
+        assert stats["records_written"] == 20
+        assert stats["commits"] == 1
+
+        reloaded = FileStorage(str(tmp_path), journal=True)
+        assert len(await reloaded.list_agents()) == 20
+        reloaded.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_register_reports_per_item_errors(self):
+        """Invalid cards fail individually; valid ones are registered."""
+        storage = InMemoryStorage()
+        with_extension = make_agent_card("extended")
+        with_extension["capabilities"] = {"extensions": [{"uri": "https://ext/x"}]}
+
+        results = await bulk_register_agents(
+            storage, [make_agent_card("plain"), {"name": "broken"}, with_extension]
+        )
+
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[1]["error"] == "Missing required field: description"
+        assert results[2]["extensions_processed"] == 1
+        assert (await storage.get_agent("plain"))["preferred_transport"] == "JSONRPC"
+        assert await storage.get_agent("broken") is None
+        ext = await storage.get_extension("https://ext/x")
+        assert ext.declaring_agents == {"extended"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "file", "sqlite"])
+    async def test_bulk_register_persists_extensions_once(
+        self, backend, tmp_path, monkeypatch
+    ):
+        """Extensions of a whole batch are written together."""
+        storage = make_storage(backend, tmp_path)
+        cards = []
+        for i in range(10):
+            card = make_agent_card(f"ext-{i}")
+            card["capabilities"] = {
+                "extensions": [
+                    {"uri": "https://ext/shared"},
+                    {"uri": f"https://ext/{i}"},
+                ]
+            }
+            cards.append(card)
+        if backend == "file":
+            writes = []
+            save_extensions = storage._save_extensions
+            monkeypatch.setattr(
+                storage,
+                "_save_extensions",
+                lambda: writes.append(1) or save_extensions(),
+            )
+
+        results = await bulk_register_agents(storage, cards)
+
+        assert all(result["extensions_processed"] == 2 for result in results)
+        shared = await storage.get_extension("https://ext/shared")
+        assert shared.declaring_agents == {f"ext-{i}" for i in range(10)}
+        assert len(await storage.get_agent_extensions("ext-3")) == 2
+        if backend == "file":
+            assert len(writes) == 1
+            reloaded = FileStorage(str(tmp_path))
+            assert (await reloaded.get_extension("https://ext/7")) is not None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["memory", "file", "sqlite"])
+    async def test_get_agents_keeps_order(self, backend, tmp_path):
+        """Batched lookups return cards in input order, None when missing."""
+        storage = make_storage(backend, tmp_path)
+        await storage.register_agents([make_agent_card(f"get-{i}") for i in range(3)])
+
+        cards = await storage.get_agents(["get-2", "missing", "get-0", "get-2"])
+
+        assert [card and card["name"] for card in cards] == [
+            "get-2",
+            None,
+            "get-0",
+            "get-2",
+        ]
@@ -16,11 +16,16 @@ class TestVectorGenerator:
     @pytest.fixture
     def generator(self):
         """Create a VectorGenerator instance for testing."""
-        with patch('a2a_registry.vector_generator.SentenceTransformer') as mock_transformer:
+        with patch('a2a_registry.embedding_backends.load_sentence_transformer') as mock_transformer:
             # Mock the sentence transformer
             mock_model = Mock()
             mock_model.get_sentence_embedding_dimension.return_value = 384
-            mock_model.encode.return_value = np.random.rand(384)  # Random 384-dim vector
+            # Random 384-dim vectors, one row per text for batched calls
+            mock_model.encode.side_effect = lambda texts, **kwargs: (
+                np.random.rand(len(texts), 384)
+                if isinstance(texts, list)
+                else np.random.rand(384)
+            )
             mock_transformer.return_value = mock_model
             
             generator = VectorGenerator("test-model")
@@ -76,7 +81,7 @@ class TestVectorGenerator:
     
     def test_vector_generator_initialization(self):
         """Test VectorGenerator initialization."""
-        with patch('a2a_registry.vector_generator.SentenceTransformer') as mock_transformer:
+        with patch('a2a_registry.embedding_backends.load_sentence_transformer') as mock_transformer:
             mock_model = Mock()
             mock_model.get_sentence_embedding_dimension.return_value = 768
             mock_transformer.return_value = mock_model
@@ -151,6 +156,103 @@ class TestVectorGenerator:
             assert vector.metadata.fields["model"].string_value == "test-model"
             assert vector.metadata.fields["dimensions"].number_value == 384
     
+    def test_generate_agent_vectors_single_encode_call(self, generator):
+        """A card is embedded in one batched call; duplicate texts once."""
+        agent_card = {
+            "name": "Agent",
+            "description": "Plans trips",
+            "skills": [{"name": "planning"}, {"name": "booking", "tags": ["travel"]}],
+        }
+        generator.model.encode.reset_mock()
+        vectors = generator.generate_agent_vectors(agent_card, "agent-1")
+
+        assert generator.model.encode.call_count == 1
+        (texts,), kwargs = generator.model.encode.call_args
+        assert kwargs["batch_size"] == generator.batch_size
+        # skills[0] combines a single part, so its text is embedded once
+        assert texts.count("planning") == 1
+        assert [v.field_path for v in vectors] == [
+            "name",
+            "description",
+            "skills[0].name",
+            "skills[0]",
+            "skills[1].name",
+            "skills[1].tags",
+            "skills[1]",
+        ]
+        assert vectors[2].values == vectors[3].values
+
+    def test_generate_agents_vectors_batches_encoding(self, generator, sample_agent_card):
+        """Bulk generation embeds every field of every card in one encode call."""
+        single = generator.generate_agent_vectors(sample_agent_card, "agent-1")
+        generator.model.encode.reset_mock()
+
+        other_card = {"name": "Other", "description": "Another agent"}
+        vectors = generator.generate_agents_vectors(
+            [("agent-1", sample_agent_card), ("agent-2", other_card)]
+        )
+
+        assert generator.model.encode.call_count == 1
+        assert [v.field_path for v in vectors["agent-1"]] == [
+            v.field_path for v in single
+        ]
+        assert [v.field_path for v in vectors["agent-2"]] == ["name", "description"]
+        assert all(v.agent_id == "agent-2" for v in vectors["agent-2"])
+        assert all(len(v.values) == 384 for v in vectors["agent-1"])
+
+    def test_generate_agents_vectors_reuses_unchanged_fields(self, generator):
+        """Only changed field texts are encoded when previous vectors are given."""
+        card = {
+            "name": "Agent",
+            "description": "Plans trips",
+            "skills": [{"name": "planning", "tags": ["travel"]}],
+        }
+        previous = generator.generate_agent_vectors(card, "agent-1")
+        generator.model.encode.reset_mock()
+
+        changed = dict(card, description="Books trips")
+        vectors = generator.generate_agents_vectors(
+            [("agent-1", changed)], existing={"agent-1": previous}
+        )["agent-1"]
+
+        (texts,), _kwargs = generator.model.encode.call_args
+        assert texts == ["Books trips"]
+        assert vectors[0] is previous[0]
+        assert vectors[1].field_content == "Books trips"
+        assert vectors[1].metadata["content_hash"] != previous[1].metadata["content_hash"]
+        assert vectors[2:] == previous[2:]
+
+        generator.model.encode.reset_mock()
+        generator.generate_agents_vectors(
+            [("agent-1", changed)], existing={"agent-1": vectors}
+        )
+        generator.model.encode.assert_not_called()
+
+    def test_embedding_cache_avoids_reencoding(self, tmp_path):
+        """Texts embedded before a restart are served from the disk cache."""
+        card = {"name": "Agent", "description": "Plans trips"}
+        with patch("a2a_registry.embedding_backends.load_sentence_transformer") as mock_cls:
+            mock_model = Mock()
+            mock_model.get_sentence_embedding_dimension.return_value = 384
+            mock_model.encode.side_effect = lambda texts, **kwargs: np.random.rand(
+                len(texts), 384
+            ).astype(np.float32)
+            mock_cls.return_value = mock_model
+
+            first = VectorGenerator("test-model", cache_dir=str(tmp_path))
+            vectors = first.generate_agent_vectors(card, "agent-1")
+            restarted = VectorGenerator("test-model", cache_dir=str(tmp_path))
+            mock_model.encode.reset_mock()
+            cached = restarted.generate_agent_vectors(
+                dict(card, url="http://other"), "agent-2"
+            )
+
+        mock_model.encode.assert_not_called()
+        np.testing.assert_allclose(
+            [v.values for v in cached], [v.values for v in vectors], rtol=1e-6
+        )
+        assert restarted.cache.get_stats()["disk_hits"] == 2
+
     def test_generate_query_vector(self, generator):
         """Test generation of query vector."""
         query = "strategic planning and leadership"
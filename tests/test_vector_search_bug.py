@@ -13,6 +13,12 @@ from a2a_registry.storage import InMemoryStorage
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def isolated_vector_files(tmp_path, monkeypatch):
+    """Keep persisted vectors and caches out of the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestVectorSearchBugReproduction:
     """Test class to reproduce the identical similarity scores bug with real agent data."""
 
@@ -21,7 +27,7 @@ class TestVectorSearchBugReproduction:
         """Set up vector storage with test agents loaded."""
         # Create storage
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         # Load test agents
         fixtures_dir = Path(__file__).parent / "fixtures"
@@ -10,6 +10,12 @@ from src.a2a_registry.vector_store import FAISSVectorStore
 from src.a2a_registry.vector_generator import VectorGenerator
 
 
+@pytest.fixture(autouse=True)
+def isolated_vector_files(tmp_path, monkeypatch):
+    """Keep persisted vectors and caches out of the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestVectorSearchIntegration:
     """Test vector search integration."""
 
@@ -48,7 +54,7 @@ class TestVectorSearchIntegration:
     async def test_vector_enhanced_storage_initialization(self):
         """Test that vector-enhanced storage initializes correctly."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         assert storage.backend == backend
         assert isinstance(storage.vector_generator, VectorGenerator)
@@ -58,7 +64,7 @@ class TestVectorSearchIntegration:
     async def test_agent_registration_generates_vectors(self, sample_agent_card):
         """Test that registering an agent generates vectors."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         # Register agent
         success = await storage.register_agent(sample_agent_card)
@@ -80,7 +86,7 @@ class TestVectorSearchIntegration:
     async def test_vector_search_functionality(self, sample_agent_card):
         """Test vector similarity search."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         # Register agent
         await storage.register_agent(sample_agent_card)
@@ -101,7 +107,7 @@ class TestVectorSearchIntegration:
     async def test_hybrid_search_modes(self, sample_agent_card):
         """Test different search modes."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         await storage.register_agent(sample_agent_card)
         
@@ -126,7 +132,7 @@ class TestVectorSearchIntegration:
     async def test_skill_filtering(self, sample_agent_card):
         """Test search with skill filtering."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         await storage.register_agent(sample_agent_card)
         
@@ -150,7 +156,7 @@ class TestVectorSearchIntegration:
     async def test_vector_operations(self, sample_agent_card):
         """Test vector CRUD operations."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         agent_id = sample_agent_card["name"]
         
@@ -174,7 +180,7 @@ class TestVectorSearchIntegration:
     async def test_unregister_removes_vectors(self, sample_agent_card):
         """Test that unregistering an agent removes its vectors."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         agent_id = sample_agent_card["name"]
         
@@ -194,7 +200,7 @@ class TestVectorSearchIntegration:
     def test_vector_stats(self):
         """Test vector store statistics."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         stats = storage.get_vector_stats()
         assert "total_vectors" in stats
@@ -206,7 +212,7 @@ class TestVectorSearchIntegration:
     async def test_extension_params_indexed(self):
         """Test that extension parameters are properly indexed."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         # Agent with specific extension params
         agent_card = {
@@ -249,7 +255,7 @@ class TestVectorSearchFailures:
     async def test_empty_query_vector_search(self):
         """Test vector search with empty query."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         results = await storage.search_agents_vector("", similarity_threshold=0.7)
         assert len(results) == 0
@@ -258,7 +264,7 @@ class TestVectorSearchFailures:
     async def test_no_agents_registered(self):
         """Test search when no agents are registered."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         results = await storage.search_agents_vector(
             "test query", 
@@ -270,7 +276,7 @@ class TestVectorSearchFailures:
     async def test_high_similarity_threshold(self, sample_agent_card):
         """Test search with very high similarity threshold."""
         backend = InMemoryStorage()
-        storage = VectorEnhancedStorage(backend)
+        storage = VectorEnhancedStorage(backend, async_indexing=False)
         
         await storage.register_agent(sample_agent_card)
         
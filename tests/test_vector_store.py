@@ -0,0 +1,827 @@
+"""Tests for the FAISS vector store."""
+
+import json
+
+import faiss
+import numpy as np
+import pytest
+
+from a2a_registry.proto.generated.registry_pb2 import Vector
+from a2a_registry.vector_store import (
+    FAISSVectorStore,
+    composite_agent_scores,
+    rank_agent_scores,
+)
+
+DIMS = 16
+
+
+def make_vectors(agent_id: str, count: int, seed: int = 0) -> list[Vector]:
+    """Helper to create random vectors for an agent."""
+    rng = np.random.default_rng(seed)
+    return [
+        Vector(
+            values=rng.standard_normal(DIMS).tolist(),
+            agent_id=agent_id,
+            field_path=f"field[{i}]",
+        )
+        for i in range(count)
+    ]
+
+
+class TestFAISSVectorStore:
+    """Test cases for FAISSVectorStore."""
+
+    @pytest.fixture
+    def store(self):
+        store = FAISSVectorStore(vector_dimensions=DIMS)
+        store.add_agent_vectors("agent-a", make_vectors("agent-a", 3, seed=1))
+        store.add_agent_vectors("agent-b", make_vectors("agent-b", 4, seed=2))
+        store.add_agent_vectors("agent-c", make_vectors("agent-c", 2, seed=3))
+        return store
+
+    def test_update_keeps_other_agents_ids(self, store):
+        """Re-registering an agent only replaces that agent's vector ids."""
+        ids_b = list(store.agent_vector_ids["agent-b"])
+        ids_c = list(store.agent_vector_ids["agent-c"])
+
+        store.add_agent_vectors("agent-a", make_vectors("agent-a", 5, seed=4))
+
+        assert list(store.agent_vector_ids["agent-b"]) == ids_b
+        assert list(store.agent_vector_ids["agent-c"]) == ids_c
+        assert store.get_stats()["total_vectors"] == 5 + 4 + 2
+        assert store.mutable.index.ntotal == 5 + 4 + 2
+
+    def test_search_maps_hits_to_matching_vector(self, store):
+        """Each hit resolves to the exact vector, also after removals."""
+        store.remove_agent_vectors("agent-a")
+        store.add_agent_vectors("agent-a", make_vectors("agent-a", 2, seed=5))
+
+        for agent_id in ["agent-a", "agent-b", "agent-c"]:
+            for vector in store.get_agent_vectors(agent_id):
+                agent, matched, score = store.search_similar_vectors(
+                    vector, k=1, similarity_threshold=0.0
+                )[0]
+                assert agent == agent_id
+                assert matched.field_path == vector.field_path
+                assert score == pytest.approx(1.0, abs=1e-5)
+
+    def test_removed_agent_is_not_returned(self, store):
+        """Removed vectors disappear from the index and the id tables."""
+        query = store.get_agent_vectors("agent-b")[0]
+        store.remove_agent_vectors("agent-b")
+
+        results = store.search_similar_vectors(query, k=10, similarity_threshold=-1.0)
+        assert {agent_id for agent_id, _vector, _score in results} == {
+            "agent-a",
+            "agent-c",
+        }
+        assert store.mutable.index.ntotal == 5
+        assert store.get_stats()["total_agents"] == 2
+
+
+class TestApproximateIndexes:
+    """Test switching to approximate FAISS indexes."""
+
+    @pytest.mark.parametrize("index_type", ["hnsw", "ivf", "ivfpq"])
+    def test_switches_after_threshold_and_finds_vectors(self, index_type):
+        """Segments merged past the threshold get the ANN index and find hits."""
+        store = FAISSVectorStore(
+            vector_dimensions=DIMS,
+            index_type=index_type,
+            ann_threshold=400,
+            pq_m=4,
+            segment_size=100,
+            merge_factor=4,
+        )
+        for i in range(39):
+            store.add_agent_vectors(f"agent-{i}", make_vectors(f"agent-{i}", 10, i))
+        assert store.get_stats()["index_type"] == "flat"
+
+        store.add_agent_vectors("agent-39", make_vectors("agent-39", 10, 39))
+        stats = store.get_stats()
+        assert stats["index_type"] == index_type
+        assert stats["total_vectors"] == 400
+        assert len(stats["segments"]) == 1
+
+        query = store.get_agent_vectors("agent-7")[3]
+        agent_id, vector, _score = store.search_similar_vectors(
+            query, k=5, similarity_threshold=-1.0
+        )[0]
+        if index_type != "ivfpq":  # PQ scores are approximate
+            assert (agent_id, vector.field_path) == ("agent-7", "field[3]")
+
+        store.remove_agent_vectors("agent-7")
+        results = store.search_similar_vectors(query, k=5, similarity_threshold=-1.0)
+        assert len(results) == 5
+        assert "agent-7" not in {agent for agent, _vector, _score in results}
+        assert store.get_stats()["total_vectors"] == 390
+
+    def test_ivf_is_trained_at_each_merge(self):
+        """Every merge trains IVF on the merged segment's vectors."""
+        store = FAISSVectorStore(
+            vector_dimensions=DIMS,
+            index_type="ivf",
+            ann_threshold=100,
+            segment_size=100,
+            merge_factor=2,
+        )
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 10, i) for i in range(10)}
+        )
+        assert [segment.trained_size for segment in store.segments] == [100]
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 10, i) for i in range(10, 20)}
+        )
+        assert [segment.trained_size for segment in store.segments] == [200]
+        assert store.get_stats()["merges"] == 2
+
+    def test_hnsw_tombstones_trigger_merge(self):
+        """Removed HNSW vectors are filtered, then dropped by a merge."""
+        store = FAISSVectorStore(
+            vector_dimensions=DIMS,
+            index_type="hnsw",
+            ann_threshold=10,
+            segment_size=100,
+        )
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 10, i) for i in range(10)}
+        )
+        store.remove_agent_vectors("agent-0")
+        assert store.get_stats()["tombstones"] == 10
+        assert store.segments[0].index.ntotal == 100
+
+        # A quarter of the segment is tombstoned after three removals
+        for i in range(1, 3):
+            store.remove_agent_vectors(f"agent-{i}")
+        assert store.get_stats()["tombstones"] == 0
+        assert store.segments[0].index.ntotal == 70
+        assert store.get_agent_vectors("agent-9")[0].field_path == "field[0]"
+
+
+class TestQuantizedStorage:
+    """Test fp16/SQ8 embedding storage."""
+
+    @pytest.mark.parametrize("vector_storage", ["fp16", "sq8"])
+    @pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf"])
+    def test_search_and_reconstruction(self, vector_storage, index_type):
+        """Quantized stores search and reconstruct close to the float32 values."""
+        store = FAISSVectorStore(
+            vector_dimensions=DIMS,
+            index_type=index_type,
+            ann_threshold=400,
+            vector_storage=vector_storage,
+            segment_size=400,
+        )
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 10, i) for i in range(40)}
+        )
+        assert store.get_stats()["index_type"] == index_type
+        original = make_vectors("agent-5", 10, 5)
+
+        # Reads decode the values from the index
+        decoded = store.get_agent_vectors("agent-5")
+        assert [v.field_path for v in decoded] == [v.field_path for v in original]
+        expected = np.array([v.values for v in original])
+        expected /= np.linalg.norm(expected, axis=1, keepdims=True)
+        tolerance = 1e-3 if vector_storage == "fp16" else 2e-2
+        np.testing.assert_allclose(
+            [v.values for v in decoded], expected, atol=tolerance
+        )
+
+        agent_id, vector, score = store.search_similar_vectors(
+            original[2], k=1, similarity_threshold=0.0
+        )[0]
+        assert (agent_id, vector.field_path) == ("agent-5", "field[2]")
+        assert score == pytest.approx(1.0, abs=0.05)
+
+    def test_memory_usage_reflects_precision(self):
+        """The reported footprint shrinks with the storage precision."""
+        usage = {}
+        for vector_storage in ["float32", "fp16", "sq8"]:
+            store = FAISSVectorStore(
+                vector_dimensions=64, vector_storage=vector_storage
+            )
+            rng = np.random.default_rng(0)
+            store.add_agents_vectors(
+                {
+                    f"agent-{i}": [
+                        Vector(
+                            values=rng.standard_normal(64).tolist(),
+                            agent_id=f"agent-{i}",
+                            field_path="description",
+                        )
+                    ]
+                    for i in range(500)
+                }
+            )
+            usage[vector_storage] = store.get_stats()["index_memory_mb"]
+        assert usage["float32"] > 1.5 * usage["fp16"] > 1.5 * usage["sq8"]
+
+
+class TestColumnarMetadata:
+    """Test the columnar vector metadata and lazy proto materialization."""
+
+    def make_vector(self, agent_id: str, field_path: str, content: str) -> Vector:
+        vector = Vector(
+            values=np.random.default_rng(len(content)).standard_normal(DIMS).tolist(),
+            agent_id=agent_id,
+            field_path=field_path,
+            field_content=content,
+        )
+        vector.created_at.seconds = 1_700_000_000
+        vector.created_at.nanos = 123
+        vector.metadata.update(
+            {"model": "test-model", "dimensions": DIMS, "source": "card"}
+        )
+        return vector
+
+    def test_materialized_vectors_round_trip(self, tmp_path):
+        """Materialized protos match the added ones, also after save and load."""
+        vectors = [
+            self.make_vector("agent-a", "description", "Plans trips"),
+            self.make_vector("agent-a", "skills[0].name", "Flights"),
+        ]
+        store = FAISSVectorStore(
+            vector_dimensions=DIMS, persist_path=str(tmp_path / "index")
+        )
+        store.add_agent_vectors("agent-a", vectors)
+        store.save_index()
+        loaded = FAISSVectorStore(
+            vector_dimensions=DIMS, persist_path=str(tmp_path / "index")
+        )
+
+        for current in (store, loaded):
+            materialized = current.get_agent_vectors("agent-a")
+            for original, vector in zip(vectors, materialized, strict=True):
+                assert vector.agent_id == "agent-a"
+                assert vector.field_path == original.field_path
+                assert vector.field_content == original.field_content
+                assert vector.created_at == original.created_at
+                assert vector.metadata["model"] == "test-model"
+                assert vector.metadata["source"] == "card"
+                assert vector.metadata["content_length"] == len(original.field_content)
+                np.testing.assert_allclose(
+                    vector.values,
+                    np.array(original.values) / np.linalg.norm(original.values),
+                    atol=1e-6,
+                )
+            assert (
+                current.search_agent_scores(vectors[1], k=1, similarity_threshold=0.0)[
+                    0
+                ][0]
+                == "agent-a"
+            )
+
+    def test_per_vector_overhead_is_small(self):
+        """Metadata costs tens of bytes per vector beyond its text."""
+        store = FAISSVectorStore(vector_dimensions=DIMS)
+        count = 20000
+        store.add_agents_vectors(
+            {
+                f"agent-{i}": [
+                    Vector(
+                        values=[1.0] * DIMS,
+                        agent_id=f"agent-{i}",
+                        field_path=f"skills[{j}].name",
+                        field_content="Flight search",
+                    )
+                    for j in range(10)
+                ]
+                for i in range(count // 10)
+            }
+        )
+        tables = [segment.metadata for segment in store._all_segments()]
+        overhead = sum(table.nbytes - len(table.arena) for table in tables)
+        assert overhead / count < 64
+
+    def test_removed_text_is_compacted(self):
+        """Merging a segment drops the arena text of removed vectors."""
+        store = FAISSVectorStore(vector_dimensions=DIMS, segment_size=10)
+        for i in range(10):
+            store.add_agent_vectors(
+                f"agent-{i}", [self.make_vector(f"agent-{i}", "description", "x" * 100)]
+            )
+        for i in range(9):
+            store.remove_agent_vectors(f"agent-{i}")
+
+        assert [len(segment.metadata.arena) for segment in store.segments] == [100]
+        assert store.get_agent_vectors("agent-9")[0].field_content == "x" * 100
+
+
+class TestSegments:
+    """Test sealing, tombstoning and merging of index segments."""
+
+    @pytest.fixture
+    def store(self):
+        store = FAISSVectorStore(vector_dimensions=DIMS, segment_size=20)
+        for i in range(10):
+            store.add_agent_vectors(f"agent-{i}", make_vectors(f"agent-{i}", 5, i))
+        return store
+
+    def test_search_fans_out_across_segments(self, store):
+        """Hits from sealed and mutable segments are merged by score."""
+        assert len(store.segments) == 2
+        assert store.mutable.live == 10
+
+        for i in (0, 5, 9):
+            query = make_vectors(f"agent-{i}", 5, i)[2]
+            hits = store.search_similar_vectors(query, k=3, similarity_threshold=-1.0)
+            assert len(hits) == 3
+            assert hits[0][0] == f"agent-{i}"
+            assert hits[0][1].field_path == "field[2]"
+            scores = [score for _agent, _vector, score in hits]
+            assert scores == sorted(scores, reverse=True)
+
+    def test_batch_search_matches_single_searches(self, store):
+        """One multi-row search returns each query's own top k, in order."""
+        queries = [make_vectors(f"agent-{i}", 5, i)[1] for i in (3, 8, 0)]
+        batch = store.search_agent_scores_batch(queries, k=4, similarity_threshold=-1.0)
+
+        assert len(batch) == 3
+        for query, hits in zip(queries, batch, strict=True):
+            single = store.search_agent_scores(query, k=4, similarity_threshold=-1.0)
+            assert [agent for agent, _ in hits] == [agent for agent, _ in single]
+            assert [score for _, score in hits] == pytest.approx(
+                [score for _, score in single]
+            )
+        assert [hits[0][0] for hits in batch] == ["agent-3", "agent-8", "agent-0"]
+        assert store.search_agent_scores_batch([], k=4) == []
+
+    def test_updates_tombstone_sealed_vectors(self, store):
+        """Re-registering an agent of a sealed segment leaves a tombstone."""
+        store.add_agent_vectors("agent-1", make_vectors("agent-1", 2, 42))
+
+        stats = store.get_stats()
+        assert stats["tombstones"] == 5
+        assert stats["total_vectors"] == 47
+        assert store.segments[0].index.ntotal == 20
+        assert store.agent_vector_ids["agent-1"].start >= store.mutable.base
+        query = make_vectors("agent-1", 5, 1)[0]
+        hits = store.search_agent_scores(query, k=50, similarity_threshold=-1.0)
+        assert len(hits) == 47
+
+    def test_merges_renumber_live_vectors(self):
+        """Merged segments keep every agent's vectors, under new ids."""
+        store = FAISSVectorStore(
+            vector_dimensions=DIMS, segment_size=10, merge_factor=3
+        )
+        for i in range(9):
+            store.add_agent_vectors(f"agent-{i}", make_vectors(f"agent-{i}", 5, i))
+        store.remove_agent_vectors("agent-2")
+        store.add_agent_vectors("agent-9", make_vectors("agent-9", 5, 9))
+
+        stats = store.get_stats()
+        assert stats["merges"] >= 2
+        assert stats["tombstones"] == 0
+        assert stats["total_vectors"] == 45
+        for i in [0, 1, 3, 4, 5, 6, 7, 8, 9]:
+            vectors = store.get_agent_vectors(f"agent-{i}")
+            assert [v.agent_id for v in vectors] == [f"agent-{i}"] * 5
+            hits = store.search_similar_vectors(
+                vectors[4], k=1, similarity_threshold=0.0
+            )
+            assert (hits[0][0], hits[0][1].field_path) == (f"agent-{i}", "field[4]")
+        assert "agent-2" not in store.agent_vector_ids
+
+    def test_background_worker_merges_and_flushes(self, tmp_path):
+        """With a flush interval, merges and flushes run on a worker thread."""
+        store = FAISSVectorStore(
+            vector_dimensions=DIMS,
+            persist_path=str(tmp_path / "index"),
+            segment_size=10,
+            merge_factor=2,
+            flush_interval=0.05,
+        )
+        for i in range(4):
+            store.add_agent_vectors(f"agent-{i}", make_vectors(f"agent-{i}", 10, i))
+        store.close()
+
+        stats = store.get_stats()
+        assert stats["merges"] >= 1
+        assert stats["flushes"] >= 1
+        loaded = FAISSVectorStore(
+            vector_dimensions=DIMS, persist_path=str(tmp_path / "index")
+        )
+        assert loaded.get_stats()["total_vectors"] == 40
+
+
+class TestFilteredSearch:
+    """Test the selectivity-based plans of filtered searches."""
+
+    @staticmethod
+    def build(index_type: str = "flat", **kwargs) -> FAISSVectorStore:
+        store = FAISSVectorStore(
+            vector_dimensions=DIMS,
+            index_type=index_type,
+            ann_threshold=200,
+            segment_size=100,
+            merge_factor=2,
+            pq_m=4,
+            **kwargs,
+        )
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 5, i) for i in range(60)}
+        )
+        return store
+
+    @staticmethod
+    def brute_force(store, query, agent_ids, k):
+        """Top k (agent_id, score) over the agents' vectors."""
+        values = np.array(query.values, dtype=np.float32)
+        values /= np.linalg.norm(values)
+        scored = [
+            (agent_id, float(np.dot(values, np.array(vector.values))))
+            for agent_id in agent_ids
+            for vector in store.get_agent_vectors(agent_id)
+        ]
+        return sorted(scored, key=lambda hit: hit[1], reverse=True)[:k]
+
+    @pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf"])
+    def test_selective_filter_is_scored_exactly(self, index_type):
+        """A selective filter returns exactly the best vectors of its agents."""
+        store = self.build(index_type)
+        assert {segment.index_type for segment in store.segments} == {index_type}
+        allowed = ["agent-3", "agent-42", "agent-59"]
+        query = make_vectors("query", 1, seed=1000)[0]
+
+        hits = store.search_agent_scores_filtered(
+            query, allowed, k=8, similarity_threshold=-1.0
+        )
+
+        expected = self.brute_force(store, query, allowed, 8)
+        assert [agent for agent, _ in hits] == [agent for agent, _ in expected]
+        assert [score for _, score in hits] == pytest.approx(
+            [score for _, score in expected], abs=1e-5
+        )
+        assert store.get_stats()["filter_plans"]["exact"] == 1
+
+    def test_broad_filter_uses_ann_and_expands_k(self):
+        """A broad filter grows k until enough filtered vectors are found."""
+        store = self.build(filter_exact_selectivity=0.0)
+        allowed = [f"agent-{i}" for i in range(30)]
+        # Excluded agents close to the query crowd out the first rounds
+        query = make_vectors("query", 1, seed=1000)[0]
+        rng = np.random.default_rng(7)
+        store.add_agents_vectors(
+            {
+                f"agent-{i}": [
+                    Vector(
+                        values=(
+                            np.array(query.values) + 0.1 * rng.standard_normal(DIMS)
+                        ).tolist(),
+                        agent_id=f"agent-{i}",
+                        field_path=f"field[{j}]",
+                    )
+                    for j in range(5)
+                ]
+                for i in range(30, 60)
+            }
+        )
+
+        hits = store.search_agent_scores_filtered(
+            query, allowed, k=40, similarity_threshold=-1.0
+        )
+
+        assert len(hits) == 40
+        assert {agent for agent, _ in hits} <= set(allowed)
+        expected = self.brute_force(store, query, allowed, 40)
+        assert [agent for agent, _ in hits] == [agent for agent, _ in expected]
+        plans = store.get_stats()["filter_plans"]
+        assert (plans["exact"], plans["ann"]) == (0, 1)
+        assert plans["ann_expansions"] >= 1
+
+    def test_unknown_or_removed_agents_match_nothing(self):
+        """Filters without indexed agents return no hits."""
+        store = self.build()
+        store.remove_agent_vectors("agent-3")
+        query = make_vectors("query", 1, seed=1000)[0]
+
+        assert store.search_agent_scores_filtered(query, ["agent-3", "nobody"]) == []
+        hits = store.search_agent_scores_filtered(
+            query, ["agent-3", "agent-4"], k=10, similarity_threshold=-1.0
+        )
+        assert {agent for agent, _ in hits} == {"agent-4"}
+
+
+class TestCentroidSearch:
+    """Test two-stage search over agent centroids."""
+
+    @pytest.fixture
+    def store(self):
+        store = FAISSVectorStore(vector_dimensions=DIMS, segment_size=40)
+        for i in range(30):
+            store.add_agent_vectors(f"agent-{i}", make_vectors(f"agent-{i}", 4, i))
+        return store
+
+    @staticmethod
+    def reference_ranking(store, query, threshold):
+        """Composite scores over every vector above threshold, in Python."""
+        values = np.array(query.values, dtype=np.float32)
+        values /= np.linalg.norm(values)
+        scores = {}
+        for agent_id in store.agent_vector_ids:
+            matches = sorted(
+                (
+                    float(np.dot(values, np.array(vector.values)))
+                    for vector in store.get_agent_vectors(agent_id)
+                ),
+                reverse=True,
+            )
+            matches = [score for score in matches if score >= threshold]
+            if matches:
+                scores[agent_id] = (
+                    0.6 * matches[0]
+                    + 0.3 * sum(matches[:3]) / min(3, len(matches))
+                    + 0.1 * min(len(matches) / 5.0, 1.0)
+                )
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+    def test_composite_scores_match_python_aggregation(self):
+        groups = np.array([2, 0, 0, 2, 0, 0, 2])
+        similarities = np.array([0.5, 0.9, 0.1, 0.7, 0.4, 0.8, 0.6])
+        scores = composite_agent_scores(groups, similarities, 4)
+
+        assert scores[0] == pytest.approx(0.6 * 0.9 + 0.3 * 0.7 + 0.1 * 0.8)
+        assert scores[2] == pytest.approx(0.6 * 0.7 + 0.3 * 0.6 + 0.1 * 0.6)
+        assert np.isneginf(scores[[1, 3]]).all()
+
+    def test_vectorized_ranking_matches_per_agent_loop(self):
+        """NumPy grouping ranks exactly like sorting per-agent score lists."""
+        rng = np.random.default_rng(3)
+        hits = [
+            (f"agent-{rng.integers(40)}", float(score))
+            for score in rng.uniform(0.3, 1.0, 400)
+        ]
+        matches: dict[str, list[float]] = {}
+        for agent_id, score in hits:
+            matches.setdefault(agent_id, []).append(score)
+        expected = sorted(
+            (
+                (
+                    agent_id,
+                    0.6 * max(scores)
+                    + 0.3 * sum(sorted(scores, reverse=True)[:3]) / min(3, len(scores))
+                    + 0.1 * min(len(scores) / 5.0, 1.0),
+                )
+                for agent_id, scores in matches.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:10]
+
+        ranked = rank_agent_scores(hits, 10)
+
+        assert [agent for agent, _ in ranked] == [agent for agent, _ in expected]
+        assert [score for _, score in ranked] == pytest.approx(
+            [score for _, score in expected]
+        )
+        assert rank_agent_scores([], 10) == []
+        assert rank_agent_scores(hits, 0) == []
+
+    def test_array_ranking_matches_ranked_field_hits(self, store):
+        """search_ranked_agents ranks like rank_agent_scores across segments."""
+        queries = make_vectors("query", 3, seed=1000)
+        store.remove_agent_vectors("agent-3")
+
+        ranked = store.search_ranked_agents(
+            queries, k=60, max_results=8, similarity_threshold=0.0
+        )
+
+        for query, result in zip(queries, ranked, strict=True):
+            expected = rank_agent_scores(
+                store.search_agent_scores(query, k=60, similarity_threshold=0.0), 8
+            )
+            assert [agent for agent, _ in result] == [agent for agent, _ in expected]
+            assert [score for _, score in result] == pytest.approx(
+                [score for _, score in expected]
+            )
+            assert "agent-3" not in dict(result)
+        assert store.search_ranked_agents([]) == []
+
+    def test_ranking_is_exact_over_all_candidates(self, store):
+        """With every agent a candidate the ranking equals a full aggregation."""
+        assert len(store.segments) == 3
+        assert store.get_stats()["centroids"] == 30
+        query = make_vectors("query", 1, seed=1000)[0]
+
+        ranked = store.search_agents_by_centroid(
+            [query], candidates=30, max_results=5, similarity_threshold=0.1
+        )[0]
+
+        expected = self.reference_ranking(store, query, 0.1)[:5]
+        assert [agent for agent, _ in ranked] == [agent for agent, _ in expected]
+        assert [score for _, score in ranked] == pytest.approx(
+            [score for _, score in expected], abs=1e-5
+        )
+
+    def test_centroid_finds_agent_of_its_own_vectors(self, store):
+        """An agent's pooled vector ranks it first for its own centroid."""
+        vectors = store.get_agent_vectors("agent-17")
+        pooled = np.sum([np.array(vector.values) for vector in vectors], axis=0)
+        query = Vector(values=pooled.tolist())
+
+        ranked = store.search_agents_by_centroid(
+            [query], candidates=3, max_results=3, similarity_threshold=-1.0
+        )[0]
+        assert ranked[0][0] == "agent-17"
+
+    def test_centroids_follow_updates_and_merges(self, store, tmp_path):
+        store.remove_agent_vectors("agent-3")
+        store.add_agent_vectors("agent-5", make_vectors("agent-5", 2, 50))
+        store.segment_size = 10
+        store.merge_factor = 2
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 4, i) for i in range(30, 40)}
+        )
+        assert store.get_stats()["merges"] > 0
+        assert store.get_stats()["centroids"] == len(store.agent_vector_ids) == 39
+
+        query = make_vectors("agent-5", 2, 50)[0]
+        ranked = store.search_agents_by_centroid(
+            [query], candidates=5, max_results=5, similarity_threshold=-1.0
+        )[0]
+        assert ranked[0][0] == "agent-5"
+        assert "agent-3" not in {agent for agent, _ in ranked}
+
+        store.persist_path = str(tmp_path / "index")
+        store.flush()
+        reopened = FAISSVectorStore(
+            vector_dimensions=DIMS, persist_path=store.persist_path
+        )
+        assert reopened.get_stats()["centroids"] == 39
+        assert reopened.search_agents_by_centroid(
+            [query], candidates=5, max_results=5, similarity_threshold=-1.0
+        ) == [ranked]
+
+
+class TestFieldWeights:
+    """Field weights scale similarities in every agent ranking path."""
+
+    @staticmethod
+    def unit(*components: float) -> Vector:
+        values = np.zeros(DIMS)
+        values[: len(components)] = components
+        return Vector(values=values.tolist())
+
+    def make_store(self, field_weights):
+        store = FAISSVectorStore(
+            vector_dimensions=DIMS,
+            filter_exact_selectivity=1.0,
+            field_weights=field_weights,
+        )
+        described = self.unit(1.0)
+        described.field_path = "description"
+        named = self.unit(0.6, 0.8)
+        named.field_path = "name"
+        store.add_agents_vectors({"described": [described], "named": [named]})
+        return store
+
+    @pytest.mark.parametrize(
+        "field_weights,first",
+        [(None, "described"), ({"name": 2.0}, "named")],
+    )
+    def test_weights_reorder_agents(self, field_weights, first):
+        store = self.make_store(field_weights)
+        query = self.unit(1.0)
+        rankings = [
+            store.search_ranked_agents([query], similarity_threshold=0.5)[0],
+            store.search_agents_by_centroid([query], similarity_threshold=0.5)[0],
+            rank_agent_scores(
+                store.search_agent_scores(query, similarity_threshold=0.5), 10
+            ),
+            rank_agent_scores(
+                store.search_agent_scores_filtered(
+                    query, ["described", "named"], similarity_threshold=0.5
+                ),
+                10,
+            ),
+        ]
+        for ranked in rankings:
+            assert [agent for agent, _ in ranked][0] == first
+            assert dict(ranked)["named"] == pytest.approx(
+                0.9 * 0.6 * (field_weights or {}).get("name", 1.0) + 0.02
+            )
+
+    def test_threshold_applies_to_unweighted_similarity(self):
+        store = self.make_store({"name": 2.0})
+        ranked = store.search_ranked_agents([self.unit(1.0)], similarity_threshold=0.7)
+        assert [agent for agent, _ in ranked[0]] == ["described"]
+
+
+class TestPersistence:
+    """Test the segmented, memory-mapped on-disk index format."""
+
+    @pytest.mark.parametrize(
+        ("index_type", "vector_storage"),
+        [("flat", "float32"), ("hnsw", "sq8"), ("ivf", "fp16"), ("ivfpq", "float32")],
+    )
+    def test_load_maps_segments_and_accepts_updates(
+        self, tmp_path, index_type, vector_storage
+    ):
+        """Loaded segments are mapped, searchable and tombstoned by updates."""
+        path = str(tmp_path / "index")
+        options = {
+            "vector_dimensions": DIMS,
+            "persist_path": path,
+            "index_type": index_type,
+            "ann_threshold": 400,
+            "vector_storage": vector_storage,
+        }
+        store = FAISSVectorStore(**options)
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 10, i) for i in range(50)}
+        )
+        store.remove_agent_vectors("agent-3")
+        store.flush()
+        names = sorted(p.name for p in (tmp_path / "index").iterdir())
+        assert names[0] == "manifest.json"
+        assert names[1].startswith("segment-")
+        assert names[2].startswith("tombstones-")
+        assert len(names) == 3
+
+        loaded = FAISSVectorStore(**options)
+        stats = loaded.get_stats()
+        assert stats["index_type"] == store.get_stats()["index_type"]
+        assert [segment["persisted"] for segment in stats["segments"]] == [True]
+        assert stats["total_vectors"] == 490
+        assert loaded.agent_vector_ids == store.agent_vector_ids
+        query = make_vectors("agent-7", 10, 7)[4]
+        hits = loaded.search_agent_scores(query, k=1, similarity_threshold=0.0)
+        assert hits[0][0] == "agent-7"
+
+        loaded.remove_agent_vectors("agent-7")
+        loaded.add_agent_vectors("agent-50", make_vectors("agent-50", 10, 50))
+        assert loaded.get_stats()["pending_tombstones"] == 10
+        loaded.flush()
+        reloaded = FAISSVectorStore(**options)
+        assert "agent-7" not in reloaded.agent_vector_ids
+        assert reloaded.get_stats()["total_vectors"] == 490
+        assert len(reloaded.get_agent_vectors("agent-50")) == 10
+
+    def test_flush_writes_only_changes(self, tmp_path):
+        """Flushing rewrites no segment written by an earlier flush."""
+        path = tmp_path / "index"
+        store = FAISSVectorStore(vector_dimensions=DIMS, persist_path=str(path))
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 3, i) for i in range(5)}
+        )
+        store.flush()
+        first = {p.name: p.stat().st_mtime_ns for p in path.glob("segment-*/*")}
+
+        store.add_agent_vectors("agent-5", make_vectors("agent-5", 3, 5))
+        store.remove_agent_vectors("agent-0")
+        store.flush()
+        second = {p.name for p in path.glob("segment-*")}
+        assert len(second) == 2
+        assert {
+            p.name: p.stat().st_mtime_ns for p in path.glob(f"{min(second)}/*")
+        } == first
+        tombstones = next(path.glob("tombstones-*")).stat().st_size
+        assert tombstones == 3 * 8
+
+    def test_loads_without_flat_code_mapping(self, tmp_path, monkeypatch):
+        """Without IO_FLAG_MMAP_IFC (older faiss) segments are read instead."""
+        monkeypatch.setattr(
+            "a2a_registry.vector_segment._MMAP_FLAG", faiss.IO_FLAG_MMAP
+        )
+        path = str(tmp_path / "index")
+        store = FAISSVectorStore(vector_dimensions=DIMS, persist_path=path)
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 3, i) for i in range(5)}
+        )
+        store.flush()
+
+        loaded = FAISSVectorStore(vector_dimensions=DIMS, persist_path=path)
+        query = make_vectors("agent-2", 3, 2)[1]
+        hits = loaded.search_agent_scores(query, k=1, similarity_threshold=0.0)
+        assert hits[0][0] == "agent-2"
+
+    def test_unflushed_changes_are_lost_on_crash(self, tmp_path):
+        """Reopening without close sees the state of the last flush."""
+        path = str(tmp_path / "index")
+        store = FAISSVectorStore(vector_dimensions=DIMS, persist_path=path)
+        store.add_agents_vectors(
+            {f"agent-{i}": make_vectors(f"agent-{i}", 3, i) for i in range(5)}
+        )
+        store.flush()
+        store.remove_agent_vectors("agent-0")
+        store.add_agent_vectors("agent-5", make_vectors("agent-5", 3, 5))
+
+        loaded = FAISSVectorStore(vector_dimensions=DIMS, persist_path=path)
+        assert set(loaded.agent_vector_ids) == {f"agent-{i}" for i in range(5)}
+        loaded.add_agent_vectors("agent-6", make_vectors("agent-6", 3, 6))
+        assert loaded.agent_vector_ids["agent-6"].start == 15
+
+    def test_newer_format_version_is_not_loaded(self, tmp_path):
+        """An index written by a newer format version starts empty."""
+        path = tmp_path / "index"
+        store = FAISSVectorStore(vector_dimensions=DIMS, persist_path=str(path))
+        store.add_agent_vectors("agent-a", make_vectors("agent-a", 3))
+        store.save_index()
+        manifest = json.loads((path / "manifest.json").read_text())
+        manifest["version"] += 1
+        (path / "manifest.json").write_text(json.dumps(manifest))
+
+        loaded = FAISSVectorStore(vector_dimensions=DIMS, persist_path=str(path))
+        assert loaded.get_stats()["total_vectors"] == 0